@@ -0,0 +1,142 @@
+"""Arrangement_2 benchmarks through the per-object Python API.
+
+Every benchmark times the bound calls only. Point_2 / Segment_2 wrappers and
+any arrangement the operation starts from are built in ``setup`` and are not
+timed. ``n`` is the target number of input edges (or points).
+"""
+import pytest
+
+import generators as gen
+import workloads as wl
+
+
+def rounds_for(n):
+    """Enough rounds for a stable median at small n, a single round at 10^6+."""
+    return max(1, min(10, 10**6 // (10 * n)))
+
+
+def run(benchmark, fn, setup, n):
+    return benchmark.pedantic(fn, setup=setup, rounds=rounds_for(n), iterations=1)
+
+
+# ---------------------------------------------------------------------------
+# Insertion: specialized methods
+# ---------------------------------------------------------------------------
+
+def bench_insert_in_face_interior_point(benchmark, cg, n):
+    benchmark.group = "insert_specialized"
+    pts = cg.points(gen.disjoint_points(n))
+    run(benchmark, wl.insert_points_in_face, lambda: ((cg, pts), {}), n)
+
+
+def bench_insert_in_face_interior_segment(benchmark, cg, n):
+    benchmark.group = "insert_specialized"
+    segs = cg.segments(gen.disjoint_segments(n))
+    run(benchmark, wl.insert_segments_in_face, lambda: ((cg, segs), {}), n)
+
+
+def bench_insert_from_left_vertex(benchmark, cg, n):
+    benchmark.group = "insert_specialized"
+    g = wl.Grid_input(cg, n)
+    benchmark.extra_info["edges"] = g.m * (g.m - 1)
+    run(benchmark, wl.rows_from_left, lambda: ((cg, g), {}), n)
+
+
+def bench_insert_from_right_vertex(benchmark, cg, n):
+    benchmark.group = "insert_specialized"
+    g = wl.Grid_input(cg, n)
+    benchmark.extra_info["edges"] = g.m * (g.m - 1)
+    run(benchmark, wl.rows_from_right, lambda: ((cg, g), {}), n)
+
+
+def bench_insert_at_vertices(benchmark, cg, n):
+    benchmark.group = "insert_specialized"
+    g = wl.Grid_input(cg, n)
+    benchmark.extra_info["edges"] = g.m * (g.m - 1)
+
+    def setup():
+        arr, rows = wl.rows_from_left(cg, g)
+        return (arr, g, rows), {}
+
+    arr = run(benchmark, wl.connect_rows, setup, n)
+    assert arr.number_of_edges() == g.n_edges
+
+
+# ---------------------------------------------------------------------------
+# Insertion: general
+# ---------------------------------------------------------------------------
+
+@pytest.mark.parametrize("kind", sorted(gen.GENERATORS))
+def bench_insert_general(benchmark, cg, n, kind):
+    benchmark.group = "insert_general"
+    segs = cg.segments(gen.GENERATORS[kind](n))
+    benchmark.extra_info["input_segments"] = len(segs)
+    arr = run(benchmark, wl.insert_general, lambda: ((cg, segs), {}), n)
+    benchmark.extra_info["edges"] = arr.number_of_edges()
+
+
+def bench_insert_non_intersecting(benchmark, cg, n):
+    benchmark.group = "insert_general"
+    segs = cg.segments(gen.road_network(n))
+    benchmark.extra_info["input_segments"] = len(segs)
+    run(benchmark, wl.insert_non_intersecting, lambda: ((cg, segs), {}), n)
+
+
+# ---------------------------------------------------------------------------
+# Removal
+# ---------------------------------------------------------------------------
+
+def bench_remove_edge(benchmark, cg, n):
+    benchmark.group = "remove"
+    segs = cg.segments(gen.road_network(n))
+    run(benchmark, wl.remove_all_edges,
+        lambda: ((wl.insert_general(cg, segs),), {}), n)
+
+
+def bench_remove_isolated_vertex(benchmark, cg, n):
+    benchmark.group = "remove"
+    pts = cg.points(gen.disjoint_points(n))
+    run(benchmark, wl.remove_isolated_vertices,
+        lambda: ((wl.insert_points_in_face(cg, pts),), {}), n)
+
+
+# ---------------------------------------------------------------------------
+# Queries on a built road network
+# ---------------------------------------------------------------------------
+
+@pytest.fixture(scope="module")
+def road(cg, n):
+    segs = gen.road_network(n)
+    return segs, wl.insert_general(cg, cg.segments(segs))
+
+
+@pytest.mark.parametrize("kind", ["vertices", "halfedges", "faces"])
+def bench_traverse(benchmark, road, n, kind):
+    benchmark.group = "traverse"
+    _, arr = road
+    run(benchmark, wl.traverse, lambda: ((arr, kind), {}), n)
+
+
+def bench_is_valid(benchmark, road, n):
+    benchmark.group = "is_valid"
+    _, arr = road
+    assert run(benchmark, arr.is_valid, lambda: ((), {}), n)
+
+
+@pytest.mark.parametrize("strategy", sorted(wl.POINT_LOCATION))
+def bench_point_location(benchmark, cg, road, n, strategy):
+    benchmark.group = "point_location"
+    if strategy == "naive" and n > 10**5:
+        pytest.skip("naive point location is O(n) per query")
+    segs, arr = road
+    pl = wl.point_locator(cg, arr, strategy)
+    queries = cg.points(gen.query_points(min(n, 10**4), gen.bounding_box(segs)))
+    benchmark.extra_info["queries"] = len(queries)
+    run(benchmark, wl.locate_all, lambda: ((pl, queries), {}), n)
+
+
+def bench_copy(benchmark, cg, road, n):
+    benchmark.group = "copy"
+    _, arr = road
+    out = run(benchmark, wl.copy, lambda: ((cg, arr), {}), n)
+    assert out.number_of_edges() == arr.number_of_edges()
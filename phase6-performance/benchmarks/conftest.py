@@ -0,0 +1,50 @@
+"""pytest-benchmark wiring: kernel config selection and problem sizes."""
+import pytest
+
+from workloads import Cgalpy
+
+SIZE_PRESETS = {
+    "smoke": [10**3],
+    "default": [10**3, 10**4, 10**5],
+    "full": [10**3, 10**4, 10**5, 10**6, 10**7],
+}
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("cgalpy")
+    group.addoption("--cgalpy-module", default="CGALPY",
+                    help="compiled module to benchmark (test_runner.py convention)")
+    group.addoption("--kernel-config", default=None,
+                    help="cmake config name recorded in the results, e.g. aos2_epic")
+    group.addoption("--sizes", default="default",
+                    help="smoke | default | full | comma-separated edge counts")
+
+
+def sizes(config):
+    spec = config.getoption("--sizes")
+    if spec in SIZE_PRESETS:
+        return SIZE_PRESETS[spec]
+    return [int(float(s)) for s in spec.split(",")]
+
+
+def pytest_generate_tests(metafunc):
+    if "n" in metafunc.fixturenames:
+        ns = sizes(metafunc.config)
+        # Module scope, so fixtures built for one size are shared by every
+        # benchmark at that size.
+        metafunc.parametrize("n", ns, ids=[f"n={n:.0e}".replace("+0", "") for n in ns],
+                             scope="module")
+
+
+@pytest.fixture(scope="session")
+def cg(request):
+    name = request.config.getoption("--cgalpy-module")
+    try:
+        return Cgalpy(name)
+    except ImportError as e:
+        pytest.skip(f"cannot import {name}: {e}")
+
+
+def pytest_benchmark_update_machine_info(config, machine_info):
+    machine_info["cgalpy_module"] = config.getoption("--cgalpy-module")
+    machine_info["kernel_config"] = config.getoption("--kernel-config")
@@ -0,0 +1,258 @@
+#!/usr/bin/env python3
+"""Run the crash scenarios in parallel, isolated processes, for every build.
+
+Usage:
+    python crash_runner.py aos2_epec_fixed=CGALPY aos2_epic=CGALPY@build_aos2_epic/... [-j 8]
+    python crash_runner.py aos2_epic=CGALPY -k crash_   # only matching scenarios
+
+Arguments are ``CONFIG=MODULE[@BUILD_DIR]``, as for kernel_matrix.py.
+For each config, one "zygote" process imports the module once. Every
+scenario then runs in a child forked from the zygote, so it starts with
+CGALPY already loaded, pays no import cost, and gets a fresh copy-on-write
+heap. A scenario that kills its process (bus error, segfault, abort) takes
+only its own child with it. Up to ``-j`` children run at a time per config,
+and the configs' zygotes run concurrently.
+
+Outcomes per scenario:
+
+    pass        returned normally
+    exception   raised; type and message recorded
+    signal      killed by a signal (SIGBUS, SIGSEGV, SIGABRT, ...)
+    timeout     still running after --timeout seconds
+
+The verdict compares the outcome with the scenario's ``expect``. Any signal
+or timeout is a failure, except that a scenario expecting "ub" (stale-handle
+use, undefined behaviour) may end in any way other than a timeout. Exit status 1 if any scenario failed on any config.
+POSIX only (needs os.fork).
+"""
+import argparse
+import json
+import os
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+from kernel_matrix import parse_spec
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DETAIL_CHARS = 300
+
+
+# -- zygote side --------------------------------------------------------------
+
+def _child(thunk, result_fd, timeout):
+    """Body of a forked child. thunk() returns the result dict. Never returns."""
+    signal.alarm(timeout)               # SIGALRM's default action ends the child
+    try:
+        msg = thunk()
+    except BaseException as e:          # noqa: BLE001 - classifying is the point
+        msg = {"outcome": "exception",
+               "detail": f"{type(e).__name__}: {e}"[:DETAIL_CHARS]}
+    os.write(result_fd, json.dumps(msg).encode())
+    os._exit(0)
+
+
+def _scenario(fn, cg):
+    def thunk():
+        fn(cg)
+        return {"outcome": "pass"}
+    return thunk
+
+
+def _reap(status, data, stderr_tail, timeout):
+    if os.WIFSIGNALED(status):
+        sig = os.WTERMSIG(status)
+        if sig == signal.SIGALRM:
+            return {"outcome": "timeout", "detail": f"> {timeout} s"}
+        return {"outcome": "signal", "detail": signal.Signals(sig).name,
+                "stderr": stderr_tail}
+    code = os.WEXITSTATUS(status)
+    if code != 0 or not data:
+        return {"outcome": "exit", "detail": f"exit status {code}", "stderr": stderr_tail}
+    return json.loads(data)
+
+
+def run_scenarios(cg, names, jobs, timeout):
+    """Fork one child per scenario, at most `jobs` at a time."""
+    from crash_scenarios import SCENARIOS
+
+    pending = list(names)
+    running = {}                        # pid -> (name, read fd, stderr file, start)
+    results = {}
+    devnull = os.open(os.devnull, os.O_WRONLY)
+    while pending or running:
+        while pending and len(running) < jobs:
+            name = pending.pop(0)
+            r, w = os.pipe()
+            err = tempfile.TemporaryFile()
+            sys.stdout.flush()
+            sys.stderr.flush()
+            pid = os.fork()
+            if pid == 0:
+                os.close(r)
+                os.dup2(devnull, 1)
+                os.dup2(err.fileno(), 2)
+                _child(_scenario(SCENARIOS[name][0], cg), w, timeout)
+            os.close(w)
+            running[pid] = (name, r, err, time.perf_counter())
+
+        pid, status = os.waitpid(-1, 0)
+        name, r, err, start = running.pop(pid)
+        with os.fdopen(r, "rb") as f:
+            data = f.read()
+        err.seek(0)
+        tail = err.read().decode(errors="replace").strip().splitlines()[-3:]
+        err.close()
+        res = _reap(status, data, "\n".join(tail), timeout)
+        res["ms"] = (time.perf_counter() - start) * 1e3
+        results[name] = res
+    os.close(devnull)
+    return results
+
+
+def fork_call(thunk, timeout):
+    """Run thunk() in one forked child and classify it like a scenario.
+
+    thunk returns a JSON-serializable dict, which becomes the result. The
+    result is read while waiting, so it may be larger than a pipe buffer.
+    """
+    r, w = os.pipe()
+    err = tempfile.TemporaryFile()
+    sys.stdout.flush()
+    sys.stderr.flush()
+    pid = os.fork()
+    if pid == 0:
+        os.close(r)
+        os.dup2(err.fileno(), 2)
+        _child(thunk, w, timeout)
+    os.close(w)
+    with os.fdopen(r, "rb") as f:
+        data = f.read()
+    _, status = os.waitpid(pid, 0)
+    err.seek(0)
+    tail = err.read().decode(errors="replace").strip().splitlines()[-3:]
+    err.close()
+    return _reap(status, data, "\n".join(tail), timeout)
+
+
+def zygote_main(args):
+    import workloads as wl
+
+    t0 = time.perf_counter()
+    cg = wl.Cgalpy(args.module, args.build_dir)
+    import_ms = (time.perf_counter() - t0) * 1e3
+    names = json.loads(args.scenarios)
+    t0 = time.perf_counter()
+    results = run_scenarios(cg, names, args.jobs, args.timeout)
+    print(json.dumps({"import_ms": import_ms,
+                      "wall_s": time.perf_counter() - t0,
+                      "results": results}))
+    return 0
+
+
+# -- parent side --------------------------------------------------------------
+
+def verdict(expect, outcome):
+    if expect == "ub":
+        return "FAIL" if outcome == "timeout" else "ok"
+    if outcome in ("signal", "timeout", "exit"):
+        return "FAIL"
+    if expect is None or expect == outcome:
+        return "ok"
+    return "FAIL"
+
+
+def main_runner(args):
+    from crash_scenarios import SCENARIOS
+
+    names = [n for n in SCENARIOS if not args.select or args.select in n]
+    if not names:
+        print(f"no scenario matches {args.select!r}", file=sys.stderr)
+        return 2
+
+    t0 = time.perf_counter()
+    procs = {}
+    for config, module, build_dir in args.configs:
+        cmd = [sys.executable, os.path.abspath(__file__), "_zygote", module,
+               "--scenarios", json.dumps(names), "-j", str(args.jobs),
+               "--timeout", str(args.timeout)]
+        if build_dir:
+            cmd += ["--build-dir", build_dir]
+        procs[config] = subprocess.Popen(cmd, cwd=HERE, stdout=subprocess.PIPE,
+                                         stderr=subprocess.PIPE, text=True)
+
+    runs, failed = {}, False
+    for config, p in procs.items():
+        out, err = p.communicate()
+        if p.returncode != 0:
+            last = (err.strip().splitlines() or [f"exit status {p.returncode}"])[-1]
+            runs[config] = {"error": last}
+            failed = True
+            continue
+        runs[config] = json.loads(out.strip().splitlines()[-1])
+
+    width = max(len(n) for n in names)
+    configs = list(runs)
+    print(f"{'scenario':<{width}}  expect     " + "  ".join(f"{c:<22}" for c in configs))
+    for name in names:
+        expect = SCENARIOS[name][1]
+        cells = []
+        for c in configs:
+            if "error" in runs[c]:
+                cells.append("-")
+                continue
+            res = runs[c]["results"][name]
+            v = verdict(expect, res["outcome"])
+            failed |= v == "FAIL"
+            cells.append(f"{res['outcome']}{' FAIL' if v == 'FAIL' else ''}")
+        print(f"{name:<{width}}  {str(expect):<9}  " + "  ".join(f"{c:<22}" for c in cells))
+
+    print()
+    for c in configs:
+        run = runs[c]
+        if "error" in run:
+            print(f"{c}: could not start: {run['error']}")
+            continue
+        print(f"{c}: {len(names)} scenarios in {run['wall_s']:.2f} s "
+              f"(import {run['import_ms']:.0f} ms, once)")
+        for name, res in run["results"].items():
+            if verdict(SCENARIOS[name][1], res["outcome"]) == "FAIL" or args.verbose:
+                print(f"  {name}: {res['outcome']} {res.get('detail', '')}")
+                if res.get("stderr"):
+                    print("    " + res["stderr"].replace("\n", "\n    "))
+    print(f"\ntotal wall time {time.perf_counter() - t0:.2f} s")
+
+    if args.json:
+        with open(args.json, "w") as f:
+            json.dump(runs, f, indent=2)
+    return 1 if failed else 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["_zygote"]:
+        p = argparse.ArgumentParser(prog="crash_runner.py _zygote")
+        p.add_argument("module")
+        p.add_argument("--build-dir")
+        p.add_argument("--scenarios", required=True)
+        p.add_argument("-j", dest="jobs", type=int, required=True)
+        p.add_argument("--timeout", type=int, required=True)
+        return zygote_main(p.parse_args(argv[1:]))
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("configs", nargs="+", type=parse_spec,
+                        help="CONFIG=MODULE[@BUILD_DIR]")
+    parser.add_argument("-j", dest="jobs", type=int, default=os.cpu_count() or 4,
+                        help="concurrent scenarios per config")
+    parser.add_argument("-k", dest="select", help="run scenarios whose name contains this")
+    parser.add_argument("--timeout", type=int, default=30, help="seconds per scenario")
+    parser.add_argument("--json", help="also write the full results here")
+    parser.add_argument("-v", "--verbose", action="store_true",
+                        help="print detail for every scenario, not just failures")
+    return main_runner(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
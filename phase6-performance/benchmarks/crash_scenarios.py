@@ -0,0 +1,174 @@
+"""The Phase 2/3 crash scenarios as functions, for crash_runner.py.
+
+Each scenario takes a ``workloads.Cgalpy`` handle and does what the
+matching script under ``phase3-research/research/crash-scenarios/`` (or the
+Phase 2.6 test table) does, without printing. ``expect`` is the outcome in a
+build with the default Phase 5.2 check flags, i.e. CGALPY_NO_PRECONDITIONS,
+CGALPY_NO_ASSERTIONS and CGALPY_NDEBUG all OFF, so CGAL's own checks throw:
+
+    "exception"  a CGAL precondition must turn the misuse into a Python
+                 exception (fails in builds with CGALPY_NO_PRECONDITIONS or
+                 CGALPY_NDEBUG, which compile the check out)
+    "pass"       must complete normally
+    "ub"         undefined behaviour: the scenario uses a handle whose record
+                 was freed. Phase 5.2 removed the HandleRegistry, and CGAL does
+                 not check handles, so any outcome, a signal included, is
+                 accepted and recorded. Isolation in a forked child is what
+                 keeps it from hurting other scenarios.
+    None         recorded only; the Phase 3 "warning" cases, which are
+                 accepted without validation today
+
+A signal is a failure unless ``expect`` is "ub".
+"""
+
+SCENARIOS = {}
+
+
+def scenario(name, expect, description):
+    def register(fn):
+        SCENARIOS[name] = (fn, expect, description)
+        return fn
+    return register
+
+
+def _chain(cg):
+    """(0,0) -> (5,5) -> (10,10): two edges inserted from the left."""
+    P, S = cg.Point_2, cg.Segment_2
+    arr = cg.Arrangement_2()
+    v1 = arr.insert_in_face_interior(P(0, 0), arr.unbounded_face())
+    he1 = arr.insert_from_left_vertex(S(P(0, 0), P(5, 5)), v1)
+    v2 = he1.target()
+    he2 = arr.insert_from_left_vertex(S(P(5, 5), P(10, 10)), v2)
+    return arr, v1, v2, he1, he2
+
+
+# -- Phase 2.6 crash table (bus error / segfault without the framework) --------
+#
+# 1 and 6 break a CGAL precondition and throw. 2-5 use a freed record: the
+# Phase 2.6 HandleRegistry caught those, and it is gone since Phase 5.2.
+
+@scenario("crash_1_remove_nonisolated_vertex", "exception",
+          "remove_isolated_vertex on a vertex with edges (bus error)")
+def crash_1(cg):
+    arr, v1, v2, he1, he2 = _chain(cg)
+    arr.remove_isolated_vertex(v2)
+
+
+@scenario("crash_2_remove_edge_twice", "ub",
+          "remove_edge called twice on the same halfedge")
+def crash_2(cg):
+    arr, v1, v2, he1, he2 = _chain(cg)
+    arr.remove_edge(he1)
+    arr.remove_edge(he1)
+
+
+@scenario("crash_3_curve_after_remove", "ub",
+          "he.curve() after the edge was removed")
+def crash_3(cg):
+    arr, v1, v2, he1, he2 = _chain(cg)
+    arr.remove_edge(he1)
+    he1.curve()
+
+
+@scenario("crash_4_twin_after_remove", "ub",
+          "twin captured before remove_edge, used after")
+def crash_4(cg):
+    arr, v1, v2, he1, he2 = _chain(cg)
+    twin = he1.twin()
+    arr.remove_edge(he1)
+    twin.source().point()
+
+
+@scenario("crash_5_remove_isolated_vertex_twice", "ub",
+          "remove_isolated_vertex called twice")
+def crash_5(cg):
+    arr = cg.Arrangement_2()
+    v = arr.insert_in_face_interior(cg.Point_2(3, 3), arr.unbounded_face())
+    arr.remove_isolated_vertex(v)
+    arr.remove_isolated_vertex(v)
+
+
+@scenario("crash_6_merge_non_adjacent", "exception",
+          "merge_edge on edges that do not share a degree-2 vertex")
+def crash_6(cg):
+    P, S = cg.Point_2, cg.Segment_2
+    arr, v1, v2, he1, he2 = _chain(cg)
+    far = arr.insert_in_face_interior(P(20, 0), arr.unbounded_face())
+    he3 = arr.insert_from_left_vertex(S(P(20, 0), P(30, 0)), far)
+    arr.merge_edge(he1, he3, S(P(0, 0), P(30, 0)))
+
+
+@scenario("regression_7_address_reuse", "pass",
+          "normal ops after remove_edge; reused addresses must not be flagged")
+def regression_7(cg):
+    P, S = cg.Point_2, cg.Segment_2
+    arr = cg.Arrangement_2()
+    for i in range(50):
+        v = arr.insert_in_face_interior(P(i, i), arr.unbounded_face())
+        he = arr.insert_from_left_vertex(S(P(i, i), P(i + 5, i + 5)), v)
+        arr.remove_edge(he)
+    assert arr.number_of_edges() == 0
+
+
+# -- Phase 3 additional scenarios (test_additional_crashes.py, test_crash_*.py) --
+
+@scenario("p3_modify_vertex_connected", None,
+          "modify_vertex on a vertex with edges (geometry left inconsistent)")
+def p3_modify_vertex_connected(cg):
+    arr, v1, v2, he1, he2 = _chain(cg)
+    arr.modify_vertex(v1, cg.Point_2(100, 100))
+
+
+@scenario("p3_split_edge_wrong_point", None,
+          "split_edge at a point not on the edge")
+def p3_split_edge_wrong_point(cg):
+    P, S = cg.Point_2, cg.Segment_2
+    arr, v1, v2, he1, he2 = _chain(cg)
+    arr.split_edge(he1, S(P(0, 0), P(3, 5)), S(P(3, 5), P(5, 5)))
+
+
+@scenario("p3_merge_wrong_orientation", None,
+          "merge_edge(he1, he2.twin()) on a chain")
+def p3_merge_wrong_orientation(cg):
+    P, S = cg.Point_2, cg.Segment_2
+    arr, v1, v2, he1, he2 = _chain(cg)
+    arr.merge_edge(he1, he2.twin(), S(P(0, 0), P(10, 10)))
+
+
+@scenario("p3_modify_edge_wrong_endpoints", None,
+          "modify_edge with a curve whose end point is not the vertex")
+def p3_modify_edge_wrong_endpoints(cg):
+    P, S = cg.Point_2, cg.Segment_2
+    arr, v1, v2, he1, he2 = _chain(cg)
+    arr.modify_edge(he1, S(P(0, 0), P(7, 7)))
+
+
+@scenario("p3_remove_while_iterating", None,
+          "remove_isolated_vertex while iterating arr.vertices()")
+def p3_remove_while_iterating(cg):
+    arr = cg.Arrangement_2()
+    for i in range(3):
+        arr.insert_in_face_interior(cg.Point_2(i, i), arr.unbounded_face())
+    for v in arr.vertices():
+        if v.is_isolated():
+            arr.remove_isolated_vertex(v)
+
+
+@scenario("p3_modify_then_remove", "pass",
+          "modify_vertex on an isolated vertex, then remove via the old handle")
+def p3_modify_then_remove(cg):
+    arr = cg.Arrangement_2()
+    v = arr.insert_in_face_interior(cg.Point_2(5, 5), arr.unbounded_face())
+    arr.modify_vertex(v, cg.Point_2(10, 10))
+    arr.remove_isolated_vertex(v)
+
+
+@scenario("p3_split_then_access", "pass",
+          "split_edge, then use the original halfedge")
+def p3_split_then_access(cg):
+    P, S = cg.Point_2, cg.Segment_2
+    arr = cg.Arrangement_2()
+    v1 = arr.insert_in_face_interior(P(0, 0), arr.unbounded_face())
+    he = arr.insert_from_left_vertex(S(P(0, 0), P(10, 10)), v1)
+    arr.split_edge(he, S(P(0, 0), P(5, 5)), S(P(5, 5), P(10, 10)))
+    he.curve()
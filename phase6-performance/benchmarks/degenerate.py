@@ -0,0 +1,126 @@
+"""Degenerate segment sets with exact expected arrangement sizes.
+
+Inexact kernels (EPIC) round constructed intersection points. Input where
+several segments meet at a point that is not a double, or where crossings
+cluster closer than the rounding error, can therefore come out with extra
+vertices, missing edges or an invalid DCEL. Each case here has its exact
+(V, E, F) computed by ``exact_counts()`` with ``fractions.Fraction``, so
+any kernel can be checked without trusting another kernel as reference.
+"""
+import random
+from fractions import Fraction
+
+
+def _cross(ox, oy, ax, ay, bx, by):
+    return (ax - ox) * (by - oy) - (ay - oy) * (bx - ox)
+
+
+def _on_segment(p, s):
+    (x1, y1), (x2, y2) = s
+    return (_cross(x1, y1, x2, y2, p[0], p[1]) == 0 and
+            min(x1, x2) <= p[0] <= max(x1, x2) and
+            min(y1, y2) <= p[1] <= max(y1, y2))
+
+
+def _intersection(s, t):
+    """Exact crossing point of s and t, or None (parallel or disjoint)."""
+    (x1, y1), (x2, y2) = s
+    (x3, y3), (x4, y4) = t
+    d = (x2 - x1) * (y4 - y3) - (y2 - y1) * (x4 - x3)
+    if d == 0:
+        return None
+    u = ((x3 - x1) * (y4 - y3) - (y3 - y1) * (x4 - x3)) / d
+    p = (x1 + u * (x2 - x1), y1 + u * (y2 - y1))
+    return p if _on_segment(p, s) and _on_segment(p, t) else None
+
+
+def exact_counts(segs):
+    """(V, E, F) of the arrangement of segs, computed exactly. O(n^2).
+
+    segs are (x1, y1, x2, y2) tuples of ints or floats. Every float is
+    converted exactly, as CGAL does.
+    """
+    S = [((Fraction(a), Fraction(b)), (Fraction(c), Fraction(d)))
+         for a, b, c, d in segs]
+    endpoints = {p for s in S for p in s}
+    on = [set(s) for s in S]
+    for i, s in enumerate(S):
+        for p in endpoints:
+            if _on_segment(p, s):
+                on[i].add(p)
+        for j in range(i + 1, len(S)):
+            p = _intersection(s, S[j])
+            if p is not None:
+                on[i].add(p)
+                on[j].add(p)
+
+    edges = set()
+    for s, pts in zip(S, on):
+        ordered = sorted(pts)                 # lexicographic = along s
+        edges.update(frozenset(e) for e in zip(ordered, ordered[1:]))
+    vertices = set().union(*on) if on else set()
+
+    parent = {v: v for v in vertices}
+
+    def find(v):
+        while parent[v] != v:
+            parent[v] = parent[parent[v]]
+            v = parent[v]
+        return v
+
+    for a, b in (tuple(e) for e in edges):
+        parent[find(a)] = find(b)
+    components = len({find(v) for v in vertices})
+    V, E = len(vertices), len(edges)
+    return V, E, E - V + 1 + components
+
+
+def concurrent_fan(k):
+    """k segments through (0.3, 0.9), which is not a double.
+
+    The directions (a, b) satisfy a = 7, b = 1 (mod 10). Both end points
+    ((3 + a)/10, (9 + b)/10) and ((3 - 9a)/10, (9 - 9b)/10) are then
+    integers. An exact kernel finds one vertex of degree 2k. An inexact
+    one finds one nearby vertex per constructed crossing.
+    """
+    segs = []
+    for i in range(k):
+        a, b = 7 + 10 * (i % 4) - 20, 1 + 10 * (i // 4) - 10
+        segs.append(((3 + a) // 10, (9 + b) // 10, (3 - 9 * a) // 10, (9 - 9 * b) // 10))
+    return segs
+
+
+def collinear_overlaps(k):
+    """k collinear segments on y = 3x, each overlapping the next by half."""
+    return [(2 * i, 6 * i, 2 * i + 4, 6 * i + 12) for i in range(k)]
+
+
+def dense_random(n, box=10, seed=0):
+    """n random integer segments in a tiny box: many near-coincident crossings."""
+    rng = random.Random(seed)
+    segs = []
+    while len(segs) < n:
+        s = tuple(rng.randint(0, box) for _ in range(4))
+        if s[:2] != s[2:]:
+            segs.append(s)
+    return segs
+
+
+def lattice_with_diagonals(m):
+    """Integer grid plus both diagonals of every cell. All crossings are
+    representable (cell centres), so every kernel must get this right; it
+    is the control case.
+    """
+    segs = [(0, j, m, j) for j in range(m + 1)] + [(i, 0, i, m) for i in range(m + 1)]
+    for i in range(m):
+        for j in range(m):
+            segs += [(i, j, i + 1, j + 1), (i + 1, j, i, j + 1)]
+    return segs
+
+
+CASES = {
+    "concurrent_fan_8": lambda: concurrent_fan(8),
+    "collinear_overlaps_6": lambda: collinear_overlaps(6),
+    "dense_random_40": lambda: dense_random(40),
+    "lattice_diagonals_4": lambda: lattice_with_diagonals(4),
+}
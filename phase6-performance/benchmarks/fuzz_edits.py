@@ -0,0 +1,655 @@
+#!/usr/bin/env python3
+"""Seeded random edit sequences against Arrangement_2, checked against a model.
+
+Usage:
+    python fuzz_edits.py CGALPY [--seed 0] [--ops 100000] [--grid 300] [--check-every 1000]
+    python fuzz_edits.py CGALPY --seeds 0:200 --ops 2000      # many short runs
+    python fuzz_edits.py CGALPY --misuse 0.02                 # also inject invalid calls
+    python fuzz_edits.py CGALPY --replay results/fuzz/seed-7.json
+
+The module name comes first, as for test_runner.py. ``--build-dir`` or
+``$CGALPY_BUILD_DIR`` says where it is.
+
+All geometry lives on a lattice of even integer points. Edges join lattice
+neighbours: horizontal, vertical, or one diagonal per cell. Split points
+are edge midpoints at odd coordinates. No two edges can cross, so a pure
+Python model (``Shadow``) knows which operations are valid and what the
+arrangement must look like afterwards. A sequence is generated from the
+seed against the model alone, before any CGALPY call, and so is identical
+for every kernel config. The sequence is then executed in a forked child.
+At every checkpoint the child compares:
+
+    V, E        with the model
+    F           with Euler's formula, V - E + F = 1 + C (C from the model)
+    is_valid()  must be true
+
+A valid call that raises, an injected misuse (``--misuse``) that does not
+raise, a failed check, or a crash of the child all count as a failure.
+Misuse means a call that breaks a CGAL precondition, so ``--misuse`` needs
+a build with the default CGALPY_NO_PRECONDITIONS / CGALPY_NDEBUG (OFF).
+``--misuse`` is the fraction of operations that are misuse. The
+sequence is then cut at the failing step and shrunk by delta debugging,
+still in forked children, to a minimal sequence with the same kind of
+failure. It is written as JSON (for ``--replay``) and as a plain Python
+script of the binding calls, ready to attach to an issue.
+
+Each run also prints ops/s per operation kind. Checkpoints are excluded,
+so the fuzzer doubles as a throughput benchmark for the edit API.
+"""
+import argparse
+import json
+import os
+import random
+import sys
+import time
+from collections import Counter, defaultdict, deque
+
+from crash_runner import fork_call
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# Slot directions from a lattice point: right, up, diagonal, anti-diagonal.
+STEPS = [(2, 0), (0, 2), (2, 2), (-2, 2)]
+
+# Relative frequency of each operation kind. Insertions outweigh removals so
+# the arrangement grows to the grid's capacity and then churns.
+WEIGHTS = {
+    "point": 4, "segment": 4, "extend": 10, "connect": 10,
+    "split": 4, "merge": 3, "modify_vertex": 2, "modify_edge": 2,
+    "remove_edge": 6, "remove_vertex": 3,
+}
+# Invalid calls a CGAL precondition must reject. Reusing a removed handle is
+# undefined behaviour since Phase 5.2 dropped the HandleRegistry, so it is
+# not injected here; crash_scenarios.py records it in an isolated child.
+MISUSE = ["remove_connected_vertex"]
+
+
+def _key(a, b):
+    return (a, b) if a < b else (b, a)
+
+
+def _mid(a, b):
+    return ((a[0] + b[0]) // 2, (a[1] + b[1]) // 2)
+
+
+class _Pool:
+    """Set with O(1) add, discard and uniform random choice."""
+
+    def __init__(self):
+        self.items = []
+        self.pos = {}
+
+    def add(self, x):
+        if x not in self.pos:
+            self.pos[x] = len(self.items)
+            self.items.append(x)
+
+    def discard(self, x):
+        i = self.pos.pop(x, None)
+        if i is None:
+            return
+        last = self.items.pop()
+        if i < len(self.items):
+            self.items[i] = last
+            self.pos[last] = i
+
+    def choice(self, rng):
+        return rng.choice(self.items) if self.items else None
+
+    def __contains__(self, x):
+        return x in self.pos
+
+    def __len__(self):
+        return len(self.items)
+
+
+class Shadow:
+    """What the arrangement must contain, in lattice coordinates.
+
+    ``vertices`` maps a point to its Vertex handle, and ``slots`` maps an
+    edge slot to its halfedge state. While a sequence is being generated,
+    the handles are None.
+    """
+
+    def __init__(self, grid):
+        self.grid = grid
+        self.vertices = {}
+        self.slots = {}                 # key -> {"src", "he"} or {"src", "he1", "he2"}
+        self.mids = {}                  # slot midpoint -> key; one diagonal per cell
+        self.degree = Counter()
+        self.lattice = _Pool()          # lattice vertices (not split points)
+        self.isolated = _Pool()
+        self.connected = _Pool()
+        self.whole = _Pool()
+        self.split = _Pool()
+
+    # -- validity ---------------------------------------------------------
+
+    def inside(self, p):
+        return 0 <= p[0] < 2 * self.grid and 0 <= p[1] < 2 * self.grid
+
+    def free_slot(self, a, b):
+        return (self.inside(a) and self.inside(b) and
+                _key(a, b) not in self.slots and _mid(a, b) not in self.mids)
+
+    def valid(self, op):
+        kind, args = op[0], [tuple(x) if isinstance(x, list) else x for x in op[1:]]
+        V = self.vertices
+        if kind == "point":
+            return self.inside(args[0]) and args[0] not in V
+        if kind == "segment":
+            a, b = args
+            return a not in V and b not in V and self.free_slot(a, b)
+        if kind == "extend":
+            a, b = args
+            return a in self.lattice and b not in V and self.free_slot(a, b)
+        if kind == "connect":
+            a, b = args
+            return a in self.lattice and b in self.lattice and self.free_slot(a, b)
+        if kind in ("split", "modify_edge", "remove_edge"):
+            return _key(*args) in self.whole
+        if kind == "merge":
+            return _key(*args) in self.split
+        if kind == "modify_vertex":
+            return args[0] in self.lattice
+        if kind == "remove_vertex":
+            return args[0] in self.isolated
+        if kind == "remove_connected_vertex":
+            return args[0] in self.connected
+        raise ValueError(f"unknown operation {kind!r}")
+
+    # -- updates ----------------------------------------------------------
+
+    def _classify(self, p):
+        if p not in self.lattice:
+            return
+        if self.degree[p]:
+            self.isolated.discard(p)
+            self.connected.add(p)
+        else:
+            self.connected.discard(p)
+            self.isolated.add(p)
+
+    def add_vertex(self, p, handle=None):
+        self.vertices[p] = handle
+        if p[0] % 2 == 0 and p[1] % 2 == 0:
+            self.lattice.add(p)
+            self._classify(p)
+
+    def remove_vertex(self, p):
+        del self.vertices[p]
+        for pool in (self.lattice, self.isolated, self.connected):
+            pool.discard(p)
+
+    def add_slot(self, a, b, src=None, he=None):
+        k = _key(a, b)
+        self.slots[k] = {"src": src, "he": he}
+        self.mids[_mid(a, b)] = k
+        self.whole.add(k)
+        for p in k:
+            self.degree[p] += 1
+            self._classify(p)
+
+    def remove_slot(self, a, b):
+        """Remove a whole slot; returns the end points left without edges."""
+        k = _key(a, b)
+        del self.slots[k]
+        del self.mids[_mid(a, b)]
+        self.whole.discard(k)
+        gone = []
+        for p in k:
+            self.degree[p] -= 1
+            if self.degree[p] == 0:
+                gone.append(p)
+            self._classify(p)
+        return gone
+
+    def split_slot(self, a, b, src=None, he1=None, he2=None, mid=None):
+        k = _key(a, b)
+        self.slots[k] = {"src": src, "he1": he1, "he2": he2}
+        self.whole.discard(k)
+        self.split.add(k)
+        self.vertices[_mid(a, b)] = mid
+
+    def merge_slot(self, a, b, src=None, he=None):
+        k = _key(a, b)
+        self.slots[k] = {"src": src, "he": he}
+        self.split.discard(k)
+        self.whole.add(k)
+        del self.vertices[_mid(a, b)]
+
+    def apply(self, op):
+        """Model-only update, used while generating."""
+        kind, args = op[0], [tuple(x) if isinstance(x, list) else x for x in op[1:]]
+        if kind == "point":
+            self.add_vertex(args[0])
+        elif kind == "segment":
+            self.add_vertex(args[0])
+            self.add_vertex(args[1])
+            self.add_slot(*args)
+        elif kind == "extend":
+            self.add_vertex(args[1])
+            self.add_slot(*args)
+        elif kind == "connect":
+            self.add_slot(*args)
+        elif kind == "split":
+            self.split_slot(*args)
+        elif kind == "merge":
+            self.merge_slot(*args)
+        elif kind == "remove_edge":
+            for p in self.remove_slot(*args):
+                self.remove_vertex(p)
+        elif kind == "remove_vertex":
+            self.remove_vertex(args[0])
+
+    # -- expected sizes ---------------------------------------------------
+
+    def counts(self):
+        """(V, E, F) the arrangement must have; F by Euler's formula."""
+        V = len(self.vertices)
+        E = len(self.whole) + 2 * len(self.split)
+        adj = defaultdict(list)
+        for a, b in self.slots:
+            adj[a].append(b)
+            adj[b].append(a)
+        seen, C = set(), 0
+        for v in self.vertices:
+            if v in seen or v[0] % 2 or v[1] % 2:
+                continue                # split points are reached through slots
+            C += 1
+            seen.add(v)
+            todo = deque([v])
+            while todo:
+                for w in adj[todo.popleft()]:
+                    if w not in seen:
+                        seen.add(w)
+                        todo.append(w)
+        return V, E, E - V + 1 + C
+
+
+# -- generation ---------------------------------------------------------------
+
+def _random_point(rng, grid):
+    return (2 * rng.randrange(grid), 2 * rng.randrange(grid))
+
+
+def _propose(kind, s, rng):
+    g = s.grid
+    if kind == "point":
+        return ["point", _random_point(rng, g)]
+    if kind in ("segment", "extend", "connect"):
+        a = _random_point(rng, g) if kind == "segment" else s.lattice.choice(rng)
+        if a is None:
+            return None
+        dx, dy = rng.choice(STEPS)
+        sign = rng.choice((1, -1))
+        return [kind, a, (a[0] + sign * dx, a[1] + sign * dy)]
+    if kind in ("split", "modify_edge", "remove_edge"):
+        k = s.whole.choice(rng)
+        return None if k is None else [kind, *k]
+    if kind == "merge":
+        k = s.split.choice(rng)
+        return None if k is None else ["merge", *k]
+    if kind == "modify_vertex":
+        p = s.lattice.choice(rng)
+        return None if p is None else ["modify_vertex", p]
+    if kind == "remove_vertex":
+        p = s.isolated.choice(rng)
+        return None if p is None else ["remove_vertex", p]
+    if kind == "remove_connected_vertex":
+        p = s.connected.choice(rng)
+        return None if p is None else ["remove_connected_vertex", p]
+    raise ValueError(kind)
+
+
+def generate(seed, n_ops, grid, misuse=0.0):
+    """A valid operation sequence. Pure Python; the same for every kernel."""
+    rng = random.Random(seed)
+    s = Shadow(grid)
+    kinds, weights = list(WEIGHTS), list(WEIGHTS.values())
+    ops = []
+    while len(ops) < n_ops:
+        # Decide once per operation, so retries do not raise the misuse rate.
+        misused = misuse and rng.random() < misuse
+        for _ in range(50):
+            kind = rng.choice(MISUSE) if misused else rng.choices(kinds, weights)[0]
+            op = _propose(kind, s, rng)
+            if op is not None and s.valid(op):
+                break
+        else:
+            op = ["point", _random_point(rng, grid)]   # saturated; keep going
+            if not s.valid(op):
+                continue
+        s.apply(op)
+        ops.append(op)
+    return ops
+
+
+# -- execution ----------------------------------------------------------------
+
+def _name(prefix, *pts):
+    return prefix + "_" + "__".join(f"{x}_{y}" for x, y in pts)
+
+
+class Executor:
+    """Run operations on a real arrangement, keeping a Shadow in step.
+
+    With ``record`` set, each call is also written there as a line of
+    Python before it is made, so the reproducer survives a crash.
+    """
+
+    def __init__(self, cg, grid, record=None):
+        self.cg = cg
+        self.s = Shadow(grid)
+        self.arr = cg.Arrangement_2()
+        self.pl = cg.aos2.Arr_walk_along_line_point_location(self.arr)
+        self.record = record
+        self.time = Counter()
+        self.calls = Counter()
+
+    def _log(self, line):
+        if self.record is not None:
+            self.record.write(line + "\n")
+            self.record.flush()
+
+    def P(self, p):
+        return self.cg.Point_2(*p)
+
+    def S(self, a, b):
+        return self.cg.Segment_2(self.P(a), self.P(b))
+
+    def _src(self, he, a, b):
+        """The end point of slot (a, b) that is he's source."""
+        return a if he.source() == self.s.vertices[a] else b
+
+    def run(self, op):
+        kind, args = op[0], [tuple(x) if isinstance(x, list) else x for x in op[1:]]
+        t0 = time.perf_counter()
+        getattr(self, "_" + kind)(*args)
+        self.time[kind] += time.perf_counter() - t0
+        self.calls[kind] += 1
+
+    def _point(self, p):
+        self._log(f"{_name('v', p)} = arr.insert_in_face_interior(P{p}, pl.locate(P{p}))")
+        v = self.arr.insert_in_face_interior(self.P(p), self.pl.locate(self.P(p)))
+        self.s.add_vertex(p, v)
+
+    def _segment(self, a, b):
+        a, b = min(a, b), max(a, b)
+        self._log(f"{_name('he', a, b)} = arr.insert_in_face_interior("
+                  f"S(P{a}, P{b}), pl.locate(P{a}))")
+        he = self.arr.insert_in_face_interior(self.S(a, b), self.pl.locate(self.P(a)))
+        self._log(f"{_name('v', a)}, {_name('v', b)} = "
+                  f"{_name('he', a, b)}.source(), {_name('he', a, b)}.target()")
+        self.s.add_vertex(a, he.source())       # directed left to right
+        self.s.add_vertex(b, he.target())
+        self.s.add_slot(a, b, a, he)
+
+    def _extend(self, a, b):
+        how = "insert_from_left_vertex" if a < b else "insert_from_right_vertex"
+        he_name = _name('he', *_key(a, b))     # slots are looked up sorted
+        self._log(f"{he_name} = arr.{how}(S(P{a}, P{b}), {_name('v', a)})")
+        he = getattr(self.arr, how)(self.S(a, b), self.s.vertices[a])
+        self._log(f"{_name('v', b)} = {he_name}.target()")
+        self.s.add_vertex(b, he.target())       # directed towards the new vertex
+        self.s.add_slot(a, b, a, he)
+
+    def _connect(self, a, b):
+        V = self.s.vertices
+        self._log(f"{_name('he', *_key(a, b))} = arr.insert_at_vertices("
+                  f"S(P{a}, P{b}), {_name('v', a)}, {_name('v', b)})")
+        he = self.arr.insert_at_vertices(self.S(a, b), V[a], V[b])
+        self.s.add_slot(a, b, self._src(he, a, b), he)
+
+    def _split(self, a, b):
+        st = self.s.slots[_key(a, b)]
+        src = st["src"]
+        tgt = b if src == a else a
+        m = _mid(a, b)
+        self._log(f"{_name('he', src, m)} = arr.split_edge({_name('he', a, b)}, "
+                  f"S(P{src}, P{m}), S(P{m}, P{tgt}))")
+        he1 = self.arr.split_edge(st["he"], self.S(src, m), self.S(m, tgt))
+        self._log(f"{_name('he', m, tgt)} = {_name('he', src, m)}.next()")
+        self._log(f"{_name('v', m)} = {_name('he', src, m)}.target()")
+        he2 = he1.next()
+        self.s.split_slot(a, b, src, he1, he2, he1.target())
+
+    def _merge(self, a, b):
+        st = self.s.slots[_key(a, b)]
+        src = st["src"]
+        tgt = b if src == a else a
+        m = _mid(a, b)
+        self._log(f"{_name('he', a, b)} = arr.merge_edge({_name('he', src, m)}, "
+                  f"{_name('he', m, tgt)}, S(P{src}, P{tgt}))")
+        he = self.arr.merge_edge(st["he1"], st["he2"], self.S(src, tgt))
+        self.s.merge_slot(a, b, None, he)
+        self.s.slots[_key(a, b)]["src"] = self._src(he, a, b)
+
+    def _modify_vertex(self, p):
+        self._log(f"{_name('v', p)} = arr.modify_vertex({_name('v', p)}, P{p})")
+        self.s.vertices[p] = self.arr.modify_vertex(self.s.vertices[p], self.P(p))
+
+    def _modify_edge(self, a, b):
+        st = self.s.slots[_key(a, b)]
+        src = st["src"]
+        tgt = b if src == a else a
+        self._log(f"{_name('he', a, b)} = arr.modify_edge({_name('he', a, b)}, S(P{src}, P{tgt}))")
+        st["he"] = self.arr.modify_edge(st["he"], self.S(src, tgt))
+
+    def _remove_edge(self, a, b):
+        self._log(f"arr.remove_edge({_name('he', a, b)})")
+        self.arr.remove_edge(self.s.slots[_key(a, b)]["he"])
+        for p in self.s.remove_slot(a, b):
+            self.s.remove_vertex(p)
+
+    def _remove_vertex(self, p):
+        self._log(f"arr.remove_isolated_vertex({_name('v', p)})")
+        self.arr.remove_isolated_vertex(self.s.vertices[p])
+        self.s.remove_vertex(p)
+
+    def _remove_connected_vertex(self, p):
+        self._log(f"arr.remove_isolated_vertex({_name('v', p)})   # has edges; must raise")
+        try:
+            self.arr.remove_isolated_vertex(self.s.vertices[p])
+        except Exception:               # noqa: BLE001 - any exception is correct
+            return
+        raise AssertionError("remove_isolated_vertex on a vertex with edges did not raise")
+
+    def check(self):
+        """None if the arrangement matches the model, else a description."""
+        arr = self.arr
+        got = (arr.number_of_vertices(), arr.number_of_edges(), arr.number_of_faces())
+        want = self.s.counts()
+        if got != want:
+            return f"VEF {got}, model {want}"
+        if not arr.is_valid():
+            return "is_valid() is false"
+        return None
+
+
+def execute(cg, ops, grid, check_every, record=None):
+    """Run ops; returns a result dict (``failure`` is None on success)."""
+    ex = Executor(cg, grid, record)
+    ran = 0
+    for i, op in enumerate(ops):
+        if not ex.s.valid(op):          # only after shrinking removed a prerequisite
+            continue
+        try:
+            ex.run(op)
+        except Exception as e:          # noqa: BLE001 - classified below
+            kind = "assertion" if isinstance(e, AssertionError) else "exception"
+            return {"outcome": "fail", "kind": kind, "step": i, "op": op,
+                    "detail": f"{type(e).__name__}: {e}"}
+        ran += 1
+        if check_every and ran % check_every == 0:
+            problem = ex.check()
+            if problem:
+                return {"outcome": "fail", "kind": "check", "step": i, "op": op,
+                        "detail": problem}
+    problem = ex.check()
+    if problem:
+        return {"outcome": "fail", "kind": "check", "step": len(ops) - 1,
+                "op": ops[-1] if ops else None, "detail": problem}
+    return {"outcome": "ok", "ran": ran,
+            "time": dict(ex.time), "calls": dict(ex.calls)}
+
+
+def run_isolated(cg, ops, grid, check_every, timeout, record_path=None):
+    """execute() in a forked child; a crash becomes kind "signal"."""
+    def thunk():
+        rec = open(record_path, "w") if record_path else None
+        try:
+            return execute(cg, ops, grid, check_every, rec)
+        finally:
+            if rec:
+                rec.close()
+    res = fork_call(thunk, timeout)
+    if res["outcome"] in ("signal", "timeout", "exit", "exception"):
+        kind = "harness" if res["outcome"] == "exception" else res["outcome"]
+        return {"outcome": "fail", "kind": kind, "step": None,
+                "detail": res.get("detail", ""), "stderr": res.get("stderr", "")}
+    return res
+
+
+# -- shrinking ----------------------------------------------------------------
+
+def shrink(ops, fails, log=None):
+    """Delta debugging (ddmin): a 1-minimal subsequence for which fails() holds."""
+    n = 2
+    while len(ops) >= 2:
+        chunk = -(-len(ops) // n)
+        for i in range(0, len(ops), chunk):
+            trial = ops[:i] + ops[i + chunk:]
+            if fails(trial):
+                ops = trial
+                n = max(n - 1, 2)
+                if log:
+                    log(f"  shrunk to {len(ops)} ops")
+                break
+        else:
+            if n >= len(ops):
+                break
+            n = min(2 * n, len(ops))
+    return ops
+
+
+def reproduce(cg, ops, failure, args, out_dir, stem):
+    """Shrink a failing sequence and write <stem>.json and <stem>.py."""
+    kind = failure["kind"]
+    if failure.get("step") is not None:
+        ops = ops[:failure["step"] + 1]
+
+    def fails(trial):
+        res = run_isolated(cg, trial, args.grid, args.check_every, args.timeout)
+        return res["outcome"] == "fail" and res["kind"] == kind
+
+    print(f"shrinking {len(ops)} ops (failure kind: {kind})")
+    small = shrink(ops, fails, log=print)
+    os.makedirs(out_dir, exist_ok=True)
+    json_path = os.path.join(out_dir, stem + ".json")
+    py_path = os.path.join(out_dir, stem + ".py")
+    final = run_isolated(cg, small, args.grid, 1, args.timeout, record_path=py_path + ".calls")
+    with open(json_path, "w") as f:
+        json.dump({"module": args.module, "grid": args.grid, "failure": final,
+                   "ops": small}, f, indent=1)
+    with open(py_path + ".calls") as f:
+        calls = f.read()
+    os.remove(py_path + ".calls")
+    write_script(py_path, args.module, final.get("detail", kind), len(small), calls)
+    print(f"minimal reproducer: {len(small)} ops\n  {json_path}\n  {py_path}")
+    return small
+
+
+def write_script(path, module, failure, n, calls):
+    """Wrap the recorded binding calls into a standalone script."""
+    with open(path, "w") as f:
+        f.write(SCRIPT_HEADER.format(module=module, failure=failure, n=n))
+        f.write(calls)
+        f.write('print("valid:", arr.is_valid(), " V E F:", arr.number_of_vertices(), '
+                'arr.number_of_edges(), arr.number_of_faces())\n')
+
+
+SCRIPT_HEADER = '''#!/usr/bin/env python3
+"""Reproducer written by fuzz_edits.py ({n} ops).
+
+Failure: {failure}
+"""
+import sys
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+from {module}.Aos2 import Arrangement_2, Arr_walk_along_line_point_location
+from {module}.Ker import Point_2, Segment_2
+
+P = Point_2
+S = Segment_2
+arr = Arrangement_2()
+pl = Arr_walk_along_line_point_location(arr)
+'''
+
+
+# -- driver -------------------------------------------------------------------
+
+def report(res, wall):
+    total_calls = sum(res["calls"].values())
+    total_time = max(sum(res["time"].values()), 1e-9)
+    print(f"  {res['ran']} ops in {wall:.2f} s wall, "
+          f"{total_calls / total_time / 1e3:.1f}k ops/s in bound calls")
+    for kind in sorted(res["calls"], key=lambda k: -res["calls"][k]):
+        n, t = res["calls"][kind], res["time"][kind]
+        print(f"    {kind:<24} {n:>8}  {n / t / 1e3:8.1f}k ops/s")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", help="compiled module name, e.g. CGALPY")
+    parser.add_argument("--build-dir")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--seeds", help="range A:B of seeds, one run each")
+    parser.add_argument("--ops", type=int, default=10_000, help="operations per run")
+    parser.add_argument("--grid", type=int, default=100,
+                        help="lattice side; the arrangement saturates near 4 grid^2 edges")
+    parser.add_argument("--check-every", type=int, default=1000,
+                        help="operations between checkpoints (1 = after every call)")
+    parser.add_argument("--misuse", type=float, default=0.0,
+                        help="fraction of deliberately invalid calls that must raise")
+    parser.add_argument("--timeout", type=int, default=600, help="seconds per run")
+    parser.add_argument("--replay", help="run the operations of a reproducer JSON")
+    parser.add_argument("--out", default=os.path.join(HERE, "results", "fuzz"))
+    args = parser.parse_args(argv)
+
+    import workloads as wl
+    cg = wl.Cgalpy(args.module, args.build_dir)
+
+    if args.replay:
+        with open(args.replay) as f:
+            data = json.load(f)
+        args.grid = data["grid"]
+        res = run_isolated(cg, data["ops"], args.grid, 1, args.timeout)
+        print(json.dumps(res, indent=1))
+        return 1 if res["outcome"] == "fail" else 0
+
+    if args.seeds:
+        lo, hi = (int(x) for x in args.seeds.split(":"))
+        seeds = range(lo, hi)
+    else:
+        seeds = [args.seed]
+
+    failed = 0
+    for seed in seeds:
+        ops = generate(seed, args.ops, args.grid, args.misuse)
+        t0 = time.perf_counter()
+        res = run_isolated(cg, ops, args.grid, args.check_every, args.timeout)
+        wall = time.perf_counter() - t0
+        print(f"seed {seed}: {res['outcome']}")
+        if res["outcome"] == "ok":
+            report(res, wall)
+            continue
+        failed += 1
+        print(f"  {res['kind']} at step {res.get('step')}: {res.get('detail')}")
+        if res.get("stderr"):
+            print("  " + res["stderr"].replace("\n", "\n  "))
+        reproduce(cg, ops, res, args, args.out, f"seed-{seed}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
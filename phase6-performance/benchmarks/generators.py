@@ -0,0 +1,148 @@
+"""Synthetic segment workloads for the Aos2 benchmarks.
+
+Pure Python (no CGALPY, no NumPy). Every kernel config therefore gets
+byte-identical input, and these generators can be checked without a build.
+Coordinates are integers, so EPIC reads them exactly and robustness
+differences between kernels come from the constructions, not from the input.
+
+Each generator is deterministic for a given ``(n, seed)`` and returns about
+``n`` segments as ``(x1, y1, x2, y2)`` tuples.
+"""
+import math
+import random
+
+SPACING = 1000      # lattice spacing; large enough for integer jitter
+
+
+def grid_side(n_edges):
+    """Smallest m >= 2 such that an m x m vertex grid has >= n_edges edges."""
+    return max(2, math.ceil((1 + math.sqrt(1 + 2 * n_edges)) / 2))
+
+
+def grid_point(i, j, spacing=SPACING):
+    return (i * spacing, j * spacing)
+
+
+def grid_segments(n, seed=0, spacing=SPACING):
+    """Axis-parallel m x m grid, 2m(m-1) >= n edges, no crossings.
+
+    Horizontals come first (row by row, left to right), then verticals
+    (bottom to top). Every segment is directed lexicographically, so it is
+    already in the order insert_from_left_vertex expects. ``seed`` is unused;
+    it is accepted so all GENERATORS share a signature.
+    """
+    m = grid_side(n)
+    segs = []
+    for j in range(m):
+        for i in range(m - 1):
+            segs.append(grid_point(i, j, spacing) + grid_point(i + 1, j, spacing))
+    for j in range(m - 1):
+        for i in range(m):
+            segs.append(grid_point(i, j, spacing) + grid_point(i, j + 1, spacing))
+    return segs
+
+
+def disjoint_segments(n, seed=0, spacing=SPACING):
+    """n segments, each strictly inside its own lattice cell.
+
+    No two segments touch, so every one of them can go straight into the
+    unbounded face with insert_in_face_interior.
+    """
+    rng = random.Random(seed)
+    k = math.ceil(math.sqrt(n))
+    segs = []
+    for c in range(n):
+        x0, y0 = (c % k) * spacing, (c // k) * spacing
+        x1 = x0 + rng.randrange(1, spacing // 2)
+        x2 = x0 + rng.randrange(spacing // 2, spacing - 1)
+        y1 = y0 + rng.randrange(1, spacing - 1)
+        y2 = y0 + rng.randrange(1, spacing - 1)
+        segs.append((x1, y1, x2, y2))
+    return segs
+
+
+def disjoint_points(n, seed=0, spacing=SPACING):
+    """n distinct points, one per lattice cell."""
+    rng = random.Random(seed)
+    k = math.ceil(math.sqrt(n))
+    return [((c % k) * spacing + rng.randrange(1, spacing - 1),
+             (c // k) * spacing + rng.randrange(1, spacing - 1))
+            for c in range(n)]
+
+
+def random_segments(n, seed=0, spacing=SPACING):
+    """Short random segments in a square of side spacing * sqrt(n).
+
+    Lengths are 0.5-2 lattice spacings. The expected number of crossings
+    therefore grows linearly with n, not quadratically, and general insert
+    at 10^6-10^7 measures the sweep rather than an output-size explosion.
+    """
+    rng = random.Random(seed)
+    side = spacing * math.sqrt(n)
+    segs = []
+    while len(segs) < n:
+        x1, y1 = rng.uniform(0, side), rng.uniform(0, side)
+        angle = rng.uniform(0, math.pi)
+        length = rng.uniform(0.5, 2.0) * spacing
+        seg = (round(x1), round(y1),
+               round(x1 + length * math.cos(angle)),
+               round(y1 + length * math.sin(angle)))
+        if seg[:2] != seg[2:]:
+            segs.append(seg)
+    return segs
+
+
+def road_network(n, seed=0, jitter=0.2, diagonal_p=0.3, spacing=SPACING):
+    """Planar road-like network of about n edges, no crossings.
+
+    A jittered lattice gives blocks of slightly irregular convex quads. In
+    about ``diagonal_p`` of the cells, one diagonal is added as a cut-through
+    street. Vertex degrees are 2-8, and faces are mostly quads and
+    triangles, close to OSM street blocks. ``jitter`` must stay below 0.25
+    to keep every quad convex, so that diagonals never cross anything.
+    """
+    if not 0 <= jitter < 0.25:
+        raise ValueError("jitter must be in [0, 0.25)")
+    rng = random.Random(seed)
+    m = max(2, math.ceil(math.sqrt(n / (2 + diagonal_p))) + 1)
+    d = int(jitter * spacing)
+    node = [[(i * spacing + rng.randint(-d, d), j * spacing + rng.randint(-d, d))
+             for i in range(m)] for j in range(m)]
+    segs = []
+    for j in range(m):
+        for i in range(m):
+            if i + 1 < m:
+                segs.append(node[j][i] + node[j][i + 1])
+            if j + 1 < m:
+                segs.append(node[j][i] + node[j + 1][i])
+            if i + 1 < m and j + 1 < m and rng.random() < diagonal_p:
+                if rng.random() < 0.5:
+                    segs.append(node[j][i] + node[j + 1][i + 1])
+                else:
+                    segs.append(node[j][i + 1] + node[j + 1][i])
+    return segs
+
+
+def bounding_box(segs):
+    xs = [c for s in segs for c in (s[0], s[2])]
+    ys = [c for s in segs for c in (s[1], s[3])]
+    return min(xs), min(ys), max(xs), max(ys)
+
+
+def query_points(n, box, seed=0):
+    """n random query points inside box = (xmin, ymin, xmax, ymax).
+
+    Half-integer coordinates. On integer-lattice inputs most queries then
+    fall inside faces rather than on vertices.
+    """
+    rng = random.Random(seed)
+    xmin, ymin, xmax, ymax = box
+    return [(rng.randrange(xmin, xmax) + 0.5, rng.randrange(ymin, ymax) + 0.5)
+            for _ in range(n)]
+
+
+GENERATORS = {
+    "grid": grid_segments,
+    "random": random_segments,
+    "road": road_network,
+}
@@ -0,0 +1,283 @@
+#!/usr/bin/env python3
+"""Run one workload against every kernel config and tabulate the results.
+
+Usage:
+    python kernel_matrix.py aos2_epec_fixed=CGALPY aos2_epic=CGALPY_2 [--n 100000]
+    python kernel_matrix.py aos2_epic=CGALPY@build/aos2_epic/src/libs/cgalpy ...
+
+Each argument is ``CONFIG=MODULE[@BUILD_DIR]``. MODULE is the compiled
+module name, as passed to test_runner.py. BUILD_DIR defaults to
+``$CGALPY_BUILD_DIR``. Every (config, workload) pair runs in a fresh child
+process. Builds of different configs usually share a module name, so they
+cannot be imported into one interpreter. A fresh process also makes import
+time and peak RSS mean something, and a crash only takes one cell down.
+
+Per config the matrix reports:
+
+    import      time to import the module, ms
+    insert      road-network and random segments via aggregated insert, segments/s
+    locate      landmarks point location on the road network, queries/s
+    peak RSS    largest ru_maxrss over the config's children, MB
+    robustness  exact (V, E, F) of the degenerate.py cases, checked per kernel
+
+A wrong answer from an inexact (EPIC) kernel on degenerate input is
+reported as a warning: that is the trade-off EPIC makes. A wrong answer
+or a crash from an exact (EPEC) kernel, and a crash anywhere outside the
+robustness cases, makes the exit status 1.
+"""
+import argparse
+import datetime
+import json
+import os
+import resource
+import signal
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# The Phase 4.5 build matrix. Unknown names fall back to a substring match.
+KERNELS = {
+    "aos2_epec_fixed": "EPEC",
+    "aos2_epic": "EPIC",
+    "sm_pmp_epec": "EPEC",
+    "sm_pmp_epic": "EPIC",
+    "ch2_epic": "EPIC",
+    "pol3_pmp_epic": "EPIC",
+    "pol3_ch3_epec": "EPEC",
+    "tri3_epic": "EPIC",
+}
+
+THROUGHPUT = ["insert_road", "insert_random", "locate"]
+LOCATE_QUERIES = 10_000
+
+
+def kernel_of(config):
+    if config in KERNELS:
+        return KERNELS[config]
+    lower = config.lower()
+    return "EPEC" if "epec" in lower else "EPIC" if "epic" in lower else "?"
+
+
+def peak_rss_mb():
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return rss / 2**20 if sys.platform == "darwin" else rss / 2**10   # bytes vs KiB
+
+
+# -- child side --------------------------------------------------------------
+
+def measure(module, build_dir, workload, n):
+    """Run one workload in this (fresh) process and return a result dict."""
+    import importlib
+
+    if build_dir and build_dir not in sys.path:
+        sys.path.insert(0, build_dir)
+    t0 = time.perf_counter()
+    importlib.import_module(module)
+    out = {"import_ms": (time.perf_counter() - t0) * 1e3}
+    if workload == "import":
+        return out
+
+    import generators as gen
+    import workloads as wl
+    try:
+        cg = wl.Cgalpy(module, build_dir)
+    except ImportError:
+        out["status"] = "n/a"               # config built without Aos2
+        return out
+
+    if workload.startswith("robust:"):
+        import degenerate
+        case = workload.split(":", 1)[1]
+        segs = degenerate.CASES[case]()
+        expected = degenerate.exact_counts(segs)
+        try:
+            arr = wl.insert_general(cg, cg.segments(segs))
+            got = (arr.number_of_vertices(), arr.number_of_edges(), arr.number_of_faces())
+            valid = arr.is_valid()
+        except Exception as e:                          # noqa: BLE001 - reported
+            out.update(status="exception", detail=f"{type(e).__name__}: {e}")
+            return out
+        if not valid:
+            out.update(status="invalid", detail=f"is_valid() false, VEF {got}")
+        elif got != expected:
+            out.update(status="wrong", detail=f"VEF {got}, exact {expected}")
+        else:
+            out["status"] = "ok"
+        return out
+
+    if workload in ("insert_road", "insert_random"):
+        make = gen.road_network if workload == "insert_road" else gen.random_segments
+        segs = cg.segments(make(n))
+        t0 = time.perf_counter()
+        arr = wl.insert_general(cg, segs)
+        dt = time.perf_counter() - t0
+        out.update(rate=len(segs) / dt, vef=[arr.number_of_vertices(),
+                                             arr.number_of_edges(),
+                                             arr.number_of_faces()])
+    elif workload == "locate":
+        raw = gen.road_network(n)
+        arr = wl.insert_general(cg, cg.segments(raw))
+        pl = wl.point_locator(cg, arr, "landmarks")
+        pts = cg.points(gen.query_points(LOCATE_QUERIES, gen.bounding_box(raw)))
+        t0 = time.perf_counter()
+        wl.locate_all(pl, pts)
+        out["rate"] = len(pts) / (time.perf_counter() - t0)
+    else:
+        raise ValueError(f"unknown workload {workload!r}")
+    out["status"] = "ok"
+    out["peak_rss_mb"] = peak_rss_mb()
+    return out
+
+
+def child_main(args):
+    result = measure(args.module, args.build_dir, args.workload, args.n)
+    result.setdefault("peak_rss_mb", peak_rss_mb())
+    print(json.dumps(result))
+    return 0
+
+
+# -- parent side -------------------------------------------------------------
+
+def spawn(module, build_dir, workload, n, timeout):
+    cmd = [sys.executable, os.path.abspath(__file__), "_child", module,
+           "--workload", workload, "--n", str(n)]
+    if build_dir:
+        cmd += ["--build-dir", build_dir]
+    try:
+        p = subprocess.run(cmd, cwd=HERE, capture_output=True, text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return {"status": "timeout", "detail": f"> {timeout} s"}
+    if p.returncode < 0:
+        return {"status": "crash", "detail": signal.Signals(-p.returncode).name}
+    if p.returncode != 0:
+        last = (p.stderr.strip().splitlines() or ["exit status %d" % p.returncode])[-1]
+        return {"status": "error", "detail": last}
+    return json.loads(p.stdout.strip().splitlines()[-1])
+
+
+def parse_spec(spec):
+    config, sep, rest = spec.partition("=")
+    if not sep or not config or not rest:
+        raise argparse.ArgumentTypeError(f"expected CONFIG=MODULE[@BUILD_DIR], got {spec!r}")
+    module, _, build_dir = rest.partition("@")
+    return config, module, build_dir or os.environ.get("CGALPY_BUILD_DIR")
+
+
+def run_config(config, module, build_dir, args):
+    import degenerate
+
+    row = {"config": config, "kernel": kernel_of(config), "module": module,
+           "build_dir": build_dir, "workloads": {}, "robustness": {}}
+    for w in ["import"] + THROUGHPUT:
+        row["workloads"][w] = spawn(module, build_dir, w, args.n, args.timeout)
+        print(f"  {config:<18} {w:<14} {row['workloads'][w].get('status', 'ok')}",
+              file=sys.stderr)
+    for case in degenerate.CASES:
+        row["robustness"][case] = spawn(module, build_dir, "robust:" + case, 0, args.timeout)
+    return row
+
+
+def fmt_rate(r):
+    if r.get("status") != "ok":
+        return r.get("status", "?")
+    return f"{r['rate'] / 1e3:.0f}k"
+
+
+def table(rows, markdown=False):
+    head = ["config", "kernel", "import ms", "insert road/s", "insert random/s",
+            "locate/s", "peak RSS MB", "robust"]
+    body = []
+    for row in rows:
+        w = row["workloads"]
+        imp = w["import"]
+        rss = [r["peak_rss_mb"] for r in w.values() if "peak_rss_mb" in r]
+        robust = [r.get("status") for r in row["robustness"].values()]
+        ok = f"{robust.count('ok')}/{len(robust)}"
+        if robust and all(s == "n/a" for s in robust):
+            ok = "n/a"
+        body.append([row["config"], row["kernel"],
+                     f"{imp['import_ms']:.0f}" if "import_ms" in imp else imp.get("status"),
+                     fmt_rate(w["insert_road"]), fmt_rate(w["insert_random"]),
+                     fmt_rate(w["locate"]),
+                     f"{max(rss):.0f}" if rss else "-",
+                     ok])
+    if markdown:
+        lines = ["| " + " | ".join(head) + " |", "|" + "---|" * len(head)]
+        lines += ["| " + " | ".join(r) + " |" for r in body]
+        return "\n".join(lines)
+    widths = [max(len(str(c)) for c in col) for col in zip(head, *body)]
+    return "\n".join("  ".join(str(c).rjust(wd) if i > 1 else str(c).ljust(wd)
+                               for i, (c, wd) in enumerate(zip(r, widths)))
+                     for r in [head] + body)
+
+
+def findings(rows):
+    """(warnings, errors) from the robustness cases and crashed workloads."""
+    warnings, errors = [], []
+    for row in rows:
+        for case, r in row["robustness"].items():
+            if r.get("status") in ("ok", "n/a"):
+                continue
+            msg = f"{row['config']}: {case}: {r['status']} ({r.get('detail', '')})"
+            if row["kernel"] == "EPIC" and r["status"] in ("wrong", "invalid", "exception"):
+                warnings.append(msg)
+            else:
+                errors.append(msg)
+        for w, r in row["workloads"].items():
+            if r.get("status") in ("crash", "error", "timeout"):
+                errors.append(f"{row['config']}: {w}: {r['status']} ({r.get('detail', '')})")
+    return warnings, errors
+
+
+def main_matrix(args):
+    rows = []
+    for spec in args.configs:
+        config, module, build_dir = spec
+        print(f"{config}: {module} from {build_dir or 'default path'}", file=sys.stderr)
+        rows.append(run_config(config, module, build_dir, args))
+
+    print(table(rows, args.markdown))
+    warnings, errors = findings(rows)
+    if warnings:
+        print("\nInexact-kernel failures on degenerate input (use EPEC for such data):")
+        for w in warnings:
+            print(f"  {w}")
+    if errors:
+        print("\nErrors:")
+        for e in errors:
+            print(f"  {e}")
+
+    os.makedirs(args.results, exist_ok=True)
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = os.path.join(args.results, f"kernel-matrix-{stamp}.json")
+    with open(out, "w") as f:
+        json.dump({"datetime": stamp, "n": args.n, "configs": rows}, f, indent=2)
+    print(f"\nResults: {out}")
+    return 1 if errors else 0
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if argv[:1] == ["_child"]:
+        p = argparse.ArgumentParser(prog="kernel_matrix.py _child")
+        p.add_argument("module")
+        p.add_argument("--build-dir")
+        p.add_argument("--workload", required=True)
+        p.add_argument("--n", type=int, default=0)
+        return child_main(p.parse_args(argv[1:]))
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("configs", nargs="+", type=parse_spec,
+                        help="CONFIG=MODULE[@BUILD_DIR]")
+    parser.add_argument("--n", type=int, default=100_000, help="segments per workload")
+    parser.add_argument("--timeout", type=float, default=600, help="seconds per child")
+    parser.add_argument("--results", default=os.path.join(HERE, "results"))
+    parser.add_argument("--markdown", action="store_true",
+                        help="print the table as Markdown (e.g. for a CI job summary)")
+    return main_matrix(parser.parse_args(argv))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""Per-method binding overhead: Python call vs the same work in a C++ loop.
+
+Usage:
+    python overhead.py CGALPY [--config aos2_epic] [--n 10000] [--out PATH]
+
+Needs a module built with -DCGALPY_OVERHEAD_PROBES=ON (adds Aos2._overhead).
+For every method the harness reports:
+
+    python   ns/call seen from Python, loop overhead removed
+    c++      ns/call of the C++ baseline loop
+    ratio    python / c++
+    dispatch nanobind call of a no-argument no-op
+    self     casting the receiver (no-op taking one handle, minus dispatch)
+    rest     everything else: argument casting, return-value wrapping,
+             exact-number conversion, keep_alive bookkeeping
+
+so that python ~= dispatch + self + c++ + rest.
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+import timeit
+
+import generators as gen
+import workloads as wl
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# (method, records iterated as x, statement). Names match the C++ baselines.
+METHODS = [
+    ("Vertex.point", "vertices", "x.point()"),
+    ("Vertex.degree", "vertices", "x.degree()"),
+    ("Vertex.is_isolated", "vertices", "x.is_isolated()"),
+    ("Halfedge.source", "halfedges", "x.source()"),
+    ("Halfedge.target", "halfedges", "x.target()"),
+    ("Halfedge.twin", "halfedges", "x.twin()"),
+    ("Halfedge.next", "halfedges", "x.next()"),
+    ("Halfedge.prev", "halfedges", "x.prev()"),
+    ("Halfedge.face", "halfedges", "x.face()"),
+    ("Halfedge.curve", "halfedges", "x.curve()"),
+    ("Face.is_unbounded", "faces", "x.is_unbounded()"),
+    ("Face.outer_ccb", "faces", "x.outer_ccb()"),
+    ("Face.number_of_inner_ccbs", "faces", "x.number_of_inner_ccbs()"),
+    ("Point_2.to_double", "points", "x.to_double()"),
+    ("Arrangement_2.number_of_vertices", "vertices", "arr.number_of_vertices()"),
+    ("Arrangement_2.unbounded_face", "vertices", "arr.unbounded_face()"),
+    ("Arrangement_2.insert_in_face_interior+remove_isolated_vertex", "free_points",
+     "arr.remove_isolated_vertex(arr.insert_in_face_interior(x, uf))"),
+    # Edit methods on free edges x = (p, q, p->q, lower half, upper half).
+    ("Arrangement_2.insert_in_face_interior+modify_vertex+remove_isolated_vertex",
+     "free_edges",
+     "arr.remove_isolated_vertex(arr.modify_vertex(arr.insert_in_face_interior(x[0], uf), x[1]))"),
+    ("Arrangement_2.insert_in_face_interior+remove_edge", "free_edges",
+     "arr.remove_edge(arr.insert_in_face_interior(x[2], uf))"),
+    ("Arrangement_2.insert_in_face_interior+insert_from_left_vertex+remove_edge",
+     "free_edges",
+     "arr.remove_edge(arr.insert_from_left_vertex(x[2], arr.insert_in_face_interior(x[0], uf)))"),
+    ("Arrangement_2.insert_in_face_interior+insert_from_right_vertex+remove_edge",
+     "free_edges",
+     "arr.remove_edge(arr.insert_from_right_vertex(x[2], arr.insert_in_face_interior(x[1], uf)))"),
+    ("Arrangement_2.insert_in_face_interior+insert_at_vertices+remove_edge", "free_edges",
+     "arr.remove_edge(arr.insert_at_vertices(x[2], arr.insert_in_face_interior(x[0], uf), "
+     "arr.insert_in_face_interior(x[1], uf)))"),
+    ("Arrangement_2.insert_in_face_interior+split_edge+merge_edge+remove_edge", "free_edges",
+     "arr.remove_edge(arr.merge_edge(h := arr.split_edge(arr.insert_in_face_interior(x[2], uf), "
+     "x[3], x[4]), h.next(), x[2]))"),
+]
+
+PROBES = {
+    "Vertex": "take_vertex(x)",
+    "Halfedge": "take_halfedge(x)",
+    "Face": "take_face(x)",
+    "Point_2": "take_point(x)",
+    "Arrangement_2": "take_arrangement(arr)",
+}
+
+
+def free_edge(cg, x, y):
+    """Records<Arr>::Free_edge: segment p -> q and its halves at the midpoint."""
+    P, S = cg.Point_2, cg.Segment_2
+    p, q, m = P(x, y), P(x + 0.5, y + 1), P(x + 0.25, y + 0.5)
+    return (p, q, S(p, q), S(p, m), S(m, q))
+
+
+def records(cg, arr):
+    """The same record lists Records<Arr> builds on the C++ side."""
+    vertices = list(arr.vertices())
+    return {
+        "vertices": vertices,
+        "halfedges": list(arr.halfedges()),
+        "faces": [f for f in arr.faces() if not f.is_unbounded()],
+        "points": [v.point() for v in vertices],
+        "free_points": [cg.Point_2(-1e9 - i, -1e9) for i in range(len(vertices))],
+        "free_edges": [free_edge(cg, -1e9 - i, -1e9) for i in range(len(vertices))],
+    }
+
+
+def ns_per_call(stmt, xs, env, passes, repeat):
+    timer = timeit.Timer(f"for x in xs: {stmt}", globals=dict(env, xs=xs))
+    return min(timer.repeat(repeat=repeat, number=passes)) / (passes * len(xs)) * 1e9
+
+
+def measure(cg, arr, passes, repeat):
+    ov = cg.aos2._overhead
+    env = {"arr": arr, "uf": arr.unbounded_face(), "noop": ov.noop,
+           "take_vertex": ov.take_vertex, "take_halfedge": ov.take_halfedge,
+           "take_face": ov.take_face, "take_point": ov.take_point,
+           "take_arrangement": ov.take_arrangement}
+    recs = records(cg, arr)
+    cpp_names = set(ov.baseline_names())
+
+    rows = []
+    for name, kind, stmt in METHODS:
+        xs = recs[kind]
+        if name not in cpp_names:
+            rows.append({"method": name, "skipped": "no C++ baseline"})
+            continue
+        try:
+            loop = ns_per_call("pass", xs, env, passes, repeat)
+            total = ns_per_call(stmt, xs, env, passes, repeat)
+        except AttributeError as e:        # method not bound in this build
+            rows.append({"method": name, "skipped": str(e)})
+            continue
+        noop = ns_per_call("noop()", xs, env, passes, repeat)
+        probe = ns_per_call(PROBES[name.split(".")[0]], xs, env, passes, repeat)
+        cpp = ov.baseline(arr, name, passes)
+        python = total - loop
+        rows.append({
+            "method": name,
+            "calls": len(xs),
+            "python_ns": python,
+            "cpp_ns": cpp,
+            "ratio": python / cpp if cpp > 0 else float("inf"),
+            "dispatch_ns": noop - loop,
+            "self_cast_ns": probe - noop,
+            "rest_ns": total - probe - cpp,
+        })
+    return rows
+
+
+def print_table(rows):
+    width = max(len(r["method"]) for r in rows)
+    cols = ("python_ns", "cpp_ns", "ratio", "dispatch_ns", "self_cast_ns", "rest_ns")
+    heads = ("python", "c++", "ratio", "dispatch", "self", "rest")
+    print(f"{'method':<{width}}  " + "  ".join(f"{h:>9}" for h in heads))
+    for r in rows:
+        if "skipped" in r:
+            print(f"{r['method']:<{width}}  skipped: {r['skipped']}")
+            continue
+        print(f"{r['method']:<{width}}  " + "  ".join(
+            f"{r[c]:9.1f}" if c != "ratio" else f"{r[c]:8.1f}x" for c in cols))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", help="compiled module name, e.g. CGALPY")
+    parser.add_argument("--config", help="kernel config name (default: module)")
+    parser.add_argument("--n", type=int, default=10**4,
+                        help="road-network size the records come from")
+    parser.add_argument("--passes", type=int, default=10,
+                        help="passes over all records per timing")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="timings per statement, best is kept")
+    parser.add_argument("--out", help="JSON output path "
+                        "(default: results/<config>/overhead-<UTC timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    cg = wl.Cgalpy(args.module)
+    if not hasattr(cg.aos2, "_overhead"):
+        sys.exit(f"{args.module}.Aos2._overhead is missing; "
+                 "rebuild with -DCGALPY_OVERHEAD_PROBES=ON")
+
+    arr = wl.insert_general(cg, cg.segments(gen.road_network(args.n)))
+    rows = measure(cg, arr, args.passes, args.repeat)
+    print_table(rows)
+
+    config = args.config or args.module
+    out = args.out
+    if out is None:
+        stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        out = os.path.join(HERE, "results", config, f"overhead-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump({"cgalpy_module": args.module, "kernel_config": config,
+                   "n": args.n, "vertices": arr.number_of_vertices(),
+                   "python": sys.version, "methods": rows}, f, indent=2)
+    print(f"\nResults: {out}")
+
+
+if __name__ == "__main__":
+    main()
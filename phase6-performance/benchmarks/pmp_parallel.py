@@ -0,0 +1,156 @@
+#!/usr/bin/env python3
+"""PMP normals and remeshing across thread counts ("parallel" named parameter).
+
+Usage:
+    python pmp_parallel.py CGALPY [--faces 1000000] [--threads 1,2,4,8] [--out PATH]
+
+For every thread count the harness reports:
+
+    face_normals    PMP.compute_face_normals, {"parallel": True, "num_threads": t}
+    vertex_normals  PMP.compute_vertex_normals, same parameters
+    remesh          t independent meshes remeshed from a t-worker thread pool,
+                    {"parallel": True} (CGAL's remeshing is sequential; the
+                    speedup comes from the released GIL)
+
+plus the sequential call ({} / no parallel key) as the baseline. Meshes are
+triangulated tori built with Surface_mesh.from_arrays.
+"""
+import argparse
+import datetime
+import importlib
+import json
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from workloads import DEFAULT_BUILD_DIR
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def torus(n_faces, R=1.0, r=0.3):
+    """Closed torus with about n_faces triangles, as (V, F) arrays."""
+    m = max(3, int(round(np.sqrt(n_faces / 2.0))))
+    u, v = np.meshgrid(np.arange(m) * (2 * np.pi / m),
+                       np.arange(m) * (2 * np.pi / m), indexing="ij")
+    V = np.stack([(R + r * np.cos(v)) * np.cos(u),
+                  (R + r * np.cos(v)) * np.sin(u),
+                  r * np.sin(v)], axis=-1).reshape(-1, 3)
+    i, j = np.meshgrid(np.arange(m), np.arange(m), indexing="ij")
+    a = i * m + j
+    b = ((i + 1) % m) * m + j
+    c = ((i + 1) % m) * m + (j + 1) % m
+    d = i * m + (j + 1) % m
+    F = np.concatenate([np.stack([a, b, c], -1).reshape(-1, 3),
+                        np.stack([a, c, d], -1).reshape(-1, 3)]).astype(np.int64)
+    return V, F
+
+
+def best_of(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return min(times)
+
+
+def measure(mods, n_faces, threads, remesh_faces, repeat):
+    Surface_mesh, PMP, Vector_3 = mods
+    V, F = torus(n_faces)
+    sm = Surface_mesh.from_arrays(V, F)
+    fn = sm.add_property_map("f:normals", Vector_3(0, 0, 0))
+    vn = sm.add_property_map("v:normals", Vector_3(0, 0, 0))
+    rV, rF = torus(remesh_faces)
+    # Edge length of the torus grid, halved: every remesh roughly quadruples
+    # the face count, which keeps the run short but not trivial.
+    target = 0.5 * 2 * np.pi * 1.3 / np.sqrt(remesh_faces / 2.0)
+
+    def remesh_pool(t, np_):
+        meshes = [Surface_mesh.from_arrays(rV, rF) for _ in range(t)]
+        t0 = time.perf_counter()
+        with ThreadPoolExecutor(t) as pool:
+            list(pool.map(lambda m: PMP.isotropic_remeshing(m, target, np_), meshes))
+        return time.perf_counter() - t0
+
+    rows = []
+    seq = {
+        "face_normals": best_of(lambda: PMP.compute_face_normals(sm, fn, {}), repeat),
+        "vertex_normals": best_of(lambda: PMP.compute_vertex_normals(sm, vn, {}), repeat),
+    }
+    for t in threads:
+        par = {"parallel": True, "num_threads": t}
+        row = {
+            "threads": t,
+            "face_normals_s": best_of(lambda: PMP.compute_face_normals(sm, fn, par), repeat),
+            "vertex_normals_s": best_of(lambda: PMP.compute_vertex_normals(sm, vn, par), repeat),
+            # t meshes either way: GIL held vs released.
+            "remesh_seq_s": min(remesh_pool(t, {}) for _ in range(repeat)),
+            "remesh_s": min(remesh_pool(t, {"parallel": True}) for _ in range(repeat)),
+        }
+        row["face_normals_speedup"] = seq["face_normals"] / row["face_normals_s"]
+        row["vertex_normals_speedup"] = seq["vertex_normals"] / row["vertex_normals_s"]
+        row["remesh_speedup"] = row["remesh_seq_s"] / row["remesh_s"]
+        rows.append(row)
+    return seq, rows
+
+
+def print_table(n_faces, seq, rows):
+    print(f"{n_faces} faces; sequential: face normals "
+          f"{seq['face_normals'] * 1e3:.1f} ms, vertex normals "
+          f"{seq['vertex_normals'] * 1e3:.1f} ms\n")
+    print(f"{'threads':>7}  {'face ms':>9} {'x':>6}  {'vertex ms':>9} {'x':>6}  "
+          f"{'remesh ms':>9} {'x':>6}")
+    for r in rows:
+        print(f"{r['threads']:>7}  {r['face_normals_s'] * 1e3:9.1f} "
+              f"{r['face_normals_speedup']:5.1f}x  {r['vertex_normals_s'] * 1e3:9.1f} "
+              f"{r['vertex_normals_speedup']:5.1f}x  {r['remesh_s'] * 1e3:9.1f} "
+              f"{r['remesh_speedup']:5.1f}x")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("module", help="compiled module name, e.g. CGALPY")
+    parser.add_argument("--config", help="kernel config name (default: module)")
+    parser.add_argument("--faces", type=int, default=10**6,
+                        help="faces of the normals mesh")
+    parser.add_argument("--remesh-faces", type=int, default=2 * 10**4,
+                        help="faces of each remeshed mesh")
+    parser.add_argument("--threads", default="1,2,4,8",
+                        help="comma-separated thread counts")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timings per measurement, best is kept")
+    parser.add_argument("--out", help="JSON output path "
+                        "(default: results/<config>/pmp-parallel-<UTC timestamp>.json)")
+    args = parser.parse_args(argv)
+
+    build_dir = os.environ.get("CGALPY_BUILD_DIR", DEFAULT_BUILD_DIR)
+    if build_dir not in sys.path:
+        sys.path.insert(0, build_dir)
+    mods = (importlib.import_module(args.module + ".Pol").Surface_mesh,
+            importlib.import_module(args.module + ".Polygon_mesh_processing"),
+            importlib.import_module(args.module + ".Ker").Vector_3)
+
+    threads = [int(t) for t in args.threads.split(",")]
+    seq, rows = measure(mods, args.faces, threads, args.remesh_faces, args.repeat)
+    print_table(args.faces, seq, rows)
+
+    config = args.config or args.module
+    out = args.out
+    if out is None:
+        stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+        out = os.path.join(HERE, "results", config, f"pmp-parallel-{stamp}.json")
+    os.makedirs(os.path.dirname(os.path.abspath(out)), exist_ok=True)
+    with open(out, "w") as f:
+        json.dump({"cgalpy_module": args.module, "kernel_config": config,
+                   "faces": args.faces, "remesh_faces": args.remesh_faces,
+                   "cpu_count": os.cpu_count(), "python": sys.version,
+                   "sequential": seq, "rows": rows}, f, indent=2)
+    print(f"\nResults: {out}")
+
+
+if __name__ == "__main__":
+    main()
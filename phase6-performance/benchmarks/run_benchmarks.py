@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Run the Aos2 benchmark suite for one kernel config, or compare two runs.
+
+Usage:
+    python run_benchmarks.py run CGALPY --config aos2_epec_fixed [--sizes default]
+    python run_benchmarks.py compare OLD.json NEW.json [--threshold 0.10]
+
+``run`` takes the module name as its first argument, like test_runner.py.
+Results go to ``results/<config>/<UTC timestamp>.json`` (pytest-benchmark
+JSON, including machine and commit info), so runs can be diffed over time.
+``compare`` prints median-time ratios per benchmark and exits with status 1
+if anything got slower than the threshold allows.
+"""
+import argparse
+import datetime
+import json
+import os
+import sys
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+
+def run(args):
+    import pytest
+
+    config = args.config or args.module
+    out_dir = os.path.join(args.results, config)
+    os.makedirs(out_dir, exist_ok=True)
+    stamp = datetime.datetime.now(datetime.timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    out = os.path.join(out_dir, f"{stamp}.json")
+
+    pytest_args = [HERE, "-c", os.path.join(HERE, "pytest.ini"),
+                   "--cgalpy-module", args.module,
+                   "--kernel-config", config,
+                   "--sizes", args.sizes,
+                   "--benchmark-json", out]
+    if args.select:
+        pytest_args += ["-k", args.select]
+    code = pytest.main(pytest_args)
+    print(f"\nResults: {out}")
+    return int(code)
+
+
+def load(path):
+    with open(path) as f:
+        data = json.load(f)
+    return data, {b["fullname"]: b for b in data["benchmarks"]}
+
+
+def compare(args):
+    old_data, old = load(args.old)
+    new_data, new = load(args.new)
+    for label, data in (("old", old_data), ("new", new_data)):
+        info = data.get("machine_info", {})
+        commit = data.get("commit_info", {}).get("id", "?")[:10]
+        print(f"{label}: {info.get('kernel_config')} ({info.get('cgalpy_module')}) "
+              f"@ {commit}, {data.get('datetime', '?')}")
+
+    width = max((len(k) for k in new), default=10)
+    print(f"\n{'benchmark':<{width}}  {'old [s]':>10}  {'new [s]':>10}  {'ratio':>6}")
+    regressions = []
+    for name in sorted(set(old) & set(new)):
+        t_old = old[name]["stats"]["median"]
+        t_new = new[name]["stats"]["median"]
+        ratio = t_new / t_old if t_old > 0 else float("inf")
+        flag = ""
+        if ratio > 1 + args.threshold:
+            flag = "  SLOWER"
+            regressions.append(name)
+        elif ratio < 1 - args.threshold:
+            flag = "  faster"
+        print(f"{name:<{width}}  {t_old:10.4f}  {t_new:10.4f}  {ratio:6.2f}{flag}")
+
+    for name in sorted(set(old) ^ set(new)):
+        print(f"{name:<{width}}  only in {'old' if name in old else 'new'}")
+
+    if regressions:
+        print(f"\n{len(regressions)} benchmark(s) slower by more than "
+              f"{args.threshold:.0%}")
+        return 1
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("run", help="run the suite against one built module")
+    p.add_argument("module", help="compiled module name, e.g. CGALPY")
+    p.add_argument("--config", help="kernel config name for the results (default: module)")
+    p.add_argument("--sizes", default="default", help="smoke | default | full | n1,n2,...")
+    p.add_argument("--results", default=os.path.join(HERE, "results"))
+    p.add_argument("-k", dest="select", help="pytest -k expression")
+    p.set_defaults(func=run)
+
+    p = sub.add_parser("compare", help="compare two result files")
+    p.add_argument("old")
+    p.add_argument("new")
+    p.add_argument("--threshold", type=float, default=0.10,
+                   help="relative median change treated as a regression")
+    p.set_defaults(func=compare)
+
+    args = parser.parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
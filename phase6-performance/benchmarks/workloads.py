@@ -0,0 +1,188 @@
+"""Aos2 operations driven through the per-object Python API.
+
+The benchmark suite and the other Phase 6 tools share these. Every function
+takes a ``Cgalpy`` handle, so the same workload can run against any kernel
+config. The loader follows the Phase 4 test_runner.py convention: the
+compiled module is named on the command line (``CGALPY``, ``CGALPY_2``, ...),
+never hard-coded.
+"""
+import importlib
+import os
+import sys
+
+from generators import SPACING, grid_point, grid_side
+
+DEFAULT_BUILD_DIR = '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy'
+
+
+class Cgalpy:
+    """The Aos2 and Ker submodules of one built CGALPY config.
+
+    Parameters
+    ----------
+    module_name : str
+        Name of the compiled module, as passed to test_runner.py.
+    build_dir : str, optional
+        Directory containing the module. Defaults to ``$CGALPY_BUILD_DIR``,
+        then to the build path used by the Phase 2 test scripts.
+    """
+
+    def __init__(self, module_name="CGALPY", build_dir=None):
+        build_dir = build_dir or os.environ.get("CGALPY_BUILD_DIR", DEFAULT_BUILD_DIR)
+        if build_dir not in sys.path:
+            sys.path.insert(0, build_dir)
+        self.name = module_name
+        self.module = importlib.import_module(module_name)
+        self.aos2 = importlib.import_module(module_name + ".Aos2")
+        self.ker = importlib.import_module(module_name + ".Ker")
+        self.Arrangement_2 = self.aos2.Arrangement_2
+        self.Point_2 = self.ker.Point_2
+        self.Segment_2 = self.ker.Segment_2
+
+    def points(self, coords):
+        P = self.Point_2
+        return [P(x, y) for x, y in coords]
+
+    def segments(self, segs):
+        P, S = self.Point_2, self.Segment_2
+        return [S(P(x1, y1), P(x2, y2)) for x1, y1, x2, y2 in segs]
+
+
+class Grid_input:
+    """Pre-built Point_2 / Segment_2 objects for an m x m grid.
+
+    Building the wrappers is excluded from the timings of the specialized
+    insertion benchmarks, so those time the insertion calls alone.
+    """
+
+    def __init__(self, cg, n, spacing=SPACING):
+        m = grid_side(n)
+        P, S = cg.Point_2, cg.Segment_2
+        self.m = m
+        self.n_edges = 2 * m * (m - 1)
+        self.points = [[P(*grid_point(i, j, spacing)) for i in range(m)]
+                       for j in range(m)]
+        self.horizontal = [[S(row[i], row[i + 1]) for i in range(m - 1)]
+                           for row in self.points]
+        self.vertical = [[S(self.points[j][i], self.points[j + 1][i])
+                          for i in range(m)] for j in range(m - 1)]
+
+
+def rows_from_left(cg, g):
+    """Grid rows as chains: one insert_in_face_interior, then insert_from_left_vertex."""
+    arr = cg.Arrangement_2()
+    uf = arr.unbounded_face()
+    rows = []
+    for pts, segs in zip(g.points, g.horizontal):
+        v = arr.insert_in_face_interior(pts[0], uf)
+        row = [v]
+        for seg in segs:
+            v = arr.insert_from_left_vertex(seg, v).target()
+            row.append(v)
+        rows.append(row)
+    return arr, rows
+
+
+def rows_from_right(cg, g):
+    """Grid rows built right to left with insert_from_right_vertex."""
+    arr = cg.Arrangement_2()
+    uf = arr.unbounded_face()
+    rows = []
+    for pts, segs in zip(g.points, g.horizontal):
+        v = arr.insert_in_face_interior(pts[-1], uf)
+        row = [v]
+        for seg in reversed(segs):
+            v = arr.insert_from_right_vertex(seg, v).target()
+            row.append(v)
+        row.reverse()
+        rows.append(row)
+    return arr, rows
+
+
+def connect_rows(arr, g, rows):
+    """Close the grid with insert_at_vertices; every call after the first column splits a face."""
+    for j, segs in enumerate(g.vertical):
+        lower, upper = rows[j], rows[j + 1]
+        for i, seg in enumerate(segs):
+            arr.insert_at_vertices(seg, lower[i], upper[i])
+    return arr
+
+
+def insert_segments_in_face(cg, segs):
+    """Pairwise disjoint segments, each via insert_in_face_interior."""
+    arr = cg.Arrangement_2()
+    uf = arr.unbounded_face()
+    for s in segs:
+        arr.insert_in_face_interior(s, uf)
+    return arr
+
+
+def insert_points_in_face(cg, pts):
+    arr = cg.Arrangement_2()
+    uf = arr.unbounded_face()
+    for p in pts:
+        arr.insert_in_face_interior(p, uf)
+    return arr
+
+
+def insert_general(cg, segs):
+    """Aggregated CGAL::insert (sweep); handles crossings."""
+    arr = cg.Arrangement_2()
+    cg.aos2.insert(arr, segs)
+    return arr
+
+
+def insert_non_intersecting(cg, segs):
+    """One insert_non_intersecting_curve per segment (point location each time)."""
+    arr = cg.Arrangement_2()
+    for s in segs:
+        cg.aos2.insert_non_intersecting_curve(arr, s)
+    return arr
+
+
+def remove_all_edges(arr):
+    for he in list(arr.edges()):
+        arr.remove_edge(he)
+
+
+def remove_isolated_vertices(arr):
+    for v in list(arr.vertices()):
+        arr.remove_isolated_vertex(v)
+
+
+def traverse(arr, kind):
+    """Touch every record once, the way per-object export scripts do."""
+    if kind == "vertices":
+        for v in arr.vertices():
+            v.point()
+    elif kind == "halfedges":
+        for h in arr.halfedges():
+            h.source()
+    elif kind == "faces":
+        for f in arr.faces():
+            f.is_unbounded()
+    else:
+        raise ValueError(f"unknown traversal kind {kind!r}")
+
+
+POINT_LOCATION = {
+    "naive": "Arr_naive_point_location",
+    "walk": "Arr_walk_along_line_point_location",
+    "trapezoid": "Arr_trapezoid_ric_point_location",
+    "landmarks": "Arr_landmarks_point_location",
+}
+
+
+def point_locator(cg, arr, strategy):
+    return getattr(cg.aos2, POINT_LOCATION[strategy])(arr)
+
+
+def locate_all(pl, pts):
+    for p in pts:
+        pl.locate(p)
+
+
+def copy(cg, arr):
+    out = cg.Arrangement_2()
+    out.assign(arr)
+    return out
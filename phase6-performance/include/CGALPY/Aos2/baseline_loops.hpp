@@ -0,0 +1,204 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_BASELINE_LOOPS_HPP
+#define CGALPY_AOS2_BASELINE_LOOPS_HPP
+
+#include <chrono>
+#include <cstddef>
+#include <functional>
+#include <map>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <CGAL/number_utils.h>
+
+namespace CGALPY {
+namespace overhead {
+
+/*! Keep `value` alive through the optimizer without storing it anywhere.
+ *
+ * Same trick as Google Benchmark's DoNotOptimize: an empty asm statement
+ * that claims to read the value and clobber memory, so neither the call
+ * producing it nor the loop around it can be removed or hoisted.
+ */
+template <typename T>
+inline void do_not_optimize(const T& value) {
+#if defined(__GNUC__) || defined(__clang__)
+  asm volatile("" : : "r,m"(value) : "memory");
+#else
+  static volatile const void* sink;
+  sink = &value;
+#endif
+}
+
+/*! The records one harness run works on, collected once.
+ *
+ * The Python harness builds the same lists (all vertices, all halfedges,
+ * bounded faces only, one Point_2 per vertex), so both sides loop over
+ * identical inputs. The free points and edges are for the edit methods:
+ * each loop body inserts one, edits it and removes it again.
+ */
+template <typename Arrangement>
+struct Records {
+  using Point = typename Arrangement::Point_2;
+  using X_monotone_curve = typename Arrangement::X_monotone_curve_2;
+
+  //! Segment p -> q, split at its midpoint into lower and upper.
+  struct Free_edge {
+    Point p, q;
+    X_monotone_curve c, lower, upper;
+  };
+
+  std::vector<typename Arrangement::Vertex_handle> vertices;
+  std::vector<typename Arrangement::Halfedge_handle> halfedges;
+  std::vector<typename Arrangement::Face_handle> faces;
+  std::vector<Point> points;
+  std::vector<Point> free_points;
+  std::vector<Free_edge> free_edges;
+
+  explicit Records(Arrangement& arr) {
+    for (auto it = arr.vertices_begin(); it != arr.vertices_end(); ++it) {
+      vertices.push_back(it);
+      points.push_back(it->point());
+    }
+    for (auto it = arr.halfedges_begin(); it != arr.halfedges_end(); ++it)
+      halfedges.push_back(it);
+    for (auto it = arr.faces_begin(); it != arr.faces_end(); ++it)
+      if (!it->is_unbounded()) faces.push_back(it);
+    // Far outside any benchmark workload, so they land in the unbounded face.
+    for (std::size_t i = 0; i < vertices.size(); ++i) {
+      const double x = -1e9 - double(i), y = -1e9;
+      free_points.emplace_back(x, y);
+      const Point p(x, y), q(x + 0.5, y + 1), m(x + 0.25, y + 0.5);
+      free_edges.push_back({p, q, X_monotone_curve(p, q), X_monotone_curve(p, m),
+                            X_monotone_curve(m, q)});
+    }
+  }
+};
+
+//! Calls `op` on every item, `repeats` times; nanoseconds per call.
+template <typename Items, typename Op>
+double ns_per_call(const Items& items, std::size_t repeats, Op op) {
+  if (items.empty())
+    throw std::invalid_argument("the arrangement has no records of this kind");
+  if (repeats == 0) throw std::invalid_argument("repeats must be positive");
+  const auto t0 = std::chrono::steady_clock::now();
+  for (std::size_t r = 0; r < repeats; ++r)
+    for (const auto& item : items) do_not_optimize(op(item));
+  const auto dt = std::chrono::steady_clock::now() - t0;
+  return double(std::chrono::duration_cast<std::chrono::nanoseconds>(dt).count()) /
+         double(repeats * items.size());
+}
+
+template <typename Arrangement>
+using Baseline = std::function<double(Arrangement&, const Records<Arrangement>&,
+                                      std::size_t)>;
+
+/*! C++ loops doing the work of one bound method each, keyed by the name the
+ *  Python harness reports.
+ *
+ * Handles and points returned by value are copied, as the binding does
+ * before wrapping them. Everything else the binding adds (dispatch, casting
+ * `self`, creating or looking up the Python wrapper) is what the harness
+ * measures as overhead.
+ */
+template <typename Arrangement>
+const std::map<std::string, Baseline<Arrangement>>& baselines() {
+  using R = Records<Arrangement>;
+  using Vh = typename Arrangement::Vertex_handle;
+  using Hh = typename Arrangement::Halfedge_handle;
+  using Fh = typename Arrangement::Face_handle;
+  using Point = typename Arrangement::Point_2;
+  using Free_edge = typename R::Free_edge;
+
+  static const std::map<std::string, Baseline<Arrangement>> table = {
+    {"Vertex.point", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.vertices, k, [](Vh v) { return Point(v->point()); }); }},
+    {"Vertex.degree", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.vertices, k, [](Vh v) { return v->degree(); }); }},
+    {"Vertex.is_isolated", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.vertices, k, [](Vh v) { return v->is_isolated(); }); }},
+    {"Halfedge.source", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.halfedges, k, [](Hh h) { return h->source(); }); }},
+    {"Halfedge.target", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.halfedges, k, [](Hh h) { return h->target(); }); }},
+    {"Halfedge.twin", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.halfedges, k, [](Hh h) { return h->twin(); }); }},
+    {"Halfedge.next", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.halfedges, k, [](Hh h) { return h->next(); }); }},
+    {"Halfedge.prev", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.halfedges, k, [](Hh h) { return h->prev(); }); }},
+    {"Halfedge.face", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.halfedges, k, [](Hh h) { return h->face(); }); }},
+    {"Halfedge.curve", [](Arrangement&, const R& r, std::size_t k) {
+       using Xcv = typename Arrangement::X_monotone_curve_2;
+       return ns_per_call(r.halfedges, k, [](Hh h) { return Xcv(h->curve()); }); }},
+    {"Face.is_unbounded", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.faces, k, [](Fh f) { return f->is_unbounded(); }); }},
+    {"Face.outer_ccb", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.faces, k, [](Fh f) { return f->outer_ccb(); }); }},
+    {"Face.number_of_inner_ccbs", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.faces, k, [](Fh f) { return f->number_of_inner_ccbs(); }); }},
+    {"Point_2.to_double", [](Arrangement&, const R& r, std::size_t k) {
+       return ns_per_call(r.points, k, [](const Point& p) {
+         return CGAL::to_double(p.x()) + CGAL::to_double(p.y()); }); }},
+    {"Arrangement_2.number_of_vertices", [](Arrangement& arr, const R& r, std::size_t k) {
+       return ns_per_call(r.vertices, k, [&arr](Vh) { return arr.number_of_vertices(); }); }},
+    {"Arrangement_2.unbounded_face", [](Arrangement& arr, const R& r, std::size_t k) {
+       return ns_per_call(r.vertices, k, [&arr](Vh) { return arr.unbounded_face(); }); }},
+    {"Arrangement_2.insert_in_face_interior+remove_isolated_vertex",
+     [](Arrangement& arr, const R& r, std::size_t k) {
+       Fh uf = arr.unbounded_face();
+       return ns_per_call(r.free_points, k, [&arr, uf](const Point& p) {
+         auto v = arr.insert_in_face_interior(p, uf);
+         arr.remove_isolated_vertex(v);
+         return 0; }); }},
+    // Edit methods, each in a loop body that leaves the arrangement as it
+    // found it; the name lists every call made.
+    {"Arrangement_2.insert_in_face_interior+modify_vertex+remove_isolated_vertex",
+     [](Arrangement& arr, const R& r, std::size_t k) {
+       Fh uf = arr.unbounded_face();
+       return ns_per_call(r.free_edges, k, [&arr, uf](const Free_edge& e) {
+         auto v = arr.modify_vertex(arr.insert_in_face_interior(e.p, uf), e.q);
+         arr.remove_isolated_vertex(v);
+         return 0; }); }},
+    {"Arrangement_2.insert_in_face_interior+remove_edge",
+     [](Arrangement& arr, const R& r, std::size_t k) {
+       Fh uf = arr.unbounded_face();
+       return ns_per_call(r.free_edges, k, [&arr, uf](const Free_edge& e) {
+         return arr.remove_edge(arr.insert_in_face_interior(e.c, uf)); }); }},
+    {"Arrangement_2.insert_in_face_interior+insert_from_left_vertex+remove_edge",
+     [](Arrangement& arr, const R& r, std::size_t k) {
+       Fh uf = arr.unbounded_face();
+       return ns_per_call(r.free_edges, k, [&arr, uf](const Free_edge& e) {
+         Vh v = arr.insert_in_face_interior(e.p, uf);
+         return arr.remove_edge(arr.insert_from_left_vertex(e.c, v)); }); }},
+    {"Arrangement_2.insert_in_face_interior+insert_from_right_vertex+remove_edge",
+     [](Arrangement& arr, const R& r, std::size_t k) {
+       Fh uf = arr.unbounded_face();
+       return ns_per_call(r.free_edges, k, [&arr, uf](const Free_edge& e) {
+         Vh v = arr.insert_in_face_interior(e.q, uf);
+         return arr.remove_edge(arr.insert_from_right_vertex(e.c, v)); }); }},
+    {"Arrangement_2.insert_in_face_interior+insert_at_vertices+remove_edge",
+     [](Arrangement& arr, const R& r, std::size_t k) {
+       Fh uf = arr.unbounded_face();
+       return ns_per_call(r.free_edges, k, [&arr, uf](const Free_edge& e) {
+         Vh v1 = arr.insert_in_face_interior(e.p, uf);
+         Vh v2 = arr.insert_in_face_interior(e.q, uf);
+         return arr.remove_edge(arr.insert_at_vertices(e.c, v1, v2)); }); }},
+    {"Arrangement_2.insert_in_face_interior+split_edge+merge_edge+remove_edge",
+     [](Arrangement& arr, const R& r, std::size_t k) {
+       Fh uf = arr.unbounded_face();
+       return ns_per_call(r.free_edges, k, [&arr, uf](const Free_edge& e) {
+         Hh h = arr.split_edge(arr.insert_in_face_interior(e.c, uf), e.lower, e.upper);
+         return arr.remove_edge(arr.merge_edge(h, h->next(), e.c)); }); }},
+  };
+  return table;
+}
+
+} // namespace overhead
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_BASELINE_LOOPS_HPP
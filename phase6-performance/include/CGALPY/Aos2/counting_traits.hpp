@@ -0,0 +1,62 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_COUNTING_TRAITS_HPP
+#define CGALPY_AOS2_COUNTING_TRAITS_HPP
+
+#include <utility>
+
+#include "CGALPY/stats.hpp"
+
+namespace CGALPY {
+
+//! Functor wrapper: count, then forward to the base traits' functor.
+template <typename Functor, stats::Counter C>
+class Counted_functor {
+public:
+  explicit Counted_functor(const Functor& f) : m_f(f) {}
+
+  template <typename... Args>
+  decltype(auto) operator()(Args&&... args) const {
+    stats::count(C);
+    return m_f(std::forward<Args>(args)...);
+  }
+
+private:
+  Functor m_f;
+};
+
+/*! Geometry-traits decorator that counts functor calls into CGALPY::stats.
+ *
+ * Same idea as CGAL::Arr_counting_traits_2, which we cannot use as is: its
+ * counters live in each traits object, are not atomic, and cannot be turned
+ * off. Here the counts go to the process-wide registry, attributed to the
+ * current Python-level operation, and cost one relaxed load while
+ * disabled. Only the functors below are wrapped. All others are inherited
+ * from Base untouched.
+ */
+template <typename Base>
+class Counting_traits_2 : public Base {
+public:
+  using Base::Base;
+
+#define CGALPY_COUNTED(TYPE, OBJECT, COUNTER)                              \
+  using TYPE = Counted_functor<typename Base::TYPE, stats::Counter::COUNTER>; \
+  TYPE OBJECT() const { return TYPE(Base::OBJECT()); }
+
+  CGALPY_COUNTED(Compare_x_2, compare_x_2_object, compare_x)
+  CGALPY_COUNTED(Compare_xy_2, compare_xy_2_object, compare_xy)
+  CGALPY_COUNTED(Compare_y_at_x_2, compare_y_at_x_2_object, compare_y_at_x)
+  CGALPY_COUNTED(Compare_y_at_x_left_2, compare_y_at_x_left_2_object, compare_y_at_x_left)
+  CGALPY_COUNTED(Compare_y_at_x_right_2, compare_y_at_x_right_2_object, compare_y_at_x_right)
+  CGALPY_COUNTED(Equal_2, equal_2_object, equal)
+  CGALPY_COUNTED(Intersect_2, intersect_2_object, intersect)
+  CGALPY_COUNTED(Split_2, split_2_object, split)
+  CGALPY_COUNTED(Make_x_monotone_2, make_x_monotone_2_object, make_x_monotone)
+
+#undef CGALPY_COUNTED
+};
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_COUNTING_TRAITS_HPP
@@ -0,0 +1,97 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_CURVE_HISTORY_HPP
+#define CGALPY_AOS2_CURVE_HISTORY_HPP
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <initializer_list>
+#include <unordered_map>
+#include <vector>
+
+#include <CGAL/enum.h>
+
+#include "CGALPY/Aos2/index_lookup.hpp"
+
+namespace CGALPY {
+
+/*! Both directions of the curve history of an arrangement, as CSR.
+ *
+ * curve i (position in curves() order) induced the edges
+ *   curve_halfedges[curve_offsets[i] : curve_offsets[i+1]]
+ * (one left-to-right halfedge id per edge), and halfedge h originates from
+ *   halfedge_curves[halfedge_offsets[h] : halfedge_offsets[h+1]]
+ * (curve positions, ascending). Both halfedges of an edge list the same
+ * curves, so the second CSR can be indexed with any halfedge id.
+ */
+struct Curve_history {
+  std::vector<std::int64_t> curve_offsets{0};
+  std::vector<std::int64_t> curve_halfedges;
+  std::vector<std::int64_t> halfedge_offsets;
+  std::vector<std::int64_t> halfedge_curves;
+};
+
+/*! Read the history of an Arrangement_on_surface_with_history_2 in two passes.
+ *
+ * Only reads the arrangement. The halfedge-side CSR is indexed by
+ * Index_lookup ids, which are dense in [0, H) both with and without handle
+ * ids enabled, so halfedge_offsets always has H + 1 entries.
+ */
+template <typename Arrangement>
+Curve_history curve_history(const Arrangement& arr,
+                            const Index_lookup<Arrangement>& ids) {
+  using Halfedge_const_handle = typename Arrangement::Halfedge_const_handle;
+
+  Curve_history h;
+  const std::size_t n_curves = arr.number_of_curves();
+  const std::size_t n_halfedges = arr.number_of_halfedges();
+
+  // Pass 1: curve -> induced edges; remember each curve's position.
+  std::unordered_map<const void*, std::int64_t> curve_pos;
+  curve_pos.reserve(n_curves);
+  h.curve_offsets.reserve(n_curves + 1);
+  h.curve_halfedges.reserve(arr.number_of_edges());
+  std::int64_t pos = 0;
+  for (auto cit = arr.curves_begin(); cit != arr.curves_end(); ++cit, ++pos) {
+    curve_pos.emplace(&*cit, pos);
+    for (auto eit = arr.induced_edges_begin(cit);
+         eit != arr.induced_edges_end(cit); ++eit) {
+      Halfedge_const_handle e = *eit;
+      if (e->direction() != CGAL::ARR_LEFT_TO_RIGHT) e = e->twin();
+      h.curve_halfedges.push_back(ids(*e));
+    }
+    h.curve_offsets.push_back(static_cast<std::int64_t>(h.curve_halfedges.size()));
+  }
+
+  // Pass 2: count originating curves per halfedge id, then fill.
+  h.halfedge_offsets.assign(n_halfedges + 1, 0);
+  for (auto eit = arr.edges_begin(); eit != arr.edges_end(); ++eit) {
+    Halfedge_const_handle e = eit;
+    const auto k = static_cast<std::int64_t>(arr.number_of_originating_curves(e));
+    h.halfedge_offsets[ids(*e) + 1] = k;
+    h.halfedge_offsets[ids(*e->twin()) + 1] = k;
+  }
+  for (std::size_t i = 0; i < n_halfedges; ++i)
+    h.halfedge_offsets[i + 1] += h.halfedge_offsets[i];
+
+  h.halfedge_curves.resize(h.halfedge_offsets.back());
+  std::vector<std::int64_t> scratch;
+  for (auto eit = arr.edges_begin(); eit != arr.edges_end(); ++eit) {
+    Halfedge_const_handle e = eit;
+    scratch.clear();
+    for (auto oit = arr.originating_curves_begin(e);
+         oit != arr.originating_curves_end(e); ++oit)
+      scratch.push_back(curve_pos.at(&*oit));
+    std::sort(scratch.begin(), scratch.end());
+    for (const Halfedge_const_handle he : { e, e->twin() })
+      std::copy(scratch.begin(), scratch.end(),
+                h.halfedge_curves.begin() + h.halfedge_offsets[ids(*he)]);
+  }
+  return h;
+}
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_CURVE_HISTORY_HPP
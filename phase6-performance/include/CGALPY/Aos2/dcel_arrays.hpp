@@ -0,0 +1,459 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_DCEL_ARRAYS_HPP
+#define CGALPY_AOS2_DCEL_ARRAYS_HPP
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <numeric>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <CGAL/enum.h>
+#include <CGAL/number_utils.h>
+#include <CGAL/Exact_predicates_inexact_constructions_kernel.h>
+#include <CGAL/Arr_enums.h>
+#include <CGAL/Arrangement_2/Arr_accessor.h>
+
+#include "CGALPY/Aos2/index_lookup.hpp"
+
+namespace CGALPY {
+
+/*! The DCEL of a bounded planar arrangement of segments, as flat arrays.
+ *
+ * Vertex v is row v of `points` (x, y rounded to double). Halfedges come in
+ * twin pairs: 2k is the left-to-right halfedge of edge k and 2k + 1 its
+ * twin; `halfedge_target` and `halfedge_next` complete the incidences.
+ * Every CCB is given by one of its halfedges and the face row it bounds,
+ * and isolated vertices by (vertex, face) rows. Vertex and face rows, and
+ * the `*_ids` arrays, follow Index_lookup ids of the source arrangement.
+ */
+struct Dcel_arrays {
+  std::vector<double> points;                   // 2V
+  std::vector<std::int64_t> halfedge_target;    // H
+  std::vector<std::int64_t> halfedge_next;      // H
+  std::vector<std::int64_t> halfedge_ids;       // H, source halfedge ids
+  std::vector<std::uint8_t> face_is_unbounded;  // F
+  std::vector<std::int64_t> ccb_face;           // C
+  std::vector<std::int64_t> ccb_halfedge;       // C
+  std::vector<std::uint8_t> ccb_is_inner;       // C
+  std::vector<std::int64_t> isolated_vertices;  // I
+  std::vector<std::int64_t> isolated_face;      // I
+  // Damage done by rounding (find_rounding_damage()):
+  std::vector<std::int64_t> degenerate_edges;   // edges k whose ends meet
+  std::vector<std::int64_t> coincident_vertices; // (v, w) pairs
+  std::vector<std::int64_t> reoriented_edges;   // direction or verticality changed
+  std::vector<std::int64_t> misordered_vertices; // incident edges out of order
+};
+
+namespace dcel_detail {
+
+/*! Pairs of distinct vertex rows whose points are equal.
+ *
+ * Used on the rounded points; sorting makes it O(V log V). Rows joined by
+ * an edge are included too; the edge is reported separately.
+ */
+inline std::vector<std::int64_t> coincident_points(const std::vector<double>& xy) {
+  const std::size_t n = xy.size() / 2;
+  std::vector<std::int64_t> order(n);
+  std::iota(order.begin(), order.end(), std::int64_t(0));
+  auto less = [&xy](std::int64_t a, std::int64_t b) {
+    return xy[2 * a] < xy[2 * b] ||
+           (xy[2 * a] == xy[2 * b] && (xy[2 * a + 1] < xy[2 * b + 1] ||
+                                       (xy[2 * a + 1] == xy[2 * b + 1] && a < b)));
+  };
+  std::sort(order.begin(), order.end(), less);
+  std::vector<std::int64_t> pairs;
+  for (std::size_t i = 0; i < n; ) {
+    std::size_t j = i + 1;
+    while (j < n && xy[2 * order[j]] == xy[2 * order[i]] &&
+           xy[2 * order[j] + 1] == xy[2 * order[i] + 1])
+      ++j;
+    for (std::size_t k = i + 1; k < j; ++k) {
+      pairs.push_back(order[i]);
+      pairs.push_back(order[k]);
+    }
+    i = j;
+  }
+  return pairs;
+}
+
+/*! Vertices whose incident edges, in `halfedge_next` order, are not in
+ *  strictly clockwise order around them in the rounded geometry.
+ *
+ * Around a vertex the incoming halfedges are h, next(h) ^ 1, ... (the way
+ * CGAL circulates a vertex, clockwise). That rotation was read from the
+ * exact arrangement, so the directions to the sources must still follow
+ * it; two edges leaving in the same direction now overlap and count too.
+ * Orientation is exact: Epick's filtered predicates on the double points.
+ * Out-of-range indices are left to check_dcel().
+ */
+inline std::vector<std::int64_t> misordered_vertices(const Dcel_arrays& d) {
+  using Point = CGAL::Epick::Point_2;
+  const std::size_t nv = d.points.size() / 2;
+  const std::size_t nh = d.halfedge_target.size();
+  std::vector<std::int64_t> bad;
+  if (nh % 2 != 0 || d.halfedge_next.size() != nh) return bad;
+  for (std::size_t h = 0; h < nh; ++h)
+    if (d.halfedge_target[h] < 0 || static_cast<std::size_t>(d.halfedge_target[h]) >= nv ||
+        d.halfedge_next[h] < 0 || static_cast<std::size_t>(d.halfedge_next[h]) >= nh)
+      return bad;
+
+  auto point = [&d](std::int64_t v) { return Point(d.points[2 * v], d.points[2 * v + 1]); };
+  std::vector<char> seen(nh, 0);
+  std::vector<Point> around;
+  for (std::size_t start = 0; start < nh; ++start) {
+    if (seen[start]) continue;
+    const std::int64_t v = d.halfedge_target[start];
+    const Point c = point(v);
+    around.clear();
+    for (std::int64_t h = static_cast<std::int64_t>(start);
+         ! seen[h] && d.halfedge_target[h] == v; h = d.halfedge_next[h] ^ 1) {
+      seen[h] = 1;
+      around.push_back(point(d.halfedge_target[h ^ 1]));
+    }
+    if (around.size() < 2) continue;
+
+    // Angles in [0, 2pi): the upper half-plane (and the +x ray) first,
+    // then by orientation within a half.
+    auto half = [&c](const Point& p) {
+      return (p.y() > c.y() || (p.y() == c.y() && p.x() > c.x())) ? 0 : 1;
+    };
+    auto compare_angle = [&](const Point& p, const Point& q) {
+      const int hp = half(p), hq = half(q);
+      if (hp != hq) return hp < hq ? CGAL::SMALLER : CGAL::LARGER;
+      switch (CGAL::orientation(c, p, q)) {
+        case CGAL::LEFT_TURN: return CGAL::SMALLER;
+        case CGAL::RIGHT_TURN: return CGAL::LARGER;
+        default: return CGAL::EQUAL;
+      }
+    };
+    // Clockwise: the angle drops at every step but the one that wraps.
+    std::size_t rises = 0;
+    bool tie = false;
+    for (std::size_t i = 0; i < around.size(); ++i) {
+      const auto r = compare_angle(around[i], around[(i + 1) % around.size()]);
+      if (r == CGAL::EQUAL) tie = true;
+      else if (r == CGAL::SMALLER) ++rises;
+    }
+    if (tie || rises != 1) bad.push_back(v);
+  }
+  std::sort(bad.begin(), bad.end());
+  bad.erase(std::unique(bad.begin(), bad.end()), bad.end());
+  return bad;
+}
+
+} // namespace dcel_detail
+
+/*! Fill the rounding-damage lists from points, targets and next pointers.
+ *
+ * Rounding is monotone in each coordinate but not in xy-lexicographic
+ * order: once two x values round to the same double, y decides. So beyond
+ * making points equal it can turn an edge vertical or reverse it, and
+ * change the circular order of the edges around a vertex. Reported are
+ * edges of zero length (degenerate_edges), equal points
+ * (coincident_vertices), edges whose halfedge 2k no longer runs left to
+ * right or whose verticality differs from `exact_vertical`
+ * (reoriented_edges; one flag per edge from the exact geometry, empty when
+ * there is none as on import), and misordered_vertices. Edges that come to
+ * cross other edges away from their ends are not detected; that needs a
+ * sweep.
+ */
+inline void find_rounding_damage(Dcel_arrays& d,
+                                 const std::vector<std::uint8_t>& exact_vertical = {}) {
+  const auto nv = static_cast<std::int64_t>(d.points.size() / 2);
+  d.degenerate_edges.clear();
+  d.reoriented_edges.clear();
+  for (std::size_t e = 0; 2 * e + 1 < d.halfedge_target.size(); ++e) {
+    const std::int64_t s = d.halfedge_target[2 * e + 1], t = d.halfedge_target[2 * e];
+    if (s < 0 || t < 0 || s >= nv || t >= nv) continue;   // check_dcel() rejects
+    const double sx = d.points[2 * s], sy = d.points[2 * s + 1];
+    const double tx = d.points[2 * t], ty = d.points[2 * t + 1];
+    if (sx == tx && sy == ty)
+      d.degenerate_edges.push_back(static_cast<std::int64_t>(e));
+    else if (sx > tx || (sx == tx && sy > ty) ||
+             (e < exact_vertical.size() && (exact_vertical[e] != 0) != (sx == tx)))
+      d.reoriented_edges.push_back(static_cast<std::int64_t>(e));
+  }
+  d.coincident_vertices = dcel_detail::coincident_points(d.points);
+  d.misordered_vertices = dcel_detail::misordered_vertices(d);
+}
+
+/*! Read the DCEL of `arr` into arrays, rounding points to double.
+ *
+ * Only reads the arrangement. Requires a bounded planar arrangement (no
+ * vertex at infinity); that is what segment configs build.
+ */
+template <typename Arrangement>
+Dcel_arrays export_dcel(const Arrangement& arr, const Index_lookup<Arrangement>& ids) {
+  using Halfedge = typename Arrangement::Halfedge;
+
+  Dcel_arrays d;
+  const std::size_t nv = arr.number_of_vertices();
+  const std::size_t nh = arr.number_of_halfedges();
+  const std::size_t nf = arr.number_of_faces();
+
+  d.points.resize(2 * nv);
+  for (auto vit = arr.vertices_begin(); vit != arr.vertices_end(); ++vit) {
+    if (vit->parameter_space_in_x() != CGAL::ARR_INTERIOR ||
+        vit->parameter_space_in_y() != CGAL::ARR_INTERIOR)
+      throw std::invalid_argument("dcel arrays need a bounded arrangement; "
+                                  "this one has vertices at infinity");
+    const std::int64_t v = ids(*vit);
+    d.points[2 * v] = CGAL::to_double(vit->point().x());
+    d.points[2 * v + 1] = CGAL::to_double(vit->point().y());
+  }
+
+  // Our halfedge numbering: source id -> pair position.
+  std::vector<std::int64_t> row(nh);
+  d.halfedge_ids.resize(nh);
+  std::int64_t k = 0;
+  for (auto eit = arr.edges_begin(); eit != arr.edges_end(); ++eit, ++k) {
+    const Halfedge* e = &*eit;
+    if (e->direction() != CGAL::ARR_LEFT_TO_RIGHT) e = &*e->twin();
+    const std::int64_t a = ids(*e), b = ids(*e->twin());
+    row[a] = 2 * k;
+    row[b] = 2 * k + 1;
+    d.halfedge_ids[2 * k] = a;
+    d.halfedge_ids[2 * k + 1] = b;
+  }
+
+  d.halfedge_target.resize(nh);
+  d.halfedge_next.resize(nh);
+  for (auto hit = arr.halfedges_begin(); hit != arr.halfedges_end(); ++hit) {
+    const std::int64_t h = row[ids(*hit)];
+    d.halfedge_target[h] = ids(*hit->target());
+    d.halfedge_next[h] = row[ids(*hit->next())];
+  }
+  std::vector<std::uint8_t> vertical(nh / 2);
+  k = 0;
+  for (auto eit = arr.edges_begin(); eit != arr.edges_end(); ++eit, ++k)
+    vertical[k] = CGAL::compare(eit->source()->point().x(),
+                                eit->target()->point().x()) == CGAL::EQUAL;
+  find_rounding_damage(d, vertical);
+
+  d.face_is_unbounded.resize(nf);
+  for (auto fit = arr.faces_begin(); fit != arr.faces_end(); ++fit) {
+    const std::int64_t f = ids(*fit);
+    d.face_is_unbounded[f] = fit->is_unbounded() ? 1 : 0;
+    for (auto it = fit->outer_ccbs_begin(); it != fit->outer_ccbs_end(); ++it) {
+      d.ccb_face.push_back(f);
+      d.ccb_halfedge.push_back(row[ids(**it)]);
+      d.ccb_is_inner.push_back(0);
+    }
+    for (auto it = fit->inner_ccbs_begin(); it != fit->inner_ccbs_end(); ++it) {
+      d.ccb_face.push_back(f);
+      d.ccb_halfedge.push_back(row[ids(**it)]);
+      d.ccb_is_inner.push_back(1);
+    }
+    for (auto it = fit->isolated_vertices_begin(); it != fit->isolated_vertices_end(); ++it) {
+      d.isolated_vertices.push_back(ids(*it));
+      d.isolated_face.push_back(f);
+    }
+  }
+  return d;
+}
+
+/*! Check that arrays describe a consistent DCEL before anything is built.
+ *
+ * Index ranges, twin pairing (next(h) starts where h ends), every halfedge
+ * on exactly one listed CCB and so on the boundary of exactly one face,
+ * one outer CCB per bounded face and none on the unbounded face, every
+ * vertex either incident to an edge or isolated exactly once, exactly one
+ * unbounded face, and no rounding damage of any kind (run
+ * find_rounding_damage() first).
+ */
+inline void check_dcel(const Dcel_arrays& d) {
+  auto fail = [](const std::string& what) {
+    throw std::invalid_argument("invalid dcel arrays: " + what);
+  };
+  const std::size_t nv = d.points.size() / 2;
+  const std::size_t nh = d.halfedge_target.size();
+  const std::size_t nf = d.face_is_unbounded.size();
+  auto in = [](std::int64_t i, std::size_t n) {
+    return i >= 0 && static_cast<std::size_t>(i) < n;
+  };
+
+  if (nh % 2 != 0) fail("odd number of halfedges");
+  if (d.halfedge_next.size() != nh) fail("halfedge_next has the wrong length");
+  if (d.ccb_face.size() != d.ccb_halfedge.size() ||
+      d.ccb_is_inner.size() != d.ccb_halfedge.size())
+    fail("ccb_face, ccb_halfedge and ccb_is_inner differ in length");
+  if (d.isolated_face.size() != d.isolated_vertices.size())
+    fail("isolated_vertices and isolated_face differ in length");
+  if (std::count(d.face_is_unbounded.begin(), d.face_is_unbounded.end(), 1) != 1)
+    fail("expected exactly one unbounded face");
+  if (! d.degenerate_edges.empty())
+    fail(std::to_string(d.degenerate_edges.size()) + " edge(s) have zero length "
+         "after rounding, e.g. edge " + std::to_string(d.degenerate_edges[0]));
+  if (! d.coincident_vertices.empty())
+    fail(std::to_string(d.coincident_vertices.size() / 2) + " pair(s) of vertices "
+         "coincide after rounding, e.g. vertices " +
+         std::to_string(d.coincident_vertices[0]) + " and " +
+         std::to_string(d.coincident_vertices[1]));
+  if (! d.reoriented_edges.empty())
+    fail(std::to_string(d.reoriented_edges.size()) + " edge(s) changed direction or "
+         "verticality after rounding, e.g. edge " +
+         std::to_string(d.reoriented_edges[0]));
+  if (! d.misordered_vertices.empty())
+    fail(std::to_string(d.misordered_vertices.size()) + " vertex(es) have their edges "
+         "out of order after rounding, e.g. vertex " +
+         std::to_string(d.misordered_vertices[0]));
+
+  std::vector<char> has_edge(nv, 0);
+  for (std::size_t h = 0; h < nh; ++h) {
+    if (! in(d.halfedge_target[h], nv)) fail("halfedge_target out of range");
+    if (! in(d.halfedge_next[h], nh)) fail("halfedge_next out of range");
+    has_edge[d.halfedge_target[h]] = 1;
+  }
+  for (std::size_t h = 0; h < nh; ++h) {
+    const std::int64_t next = d.halfedge_next[h];
+    if (d.halfedge_target[next ^ 1] != d.halfedge_target[h])
+      fail("halfedge " + std::to_string(h) + " and its next do not meet");
+  }
+
+  // Walk every cycle, recording which ccb (and so which face) each halfedge
+  // bounds. A halfedge reached twice means two rows share a cycle, or the
+  // next pointers leave the cycle of the listed halfedge.
+  std::vector<std::int64_t> halfedge_ccb(nh, -1);
+  std::vector<std::size_t> outer_ccbs(nf, 0);
+  for (std::size_t c = 0; c < d.ccb_halfedge.size(); ++c) {
+    const std::int64_t f = d.ccb_face[c];
+    if (! in(f, nf) || ! in(d.ccb_halfedge[c], nh)) fail("ccb index out of range");
+    if (! d.ccb_is_inner[c]) ++outer_ccbs[f];
+    std::int64_t h = d.ccb_halfedge[c];
+    do {
+      const std::int64_t other = halfedge_ccb[h];
+      if (other >= 0) {
+        const std::int64_t g = d.ccb_face[other];
+        if (g != f)
+          fail("halfedge " + std::to_string(h) + " lies on the boundary of faces " +
+               std::to_string(g) + " and " + std::to_string(f));
+        fail("halfedge " + std::to_string(h) + " is on ccbs " +
+             std::to_string(other) + " and " + std::to_string(c));
+      }
+      halfedge_ccb[h] = static_cast<std::int64_t>(c);
+      h = d.halfedge_next[h];
+    } while (h != d.ccb_halfedge[c]);
+  }
+  if (std::count(halfedge_ccb.begin(), halfedge_ccb.end(), -1) != 0)
+    fail("some halfedges are on no listed ccb");
+  for (std::size_t f = 0; f < nf; ++f) {
+    const std::size_t want = d.face_is_unbounded[f] ? 0 : 1;
+    if (outer_ccbs[f] != want)
+      fail((d.face_is_unbounded[f] ? "unbounded face " : "bounded face ") +
+           std::to_string(f) + " has " + std::to_string(outer_ccbs[f]) +
+           " outer ccb(s), expected " + std::to_string(want));
+  }
+
+  for (std::size_t i = 0; i < d.isolated_vertices.size(); ++i) {
+    const std::int64_t v = d.isolated_vertices[i];
+    if (! in(v, nv) || ! in(d.isolated_face[i], nf)) fail("isolated index out of range");
+    if (has_edge[v]) fail("vertex " + std::to_string(v) + " is isolated and has edges");
+    has_edge[v] = 1;
+  }
+  if (std::count(has_edge.begin(), has_edge.end(), 1) != static_cast<std::ptrdiff_t>(nv))
+    fail("some vertices have no edge and are not isolated");
+}
+
+/*! Rebuild `arr` from arrays, mapping the DCEL record for record.
+ *
+ * No sweep and no geometric test: this is what CGAL's Arrangement_2_reader
+ * does with a file, fed from arrays instead. Segments are created between
+ * the points of their end vertices. `arr` is cleared first and must not be
+ * observed by point-location objects. Call check_dcel() first.
+ */
+template <typename Arrangement>
+void import_dcel(Arrangement& arr, const Dcel_arrays& d) {
+  using Traits = typename Arrangement::Geometry_traits_2;
+  using Point = typename Traits::Point_2;
+  using X_monotone_curve = typename Traits::X_monotone_curve_2;
+  using Accessor = CGAL::Arr_accessor<Arrangement>;
+  using DVertex = typename Accessor::Dcel_vertex;
+  using DHalfedge = typename Accessor::Dcel_halfedge;
+  using DFace = typename Accessor::Dcel_face;
+  using DOuter_ccb = typename Accessor::Dcel_outer_ccb;
+  using DInner_ccb = typename Accessor::Dcel_inner_ccb;
+  using DIso_vert = typename Accessor::Dcel_isolated_vertex;
+
+  const std::size_t nv = d.points.size() / 2;
+  const std::size_t nh = d.halfedge_target.size();
+  const std::size_t nf = d.face_is_unbounded.size();
+
+  Accessor acc(arr);
+  acc.clear_all();
+
+  std::vector<DVertex*> vertices(nv);
+  std::vector<Point> points;
+  points.reserve(nv);
+  for (std::size_t v = 0; v < nv; ++v) {
+    points.emplace_back(d.points[2 * v], d.points[2 * v + 1]);
+    vertices[v] = acc.new_vertex(&points.back(), CGAL::ARR_INTERIOR, CGAL::ARR_INTERIOR);
+  }
+
+  std::vector<DHalfedge*> halfedges(nh);
+  for (std::size_t e = 0; 2 * e < nh; ++e) {
+    DVertex* trg = vertices[d.halfedge_target[2 * e]];
+    DVertex* src = vertices[d.halfedge_target[2 * e + 1]];
+    const Point& p = points[d.halfedge_target[2 * e + 1]];
+    const Point& q = points[d.halfedge_target[2 * e]];
+    const X_monotone_curve cv(p, q);
+    DHalfedge* he = acc.new_edge(&cv);
+    trg->set_halfedge(he);
+    he->set_vertex(trg);
+    src->set_halfedge(he->opposite());
+    he->opposite()->set_vertex(src);
+    // Left to right: check_dcel() rejected reversed and degenerate edges.
+    he->set_direction(CGAL::compare_xy(p, q) == CGAL::SMALLER ?
+                      CGAL::ARR_LEFT_TO_RIGHT : CGAL::ARR_RIGHT_TO_LEFT);
+    halfedges[2 * e] = he;
+    halfedges[2 * e + 1] = he->opposite();
+  }
+
+  std::vector<DFace*> faces(nf);
+  for (std::size_t f = 0; f < nf; ++f) {
+    faces[f] = acc.new_face();
+    faces[f]->set_unbounded(d.face_is_unbounded[f]);
+    faces[f]->set_fictitious(false);
+  }
+
+  for (std::size_t c = 0; c < d.ccb_halfedge.size(); ++c) {
+    DFace* f = faces[d.ccb_face[c]];
+    DHalfedge* first = halfedges[d.ccb_halfedge[c]];
+    DOuter_ccb* occb = nullptr;
+    DInner_ccb* iccb = nullptr;
+    if (d.ccb_is_inner[c]) { iccb = acc.new_inner_ccb(); iccb->set_face(f); }
+    else { occb = acc.new_outer_ccb(); occb->set_face(f); }
+    // Link the cycle in traversal order; set_next() also sets prev.
+    std::int64_t h = d.ccb_halfedge[c];
+    do {
+      DHalfedge* cur = halfedges[h];
+      if (iccb) cur->set_inner_ccb(iccb);
+      else cur->set_outer_ccb(occb);
+      const std::int64_t n = d.halfedge_next[h];
+      cur->set_next(halfedges[n]);
+      h = n;
+    } while (h != d.ccb_halfedge[c]);
+    if (iccb) f->add_inner_ccb(iccb, first);
+    else f->add_outer_ccb(occb, first);
+  }
+
+  for (std::size_t i = 0; i < d.isolated_vertices.size(); ++i) {
+    DFace* f = faces[d.isolated_face[i]];
+    DVertex* v = vertices[d.isolated_vertices[i]];
+    DIso_vert* iv = acc.new_isolated_vertex();
+    iv->set_face(f);
+    v->set_isolated_vertex(iv);
+    f->add_isolated_vertex(iv, v);
+  }
+
+  // Lets the topology traits find the new unbounded face.
+  acc.dcel_updated();
+}
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_DCEL_ARRAYS_HPP
@@ -0,0 +1,328 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_EDGE_INDEX_HPP
+#define CGALPY_AOS2_EDGE_INDEX_HPP
+
+#include <algorithm>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <mutex>
+#include <shared_mutex>
+#include <unordered_map>
+#include <utility>
+#include <vector>
+
+#include <CGAL/Arr_observer.h>
+#include <CGAL/number_utils.h>
+
+#include "CGALPY/packed_rtree.hpp"
+#include "CGALPY/parallel_chunks.hpp"
+
+namespace CGALPY {
+
+/*! Nearest-edge and box queries over the edges of a segment arrangement.
+ *
+ * Each edge is stored once, as its left-to-right halfedge, with its end
+ * points rounded to double. Edges live in slots: slots [0, m_tree_items)
+ * are covered by a Packed_rtree, later slots form a small unindexed delta
+ * that queries scan linearly. The class is an arrangement observer, so
+ * every edit costs O(1): new edges are appended to the delta, removed ones
+ * are tombstoned. refresh() repacks the tree only once the delta or the
+ * tombstones grow past a threshold, which keeps both the per-query scan and
+ * the amortized rebuild cost per edit small.
+ *
+ * Edits take a unique lock, queries a shared one, so queries can run on
+ * worker threads with the GIL released while another thread edits.
+ */
+template <typename Arrangement>
+class Edge_index : public CGAL::Arr_observer<Arrangement> {
+  using Base = CGAL::Arr_observer<Arrangement>;
+
+public:
+  using Halfedge = typename Arrangement::Halfedge;
+  using Vertex_handle = typename Arrangement::Vertex_handle;
+  using Halfedge_handle = typename Arrangement::Halfedge_handle;
+  using X_monotone_curve_2 = typename Arrangement::X_monotone_curve_2;
+
+  //! Unindexed edges tolerated before refresh() repacks: max(this, live / 256).
+  static constexpr std::size_t min_delta = 256;
+
+  explicit Edge_index(Arrangement& arr) : Base(arr), m_arr(&arr) { reset(); }
+
+  const Arrangement* arrangement() const { return m_arr; }
+
+  std::size_t size() const {
+    std::shared_lock<std::shared_mutex> lock(m_mutex);
+    return m_live;
+  }
+
+  //! Repack if the delta or the tombstones are too large (or if forced).
+  void refresh(bool force = false) {
+    std::unique_lock<std::shared_mutex> lock(m_mutex);
+    const std::size_t delta = m_items.size() - m_tree_items;
+    if (force || delta > std::max(min_delta, m_live / 256) || 4 * m_dead > m_live)
+      rebuild();
+  }
+
+  /*! k nearest edges of each point.
+   *
+   * out_he[i*k + j] / out_dist[i*k + j] is the j-th nearest edge of point i
+   * and its Euclidean distance; rows with fewer than k edges are padded with
+   * nullptr / +inf. out_xy, if not null, receives the closest point on each
+   * edge (NaN when padded).
+   */
+  void nearest(const double* xy, std::size_t n, std::size_t k,
+               std::size_t num_threads, const Halfedge** out_he,
+               double* out_dist, double* out_xy) const {
+    std::shared_lock<std::shared_mutex> lock(m_mutex);
+    parallel_for_chunks(n, num_threads, [&](std::size_t begin, std::size_t end) {
+      std::vector<std::pair<double, std::size_t>> best;
+      for (std::size_t i = begin; i < end; ++i)
+        nearest_one(xy[2 * i], xy[2 * i + 1], k, best, out_he + i * k,
+                    out_dist + i * k, out_xy ? out_xy + 2 * i * k : nullptr);
+    }, 256);
+  }
+
+  /*! Edges meeting each box (xmin, ymin, xmax, ymax), as CSR.
+   *
+   * The segments themselves are clipped against the box, so an edge whose
+   * bounding box overlaps the query but which passes by it is not reported.
+   */
+  void in_boxes(const double* boxes, std::size_t m, std::size_t num_threads,
+                std::vector<std::int64_t>& offsets,
+                std::vector<const Halfedge*>& out) const {
+    std::shared_lock<std::shared_mutex> lock(m_mutex);
+    std::vector<std::size_t> counts(m);
+    std::vector<std::pair<std::size_t, std::vector<const Halfedge*>>> parts;
+    std::mutex parts_mutex;
+    parallel_for_chunks(m, num_threads, [&](std::size_t begin, std::size_t end) {
+      std::vector<const Halfedge*> local;
+      for (std::size_t i = begin; i < end; ++i) {
+        const double* b = boxes + 4 * i;
+        const Box2 q{ b[0], b[1], b[2], b[3] };
+        const std::size_t before = local.size();
+        auto test = [&](std::size_t slot) {
+          const Item& it = m_items[slot];
+          if (it.he != nullptr && it.box.intersects(q) && segment_meets_box(it, q))
+            local.push_back(it.he);
+        };
+        m_tree.search(q, test);
+        for (std::size_t s = m_tree_items; s < m_items.size(); ++s) test(s);
+        counts[i] = local.size() - before;
+      }
+      std::lock_guard<std::mutex> guard(parts_mutex);
+      parts.emplace_back(begin, std::move(local));
+    }, 256);
+
+    std::sort(parts.begin(), parts.end(),
+              [](const auto& a, const auto& b) { return a.first < b.first; });
+    offsets.assign(1, 0);
+    offsets.reserve(m + 1);
+    for (std::size_t c : counts)
+      offsets.push_back(offsets.back() + static_cast<std::int64_t>(c));
+    out.clear();
+    out.reserve(static_cast<std::size_t>(offsets.back()));
+    for (auto& p : parts) out.insert(out.end(), p.second.begin(), p.second.end());
+  }
+
+  // -- observer ---------------------------------------------------------------
+
+  void after_create_edge(Halfedge_handle e) override { locked_add(e); }
+  void before_remove_edge(Halfedge_handle e) override { locked_remove(e); }
+  void before_modify_edge(Halfedge_handle e, const X_monotone_curve_2&) override
+  { locked_remove(e); }
+  void after_modify_edge(Halfedge_handle e) override { locked_add(e); }
+  void before_split_edge(Halfedge_handle e, Vertex_handle,
+                         const X_monotone_curve_2&,
+                         const X_monotone_curve_2&) override
+  { locked_remove(e); }
+  void after_split_edge(Halfedge_handle e1, Halfedge_handle e2) override {
+    std::unique_lock<std::shared_mutex> lock(m_mutex);
+    add(e1);
+    add(e2);
+  }
+  void before_merge_edge(Halfedge_handle e1, Halfedge_handle e2,
+                         const X_monotone_curve_2&) override {
+    std::unique_lock<std::shared_mutex> lock(m_mutex);
+    remove(e1);
+    remove(e2);
+  }
+  void after_merge_edge(Halfedge_handle e) override { locked_add(e); }
+  void after_clear() override { reset(); }
+  void after_assign() override { reset(); }
+  void before_detach() override {
+    std::unique_lock<std::shared_mutex> lock(m_mutex);
+    clear();
+    m_arr = nullptr;
+  }
+
+private:
+  //! One edge; he == nullptr marks a tombstone.
+  struct Item {
+    const Halfedge* he;
+    double x1, y1, x2, y2;
+    Box2 box;
+  };
+
+  static bool segment_meets_box(const Item& s, const Box2& b) {
+    // Liang-Barsky clipping of the segment against the box.
+    double t0 = 0, t1 = 1;
+    const double dx = s.x2 - s.x1, dy = s.y2 - s.y1;
+    auto clip = [&](double p, double q) {
+      if (p == 0) return q >= 0;
+      const double r = q / p;
+      if (p < 0) { if (r > t1) return false; t0 = std::max(t0, r); }
+      else       { if (r < t0) return false; t1 = std::min(t1, r); }
+      return true;
+    };
+    return clip(-dx, s.x1 - b.xmin) && clip(dx, b.xmax - s.x1) &&
+           clip(-dy, s.y1 - b.ymin) && clip(dy, b.ymax - s.y1);
+  }
+
+  //! Squared distance from (x, y) to the edge, and the closest point.
+  static double squared_distance(const Item& s, double x, double y,
+                                 double& px, double& py) {
+    const double dx = s.x2 - s.x1, dy = s.y2 - s.y1;
+    const double len2 = dx * dx + dy * dy;
+    double t = len2 > 0 ? ((x - s.x1) * dx + (y - s.y1) * dy) / len2 : 0.0;
+    t = std::clamp(t, 0.0, 1.0);
+    px = s.x1 + t * dx;
+    py = s.y1 + t * dy;
+    return (x - px) * (x - px) + (y - py) * (y - py);
+  }
+
+  void nearest_one(double x, double y, std::size_t k,
+                   std::vector<std::pair<double, std::size_t>>& best,
+                   const Halfedge** out_he, double* out_dist,
+                   double* out_xy) const {
+    best.clear();
+    double px, py;
+    auto item_d2 = [&](std::size_t slot) {
+      const Item& it = m_items[slot];
+      return it.he ? squared_distance(it, x, y, px, py)
+                   : std::numeric_limits<double>::infinity();
+    };
+    m_tree.nearest(x, y, item_d2, [&](std::size_t slot, double d2) {
+      best.emplace_back(d2, slot);
+      return best.size() < k;
+    });
+    // Merge in the delta; best stays sorted and at most k long.
+    for (std::size_t s = m_tree_items; s < m_items.size(); ++s) {
+      if (m_items[s].he == nullptr) continue;
+      const std::pair<double, std::size_t> c(item_d2(s), s);
+      if (best.size() == k && ! (c < best.back())) continue;
+      best.insert(std::upper_bound(best.begin(), best.end(), c), c);
+      if (best.size() > k) best.pop_back();
+    }
+
+    for (std::size_t j = 0; j < k; ++j) {
+      if (j < best.size()) {
+        const Item& it = m_items[best[j].second];
+        out_he[j] = it.he;
+        out_dist[j] = std::sqrt(best[j].first);
+        if (out_xy) {
+          squared_distance(it, x, y, out_xy[2 * j], out_xy[2 * j + 1]);
+        }
+      }
+      else {
+        out_he[j] = nullptr;
+        out_dist[j] = std::numeric_limits<double>::infinity();
+        if (out_xy)
+          out_xy[2 * j] = out_xy[2 * j + 1] = std::numeric_limits<double>::quiet_NaN();
+      }
+    }
+  }
+
+  void locked_add(Halfedge_handle e) {
+    std::unique_lock<std::shared_mutex> lock(m_mutex);
+    add(e);
+  }
+
+  void locked_remove(Halfedge_handle e) {
+    std::unique_lock<std::shared_mutex> lock(m_mutex);
+    remove(e);
+  }
+
+  template <typename Handle>
+  void add(Handle e) {
+    const Halfedge* h = (e->direction() == CGAL::ARR_LEFT_TO_RIGHT) ? &*e : &*e->twin();
+    const auto& s = h->source()->point();
+    const auto& t = h->target()->point();
+    Item it;
+    it.he = h;
+    it.x1 = CGAL::to_double(s.x()); it.y1 = CGAL::to_double(s.y());
+    it.x2 = CGAL::to_double(t.x()); it.y2 = CGAL::to_double(t.y());
+    it.box = Box2{ std::min(it.x1, it.x2), std::min(it.y1, it.y2),
+                   std::max(it.x1, it.x2), std::max(it.y1, it.y2) };
+    const std::size_t slot = m_items.size();
+    m_items.push_back(it);
+    m_slot[h] = slot;
+    m_slot[&*h->twin()] = slot;
+    ++m_live;
+  }
+
+  template <typename Handle>
+  void remove(Handle e) {
+    auto found = m_slot.find(&*e);
+    if (found == m_slot.end()) return;
+    Item& it = m_items[found->second];
+    m_slot.erase(it.he);
+    m_slot.erase(&*it.he->twin());
+    it.he = nullptr;
+    --m_live;
+    ++m_dead;
+  }
+
+  void clear() {
+    m_items.clear();
+    m_slot.clear();
+    m_tree.build({});
+    m_tree_items = m_live = m_dead = 0;
+  }
+
+  void reset() {
+    std::unique_lock<std::shared_mutex> lock(m_mutex);
+    clear();
+    m_items.reserve(m_arr->number_of_edges());
+    m_slot.reserve(2 * m_arr->number_of_edges());
+    for (auto it = m_arr->edges_begin(); it != m_arr->edges_end(); ++it)
+      add(it);
+    rebuild();
+  }
+
+  //! Drop tombstones and pack every live edge into a new tree.
+  void rebuild() {
+    std::vector<Item> items;
+    items.reserve(m_live);
+    for (const Item& it : m_items)
+      if (it.he != nullptr) items.push_back(it);
+    m_items.swap(items);
+    m_slot.clear();
+    std::vector<Box2> boxes;
+    boxes.reserve(m_items.size());
+    for (std::size_t s = 0; s < m_items.size(); ++s) {
+      m_slot[m_items[s].he] = s;
+      m_slot[&*m_items[s].he->twin()] = s;
+      boxes.push_back(m_items[s].box);
+    }
+    m_tree.build(boxes);
+    m_tree_items = m_items.size();
+    m_dead = 0;
+  }
+
+  Arrangement* m_arr;
+  mutable std::shared_mutex m_mutex;
+  std::vector<Item> m_items;
+  std::unordered_map<const Halfedge*, std::size_t> m_slot;
+  Packed_rtree m_tree;
+  std::size_t m_tree_items = 0;
+  std::size_t m_live = 0;
+  std::size_t m_dead = 0;
+};
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_EDGE_INDEX_HPP
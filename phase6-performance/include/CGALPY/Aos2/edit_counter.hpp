@@ -0,0 +1,69 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_EDIT_COUNTER_HPP
+#define CGALPY_AOS2_EDIT_COUNTER_HPP
+
+#include <cstdint>
+
+#include <CGAL/Arr_observer.h>
+
+namespace CGALPY {
+
+/*! Observer that counts topology and geometry edits of one arrangement.
+ *
+ * Objects that hold DCEL iterators across Python calls (batch iterators,
+ * indexes) compare version() with the value they started from and refuse to
+ * continue after an edit, instead of walking freed records. Only the
+ * before_* notifications are counted, one per elementary edit; a bulk
+ * operation counts at least once through before_global_change().
+ *
+ * The callbacks only bump an integer, so GIL-free bulk edits may fire them.
+ */
+template <typename Arrangement>
+class Edit_counter : public CGAL::Arr_observer<Arrangement> {
+  using Base = CGAL::Arr_observer<Arrangement>;
+
+public:
+  using Point_2 = typename Arrangement::Point_2;
+  using X_monotone_curve_2 = typename Arrangement::X_monotone_curve_2;
+  using Vertex_handle = typename Arrangement::Vertex_handle;
+  using Halfedge_handle = typename Arrangement::Halfedge_handle;
+  using Face_handle = typename Arrangement::Face_handle;
+
+  explicit Edit_counter(Arrangement& arr) : Base(arr) {}
+
+  std::uint64_t version() const { return m_version; }
+  bool attached() const { return m_attached; }
+
+  void before_assign(const Arrangement&) override { ++m_version; }
+  void before_clear() override { ++m_version; }
+  void before_global_change() override { ++m_version; }
+  void before_detach() override { ++m_version; m_attached = false; }
+
+  void before_create_vertex(const Point_2&) override { ++m_version; }
+  void before_create_edge(const X_monotone_curve_2&, Vertex_handle,
+                          Vertex_handle) override { ++m_version; }
+  void before_modify_vertex(Vertex_handle, const Point_2&) override
+  { ++m_version; }
+  void before_modify_edge(Halfedge_handle, const X_monotone_curve_2&) override
+  { ++m_version; }
+  void before_split_edge(Halfedge_handle, Vertex_handle,
+                         const X_monotone_curve_2&,
+                         const X_monotone_curve_2&) override { ++m_version; }
+  void before_split_face(Face_handle, Halfedge_handle) override { ++m_version; }
+  void before_merge_edge(Halfedge_handle, Halfedge_handle,
+                         const X_monotone_curve_2&) override { ++m_version; }
+  void before_merge_face(Face_handle, Face_handle, Halfedge_handle) override
+  { ++m_version; }
+  void before_remove_vertex(Vertex_handle) override { ++m_version; }
+  void before_remove_edge(Halfedge_handle) override { ++m_version; }
+
+private:
+  std::uint64_t m_version = 0;
+  bool m_attached = true;
+};
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_EDIT_COUNTER_HPP
@@ -0,0 +1,155 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_FACE_MEASURES_HPP
+#define CGALPY_AOS2_FACE_MEASURES_HPP
+
+#include <algorithm>
+#include <cmath>
+#include <cstdint>
+#include <limits>
+#include <type_traits>
+#include <utility>
+#include <vector>
+
+#include <CGAL/Lazy.h>
+#include <CGAL/number_utils.h>
+
+#include "CGALPY/Aos2/index_lookup.hpp"
+
+namespace CGALPY {
+
+/*! Area, perimeter, centroid and bounding box of every bounded face.
+ *
+ *   area[f]                   holes subtracted
+ *   perimeter[f]              outer boundary plus hole boundaries
+ *   centroid[2f], [2f+1]      centroid of the face region
+ *   bbox[4f .. 4f+3]          xmin, ymin, xmax, ymax of the outer boundary
+ *
+ * Rows follow faces() order with the unbounded face left out; face_ids
+ * come from Index_lookup.
+ */
+struct Face_measures {
+  std::vector<std::int64_t> face_ids;
+  std::vector<double> area;
+  std::vector<double> perimeter;
+  std::vector<double> centroid;
+  std::vector<double> bbox;
+};
+
+namespace face_measures_detail {
+
+/*! Shoelace sums over every CCB of a face, in NT.
+ *
+ * Boundary halfedges have the face on their left, so the outer CCB runs
+ * counterclockwise and holes clockwise: summing the signed terms of all CCBs
+ * subtracts the holes from both the area and the first moments. Segment
+ * lengths involve a square root, so they are always summed in double.
+ *
+ * coord(vertex) returns the vertex coordinates as a pair of NT.
+ */
+template <typename NT, typename Face, typename Coord>
+void measure(const Face& f, Coord coord, double& area, double& perimeter,
+             double& cx, double& cy, double shift_x, double shift_y) {
+  NT a2(0), mx(0), my(0);
+  double length = 0;
+  auto add_ccb = [&](auto circ) {
+    auto curr = circ;
+    do {
+      const std::pair<NT, NT> p = coord(*curr->source());
+      const std::pair<NT, NT> q = coord(*curr->target());
+      const NT cross = p.first * q.second - q.first * p.second;
+      a2 += cross;
+      mx += (p.first + q.first) * cross;
+      my += (p.second + q.second) * cross;
+      const NT dx = q.first - p.first, dy = q.second - p.second;
+      length += std::sqrt(CGAL::to_double(dx * dx + dy * dy));
+    } while (++curr != circ);
+  };
+  for (auto it = f.outer_ccbs_begin(); it != f.outer_ccbs_end(); ++it)
+    add_ccb(*it);
+  for (auto it = f.inner_ccbs_begin(); it != f.inner_ccbs_end(); ++it)
+    add_ccb(*it);
+
+  area = CGAL::to_double(a2) / 2;
+  perimeter = length;
+  if (a2 == NT(0)) {
+    cx = cy = std::numeric_limits<double>::quiet_NaN();
+    return;
+  }
+  // Centroid = first moment / (6 A) = m / (3 a2); divide before rounding.
+  cx = CGAL::to_double(mx / (NT(3) * a2)) + shift_x;
+  cy = CGAL::to_double(my / (NT(3) * a2)) + shift_y;
+}
+
+} // namespace face_measures_detail
+
+/*! One pass over all faces, O(F + H).
+ *
+ * Fast mode rounds every vertex to double and works relative to the first
+ * vertex of the face, which keeps the shoelace sums well conditioned for
+ * faces far from the origin. Exact mode sums the kernel's exact coordinates
+ * (CGAL::exact, e.g. Gmpq under EPEC) and rounds once per result; under
+ * EPIC the exact type is double and both modes compute the same thing.
+ */
+template <typename Arrangement>
+Face_measures face_measures(const Arrangement& arr,
+                            const Index_lookup<Arrangement>& ids, bool exact) {
+  using Vertex = typename Arrangement::Vertex;
+  using Point = typename Arrangement::Point_2;
+  using FT = std::decay_t<decltype(std::declval<const Point&>().x())>;
+  using ET = std::decay_t<decltype(CGAL::exact(std::declval<FT>()))>;
+  namespace d = face_measures_detail;
+
+  Face_measures m;
+  const std::size_t n = arr.number_of_faces() - arr.number_of_unbounded_faces();
+  m.face_ids.reserve(n);
+  m.area.reserve(n);
+  m.perimeter.reserve(n);
+  m.centroid.reserve(2 * n);
+  m.bbox.reserve(4 * n);
+
+  for (auto fit = arr.faces_begin(); fit != arr.faces_end(); ++fit) {
+    if (fit->is_unbounded()) continue;
+    const auto outer = *fit->outer_ccbs_begin();
+
+    double xmin = std::numeric_limits<double>::infinity(), ymin = xmin;
+    double xmax = -xmin, ymax = -xmin;
+    auto curr = outer;
+    do {
+      const auto& p = curr->source()->point();
+      const double x = CGAL::to_double(p.x()), y = CGAL::to_double(p.y());
+      xmin = std::min(xmin, x); xmax = std::max(xmax, x);
+      ymin = std::min(ymin, y); ymax = std::max(ymax, y);
+    } while (++curr != outer);
+
+    double area, perimeter, cx, cy;
+    if (exact) {
+      auto coord = [](const Vertex& v) {
+        return std::pair<ET, ET>(CGAL::exact(v.point().x()),
+                                 CGAL::exact(v.point().y()));
+      };
+      d::measure<ET>(*fit, coord, area, perimeter, cx, cy, 0.0, 0.0);
+    }
+    else {
+      const auto& o = outer->source()->point();
+      const double ox = CGAL::to_double(o.x()), oy = CGAL::to_double(o.y());
+      auto coord = [ox, oy](const Vertex& v) {
+        return std::pair<double, double>(CGAL::to_double(v.point().x()) - ox,
+                                         CGAL::to_double(v.point().y()) - oy);
+      };
+      d::measure<double>(*fit, coord, area, perimeter, cx, cy, ox, oy);
+    }
+
+    m.face_ids.push_back(ids(*fit));
+    m.area.push_back(area);
+    m.perimeter.push_back(perimeter);
+    m.centroid.insert(m.centroid.end(), {cx, cy});
+    m.bbox.insert(m.bbox.end(), {xmin, ymin, xmax, ymax});
+  }
+  return m;
+}
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_FACE_MEASURES_HPP
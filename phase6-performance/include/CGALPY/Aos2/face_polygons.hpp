@@ -0,0 +1,117 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_FACE_POLYGONS_HPP
+#define CGALPY_AOS2_FACE_POLYGONS_HPP
+
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+#include <vector>
+
+#include <CGAL/number_utils.h>
+
+#include "CGALPY/Aos2/edit_counter.hpp"
+#include "CGALPY/Aos2/handle_ids.hpp"
+
+namespace CGALPY {
+
+/*! Bounded faces as polygons, in the ragged layout of
+ * shapely.from_ragged_array(GeometryType.POLYGON, ...):
+ *
+ *   polygon_offsets[b] .. polygon_offsets[b+1]   ring rows of face b
+ *                                                (outer ring first, then holes)
+ *   ring_offsets[r] .. ring_offsets[r+1]         coordinate rows of ring r
+ *   coords[2k], coords[2k+1]                     x, y of coordinate row k
+ *
+ * Outer rings run counterclockwise and holes clockwise (the face is on the
+ * left of every boundary halfedge), as GeoJSON asks for.
+ */
+struct Polygon_batch {
+  std::vector<std::int64_t> face_ids;
+  std::vector<std::int64_t> polygon_offsets{0};
+  std::vector<std::int64_t> ring_offsets{0};
+  std::vector<double> coords;
+};
+
+/*! Walks the bounded faces of an arrangement, batch_size faces at a time.
+ *
+ * The face iterator is kept between batches, so the arrangement must not
+ * change while a walk is in progress; an attached Edit_counter notices if it
+ * does and next() throws instead of following a dangling iterator.
+ *
+ * Face ids are handle ids if enabled (step 6.4), otherwise positions in
+ * faces() order, the same as face_topology_arrays() uses.
+ */
+template <typename Arrangement>
+class Face_polygon_reader {
+public:
+  using Face = typename Arrangement::Face;
+  using Face_const_iterator = typename Arrangement::Face_const_iterator;
+
+  Face_polygon_reader(Arrangement& arr, std::size_t batch_size,
+                      bool close_rings) :
+    m_arr(arr), m_edits(arr), m_version(m_edits.version()),
+    m_it(static_cast<const Arrangement&>(arr).faces_begin()),
+    m_batch_size(batch_size), m_close_rings(close_rings)
+  {
+    if (batch_size == 0)
+      throw std::invalid_argument("batch_size must be positive");
+  }
+
+  bool done() const { return m_it == m_arr.faces_end(); }
+
+  //! The next batch; empty only once every face has been read.
+  Polygon_batch next() {
+    if (m_edits.version() != m_version || ! m_edits.attached())
+      throw std::runtime_error("arrangement was modified during "
+                               "iter_face_polygons(); start a new iteration");
+    const Handle_ids<Arrangement>* ids = find_handle_ids(m_arr);
+    Polygon_batch b;
+    b.face_ids.reserve(m_batch_size);
+    while (! done() && b.face_ids.size() < m_batch_size) {
+      const Face& f = *m_it;
+      ++m_it;
+      const std::int64_t position = m_position++;
+      if (f.is_unbounded()) continue;
+      b.face_ids.push_back(ids ? static_cast<std::int64_t>(*ids->faces.find(&f))
+                               : position);
+      for (auto oit = f.outer_ccbs_begin(); oit != f.outer_ccbs_end(); ++oit)
+        add_ring(*oit, b);
+      for (auto iit = f.inner_ccbs_begin(); iit != f.inner_ccbs_end(); ++iit)
+        add_ring(*iit, b);
+      b.polygon_offsets.push_back(
+        static_cast<std::int64_t>(b.ring_offsets.size() - 1));
+    }
+    return b;
+  }
+
+private:
+  template <typename Circulator>
+  void add_ring(Circulator circ, Polygon_batch& b) const {
+    const std::size_t first = b.coords.size();
+    auto curr = circ;
+    do {
+      const auto& p = curr->source()->point();
+      b.coords.push_back(CGAL::to_double(p.x()));
+      b.coords.push_back(CGAL::to_double(p.y()));
+    } while (++curr != circ);
+    if (m_close_rings) {
+      b.coords.push_back(b.coords[first]);
+      b.coords.push_back(b.coords[first + 1]);
+    }
+    b.ring_offsets.push_back(static_cast<std::int64_t>(b.coords.size() / 2));
+  }
+
+  const Arrangement& m_arr;
+  Edit_counter<Arrangement> m_edits;
+  std::uint64_t m_version;
+  Face_const_iterator m_it;
+  std::int64_t m_position = 0;
+  std::size_t m_batch_size;
+  bool m_close_rings;
+};
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_FACE_POLYGONS_HPP
@@ -0,0 +1,76 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_FACE_TOPOLOGY_HPP
+#define CGALPY_AOS2_FACE_TOPOLOGY_HPP
+
+#include <cstdint>
+#include <vector>
+
+#include "CGALPY/Aos2/index_lookup.hpp"
+
+namespace CGALPY {
+
+/*! Face / CCB / isolated-vertex membership of a whole arrangement, as CSR.
+ *
+ * Two levels: faces own CCBs (outer first, then inner), CCBs own halfedges
+ * in boundary-traversal order.
+ *
+ *   face_ccb_offsets[f] .. face_ccb_offsets[f+1]   CCB rows of face f
+ *   ccb_offsets[c] .. ccb_offsets[c+1]             halfedge rows of CCB c
+ *   ccb_halfedges[k]                               halfedge id
+ *   ccb_face[c], ccb_is_inner[c]                   owner face id, hole flag
+ *   isolated_offsets[f] .. isolated_offsets[f+1]   rows of isolated_vertices
+ *
+ * Face rows follow faces() order; the ids stored inside the arrays come
+ * from Index_lookup.
+ */
+struct Face_topology {
+  std::vector<std::int64_t> face_ids;
+  std::vector<std::int64_t> face_ccb_offsets{0};
+  std::vector<std::int64_t> ccb_offsets{0};
+  std::vector<std::int64_t> ccb_halfedges;
+  std::vector<std::int64_t> ccb_face;
+  std::vector<std::uint8_t> ccb_is_inner;
+  std::vector<std::int64_t> isolated_offsets{0};
+  std::vector<std::int64_t> isolated_vertices;
+};
+
+//! One pass over all faces: O(F + H + V).
+template <typename Arrangement>
+Face_topology face_topology(const Arrangement& arr,
+                            const Index_lookup<Arrangement>& ids) {
+  Face_topology t;
+  t.face_ids.reserve(arr.number_of_faces());
+  t.ccb_halfedges.reserve(arr.number_of_halfedges());
+  t.isolated_vertices.reserve(arr.number_of_isolated_vertices());
+
+  auto add_ccb = [&](auto circ, std::int64_t face_id, bool inner) {
+    auto curr = circ;
+    do { t.ccb_halfedges.push_back(ids(*curr)); } while (++curr != circ);
+    t.ccb_offsets.push_back(static_cast<std::int64_t>(t.ccb_halfedges.size()));
+    t.ccb_face.push_back(face_id);
+    t.ccb_is_inner.push_back(inner ? 1 : 0);
+  };
+
+  for (auto fit = arr.faces_begin(); fit != arr.faces_end(); ++fit) {
+    const std::int64_t fid = ids(*fit);
+    t.face_ids.push_back(fid);
+    for (auto oit = fit->outer_ccbs_begin(); oit != fit->outer_ccbs_end(); ++oit)
+      add_ccb(*oit, fid, false);
+    for (auto iit = fit->inner_ccbs_begin(); iit != fit->inner_ccbs_end(); ++iit)
+      add_ccb(*iit, fid, true);
+    t.face_ccb_offsets.push_back(static_cast<std::int64_t>(t.ccb_face.size()));
+
+    for (auto vit = fit->isolated_vertices_begin();
+         vit != fit->isolated_vertices_end(); ++vit)
+      t.isolated_vertices.push_back(ids(*vit));
+    t.isolated_offsets.push_back(
+      static_cast<std::int64_t>(t.isolated_vertices.size()));
+  }
+  return t;
+}
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_FACE_TOPOLOGY_HPP
@@ -0,0 +1,252 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_HANDLE_IDS_HPP
+#define CGALPY_AOS2_HANDLE_IDS_HPP
+
+#include <algorithm>
+#include <cstdint>
+#include <memory>
+#include <stdexcept>
+#include <unordered_map>
+#include <vector>
+
+#include <Python.h>
+#include <nanobind/nanobind.h>
+
+#include <CGAL/Arr_observer.h>
+
+namespace py = nanobind;
+
+namespace CGALPY {
+
+// ---------------------------------------------------------------------------
+// Hash / equality as C-level type slots
+// ---------------------------------------------------------------------------
+
+/*! tp_hash for a bound DCEL record type (Vertex, Halfedge, Face).
+ *
+ * The wrapper's C++ pointer *is* the record address, which is unique among
+ * live records of all arrangements and never moves while the record exists.
+ * Hashing it is O(1) and goes through no nanobind dispatch at all.
+ */
+template <typename Record>
+Py_hash_t record_hash(PyObject* self) {
+  auto addr = reinterpret_cast<std::uintptr_t>(py::inst_ptr<Record>(self));
+  // Same idea as CPython's pointer hash: drop the always-zero low bits.
+  auto h = static_cast<Py_hash_t>((addr >> 4) | (addr << (8 * sizeof(addr) - 4)));
+  return (h == -1) ? -2 : h;
+}
+
+//! tp_richcompare: identity of the underlying record; only == and !=.
+template <typename Record>
+PyObject* record_richcompare(PyObject* self, PyObject* other, int op) {
+  if ((op != Py_EQ && op != Py_NE) || Py_TYPE(self) != Py_TYPE(other))
+    Py_RETURN_NOTIMPLEMENTED;
+  bool same = py::inst_ptr<Record>(self) == py::inst_ptr<Record>(other);
+  if ((op == Py_EQ) == same) Py_RETURN_TRUE;
+  Py_RETURN_FALSE;
+}
+
+/*! Slots to pass as `py::type_slots(...)` when the record class is created:
+ *
+ *   py::class_<Vertex>(m, "Vertex", py::type_slots(CGALPY::record_slots<Vertex>()))
+ *
+ * This replaces the `.def("__eq__", ...)` / `.def("__hash__", ...)` pair, so
+ * `iso_face == unbounded` and `{v: ...}` never leave C.
+ */
+template <typename Record>
+PyType_Slot* record_slots() {
+  static PyType_Slot slots[] = {
+    { Py_tp_hash, reinterpret_cast<void*>(&record_hash<Record>) },
+    { Py_tp_richcompare, reinterpret_cast<void*>(&record_richcompare<Record>) },
+    { 0, nullptr }
+  };
+  return slots;
+}
+
+// ---------------------------------------------------------------------------
+// Dense ids
+// ---------------------------------------------------------------------------
+
+/*! Dense index over one kind of record, [0, n).
+ *
+ * Same policy as CGAL::Arr_vertex_index_map / Arr_face_index_map: removing
+ * a record moves the last record into the freed slot, so ids stay dense and
+ * every update is O(1).
+ */
+template <typename Record>
+class Dense_ids {
+public:
+  void clear() { m_id.clear(); m_records.clear(); }
+
+  void add(const Record* r) {
+    if (m_id.emplace(r, m_records.size()).second) m_records.push_back(r);
+  }
+
+  //! Idempotent: removing an unknown record is a no-op.
+  void remove(const Record* r) {
+    auto it = m_id.find(r);
+    if (it == m_id.end()) return;
+    const std::size_t slot = it->second;
+    const Record* last = m_records.back();
+    m_records[slot] = last;
+    m_id[last] = slot;
+    m_records.pop_back();
+    m_id.erase(r);
+  }
+
+  const std::size_t* find(const Record* r) const {
+    auto it = m_id.find(r);
+    return (it == m_id.end()) ? nullptr : &it->second;
+  }
+
+  std::size_t size() const { return m_records.size(); }
+
+private:
+  std::unordered_map<const Record*, std::size_t> m_id;
+  std::vector<const Record*> m_records;
+};
+
+/*! Observer maintaining dense vertex / halfedge / face ids of one arrangement.
+ *
+ * Right after enabling, ids equal the position in vertices() / halfedges() /
+ * faces() iteration order (so vertex ids match vertex_coordinates() rows
+ * until the first removal).
+ */
+template <typename Arrangement>
+class Handle_ids : public CGAL::Arr_observer<Arrangement> {
+  using Base = CGAL::Arr_observer<Arrangement>;
+
+public:
+  using Vertex = typename Arrangement::Vertex;
+  using Halfedge = typename Arrangement::Halfedge;
+  using Face = typename Arrangement::Face;
+  using Vertex_handle = typename Arrangement::Vertex_handle;
+  using Halfedge_handle = typename Arrangement::Halfedge_handle;
+  using Face_handle = typename Arrangement::Face_handle;
+  using X_monotone_curve_2 = typename Arrangement::X_monotone_curve_2;
+
+  explicit Handle_ids(Arrangement& arr) : Base(arr), m_arr(&arr) { rebuild(); }
+
+  const Arrangement* arrangement() const { return m_arr; }
+
+  Dense_ids<Vertex> vertices;
+  Dense_ids<Halfedge> halfedges;
+  Dense_ids<Face> faces;
+
+  // Vertices
+  void after_create_vertex(Vertex_handle v) override { vertices.add(&*v); }
+  void after_create_boundary_vertex(Vertex_handle v) override
+  { vertices.add(&*v); }
+  void before_remove_vertex(Vertex_handle v) override { vertices.remove(&*v); }
+
+  // Edges
+  void after_create_edge(Halfedge_handle e) override { add_edge(e); }
+  void after_split_edge(Halfedge_handle e1, Halfedge_handle e2) override {
+    // The new edge is not reported through after_create_edge.
+    add_edge(e1);
+    add_edge(e2);
+  }
+  void before_merge_edge(Halfedge_handle e1, Halfedge_handle e2,
+                         const X_monotone_curve_2&) override {
+    m_merging = { &*e1, &*(e1->twin()), &*e2, &*(e2->twin()) };
+    m_merge_vertex = (e1->target() == e2->source() ||
+                      e1->target() == e2->target()) ?
+      &*(e1->target()) : &*(e1->source());
+  }
+  void after_merge_edge(Halfedge_handle e) override {
+    // One of the two edges survives as e; drop the other one and the vertex
+    // between them (only addresses are compared, nothing is dereferenced).
+    for (const Halfedge* h : m_merging)
+      if (h != &*e && h != &*(e->twin())) halfedges.remove(h);
+    vertices.remove(m_merge_vertex);
+  }
+  void before_remove_edge(Halfedge_handle e) override {
+    halfedges.remove(&*e);
+    halfedges.remove(&*(e->twin()));
+  }
+
+  // Faces
+  void after_split_face(Face_handle, Face_handle new_f, bool) override
+  { faces.add(&*new_f); }
+  void before_merge_face(Face_handle, Face_handle f2, Halfedge_handle) override
+  { faces.remove(&*f2); }
+
+  // Whole-arrangement events
+  void after_clear() override { rebuild(); }
+  void after_assign() override { rebuild(); }
+  void before_detach() override {
+    vertices.clear(); halfedges.clear(); faces.clear();
+    m_arr = nullptr;
+  }
+
+private:
+  void add_edge(Halfedge_handle e) {
+    halfedges.add(&*e);
+    halfedges.add(&*(e->twin()));
+  }
+
+  void rebuild() {
+    vertices.clear(); halfedges.clear(); faces.clear();
+    for (auto it = m_arr->vertices_begin(); it != m_arr->vertices_end(); ++it)
+      vertices.add(&*it);
+    for (auto it = m_arr->halfedges_begin(); it != m_arr->halfedges_end(); ++it)
+      halfedges.add(&*it);
+    for (auto it = m_arr->faces_begin(); it != m_arr->faces_end(); ++it)
+      faces.add(&*it);
+  }
+
+  Arrangement* m_arr;
+  std::vector<const Halfedge*> m_merging;
+  const Vertex* m_merge_vertex = nullptr;
+};
+
+//! Arrangements with ids enabled; detached entries are purged lazily.
+template <typename Arrangement>
+std::vector<std::unique_ptr<Handle_ids<Arrangement>>>& handle_id_registry() {
+  static std::vector<std::unique_ptr<Handle_ids<Arrangement>>> registry;
+  return registry;
+}
+
+template <typename Arrangement>
+void set_handle_ids(Arrangement& arr, bool enable) {
+  auto& reg = handle_id_registry<Arrangement>();
+  reg.erase(std::remove_if(reg.begin(), reg.end(),
+                           [](const auto& h) { return !h->arrangement(); }),
+            reg.end());
+  auto it = std::find_if(reg.begin(), reg.end(),
+                         [&](const auto& h) { return h->arrangement() == &arr; });
+  if (enable && it == reg.end())
+    reg.push_back(std::make_unique<Handle_ids<Arrangement>>(arr));
+  else if (! enable && it != reg.end()) {
+    (*it)->detach();
+    reg.erase(it);
+  }
+}
+
+//! The id observer of `arr`, or nullptr if ids are not enabled on it.
+template <typename Arrangement>
+const Handle_ids<Arrangement>* find_handle_ids(const Arrangement& arr) {
+  for (const auto& h : handle_id_registry<Arrangement>())
+    if (h->arrangement() == &arr) return h.get();
+  return nullptr;
+}
+
+/*! `.id` property of Vertex / Halfedge / Face.
+ *
+ * `Member` selects which Dense_ids of Handle_ids to consult. Usually only one
+ * or two arrangements have ids enabled, so a linear scan over them is cheap.
+ */
+template <typename Arrangement, typename Record,
+          Dense_ids<Record> Handle_ids<Arrangement>::* Member>
+std::size_t record_id(const Record& r) {
+  for (const auto& h : handle_id_registry<Arrangement>())
+    if (const std::size_t* id = ((*h).*Member).find(&r)) return *id;
+  throw std::runtime_error("handle has no id: call set_handle_ids(True) on its "
+                           "arrangement first (or the handle was removed)");
+}
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_HANDLE_IDS_HPP
@@ -0,0 +1,66 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_INDEX_LOOKUP_HPP
+#define CGALPY_AOS2_INDEX_LOOKUP_HPP
+
+#include <cstdint>
+#include <unordered_map>
+
+#include "CGALPY/Aos2/handle_ids.hpp"
+
+namespace CGALPY {
+
+/*! Record -> integer id, for bulk array accessors.
+ *
+ * If dense handle ids are enabled on the arrangement (step 6.4) they are used
+ * as is, so array output and `.id` always agree. Otherwise the ids are
+ * positions in vertices() / halfedges() / faces() iteration order, built in
+ * one O(V + H + F) pass - which is exactly what `.id` would return right
+ * after `set_handle_ids(True)`.
+ *
+ * Call only while the GIL is held or the arrangement cannot change: the
+ * lookup points into the observer's tables.
+ */
+template <typename Arrangement>
+class Index_lookup {
+public:
+  using Vertex = typename Arrangement::Vertex;
+  using Halfedge = typename Arrangement::Halfedge;
+  using Face = typename Arrangement::Face;
+
+  explicit Index_lookup(const Arrangement& arr) {
+    m_ids = find_handle_ids(arr);
+    if (m_ids) return;
+
+    std::int64_t i = 0;
+    m_vertices.reserve(arr.number_of_vertices());
+    for (auto it = arr.vertices_begin(); it != arr.vertices_end(); ++it)
+      m_vertices.emplace(&*it, i++);
+    i = 0;
+    m_halfedges.reserve(arr.number_of_halfedges());
+    for (auto it = arr.halfedges_begin(); it != arr.halfedges_end(); ++it)
+      m_halfedges.emplace(&*it, i++);
+    i = 0;
+    m_faces.reserve(arr.number_of_faces());
+    for (auto it = arr.faces_begin(); it != arr.faces_end(); ++it)
+      m_faces.emplace(&*it, i++);
+  }
+
+  std::int64_t operator()(const Vertex& v) const
+  { return m_ids ? *m_ids->vertices.find(&v) : m_vertices.at(&v); }
+  std::int64_t operator()(const Halfedge& h) const
+  { return m_ids ? *m_ids->halfedges.find(&h) : m_halfedges.at(&h); }
+  std::int64_t operator()(const Face& f) const
+  { return m_ids ? *m_ids->faces.find(&f) : m_faces.at(&f); }
+
+private:
+  const Handle_ids<Arrangement>* m_ids = nullptr;
+  std::unordered_map<const Vertex*, std::int64_t> m_vertices;
+  std::unordered_map<const Halfedge*, std::int64_t> m_halfedges;
+  std::unordered_map<const Face*, std::int64_t> m_faces;
+};
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_INDEX_LOOKUP_HPP
@@ -0,0 +1,175 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_INGEST_HPP
+#define CGALPY_AOS2_INGEST_HPP
+
+#include <algorithm>
+#include <array>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <CGAL/Arrangement_on_surface_2.h>
+
+#include "CGALPY/geometry_reader.hpp"
+
+namespace CGALPY {
+namespace ingest {
+
+/*! Options for insert_from_file().
+ *
+ * batch_size is the number of segments per CGAL::insert() call. Every call
+ * sweeps the new curves together with the whole existing arrangement, so
+ * small batches turn a single O((n + k) log n) sweep into one sweep per
+ * batch. Keep it large; it only bounds the memory held by pending curves.
+ */
+struct Options {
+  geometry_reader::Format format = geometry_reader::Format::wkt;
+  std::size_t batch_size = std::size_t(1) << 20;
+  std::size_t buffer_size = std::size_t(1) << 22;     // read buffer, bytes
+  std::uint64_t progress_bytes = std::uint64_t(64) << 20;
+  bool assume_disjoint = false;
+  char csv_delimiter = ',';
+};
+
+//! Counters passed to the progress callback and returned at the end.
+struct Stats {
+  std::uint64_t bytes = 0;              // input consumed so far
+  std::uint64_t total_bytes = 0;        // file size (0 if unknown)
+  std::uint64_t geometries = 0;         // only final after the last report
+  std::uint64_t skipped_geometries = 0;
+  std::uint64_t polylines = 0;
+  std::uint64_t segments = 0;           // inserted into the arrangement
+  std::uint64_t skipped_segments = 0;   // zero-length pieces
+  std::uint64_t batches = 0;
+  double seconds = 0;
+};
+
+/*! Stream the line geometry of a file into an arrangement.
+ *
+ * Polylines from the parser are split into segments and collected in a
+ * batch of at most opt.batch_size curves, which is handed to CGAL::insert()
+ * (or insert_non_intersecting_curves() with assume_disjoint) when full.
+ * Memory beyond the arrangement itself is the read buffer, one geometry and
+ * one batch.
+ *
+ * progress(const Stats&) is called after every batch, every
+ * opt.progress_bytes of input, and once at the end. It may throw to abort;
+ * curves inserted by earlier batches stay in the arrangement.
+ */
+template <typename Arrangement, typename Progress>
+Stats insert_from_file(Arrangement& arr, const std::string& path,
+                       const Options& opt, Progress&& progress) {
+  using Traits = typename Arrangement::Geometry_traits_2;
+  using Point = typename Traits::Point_2;
+  using X_monotone_curve = typename Traits::X_monotone_curve_2;
+  namespace gr = geometry_reader;
+
+  if (opt.batch_size == 0)
+    throw std::invalid_argument("batch_size must be positive");
+
+  const auto start = std::chrono::steady_clock::now();
+  gr::Source src(path, opt.buffer_size);
+  Stats st;
+  st.total_bytes = src.size();
+  std::uint64_t next_report = opt.progress_bytes;
+
+  auto report = [&]() {
+    st.bytes = src.offset();
+    st.seconds = std::chrono::duration<double>(
+                   std::chrono::steady_clock::now() - start).count();
+    progress(static_cast<const Stats&>(st));
+  };
+
+  std::vector<X_monotone_curve> batch;
+  batch.reserve(opt.batch_size);
+  auto flush = [&]() {
+    if (batch.empty()) return;
+    if (opt.assume_disjoint)
+      CGAL::insert_non_intersecting_curves(arr, batch.begin(), batch.end());
+    else
+      CGAL::insert(arr, batch.begin(), batch.end());
+    st.segments += batch.size();
+    ++st.batches;
+    batch.clear();
+    report();
+  };
+
+  auto sink = [&](const double* xy, std::size_t n_points) {
+    ++st.polylines;
+    for (std::size_t i = 1; i < n_points; ++i) {
+      const double* a = xy + 2 * (i - 1);
+      const double* b = xy + 2 * i;
+      if (a[0] == b[0] && a[1] == b[1]) {
+        ++st.skipped_segments;
+        continue;
+      }
+      batch.emplace_back(Point(a[0], a[1]), Point(b[0], b[1]));
+      if (batch.size() == opt.batch_size) flush();
+    }
+    if (src.offset() >= next_report) {
+      next_report = src.offset() + opt.progress_bytes;
+      report();
+    }
+  };
+
+  const gr::Parse_counts counts =
+    gr::parse(src, opt.format, sink, opt.csv_delimiter);
+  flush();
+  st.geometries = counts.geometries;
+  st.skipped_geometries = counts.skipped_geometries;
+  report();
+  return st;
+}
+
+/*! Insert n segments, rows (x1, y1, x2, y2), in one aggregated insertion.
+ *
+ * The array counterpart of one insert_from_file() batch. Zero-length rows
+ * are rejected with their index. With assume_disjoint, a segment listed more
+ * than once (in either direction) is inserted once, because
+ * insert_non_intersecting_curves() does not accept overlapping curves; this
+ * is what lets snap-rounded fragments go in without a sweep. Returns the
+ * number of curves inserted.
+ */
+template <typename Arrangement>
+std::size_t insert_segments(Arrangement& arr, const double* xyxy,
+                            std::size_t n, bool assume_disjoint) {
+  using Traits = typename Arrangement::Geometry_traits_2;
+  using Point = typename Traits::Point_2;
+  using X_monotone_curve = typename Traits::X_monotone_curve_2;
+
+  std::vector<std::array<double, 4>> rows(n);
+  for (std::size_t i = 0; i < n; ++i) {
+    const double* r = xyxy + 4 * i;
+    if (r[0] == r[2] && r[1] == r[3])
+      throw std::invalid_argument("segment " + std::to_string(i) +
+                                  " is degenerate (source == target)");
+    rows[i] = {r[0], r[1], r[2], r[3]};
+  }
+  if (assume_disjoint) {
+    for (auto& r : rows)
+      if (r[2] < r[0] || (r[2] == r[0] && r[3] < r[1]))
+        r = {r[2], r[3], r[0], r[1]};
+    std::sort(rows.begin(), rows.end());
+    rows.erase(std::unique(rows.begin(), rows.end()), rows.end());
+  }
+
+  std::vector<X_monotone_curve> curves;
+  curves.reserve(rows.size());
+  for (const auto& r : rows)
+    curves.emplace_back(Point(r[0], r[1]), Point(r[2], r[3]));
+  if (assume_disjoint)
+    CGAL::insert_non_intersecting_curves(arr, curves.begin(), curves.end());
+  else
+    CGAL::insert(arr, curves.begin(), curves.end());
+  return curves.size();
+}
+
+} // namespace ingest
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_INGEST_HPP
@@ -0,0 +1,227 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_POINT_CACHE_HPP
+#define CGALPY_AOS2_POINT_CACHE_HPP
+
+#include <algorithm>
+#include <memory>
+#include <unordered_map>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+
+#include <CGAL/Arr_observer.h>
+
+namespace py = nanobind;
+
+namespace CGALPY {
+
+template <typename Arrangement> class Point_cache;
+
+/*! Process-wide table: DCEL vertex record -> cached Point_2 wrapper.
+ *
+ * Only vertices of arrangements that opted in (Point_cache attached) ever
+ * appear here, so `Vertex.point()` can keep its old copying path with a
+ * single `empty()` test when caching is not in use.
+ *
+ * All access happens with the GIL held. Observer callbacks that may run from
+ * GIL-free bulk edits re-acquire it before touching the table.
+ *
+ * The table owns Python objects, so it must not be destroyed after
+ * Py_Finalize. It is allocated once and never freed; shutdown(), registered
+ * with `atexit` by the binding, drops its contents while the interpreter is
+ * still alive.
+ */
+template <typename Arrangement>
+class Point_table {
+public:
+  using Vertex = typename Arrangement::Vertex;
+
+  struct Entry {
+    Point_cache<Arrangement>* owner;
+    py::object point;              // empty until first accessed
+  };
+
+  static Point_table& instance() {
+    static Point_table* table = new Point_table;   // intentionally leaked
+    return *table;
+  }
+
+  bool empty() const { return m_entries.empty(); }
+
+  Entry* find(const Vertex* v) {
+    auto it = m_entries.find(v);
+    return (it == m_entries.end()) ? nullptr : &it->second;
+  }
+
+  void adopt(const Vertex* v, Point_cache<Arrangement>* owner)
+  { m_entries[v] = Entry{owner, py::object()}; }
+
+  void invalidate(const Vertex* v) {
+    auto it = m_entries.find(v);
+    if (it != m_entries.end()) it->second.point = py::object();
+  }
+
+  void forget(const Vertex* v) { m_entries.erase(v); }
+
+  void forget_all(const Point_cache<Arrangement>* owner) {
+    for (auto it = m_entries.begin(); it != m_entries.end(); ) {
+      if (it->second.owner == owner) it = m_entries.erase(it);
+      else ++it;
+    }
+  }
+
+  //! Detach every cache and release every wrapper. GIL held.
+  void shutdown() {
+    for (auto& c : caches)
+      if (c->arrangement()) c->detach();
+    caches.clear();
+    m_entries.clear();
+  }
+
+  //! Keeps attached caches alive; detached ones are purged on next enable.
+  std::vector<std::unique_ptr<Point_cache<Arrangement>>> caches;
+
+private:
+  Point_table() = default;
+  std::unordered_map<const Vertex*, Entry> m_entries;
+};
+
+/*! Arrangement observer that keeps the Point_table in sync with the DCEL.
+ *
+ * - new vertices are adopted (but no wrapper is built until point() is asked)
+ * - modify_vertex drops the cached wrapper, so the next point() returns a
+ *   fresh object and any wrapper the user already holds keeps the old value
+ * - removal, merge_edge (which deletes the shared vertex without reporting
+ *   it), clear, assign and arrangement destruction drop the entries
+ */
+template <typename Arrangement>
+class Point_cache : public CGAL::Arr_observer<Arrangement> {
+  using Base = CGAL::Arr_observer<Arrangement>;
+  using Table = Point_table<Arrangement>;
+
+public:
+  using Vertex_handle = typename Arrangement::Vertex_handle;
+  using Halfedge_handle = typename Arrangement::Halfedge_handle;
+  using Point_2 = typename Arrangement::Point_2;
+  using X_monotone_curve_2 = typename Arrangement::X_monotone_curve_2;
+
+  explicit Point_cache(Arrangement& arr) : Base(arr), m_arr(&arr) {
+    for (auto vit = arr.vertices_begin(); vit != arr.vertices_end(); ++vit)
+      Table::instance().adopt(&*vit, this);
+  }
+
+  const Arrangement* arrangement() const { return m_arr; }
+
+  void after_create_vertex(Vertex_handle v) override {
+    py::gil_scoped_acquire gil;
+    Table::instance().adopt(&*v, this);
+  }
+
+  void before_modify_vertex(Vertex_handle v, const Point_2&) override {
+    py::gil_scoped_acquire gil;
+    Table::instance().invalidate(&*v);
+  }
+
+  void before_remove_vertex(Vertex_handle v) override {
+    py::gil_scoped_acquire gil;
+    Table::instance().forget(&*v);
+  }
+
+  // merge_edge deletes the shared vertex without before_remove_vertex. Its
+  // address may be reused by any arrangement, so drop the entry now.
+  void before_merge_edge(Halfedge_handle e1, Halfedge_handle e2,
+                         const X_monotone_curve_2&) override {
+    py::gil_scoped_acquire gil;
+    const bool at_target = (e1->target() == e2->source() ||
+                            e1->target() == e2->target());
+    Table::instance().forget(at_target ? &*(e1->target()) : &*(e1->source()));
+  }
+
+  void before_clear() override { drop_all(); }
+  void after_clear() override { readopt(); }
+
+  void before_assign(const typename Base::Base_aos&) override { drop_all(); }
+  void after_assign() override { readopt(); }
+
+  void before_detach() override {
+    drop_all();
+    m_arr = nullptr;
+  }
+
+private:
+  void drop_all() {
+    py::gil_scoped_acquire gil;
+    Table::instance().forget_all(this);
+  }
+
+  void readopt() {
+    py::gil_scoped_acquire gil;
+    for (auto vit = m_arr->vertices_begin(); vit != m_arr->vertices_end(); ++vit)
+      Table::instance().adopt(&*vit, this);
+  }
+
+  Arrangement* m_arr;
+};
+
+/*! Turn point caching on or off for one arrangement.
+ *
+ * Enabling twice is a no-op. Disabling detaches the observer and drops every
+ * cached wrapper of this arrangement (wrappers already handed out stay valid:
+ * they are independent copies).
+ */
+template <typename Arrangement>
+void set_point_caching(Arrangement& arr, bool enable) {
+  auto& table = Point_table<Arrangement>::instance();
+  auto& caches = table.caches;
+  // Purge caches whose arrangement was destroyed (observer detached itself).
+  caches.erase(std::remove_if(caches.begin(), caches.end(),
+                              [](const auto& c) { return !c->arrangement(); }),
+               caches.end());
+
+  auto it = std::find_if(caches.begin(), caches.end(),
+                         [&](const auto& c) { return c->arrangement() == &arr; });
+  if (enable && it == caches.end())
+    caches.push_back(std::make_unique<Point_cache<Arrangement>>(arr));
+  else if (! enable && it != caches.end()) {
+    (*it)->detach();
+    caches.erase(it);
+  }
+}
+
+template <typename Arrangement>
+bool point_caching(const Arrangement& arr) {
+  for (const auto& c : Point_table<Arrangement>::instance().caches)
+    if (c->arrangement() == &arr) return true;
+  return false;
+}
+
+/*! Replacement for the `Vertex.point()` binding.
+ *
+ * Without caching this is the old behaviour: a new Point_2 copy per call.
+ * With caching the first call builds the copy and later calls return the
+ * same Python object until the vertex is modified or removed.
+ */
+template <typename Arrangement>
+py::object vertex_point(const typename Arrangement::Vertex& v) {
+  auto& table = Point_table<Arrangement>::instance();
+  if (! table.empty()) {
+    if (auto* entry = table.find(&v)) {
+      if (! entry->point.is_valid())
+        entry->point = py::cast(v.point(), py::rv_policy::copy);
+      return entry->point;
+    }
+  }
+  return py::cast(v.point(), py::rv_policy::copy);
+}
+
+//! `Vertex.to_double()` / `Point_2.to_double()`: plain (x, y) floats.
+template <typename Point_2>
+py::tuple point_to_double(const Point_2& p) {
+  return py::make_tuple(CGAL::to_double(p.x()), CGAL::to_double(p.y()));
+}
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_POINT_CACHE_HPP
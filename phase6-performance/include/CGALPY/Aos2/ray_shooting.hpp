@@ -0,0 +1,168 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_RAY_SHOOTING_HPP
+#define CGALPY_AOS2_RAY_SHOOTING_HPP
+
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <optional>
+#include <utility>
+#include <variant>
+#include <vector>
+
+#include <boost/iterator/function_output_iterator.hpp>
+
+#include <CGAL/Arr_vertical_decomposition_2.h>
+#include <CGAL/number_utils.h>
+
+#include "CGALPY/Aos2/index_lookup.hpp"
+
+namespace CGALPY {
+
+//! Feature codes in the kind arrays of the ray-shooting / decomposition output.
+enum Feature_kind : std::int8_t {
+  no_feature = -1,
+  vertex_feature = 0,
+  halfedge_feature = 1,
+  face_feature = 2
+};
+
+/*! Decodes one point-location style result into (kind, id, y).
+ *
+ * Accepts the handle types themselves, std::variant of them (ray shooting)
+ * and std::optional of such a variant (vertical decomposition, where an
+ * empty optional means nothing is visible in that direction). y is where a
+ * vertical line through `q` meets the feature: the vertex's y, the edge's
+ * y at q.x, or `face_y` (±inf) when the ray escapes into a face.
+ */
+template <typename Arrangement>
+class Feature_reader {
+public:
+  using Point_2 = typename Arrangement::Point_2;
+  using Vertex_const_handle = typename Arrangement::Vertex_const_handle;
+  using Halfedge_const_handle = typename Arrangement::Halfedge_const_handle;
+  using Face_const_handle = typename Arrangement::Face_const_handle;
+
+  Feature_reader(const Index_lookup<Arrangement>& ids) : m_ids(ids) {}
+
+  template <typename Result>
+  void read(const Result& r, const Point_2& q, double face_y,
+            std::int8_t& kind, std::int64_t& id, double& y) {
+    m_q = &q;
+    m_face_y = face_y;
+    m_kind = &kind;
+    m_id = &id;
+    m_y = &y;
+    visit(r);
+  }
+
+private:
+  void visit(Vertex_const_handle v) {
+    set(vertex_feature, m_ids(*v), CGAL::to_double(v->point().y()));
+  }
+
+  void visit(Halfedge_const_handle h) {
+    const Point_2& a = h->source()->point();
+    const Point_2& b = h->target()->point();
+    // A vertical edge can only be hit at the query's own y.
+    const double y = (a.x() == b.x()) ? CGAL::to_double(m_q->y()) :
+      CGAL::to_double(a.y() + (m_q->x() - a.x()) * (b.y() - a.y()) / (b.x() - a.x()));
+    set(halfedge_feature, m_ids(*h), y);
+  }
+
+  void visit(Face_const_handle f) { set(face_feature, m_ids(*f), m_face_y); }
+
+  template <typename... T>
+  void visit(const std::variant<T...>& v) {
+    std::visit([this](const auto& h) { visit(h); }, v);
+  }
+
+  template <typename T>
+  void visit(const std::optional<T>& o) {
+    if (o) visit(*o);
+    else set(no_feature, -1, m_face_y);
+  }
+
+  void set(std::int8_t kind, std::int64_t id, double y) {
+    *m_kind = kind;
+    *m_id = id;
+    *m_y = y;
+  }
+
+  const Index_lookup<Arrangement>& m_ids;
+  const Point_2* m_q = nullptr;
+  double m_face_y = 0;
+  std::int8_t* m_kind = nullptr;
+  std::int64_t* m_id = nullptr;
+  double* m_y = nullptr;
+};
+
+//! Shoot a vertical ray from each of n points; fills kind / id / y per point.
+template <typename Arrangement, typename Point_location>
+void shoot_many(const Point_location& pl, const Index_lookup<Arrangement>& ids,
+                const double* xy, std::size_t n, bool up, std::int8_t* kind,
+                std::int64_t* id, double* y) {
+  using Point_2 = typename Arrangement::Point_2;
+  const double inf = std::numeric_limits<double>::infinity();
+  Feature_reader<Arrangement> reader(ids);
+  for (std::size_t i = 0; i < n; ++i) {
+    const Point_2 q(xy[2 * i], xy[2 * i + 1]);
+    if (up) reader.read(pl.ray_shoot_up(q), q, inf, kind[i], id[i], y[i]);
+    else reader.read(pl.ray_shoot_down(q), q, -inf, kind[i], id[i], y[i]);
+  }
+}
+
+/*! Symbolic vertical decomposition as arrays, one row per vertex.
+ *
+ * Rows follow CGAL::decompose() output (xy-lexicographic vertex order).
+ * below_* / above_* describe the feature hit by the vertical walls shot
+ * down / up from the vertex; no_feature with y = -inf / +inf when the wall
+ * is unbounded.
+ */
+struct Vertical_decomposition {
+  std::vector<std::int64_t> vertex_ids;
+  std::vector<double> x;
+  std::vector<double> y;
+  std::vector<std::int8_t> below_kind, above_kind;
+  std::vector<std::int64_t> below_ids, above_ids;
+  std::vector<double> below_y, above_y;
+};
+
+template <typename Arrangement>
+Vertical_decomposition vertical_decomposition(const Arrangement& arr,
+                                              const Index_lookup<Arrangement>& ids) {
+  using Vertex_const_handle = typename Arrangement::Vertex_const_handle;
+  const double inf = std::numeric_limits<double>::infinity();
+  Vertical_decomposition d;
+  const std::size_t n = arr.number_of_vertices();
+  d.vertex_ids.reserve(n);
+  d.x.reserve(n); d.y.reserve(n);
+  d.below_kind.reserve(n); d.above_kind.reserve(n);
+  d.below_ids.reserve(n); d.above_ids.reserve(n);
+  d.below_y.reserve(n); d.above_y.reserve(n);
+
+  Feature_reader<Arrangement> reader(ids);
+  std::int8_t kind;
+  std::int64_t id;
+  double y;
+  // The entry type is whatever decompose() emits: (vertex, (below, above)).
+  auto out = boost::make_function_output_iterator([&](const auto& entry) {
+    const Vertex_const_handle v = entry.first;
+    const auto& q = v->point();
+    d.vertex_ids.push_back(ids(*v));
+    d.x.push_back(CGAL::to_double(q.x()));
+    d.y.push_back(CGAL::to_double(q.y()));
+    reader.read(entry.second.first, q, -inf, kind, id, y);
+    d.below_kind.push_back(kind); d.below_ids.push_back(id); d.below_y.push_back(y);
+    reader.read(entry.second.second, q, inf, kind, id, y);
+    d.above_kind.push_back(kind); d.above_ids.push_back(id); d.above_y.push_back(y);
+  });
+  CGAL::decompose(arr, out);
+  return d;
+}
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_RAY_SHOOTING_HPP
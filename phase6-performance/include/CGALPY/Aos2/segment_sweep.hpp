@@ -0,0 +1,209 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_SEGMENT_SWEEP_HPP
+#define CGALPY_AOS2_SEGMENT_SWEEP_HPP
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <iterator>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <CGAL/Arr_segment_traits_2.h>
+#include <CGAL/Arr_consolidated_curve_data_traits_2.h>
+#include <CGAL/Surface_sweep_2.h>
+#include <CGAL/Surface_sweep_2/Default_visitor.h>
+#include <CGAL/Surface_sweep_2_algorithms.h>
+
+#include "CGALPY/stats.hpp"
+#include "CGALPY/Aos2/counting_traits.hpp"
+
+namespace CGALPY {
+namespace segment_sweep {
+
+//! Traits the sweeps run on; functor calls are counted in CGALPY_STATS builds.
+#ifdef CGALPY_STATS
+template <typename Kernel>
+using Segment_traits = Counting_traits_2<CGAL::Arr_segment_traits_2<Kernel>>;
+#else
+template <typename Kernel>
+using Segment_traits = CGAL::Arr_segment_traits_2<Kernel>;
+#endif
+
+/*! Result of a sweep over an (N, 4) segment array.
+ *
+ * points[2k], points[2k+1]   - k-th reported point (rounded to double)
+ * pairs[2j], pairs[2j+1]     - indices (i < j) of two input segments that
+ *                              meet at points[pair_point[j]]
+ */
+struct Intersection_report {
+  std::vector<double> points;
+  std::vector<std::int64_t> pairs;
+  std::vector<std::int64_t> pair_point;
+};
+
+/*! Convert row i of an (N, 4) buffer into a kernel segment.
+ *
+ * Zero-length rows are rejected: the sweep has no x-monotone curve to build
+ * from them, and silently dropping them would shift every index we report.
+ */
+template <typename Kernel>
+typename Kernel::Segment_2 checked_segment(const double* xyxy, std::size_t i) {
+  const double* r = xyxy + 4 * i;
+  typename Kernel::Point_2 s(r[0], r[1]), t(r[2], r[3]);
+  if (s == t)
+    throw std::invalid_argument("segment " + std::to_string(i) +
+                                " is degenerate (source == target)");
+  return typename Kernel::Segment_2(s, t);
+}
+
+/*! Surface-sweep visitor that reports the input indices meeting at each event.
+ *
+ * Modelled on CGAL's Intersection_points_visitor. The curves carry their
+ * input index through Arr_consolidated_curve_data_traits_2, so when segments
+ * overlap the merged subcurve still knows every segment it came from.
+ */
+template <typename DataTraits>
+class Indexed_intersection_visitor :
+  public CGAL::Surface_sweep_2::Default_visitor<
+    Indexed_intersection_visitor<DataTraits>, DataTraits>
+{
+  using Self = Indexed_intersection_visitor<DataTraits>;
+  using Base = CGAL::Surface_sweep_2::Default_visitor<Self, DataTraits>;
+
+public:
+  using Event = typename Base::Event;
+  using Subcurve = typename Base::Subcurve;
+  using Status_line_iterator = typename Base::Status_line_iterator;
+  using X_monotone_curve_2 = typename DataTraits::X_monotone_curve_2;
+
+  Indexed_intersection_visitor(Intersection_report& report,
+                               bool report_endpoints) :
+    m_report(report),
+    m_report_endpoints(report_endpoints)
+  {}
+
+  template <typename CurveIterator>
+  void sweep(CurveIterator begin, CurveIterator end) {
+    // Segments are already x-monotone, so skip make_x_monotone and hand the
+    // curves straight to the sweep.
+    this->surface_sweep()->sweep(begin, end);
+  }
+
+  bool after_handle_event(Event* event, Status_line_iterator, bool) {
+    CGALPY_STATS_COUNT(sweep_events);
+    if (! event->is_closed()) return true;
+    const bool crossing = event->is_intersection() ||
+                          event->is_weak_intersection();
+    if (! crossing && ! m_report_endpoints) return true;
+
+    m_ids.clear();
+    collect(event->left_curves_begin(), event->left_curves_end());
+    collect(event->right_curves_begin(), event->right_curves_end());
+    std::sort(m_ids.begin(), m_ids.end());
+    m_ids.erase(std::unique(m_ids.begin(), m_ids.end()), m_ids.end());
+    if (m_ids.size() < 2) return true;
+
+    const auto k = static_cast<std::int64_t>(m_report.points.size() / 2);
+    m_report.points.push_back(CGAL::to_double(event->point().x()));
+    m_report.points.push_back(CGAL::to_double(event->point().y()));
+    for (std::size_t a = 0; a < m_ids.size(); ++a)
+      for (std::size_t b = a + 1; b < m_ids.size(); ++b) {
+        m_report.pairs.push_back(m_ids[a]);
+        m_report.pairs.push_back(m_ids[b]);
+        m_report.pair_point.push_back(k);
+      }
+    return true;
+  }
+
+private:
+  template <typename SubcurveIterator>
+  void collect(SubcurveIterator begin, SubcurveIterator end) {
+    for (auto it = begin; it != end; ++it) {
+      const X_monotone_curve_2& xcv = (*it)->last_curve();
+      m_ids.insert(m_ids.end(), xcv.data().begin(), xcv.data().end());
+    }
+  }
+
+  Intersection_report& m_report;
+  bool m_report_endpoints;
+  std::vector<std::int64_t> m_ids;      // scratch, reused across events
+};
+
+/*! Sweep n segments and report every meeting point with its index pairs.
+ *
+ * O((n + k) log n) for k events; no DCEL is built.
+ */
+template <typename Kernel>
+Intersection_report intersections_with_pairs(const double* xyxy, std::size_t n,
+                                             bool report_endpoints) {
+  using Seg_traits = Segment_traits<Kernel>;
+  using Data_traits =
+    CGAL::Arr_consolidated_curve_data_traits_2<Seg_traits, std::int64_t>;
+  using Data_curve = typename Data_traits::X_monotone_curve_2;
+  using Visitor = Indexed_intersection_visitor<Data_traits>;
+  using Sweep = CGAL::Surface_sweep_2::Surface_sweep_2<Visitor>;
+
+  std::vector<Data_curve> curves;
+  curves.reserve(n);
+  for (std::size_t i = 0; i < n; ++i)
+    curves.emplace_back(checked_segment<Kernel>(xyxy, i),
+                        static_cast<std::int64_t>(i));
+
+  Intersection_report report;
+  Data_traits traits;
+  Visitor visitor(report, report_endpoints);
+  Sweep sweep(&traits, &visitor);
+  visitor.sweep(curves.begin(), curves.end());
+  return report;
+}
+
+/*! Points only, through CGAL::compute_intersection_points() as is.
+ *
+ * Cheaper than intersections_with_pairs() when the caller does not need to
+ * know which segments met: no curve data, no per-event index bookkeeping.
+ */
+template <typename Kernel>
+std::vector<double> intersection_points(const double* xyxy, std::size_t n,
+                                        bool report_endpoints) {
+  using Seg_traits = Segment_traits<Kernel>;
+  using Point_2 = typename Seg_traits::Point_2;
+
+  std::vector<typename Seg_traits::Curve_2> curves;
+  curves.reserve(n);
+  for (std::size_t i = 0; i < n; ++i)
+    curves.push_back(checked_segment<Kernel>(xyxy, i));
+
+  std::vector<Point_2> points;
+  Seg_traits traits;
+  CGAL::compute_intersection_points(curves.begin(), curves.end(),
+                                    std::back_inserter(points),
+                                    report_endpoints, traits);
+  std::vector<double> out;
+  out.reserve(2 * points.size());
+  for (const auto& p : points) {
+    out.push_back(CGAL::to_double(p.x()));
+    out.push_back(CGAL::to_double(p.y()));
+  }
+  return out;
+}
+
+//! True if any two of the n segments intersect (CGAL::do_curves_intersect).
+template <typename Kernel>
+bool any_intersection(const double* xyxy, std::size_t n) {
+  using Seg_traits = Segment_traits<Kernel>;
+  std::vector<typename Seg_traits::Curve_2> curves;
+  curves.reserve(n);
+  for (std::size_t i = 0; i < n; ++i)
+    curves.push_back(checked_segment<Kernel>(xyxy, i));
+  Seg_traits traits;
+  return CGAL::do_curves_intersect(curves.begin(), curves.end(), traits);
+}
+
+} // namespace segment_sweep
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_SEGMENT_SWEEP_HPP
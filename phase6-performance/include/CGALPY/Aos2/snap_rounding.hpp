@@ -0,0 +1,106 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_SNAP_ROUNDING_HPP
+#define CGALPY_AOS2_SNAP_ROUNDING_HPP
+
+#include <algorithm>
+#include <array>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <list>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <CGAL/Exact_predicates_exact_constructions_kernel.h>
+#include <CGAL/Snap_rounding_2.h>
+#include <CGAL/Snap_rounding_traits_2.h>
+
+#include "CGALPY/Aos2/segment_sweep.hpp"
+
+namespace CGALPY {
+namespace snap_rounding {
+
+/*! Snap rounding always runs on an exact kernel, whatever the config's
+ * kernel is: its guarantees rest on exact hot-pixel tests, and the whole
+ * point is to make input safe for the inexact configs.
+ */
+using Sr_kernel = CGAL::Exact_predicates_exact_constructions_kernel;
+using Sr_traits = CGAL::Snap_rounding_traits_2<Sr_kernel>;
+
+/*! Result of snap_round() over an (N, 4) segment array.
+ *
+ * points[2 * offsets[i]] ... points[2 * offsets[i + 1] - 1]
+ *                      - polyline of input segment i, pixel centers in order
+ *                        (a single point if the segment stays in one pixel)
+ * segments[4j .. 4j+3] - distinct fragments of all polylines, each once,
+ *                        lexicographically smaller end point first
+ */
+struct Snapped {
+  std::vector<std::int64_t> offsets{0};
+  std::vector<double> points;
+  std::vector<double> segments;
+};
+
+/*! Snap round n segments to a grid of pixel_size (CGAL::snap_rounding_2).
+ *
+ * With iterated, CGAL's iterated snap rounding keeps every vertex at least
+ * half a pixel away from any edge it is not on, which is what lets the
+ * fragments go into an arrangement with insert_non_intersecting_curves().
+ */
+inline Snapped snap_round(const double* xyxy, std::size_t n, double pixel_size,
+                          bool iterated, unsigned int number_of_kd_trees) {
+  using Segment = Sr_kernel::Segment_2;
+  using Point = Sr_kernel::Point_2;
+
+  if (! (pixel_size > 0) || ! std::isfinite(pixel_size))
+    throw std::invalid_argument("pixel_size must be positive and finite");
+  if (number_of_kd_trees == 0)
+    throw std::invalid_argument("number_of_kd_trees must be positive");
+  for (std::size_t i = 0; i < 4 * n; ++i)
+    if (! std::isfinite(xyxy[i]))
+      throw std::invalid_argument("segment " + std::to_string(i / 4) +
+                                  " has a non-finite coordinate");
+
+  std::list<Segment> input;
+  for (std::size_t i = 0; i < n; ++i)
+    input.push_back(segment_sweep::checked_segment<Sr_kernel>(xyxy, i));
+
+  std::list<std::list<Point>> output;
+  CGAL::snap_rounding_2<Sr_traits>(input.begin(), input.end(), output,
+                                   Sr_traits::FT(pixel_size), iterated,
+                                   false, number_of_kd_trees);
+
+  Snapped s;
+  s.offsets.reserve(n + 1);
+  std::vector<std::array<double, 4>> fragments;
+  for (const auto& polyline : output) {
+    const std::size_t first = s.points.size();
+    for (const Point& p : polyline) {
+      s.points.push_back(CGAL::to_double(p.x()));
+      s.points.push_back(CGAL::to_double(p.y()));
+    }
+    s.offsets.push_back(static_cast<std::int64_t>(s.points.size() / 2));
+    for (std::size_t k = first + 2; k < s.points.size(); k += 2) {
+      std::array<double, 2> a{s.points[k - 2], s.points[k - 1]};
+      std::array<double, 2> b{s.points[k], s.points[k + 1]};
+      if (a == b) continue;     // distinct centers that round to one double
+      if (b < a) std::swap(a, b);
+      fragments.push_back({a[0], a[1], b[0], b[1]});
+    }
+  }
+  std::sort(fragments.begin(), fragments.end());
+  fragments.erase(std::unique(fragments.begin(), fragments.end()),
+                  fragments.end());
+  s.segments.reserve(4 * fragments.size());
+  for (const auto& f : fragments)
+    s.segments.insert(s.segments.end(), f.begin(), f.end());
+  return s;
+}
+
+} // namespace snap_rounding
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_SNAP_ROUNDING_HPP
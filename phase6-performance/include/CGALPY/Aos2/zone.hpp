@@ -0,0 +1,161 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_AOS2_ZONE_HPP
+#define CGALPY_AOS2_ZONE_HPP
+
+#include <algorithm>
+#include <cstddef>
+#include <cstdint>
+#include <functional>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <variant>
+#include <vector>
+
+#include <boost/iterator/function_output_iterator.hpp>
+
+#include <CGAL/Arrangement_on_surface_2.h>
+#include <CGAL/Arr_walk_along_line_point_location.h>
+
+#include "CGALPY/parallel_chunks.hpp"
+#include "CGALPY/Aos2/index_lookup.hpp"
+#include "CGALPY/Aos2/ray_shooting.hpp"
+
+namespace CGALPY {
+
+/*! Zones of M query curves in CSR form.
+ *
+ * The cells crossed by curve i are kinds / ids [offsets[i], offsets[i+1]),
+ * in the order the zone walk meets them (left to right along the curve).
+ * Kinds use Feature_kind; halfedges are reported left-to-right.
+ */
+struct Zone_report {
+  std::vector<std::int64_t> offsets{0};
+  std::vector<std::int8_t> kinds;
+  std::vector<std::int64_t> ids;
+};
+
+namespace zone_detail {
+
+template <typename Arrangement>
+class Cell_sink {
+public:
+  using Vertex_const_handle = typename Arrangement::Vertex_const_handle;
+  using Halfedge_const_handle = typename Arrangement::Halfedge_const_handle;
+  using Face_const_handle = typename Arrangement::Face_const_handle;
+
+  Cell_sink(const Index_lookup<Arrangement>& ids,
+            std::vector<std::int8_t>& kinds, std::vector<std::int64_t>& out) :
+    m_ids(ids), m_kinds(kinds), m_out(out)
+  {}
+
+  template <typename... T>
+  void operator()(const std::variant<T...>& v) {
+    std::visit([this](const auto& h) { (*this)(h); }, v);
+  }
+
+  // Zone reports mutable handles; dispatch on what they convert to.
+  template <typename Handle>
+  std::enable_if_t<std::is_convertible_v<Handle, Vertex_const_handle> ||
+                   std::is_convertible_v<Handle, Halfedge_const_handle> ||
+                   std::is_convertible_v<Handle, Face_const_handle>>
+  operator()(const Handle& h) {
+    if constexpr (std::is_convertible_v<Handle, Vertex_const_handle>) {
+      push(vertex_feature, m_ids(*Vertex_const_handle(h)));
+    }
+    else if constexpr (std::is_convertible_v<Handle, Halfedge_const_handle>) {
+      Halfedge_const_handle e(h);
+      if (e->direction() != CGAL::ARR_LEFT_TO_RIGHT) e = e->twin();
+      push(halfedge_feature, m_ids(*e));
+    }
+    else {
+      push(face_feature, m_ids(*Face_const_handle(h)));
+    }
+  }
+
+private:
+  void push(std::int8_t kind, std::int64_t id) {
+    m_kinds.push_back(kind);
+    m_out.push_back(id);
+  }
+
+  const Index_lookup<Arrangement>& m_ids;
+  std::vector<std::int8_t>& m_kinds;
+  std::vector<std::int64_t>& m_out;
+};
+
+struct Chunk {
+  std::size_t begin;
+  std::vector<std::int64_t> counts;
+  std::vector<std::int8_t> kinds;
+  std::vector<std::int64_t> ids;
+};
+
+} // namespace zone_detail
+
+/*! Zone of each of n segments (rows of an (n, 4) buffer), without inserting.
+ *
+ * Must be called with the GIL released when num_threads != 1. The
+ * arrangement is only read; every worker runs its own CGAL::zone() walk and
+ * they share one walk-along-line point location, which keeps no state
+ * between queries. Zero-length rows are rejected before any work starts.
+ */
+template <typename Arrangement>
+Zone_report zone_many(Arrangement& arr, const Index_lookup<Arrangement>& ids,
+                      const double* xyxy, std::size_t n,
+                      std::size_t num_threads) {
+  using Traits = typename Arrangement::Geometry_traits_2;
+  using Point = typename Traits::Point_2;
+  using X_monotone_curve = typename Traits::X_monotone_curve_2;
+  using Point_location = CGAL::Arr_walk_along_line_point_location<Arrangement>;
+
+  for (std::size_t i = 0; i < n; ++i) {
+    const double* r = xyxy + 4 * i;
+    if (r[0] == r[2] && r[1] == r[3])
+      throw std::invalid_argument("segment " + std::to_string(i) +
+                                  " is degenerate (source == target)");
+  }
+
+  const Point_location pl(arr);
+  std::vector<zone_detail::Chunk> chunks;
+  std::mutex chunks_mutex;
+  parallel_for_chunks(n, num_threads, [&](std::size_t begin, std::size_t end) {
+    zone_detail::Chunk c;
+    c.begin = begin;
+    c.counts.reserve(end - begin);
+    zone_detail::Cell_sink<Arrangement> sink(ids, c.kinds, c.ids);
+    auto out = boost::make_function_output_iterator(std::ref(sink));
+    for (std::size_t i = begin; i < end; ++i) {
+      const double* r = xyxy + 4 * i;
+      const std::size_t before = c.ids.size();
+      const X_monotone_curve xcv(Point(r[0], r[1]), Point(r[2], r[3]));
+      CGAL::zone(arr, xcv, out, pl);
+      c.counts.push_back(static_cast<std::int64_t>(c.ids.size() - before));
+    }
+    std::lock_guard<std::mutex> lock(chunks_mutex);
+    chunks.push_back(std::move(c));
+  }, 64);
+
+  std::sort(chunks.begin(), chunks.end(),
+            [](const auto& a, const auto& b) { return a.begin < b.begin; });
+  Zone_report report;
+  report.offsets.reserve(n + 1);
+  std::size_t total = 0;
+  for (const auto& c : chunks) total += c.ids.size();
+  report.kinds.reserve(total);
+  report.ids.reserve(total);
+  for (const auto& c : chunks) {
+    for (std::int64_t k : c.counts)
+      report.offsets.push_back(report.offsets.back() + k);
+    report.kinds.insert(report.kinds.end(), c.kinds.begin(), c.kinds.end());
+    report.ids.insert(report.ids.end(), c.ids.begin(), c.ids.end());
+  }
+  return report;
+}
+
+} // namespace CGALPY
+
+#endif // CGALPY_AOS2_ZONE_HPP
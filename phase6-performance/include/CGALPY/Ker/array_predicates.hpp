@@ -0,0 +1,131 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_KER_ARRAY_PREDICATES_HPP
+#define CGALPY_KER_ARRAY_PREDICATES_HPP
+
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <variant>
+
+#include <CGAL/intersections.h>
+#include <CGAL/squared_distance_2.h>
+
+namespace CGALPY {
+namespace ker_arrays {
+
+/*! Row kernels behind the vectorized `CGALPY.Ker` functions.
+ *
+ * Everything here works on raw row-major double buffers and builds kernel
+ * objects on the stack, so no Python object is created per row. The
+ * predicates go through the kernel's own functors: for Epick/Epeck these are
+ * the filtered predicates, so the exact fallback only runs for rows where
+ * the interval filter fails.
+ *
+ * Targets CGAL 6 (std::optional<std::variant> intersection results); CGAL
+ * 5.6 needs boost::get instead of std::get_if.
+ *
+ * Each function handles the half-open row range [begin, end) so it can be
+ * handed straight to parallel_for_chunks().
+ */
+
+//! Intersection kind codes written by intersection_rows().
+enum Intersection_kind : std::int8_t {
+  NO_INTERSECTION = 0,
+  POINT_INTERSECTION = 1,
+  SEGMENT_INTERSECTION = 2
+};
+
+template <typename Kernel>
+typename Kernel::Point_2 point_at(const double* xy, std::size_t i) {
+  return typename Kernel::Point_2(xy[2 * i], xy[2 * i + 1]);
+}
+
+template <typename Kernel>
+typename Kernel::Segment_2 segment_at(const double* xyxy, std::size_t i) {
+  const double* r = xyxy + 4 * i;
+  return typename Kernel::Segment_2(typename Kernel::Point_2(r[0], r[1]),
+                                    typename Kernel::Point_2(r[2], r[3]));
+}
+
+//! out[i] = orientation(p[i], q[i], r[i]) as -1 / 0 / +1.
+template <typename Kernel>
+void orientation_rows(const Kernel& kernel, const double* p, const double* q,
+                      const double* r, std::int8_t* out,
+                      std::size_t begin, std::size_t end) {
+  auto orientation = kernel.orientation_2_object();
+  for (std::size_t i = begin; i < end; ++i)
+    out[i] = static_cast<std::int8_t>(
+      orientation(point_at<Kernel>(p, i), point_at<Kernel>(q, i),
+                  point_at<Kernel>(r, i)));
+}
+
+//! out[i] = do_intersect(a[i], b[i]).
+template <typename Kernel>
+void do_intersect_rows(const Kernel& kernel, const double* a, const double* b,
+                       bool* out, std::size_t begin, std::size_t end) {
+  auto do_intersect = kernel.do_intersect_2_object();
+  for (std::size_t i = begin; i < end; ++i)
+    out[i] = do_intersect(segment_at<Kernel>(a, i), segment_at<Kernel>(b, i));
+}
+
+/*! kinds[i] = Intersection_kind, coords[4i..4i+3] = result as doubles.
+ *
+ * A point result fills the first two columns and leaves NaN in the last two;
+ * an overlap fills all four with the segment end points; no intersection
+ * leaves the whole row NaN. The intersection is only constructed when the
+ * (filtered) do_intersect predicate succeeds, which keeps the common
+ * "disjoint" case on the cheap path.
+ */
+template <typename Kernel>
+void intersection_rows(const Kernel& kernel, const double* a, const double* b,
+                       std::int8_t* kinds, double* coords,
+                       std::size_t begin, std::size_t end) {
+  using Point_2 = typename Kernel::Point_2;
+  using Segment_2 = typename Kernel::Segment_2;
+  constexpr double nan = std::numeric_limits<double>::quiet_NaN();
+
+  auto do_intersect = kernel.do_intersect_2_object();
+  auto intersect = kernel.intersect_2_object();
+  for (std::size_t i = begin; i < end; ++i) {
+    double* row = coords + 4 * i;
+    row[0] = row[1] = row[2] = row[3] = nan;
+    kinds[i] = NO_INTERSECTION;
+
+    auto sa = segment_at<Kernel>(a, i);
+    auto sb = segment_at<Kernel>(b, i);
+    if (! do_intersect(sa, sb)) continue;
+
+    auto result = intersect(sa, sb);
+    if (! result) continue;
+    if (const Point_2* p = std::get_if<Point_2>(&*result)) {
+      kinds[i] = POINT_INTERSECTION;
+      row[0] = CGAL::to_double(p->x());
+      row[1] = CGAL::to_double(p->y());
+    }
+    else if (const Segment_2* s = std::get_if<Segment_2>(&*result)) {
+      kinds[i] = SEGMENT_INTERSECTION;
+      row[0] = CGAL::to_double(s->source().x());
+      row[1] = CGAL::to_double(s->source().y());
+      row[2] = CGAL::to_double(s->target().x());
+      row[3] = CGAL::to_double(s->target().y());
+    }
+  }
+}
+
+//! out[i] = squared_distance(points[i], segments[i]), rounded to double.
+template <typename Kernel>
+void squared_distance_rows(const Kernel& kernel, const double* points,
+                           const double* segments, double* out,
+                           std::size_t begin, std::size_t end) {
+  auto squared_distance = kernel.compute_squared_distance_2_object();
+  for (std::size_t i = begin; i < end; ++i)
+    out[i] = CGAL::to_double(squared_distance(point_at<Kernel>(points, i),
+                                              segment_at<Kernel>(segments, i)));
+}
+
+} // namespace ker_arrays
+} // namespace CGALPY
+
+#endif // CGALPY_KER_ARRAY_PREDICATES_HPP
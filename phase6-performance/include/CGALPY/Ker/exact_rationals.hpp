@@ -0,0 +1,213 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_KER_EXACT_RATIONALS_HPP
+#define CGALPY_KER_EXACT_RATIONALS_HPP
+
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <CGAL/number_utils.h>
+
+#if defined(CGAL_USE_GMP)
+#include <gmp.h>
+#include <CGAL/Gmpq.h>
+#if __has_include(<boost/multiprecision/gmp.hpp>)
+#include <boost/multiprecision/gmp.hpp>
+#define CGALPY_EXACT_RATIONALS_BOOST_GMP
+#endif
+#endif
+
+#include <Python.h>
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include "CGALPY/array_support.hpp"
+
+namespace CGALPY {
+namespace exact_rationals {
+
+/*! Exact rationals as sign + little-endian magnitude bytes.
+ *
+ * Value k has numerator magnitude bytes[offsets[2k] .. offsets[2k+1]) and
+ * denominator bytes[offsets[2k+1] .. offsets[2k+2]). Zero has an empty
+ * numerator and denominator 1; denominators are positive and coprime to the
+ * numerator, as the GMP types keep them.
+ */
+struct Rationals {
+  std::vector<std::int8_t> sign;
+  std::vector<std::int64_t> offsets{0};
+  std::vector<std::uint8_t> bytes;
+  std::uint64_t materialized = 0;       // values that needed CGAL::exact()
+};
+
+namespace detail {
+
+inline void close_integer(Rationals& r) {
+  r.offsets.push_back(static_cast<std::int64_t>(r.bytes.size()));
+}
+
+//! Append m * 2^shift as magnitude bytes.
+inline void append_shifted(Rationals& r, std::uint64_t m, int shift) {
+  const std::size_t start = r.bytes.size();
+  r.bytes.insert(r.bytes.end(), static_cast<std::size_t>(shift / 8), 0);
+  const int s = shift % 8;
+  const std::uint64_t lo = m << s;
+  for (int i = 0; i < 8; ++i)
+    r.bytes.push_back(static_cast<std::uint8_t>(lo >> (8 * i)));
+  r.bytes.push_back(s == 0 ? 0 : static_cast<std::uint8_t>(m >> (64 - s)));
+  while (r.bytes.size() > start && r.bytes.back() == 0) r.bytes.pop_back();
+}
+
+#if defined(CGAL_USE_GMP)
+inline void append_mpz(Rationals& r, mpz_srcptr z) {
+  if (mpz_sgn(z) != 0) {
+    const std::size_t n = (mpz_sizeinbase(z, 2) + 7) / 8;
+    const std::size_t start = r.bytes.size();
+    r.bytes.resize(start + n);
+    std::size_t written = 0;
+    mpz_export(r.bytes.data() + start, &written, -1, 1, 0, 0, z);
+    r.bytes.resize(start + written);
+  }
+  close_integer(r);
+}
+
+inline void append_mpq(Rationals& r, mpq_srcptr q) {
+  r.sign.push_back(static_cast<std::int8_t>(mpq_sgn(q)));
+  append_mpz(r, mpq_numref(q));
+  append_mpz(r, mpq_denref(q));
+}
+#endif
+
+} // namespace detail
+
+/*! Append a double exactly: |x| = m * 2^e with m odd. */
+inline void append(Rationals& r, double x) {
+  if (! std::isfinite(x))
+    throw std::invalid_argument("cannot export a non-finite coordinate exactly");
+  r.sign.push_back(static_cast<std::int8_t>((x > 0) - (x < 0)));
+  if (x == 0) {
+    detail::close_integer(r);
+    detail::append_shifted(r, 1, 0);
+    detail::close_integer(r);
+    return;
+  }
+  int e = 0;
+  auto m = static_cast<std::uint64_t>(std::ldexp(std::frexp(std::fabs(x), &e), 53));
+  e -= 53;
+  while ((m & 1) == 0) { m >>= 1; ++e; }
+  detail::append_shifted(r, m, e > 0 ? e : 0);
+  detail::close_integer(r);
+  detail::append_shifted(r, 1, e < 0 ? -e : 0);
+  detail::close_integer(r);
+}
+
+#if defined(CGAL_USE_GMP)
+inline void append(Rationals& r, const CGAL::Gmpq& q) {
+  detail::append_mpq(r, q.mpq());
+}
+#endif
+
+#if defined(CGALPY_EXACT_RATIONALS_BOOST_GMP)
+template <boost::multiprecision::expression_template_option Et>
+void append(Rationals& r,
+            const boost::multiprecision::number<boost::multiprecision::gmp_rational, Et>& q) {
+  detail::append_mpq(r, q.backend().data());
+}
+#endif
+
+//! Exact types without GMP limbs (e.g. Quotient<MP_Float>) are not supported.
+template <typename ET>
+void append(Rationals&, const ET&) {
+  throw std::runtime_error("exact export needs a GMP-backed exact number "
+                           "type; this config was built without GMP");
+}
+
+/*! Append one kernel number, computing its exact value only if needed.
+ *
+ * A lazy-exact number whose interval has collapsed to a point is that
+ * double, so it is written from the interval and its exact DAG is left
+ * alone. Only the others go through CGAL::exact(). Under EPIC every value
+ * takes the first path.
+ */
+template <typename FT>
+void append_number(Rationals& r, const FT& x) {
+  const std::pair<double, double> i = CGAL::to_interval(x);
+  if (i.first == i.second) {
+    append(r, i.first);
+    return;
+  }
+  ++r.materialized;
+  append(r, CGAL::exact(x));
+}
+
+template <typename Point>
+void append_point(Rationals& r, const Point& p) {
+  append_number(r, p.x());
+  append_number(r, p.y());
+}
+
+/*! Hand rationals over to Python, `rows` x `cols` values.
+ *
+ * "bytes" returns the arrays as they are. "fraction" and "gmpy2" build
+ * Python integers with int.from_bytes() straight from the magnitudes (no
+ * decimal strings) and return nested lists of fractions.Fraction or
+ * gmpy2.mpq.
+ */
+inline py::object to_python(Rationals&& r, std::size_t rows, std::size_t cols,
+                            const std::string& format) {
+  if (format == "bytes") {
+    const std::size_t no = r.offsets.size();
+    const std::size_t nb = r.bytes.size();
+    py::dict d;
+    d["sign"] = to_numpy(std::move(r.sign), {rows, cols});
+    d["offsets"] = to_numpy(std::move(r.offsets), {no});
+    d["bytes"] = to_numpy(std::move(r.bytes), {nb});
+    d["materialized"] = r.materialized;
+    return std::move(d);
+  }
+
+  py::object make;
+  if (format == "fraction")
+    make = py::module_::import_("fractions").attr("Fraction");
+  else if (format == "gmpy2")
+    make = py::module_::import_("gmpy2").attr("mpq");
+  else
+    throw std::invalid_argument("format must be 'bytes', 'fraction' or "
+                                "'gmpy2', not '" + format + "'");
+
+  py::object from_bytes = py::module_::import_("builtins").attr("int")
+                            .attr("from_bytes");
+  py::str little("little");
+  auto integer = [&](std::int64_t a, std::int64_t b) {
+    return from_bytes(py::bytes(reinterpret_cast<const char*>(r.bytes.data()) + a,
+                                static_cast<std::size_t>(b - a)),
+                      little);
+  };
+
+  py::list out;
+  std::size_t k = 0;
+  for (std::size_t i = 0; i < rows; ++i) {
+    py::list row;
+    for (std::size_t j = 0; j < cols; ++j, ++k) {
+      py::object num = integer(r.offsets[2 * k], r.offsets[2 * k + 1]);
+      if (r.sign[k] < 0) {
+        num = py::steal(PyNumber_Negative(num.ptr()));
+        if (! num.is_valid()) throw py::python_error();
+      }
+      row.append(make(num, integer(r.offsets[2 * k + 1], r.offsets[2 * k + 2])));
+    }
+    out.append(row);
+  }
+  return std::move(out);
+}
+
+} // namespace exact_rationals
+} // namespace CGALPY
+
+#endif // CGALPY_KER_EXACT_RATIONALS_HPP
@@ -0,0 +1,97 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_PMP_CONCURRENCY_HPP
+#define CGALPY_PMP_CONCURRENCY_HPP
+
+#include <cstddef>
+#include <optional>
+#include <stdexcept>
+#include <string>
+
+#include <nanobind/nanobind.h>
+
+#include <CGAL/tags.h>
+
+#if defined(CGAL_LINKED_WITH_TBB)
+#  include <tbb/global_control.h>
+#endif
+
+namespace py = nanobind;
+
+namespace CGALPY {
+
+/*! Requested concurrency of one PMP call.
+ *
+ * CGAL selects parallel PMP code through a ConcurrencyTag template argument,
+ * not through a named parameter, so the choice cannot ride on the CGAL
+ * parameter chain. The operators below record it here instead while the
+ * applicator walks the dict; the wrapper reads it when it makes the call.
+ */
+struct Concurrency {
+  bool parallel = false;
+  std::size_t num_threads = 0;        // 0 = all hardware threads
+};
+
+/*! Operator for the "parallel" named parameter.
+ *
+ * Python usage:
+ *   PMP.compute_vertex_normals(mesh, vnormals, {"parallel": True})
+ *
+ * Leaves the CGAL chain unchanged and records the flag.
+ */
+struct Named_parameter_parallel {
+  const std::string m_name = "parallel";
+  Concurrency* m_concurrency;
+
+  explicit Named_parameter_parallel(Concurrency& c) : m_concurrency(&c) {}
+
+  template <typename NamedParameters, typename Value>
+  auto operator()(NamedParameters& np, Value& value) const {
+    m_concurrency->parallel = py::cast<bool>(value);
+    return np;
+  }
+};
+
+/*! Operator for the "num_threads" named parameter.
+ *
+ * Python usage:
+ *   PMP.compute_vertex_normals(mesh, vnormals, {"parallel": True, "num_threads": 4})
+ *
+ * Only meaningful together with "parallel": True.
+ */
+struct Named_parameter_num_threads {
+  const std::string m_name = "num_threads";
+  Concurrency* m_concurrency;
+
+  explicit Named_parameter_num_threads(Concurrency& c) : m_concurrency(&c) {}
+
+  template <typename NamedParameters, typename Value>
+  auto operator()(NamedParameters& np, Value& value) const {
+    const long n = py::cast<long>(value);
+    if (n < 0) throw std::invalid_argument("num_threads must be >= 0");
+    m_concurrency->num_threads = static_cast<std::size_t>(n);
+    return np;
+  }
+};
+
+/*! Run fn(tag) with CGAL::Parallel_if_available_tag or CGAL::Sequential_tag.
+ *
+ * For PMP functions that have a TBB implementation. With TBB, num_threads
+ * caps the scheduler for the duration of the call; without TBB the
+ * parallel tag falls back to the sequential code, as it does in CGAL.
+ */
+template <typename Fn>
+decltype(auto) with_concurrency_tag(const Concurrency& c, Fn&& fn) {
+  if (! c.parallel) return fn(CGAL::Sequential_tag());
+#if defined(CGAL_LINKED_WITH_TBB)
+  std::optional<tbb::global_control> cap;
+  if (c.num_threads != 0)
+    cap.emplace(tbb::global_control::max_allowed_parallelism, c.num_threads);
+#endif
+  return fn(CGAL::Parallel_if_available_tag());
+}
+
+} // namespace CGALPY
+
+#endif // CGALPY_PMP_CONCURRENCY_HPP
@@ -0,0 +1,128 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_PMP_MESH_ARRAYS_HPP
+#define CGALPY_PMP_MESH_ARRAYS_HPP
+
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <CGAL/boost/graph/iterator.h>
+#include <CGAL/number_utils.h>
+
+namespace CGALPY {
+namespace mesh_arrays {
+
+/*! Fill an empty Surface_mesh from (nv, 3) vertices and (nf, k) faces.
+ *
+ * Indices are checked before anything is added, so a bad row never leaves a
+ * half-built mesh behind. A face that Surface_mesh::add_face() refuses
+ * (non-manifold edge or vertex, or an orientation clash with a neighbour)
+ * is reported with its row number; the mesh is cleared in that case.
+ */
+template <typename Mesh>
+void build(Mesh& sm, const double* V, std::size_t nv,
+           const std::int64_t* F, std::size_t nf, std::size_t k) {
+  using Point = typename Mesh::Point;
+  using Vertex_index = typename Mesh::Vertex_index;
+
+  if (k < 3)
+    throw std::invalid_argument("faces need at least 3 vertices, got " +
+                                std::to_string(k));
+  for (std::size_t f = 0; f < nf; ++f) {
+    const std::int64_t* row = F + k * f;
+    for (std::size_t j = 0; j < k; ++j) {
+      if (row[j] < 0 || static_cast<std::size_t>(row[j]) >= nv)
+        throw std::invalid_argument("face " + std::to_string(f) +
+                                    " references vertex " +
+                                    std::to_string(row[j]) + ", but there are " +
+                                    std::to_string(nv) + " vertices");
+      for (std::size_t i = 0; i < j; ++i)
+        if (row[i] == row[j])
+          throw std::invalid_argument("face " + std::to_string(f) +
+                                      " repeats vertex " + std::to_string(row[j]));
+    }
+  }
+
+  sm.clear();
+  // Every interior edge is shared by two faces; border edges make this an
+  // underestimate, which reserve() tolerates.
+  sm.reserve(nv, (nf * k + 1) / 2, nf);
+  for (std::size_t v = 0; v < nv; ++v)
+    sm.add_vertex(Point(V[3 * v], V[3 * v + 1], V[3 * v + 2]));
+
+  std::vector<Vertex_index> face(k);
+  for (std::size_t f = 0; f < nf; ++f) {
+    const std::int64_t* row = F + k * f;
+    for (std::size_t j = 0; j < k; ++j)
+      face[j] = Vertex_index(static_cast<typename Mesh::size_type>(row[j]));
+    if (sm.add_face(face) == Mesh::null_face()) {
+      sm.clear();
+      throw std::invalid_argument("face " + std::to_string(f) +
+                                  " cannot be added: it would create a "
+                                  "non-manifold edge or vertex, or its "
+                                  "orientation clashes with a neighbour");
+    }
+  }
+}
+
+//! Compact vertex / face arrays of a Surface_mesh (see export_arrays()).
+struct Arrays {
+  std::vector<double> vertices;         // nv * 3
+  std::vector<std::int64_t> faces;      // nf * k
+  std::size_t nv = 0;
+  std::size_t nf = 0;
+  std::size_t k = 0;
+};
+
+/*! Vertex coordinates and face indices, skipping removed elements.
+ *
+ * Without garbage, row i is Vertex_index(i) and face rows follow Face_index
+ * order; after removals, vertices are renumbered in vertices() order. All
+ * faces must have the same degree.
+ */
+template <typename Mesh>
+Arrays export_arrays(const Mesh& sm) {
+  Arrays a;
+  a.nv = sm.number_of_vertices();
+  a.nf = sm.number_of_faces();
+
+  std::vector<std::int64_t> row;
+  if (sm.has_garbage()) {
+    row.assign(sm.num_vertices(), -1);
+    std::int64_t i = 0;
+    for (auto v : sm.vertices()) row[v] = i++;
+  }
+
+  a.vertices.reserve(3 * a.nv);
+  for (auto v : sm.vertices()) {
+    const auto& p = sm.point(v);
+    a.vertices.push_back(CGAL::to_double(p.x()));
+    a.vertices.push_back(CGAL::to_double(p.y()));
+    a.vertices.push_back(CGAL::to_double(p.z()));
+  }
+
+  if (a.nf == 0) return a;
+  a.k = sm.degree(*sm.faces().begin());
+  a.faces.reserve(a.k * a.nf);
+  for (auto f : sm.faces()) {
+    const std::size_t before = a.faces.size();
+    for (auto v : CGAL::vertices_around_face(sm.halfedge(f), sm))
+      a.faces.push_back(row.empty() ? static_cast<std::int64_t>(v) : row[v]);
+    const std::size_t d = a.faces.size() - before;
+    if (d != a.k)
+      throw std::invalid_argument("faces have mixed degrees (" +
+                                  std::to_string(a.k) + " and " +
+                                  std::to_string(d) + "); triangulate the mesh "
+                                  "first to export a single (F, k) array");
+  }
+  return a;
+}
+
+} // namespace mesh_arrays
+} // namespace CGALPY
+
+#endif // CGALPY_PMP_MESH_ARRAYS_HPP
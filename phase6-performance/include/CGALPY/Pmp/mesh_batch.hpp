@@ -0,0 +1,150 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_PMP_MESH_BATCH_HPP
+#define CGALPY_PMP_MESH_BATCH_HPP
+
+#include <cstddef>
+#include <cstdint>
+#include <stdexcept>
+#include <string>
+#include <unordered_set>
+#include <vector>
+
+#include <CGAL/number_utils.h>
+#include <CGAL/Polygon_mesh_processing/compute_normal.h>
+#include <CGAL/Polygon_mesh_processing/remesh.h>
+
+#include "CGALPY/parallel_chunks.hpp"
+#include "CGALPY/Pmp/mesh_arrays.hpp"
+
+namespace CGALPY {
+namespace mesh_batch {
+
+//! Meshes per worker chunk; batches are many small meshes.
+constexpr std::size_t min_chunk = 16;
+
+/*! Per-face normals of many meshes, concatenated.
+ *
+ * The normals of mesh i are rows [offsets[i], offsets[i+1]) of the
+ * (offsets.back(), 3) `normals` buffer, in faces() order (the face rows
+ * of mesh_arrays::export_arrays()).
+ */
+struct Face_normals {
+  std::vector<std::int64_t> offsets{0};
+  std::vector<double> normals;
+};
+
+/*! Several meshes as one vertex buffer and one face buffer.
+ *
+ * Mesh i owns vertex rows [vertex_offsets[i], vertex_offsets[i+1]) and
+ * face rows [face_offsets[i], face_offsets[i+1]); face entries index the
+ * mesh's own vertex rows, starting at 0.
+ */
+struct Meshes {
+  std::vector<std::int64_t> vertex_offsets{0};
+  std::vector<std::int64_t> face_offsets{0};
+  std::vector<double> vertices;
+  std::vector<std::int64_t> faces;
+};
+
+//! Reject a batch that lists the same mesh twice (workers would race on it).
+template <typename Mesh>
+void check_distinct(const std::vector<Mesh*>& meshes) {
+  std::unordered_set<const void*> seen;
+  seen.reserve(meshes.size());
+  for (std::size_t i = 0; i < meshes.size(); ++i)
+    if (! seen.insert(meshes[i]).second)
+      throw std::invalid_argument("mesh " + std::to_string(i) +
+                                  " appears more than once in the batch");
+}
+
+/*! PMP::compute_face_normal() for every face of every mesh.
+ *
+ * Must be called with the GIL released when num_threads != 1. The meshes
+ * are only read; worker chunks write disjoint slices of the output, whose
+ * offsets are fixed before any worker starts.
+ */
+template <typename Mesh, typename NamedParameters>
+Face_normals face_normals(const std::vector<const Mesh*>& meshes,
+                          const NamedParameters& np, std::size_t num_threads) {
+  namespace PMP = CGAL::Polygon_mesh_processing;
+
+  Face_normals r;
+  r.offsets.reserve(meshes.size() + 1);
+  for (const Mesh* m : meshes)
+    r.offsets.push_back(r.offsets.back() +
+                        static_cast<std::int64_t>(m->number_of_faces()));
+  r.normals.resize(3 * static_cast<std::size_t>(r.offsets.back()));
+
+  parallel_for_chunks(meshes.size(), num_threads,
+                      [&](std::size_t begin, std::size_t end) {
+    for (std::size_t i = begin; i < end; ++i) {
+      const Mesh& m = *meshes[i];
+      double* out = r.normals.data() + 3 * r.offsets[i];
+      for (auto f : faces(m)) {
+        const auto n = PMP::compute_face_normal(f, m, np);
+        *out++ = CGAL::to_double(n.x());
+        *out++ = CGAL::to_double(n.y());
+        *out++ = CGAL::to_double(n.z());
+      }
+    }
+  }, min_chunk);
+  return r;
+}
+
+/*! PMP::isotropic_remeshing() of every mesh in place, then export.
+ *
+ * `targets` holds one target edge length per mesh, or a single one for all
+ * (n_targets == 1). Must be called with the GIL released when
+ * num_threads != 1, and without duplicates in `meshes` (check_distinct()).
+ * An error from mesh i is reported with its position; meshes before it in
+ * the same chunk are already remeshed.
+ */
+template <typename Mesh, typename NamedParameters>
+Meshes isotropic_remeshing(const std::vector<Mesh*>& meshes,
+                           const double* targets, std::size_t n_targets,
+                           const NamedParameters& np, std::size_t num_threads) {
+  namespace PMP = CGAL::Polygon_mesh_processing;
+
+  std::vector<mesh_arrays::Arrays> out(meshes.size());
+  parallel_for_chunks(meshes.size(), num_threads,
+                      [&](std::size_t begin, std::size_t end) {
+    for (std::size_t i = begin; i < end; ++i) {
+      Mesh& m = *meshes[i];
+      const double target = targets[n_targets == 1 ? 0 : i];
+      try {
+        PMP::isotropic_remeshing(faces(m), target, m, np);
+        out[i] = mesh_arrays::export_arrays(m);
+      }
+      catch (const std::invalid_argument& e) {
+        throw std::invalid_argument("mesh " + std::to_string(i) + ": " + e.what());
+      }
+    }
+  }, 1);
+
+  Meshes r;
+  std::size_t nv = 0, nf = 0;
+  for (const auto& a : out) { nv += a.nv; nf += a.nf; }
+  r.vertex_offsets.reserve(meshes.size() + 1);
+  r.face_offsets.reserve(meshes.size() + 1);
+  r.vertices.reserve(3 * nv);
+  r.faces.reserve(3 * nf);
+  for (std::size_t i = 0; i < out.size(); ++i) {
+    auto& a = out[i];
+    if (a.nf != 0 && a.k != 3)
+      throw std::invalid_argument("mesh " + std::to_string(i) +
+                                  " is not a triangle mesh after remeshing");
+    r.vertex_offsets.push_back(r.vertex_offsets.back() + static_cast<std::int64_t>(a.nv));
+    r.face_offsets.push_back(r.face_offsets.back() + static_cast<std::int64_t>(a.nf));
+    r.vertices.insert(r.vertices.end(), a.vertices.begin(), a.vertices.end());
+    r.faces.insert(r.faces.end(), a.faces.begin(), a.faces.end());
+    a = mesh_arrays::Arrays();            // release as we go
+  }
+  return r;
+}
+
+} // namespace mesh_batch
+} // namespace CGALPY
+
+#endif // CGALPY_PMP_MESH_BATCH_HPP
@@ -0,0 +1,69 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_PMP_PARALLEL_NORMALS_HPP
+#define CGALPY_PMP_PARALLEL_NORMALS_HPP
+
+#include <cstddef>
+#include <vector>
+
+#include <CGAL/boost/graph/named_params_helper.h>
+#include <CGAL/boost/graph/properties.h>
+#include <CGAL/Named_function_parameters.h>
+#include <CGAL/Polygon_mesh_processing/compute_normal.h>
+
+#include "CGALPY/parallel_chunks.hpp"
+
+namespace CGALPY {
+namespace pmp_parallel {
+
+/*! PMP::compute_face_normals() over contiguous chunks of faces.
+ *
+ * Must be called with the GIL released. Each face normal only reads the
+ * mesh and writes its own slot of `fnm`, so the workers share nothing
+ * mutable; the result is identical to the sequential function.
+ */
+template <typename PolygonMesh, typename FaceNormalMap, typename NamedParameters>
+void compute_face_normals(const PolygonMesh& pm, FaceNormalMap fnm,
+                          const NamedParameters& np, std::size_t num_threads) {
+  namespace PMP = CGAL::Polygon_mesh_processing;
+  using face_descriptor = typename boost::graph_traits<PolygonMesh>::face_descriptor;
+
+  const std::vector<face_descriptor> fs(faces(pm).begin(), faces(pm).end());
+  parallel_for_chunks(fs.size(), num_threads, [&](std::size_t begin, std::size_t end) {
+    for (std::size_t i = begin; i < end; ++i)
+      put(fnm, fs[i], PMP::compute_face_normal(fs[i], pm, np));
+  });
+}
+
+/*! PMP::compute_vertex_normals() in two parallel passes.
+ *
+ * Face normals go to a temporary dynamic map first (as CGAL does), then
+ * every vertex normal is computed from its incident face normals. The
+ * temporary map is created before any worker starts.
+ */
+template <typename PolygonMesh, typename VertexNormalMap, typename NamedParameters>
+void compute_vertex_normals(const PolygonMesh& pm, VertexNormalMap vnm,
+                            const NamedParameters& np, std::size_t num_threads) {
+  namespace PMP = CGAL::Polygon_mesh_processing;
+  using vertex_descriptor = typename boost::graph_traits<PolygonMesh>::vertex_descriptor;
+  using Geom_traits = typename CGAL::GetGeomTraits<PolygonMesh, NamedParameters>::type;
+  using Face_normal_tag = CGAL::dynamic_face_property_t<typename Geom_traits::Vector_3>;
+  using Face_normal_dmap =
+    typename boost::property_map<PolygonMesh, Face_normal_tag>::const_type;
+
+  Face_normal_dmap face_normals = get(Face_normal_tag(), pm);
+  compute_face_normals(pm, face_normals, np, num_threads);
+
+  const auto vnp = np.face_normal_map(face_normals);
+  const std::vector<vertex_descriptor> vs(vertices(pm).begin(), vertices(pm).end());
+  parallel_for_chunks(vs.size(), num_threads, [&](std::size_t begin, std::size_t end) {
+    for (std::size_t i = begin; i < end; ++i)
+      put(vnm, vs[i], PMP::compute_vertex_normal(vs[i], pm, vnp));
+  });
+}
+
+} // namespace pmp_parallel
+} // namespace CGALPY
+
+#endif // CGALPY_PMP_PARALLEL_NORMALS_HPP
@@ -0,0 +1,45 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_PMP_REMESHING_PARAMETERS_HPP
+#define CGALPY_PMP_REMESHING_PARAMETERS_HPP
+
+#include <string>
+
+#include <nanobind/nanobind.h>
+
+namespace py = nanobind;
+
+namespace CGALPY {
+
+/*! Operator for the "number_of_iterations" named parameter.
+ *
+ * Python usage:
+ *   PMP.isotropic_remeshing(mesh, 0.1, {"number_of_iterations": 3})
+ */
+struct Named_parameter_number_of_iterations {
+  const std::string m_name = "number_of_iterations";
+
+  template <typename NamedParameters, typename Value>
+  auto operator()(NamedParameters& np, Value& value) const {
+    return np.number_of_iterations(py::cast<unsigned int>(value));
+  }
+};
+
+/*! Operator for the "protect_constraints" named parameter.
+ *
+ * Python usage:
+ *   PMP.isotropic_remeshing(mesh, 0.1, {"protect_constraints": True})
+ */
+struct Named_parameter_protect_constraints {
+  const std::string m_name = "protect_constraints";
+
+  template <typename NamedParameters, typename Value>
+  auto operator()(NamedParameters& np, Value& value) const {
+    return np.protect_constraints(py::cast<bool>(value));
+  }
+};
+
+} // namespace CGALPY
+
+#endif // CGALPY_PMP_REMESHING_PARAMETERS_HPP
@@ -0,0 +1,82 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_ARRAY_SUPPORT_HPP
+#define CGALPY_ARRAY_SUPPORT_HPP
+
+#include <cstddef>
+#include <cstdint>
+#include <initializer_list>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+namespace py = nanobind;
+
+namespace CGALPY {
+
+/*! Read-only (N, Cols) input array, C-contiguous, on the CPU.
+ *
+ * nanobind rejects anything else at the call boundary (wrong dtype, wrong
+ * column count, Fortran order), so the kernels below can index raw memory
+ * without re-checking strides.
+ */
+template <typename T, std::size_t Cols>
+using Rows_in = py::ndarray<const T, py::shape<-1, Cols>, py::c_contig,
+                            py::device::cpu>;
+
+//! Read-only (N,) input array.
+template <typename T>
+using Vector_in = py::ndarray<const T, py::shape<-1>, py::c_contig,
+                              py::device::cpu>;
+
+//! NumPy output array with a runtime shape.
+template <typename T>
+using Array_out = py::ndarray<py::numpy, T>;
+
+/*! Hand a std::vector over to NumPy without copying.
+ *
+ * The vector is moved to the heap and owned by a capsule, so the buffer
+ * lives exactly as long as the NumPy array that views it.
+ */
+template <typename T>
+Array_out<T> to_numpy(std::vector<T>&& data,
+                      std::initializer_list<std::size_t> shape) {
+  auto* owner = new std::vector<T>(std::move(data));
+  py::capsule deleter(owner, [](void* p) noexcept {
+    delete static_cast<std::vector<T>*>(p);
+  });
+  return Array_out<T>(owner->data(), shape, deleter);
+}
+
+/*! Boolean variant of to_numpy().
+ *
+ * std::vector<bool> is bit-packed, so boolean results are collected as one
+ * byte per entry and exposed with NumPy's bool dtype (also one byte).
+ */
+inline Array_out<bool> to_numpy_bool(std::vector<std::uint8_t>&& data,
+                                     std::initializer_list<std::size_t> shape) {
+  auto* owner = new std::vector<std::uint8_t>(std::move(data));
+  py::capsule deleter(owner, [](void* p) noexcept {
+    delete static_cast<std::vector<std::uint8_t>*>(p);
+  });
+  return Array_out<bool>(owner->data(), shape, deleter);
+}
+
+//! Raise ValueError (via std::invalid_argument) on mismatched row counts.
+inline void check_same_rows(std::size_t a, std::size_t b,
+                            const char* name_a, const char* name_b) {
+  if (a == b) return;
+  throw std::invalid_argument(std::string(name_a) + " and " + name_b +
+                              " must have the same number of rows (" +
+                              std::to_string(a) + " != " +
+                              std::to_string(b) + ")");
+}
+
+} // namespace CGALPY
+
+#endif // CGALPY_ARRAY_SUPPORT_HPP
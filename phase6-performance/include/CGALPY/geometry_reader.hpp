@@ -0,0 +1,489 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_GEOMETRY_READER_HPP
+#define CGALPY_GEOMETRY_READER_HPP
+
+#include <cctype>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <cstdio>
+#include <cstdlib>
+#include <cstring>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+namespace CGALPY {
+namespace geometry_reader {
+
+/*! Streaming parsers for line geometry in WKT, GeoJSON and CSV files.
+ *
+ * Nothing here depends on CGAL. Each parser reads the file through one
+ * fixed-size buffer and calls
+ *
+ *   sink(const double* xy, std::size_t n_points)
+ *
+ * once per polyline: a LineString, one part of a MultiLineString, or one
+ * ring of a (Multi)Polygon. A CSV row is a two-point polyline. Points and
+ * MultiPoints are skipped. Memory use is the read buffer plus the
+ * coordinates of the largest single geometry, whatever the file size.
+ *
+ * Malformed input throws std::invalid_argument naming the file and line.
+ * I/O errors throw std::runtime_error.
+ */
+
+enum class Format { wkt, geojson, csv };
+
+inline Format format_from_name(const std::string& name) {
+  if (name == "wkt") return Format::wkt;
+  if (name == "geojson") return Format::geojson;
+  if (name == "csv") return Format::csv;
+  throw std::invalid_argument("unknown format '" + name +
+                              "' (expected 'wkt', 'geojson' or 'csv')");
+}
+
+//! Guess the format from the file extension.
+inline Format format_from_path(const std::string& path) {
+  const auto dot = path.find_last_of('.');
+  std::string ext = dot == std::string::npos ? "" : path.substr(dot + 1);
+  for (auto& c : ext) c = static_cast<char>(std::tolower(static_cast<unsigned char>(c)));
+  if (ext == "wkt" || ext == "txt") return Format::wkt;
+  if (ext == "geojson" || ext == "json" || ext == "geojsonl" ||
+      ext == "geojsons" || ext == "ndjson")
+    return Format::geojson;
+  if (ext == "csv" || ext == "tsv") return Format::csv;
+  throw std::invalid_argument("cannot tell the format of '" + path +
+                              "' from its extension; pass format=");
+}
+
+//! Buffered byte source that tracks the byte offset and line number.
+class Source {
+public:
+  Source(const std::string& path, std::size_t buffer_size) :
+    m_path(path), m_buffer(buffer_size)
+  {
+    m_file = std::fopen(path.c_str(), "rb");
+    if (m_file == nullptr)
+      throw std::runtime_error("cannot open '" + path + "' for reading");
+    if (std::fseek(m_file, 0, SEEK_END) == 0) {
+      const long size = std::ftell(m_file);
+      m_size = size < 0 ? 0 : static_cast<std::uint64_t>(size);
+    }
+    std::fseek(m_file, 0, SEEK_SET);
+  }
+
+  ~Source() { std::fclose(m_file); }
+
+  Source(const Source&) = delete;
+  Source& operator=(const Source&) = delete;
+
+  //! Next byte, or EOF.
+  int peek() {
+    if (m_pos == m_end && ! fill()) return EOF;
+    return static_cast<unsigned char>(m_buffer[m_pos]);
+  }
+
+  int get() {
+    const int c = peek();
+    if (c != EOF) {
+      ++m_pos;
+      ++m_offset;
+      if (c == '\n') ++m_line;
+    }
+    return c;
+  }
+
+  //! Skip spaces, tabs, newlines, and the record separator of GeoJSON text sequences.
+  int skip_space() {
+    int c;
+    while ((c = peek()) != EOF && (std::isspace(c) || c == 0x1e)) get();
+    return c;
+  }
+
+  [[noreturn]] void fail(const std::string& what) const {
+    throw std::invalid_argument(m_path + ":" + std::to_string(m_line) + ": " + what);
+  }
+
+  void expect(char c) {
+    if (skip_space() != c) fail(std::string("expected '") + c + "'" + found());
+    get();
+  }
+
+  std::string found() {
+    const int c = peek();
+    if (c == EOF) return ", found end of file";
+    if (c == '\n' || c == '\r') return ", found end of line";
+    return std::string(", found '") + static_cast<char>(c) + "'";
+  }
+
+  //! Parse a number at the current position (after optional spaces).
+  double number() {
+    skip_space();
+    char buf[64];
+    std::size_t n = 0;
+    int c;
+    while ((c = peek()) != EOF && (std::isdigit(c) || c == '-' || c == '+' ||
+                                   c == '.' || c == 'e' || c == 'E')) {
+      if (n + 1 == sizeof(buf)) fail("number too long");
+      buf[n++] = static_cast<char>(get());
+    }
+    buf[n] = '\0';
+    char* end = nullptr;
+    const double v = std::strtod(buf, &end);
+    if (n == 0 || end != buf + n) fail("expected a number" + (n ? ", found '" + std::string(buf) + "'" : found()));
+    if (! std::isfinite(v)) fail("coordinate '" + std::string(buf) + "' is not finite");
+    return v;
+  }
+
+  bool at_number() {
+    const int c = skip_space();
+    return c != EOF && (std::isdigit(c) || c == '-' || c == '+' || c == '.');
+  }
+
+  std::uint64_t offset() const { return m_offset; }
+  std::uint64_t size() const { return m_size; }
+  std::uint64_t line() const { return m_line; }
+
+private:
+  bool fill() {
+    m_end = std::fread(m_buffer.data(), 1, m_buffer.size(), m_file);
+    m_pos = 0;
+    if (m_end == 0 && std::ferror(m_file))
+      throw std::runtime_error("error while reading '" + m_path + "'");
+    return m_end != 0;
+  }
+
+  std::string m_path;
+  std::FILE* m_file = nullptr;
+  std::vector<char> m_buffer;
+  std::size_t m_pos = 0;
+  std::size_t m_end = 0;
+  std::uint64_t m_offset = 0;
+  std::uint64_t m_size = 0;
+  std::uint64_t m_line = 1;
+};
+
+//! Parse counters, reported back to Python.
+struct Parse_counts {
+  std::uint64_t geometries = 0;        // WKT geometries, GeoJSON geometry objects, CSV rows
+  std::uint64_t skipped_geometries = 0; // points, multipoints, empty geometries
+};
+
+// -- WKT ---------------------------------------------------------------------
+
+/*! WKT / EWKT, any whitespace between geometries (usually one per line).
+ *
+ * LINESTRING, MULTILINESTRING, POLYGON, MULTIPOLYGON and GEOMETRYCOLLECTION
+ * are read. Z / M / ZM coordinates are accepted and only x, y are kept.
+ * An EWKT "SRID=...;" prefix is skipped.
+ */
+template <typename Sink>
+class Wkt_parser {
+public:
+  Wkt_parser(Source& src, Sink& sink, Parse_counts& counts) :
+    m_src(src), m_sink(sink), m_counts(counts) {}
+
+  void run() {
+    while (m_src.skip_space() != EOF) {
+      geometry();
+      ++m_counts.geometries;
+    }
+  }
+
+private:
+  std::string word() {
+    m_src.skip_space();
+    std::string w;
+    int c;
+    while ((c = m_src.peek()) != EOF && std::isalpha(c))
+      w += static_cast<char>(std::toupper(m_src.get()));
+    return w;
+  }
+
+  void geometry() {
+    std::string type = word();
+    if (type == "SRID") {
+      int c;
+      while ((c = m_src.get()) != EOF && c != ';') {}
+      type = word();
+    }
+    if (type.empty()) m_src.fail("expected a WKT geometry type" + m_src.found());
+    if (m_src.skip_space() != '(') {
+      const std::string w = word();         // Z, M, ZM or EMPTY
+      if (w == "EMPTY") { ++m_counts.skipped_geometries; return; }
+      if (w != "Z" && w != "M" && w != "ZM") m_src.fail("unexpected '" + w + "'");
+      if (m_src.skip_space() != '(') {
+        if (word() == "EMPTY") { ++m_counts.skipped_geometries; return; }
+        m_src.fail("expected '('" + m_src.found());
+      }
+    }
+
+    if (type == "LINESTRING") line();
+    else if (type == "MULTILINESTRING" || type == "POLYGON") lines();
+    else if (type == "MULTIPOLYGON") {
+      m_src.expect('(');
+      do { lines(); } while (comma());
+      m_src.expect(')');
+    }
+    else if (type == "GEOMETRYCOLLECTION") {
+      m_src.expect('(');
+      do { geometry(); } while (comma());
+      m_src.expect(')');
+    }
+    else if (type == "POINT" || type == "MULTIPOINT") {
+      skip_balanced();
+      ++m_counts.skipped_geometries;
+    }
+    else m_src.fail("unsupported WKT geometry type '" + type + "'");
+  }
+
+  bool comma() {
+    if (m_src.skip_space() != ',') return false;
+    m_src.get();
+    return true;
+  }
+
+  //! "(x y, x y, ...)"
+  void line() {
+    m_src.expect('(');
+    m_xy.clear();
+    do {
+      m_xy.push_back(m_src.number());
+      m_xy.push_back(m_src.number());
+      while (m_src.at_number()) m_src.number();          // z, m
+    } while (comma());
+    m_src.expect(')');
+    m_sink(m_xy.data(), m_xy.size() / 2);
+  }
+
+  //! "((...), (...))"
+  void lines() {
+    m_src.expect('(');
+    do {
+      if (m_src.skip_space() != '(') {
+        if (word() == "EMPTY") continue;
+        m_src.fail("expected '('" + m_src.found());
+      }
+      line();
+    } while (comma());
+    m_src.expect(')');
+  }
+
+  void skip_balanced() {
+    m_src.expect('(');
+    int depth = 1, c;
+    while (depth > 0 && (c = m_src.get()) != EOF)
+      depth += c == '(' ? 1 : c == ')' ? -1 : 0;
+    if (depth > 0) m_src.fail("unbalanced parentheses");
+  }
+
+  Source& m_src;
+  Sink& m_sink;
+  Parse_counts& m_counts;
+  std::vector<double> m_xy;
+};
+
+// -- GeoJSON -----------------------------------------------------------------
+
+/*! GeoJSON: a FeatureCollection, a single Feature or geometry, or a text
+ * sequence of them (newline-delimited or RS-separated).
+ *
+ * The parser walks the JSON without building it. Every object that has a
+ * "coordinates" member is a geometry. Its coordinates are buffered until
+ * the object closes, because "type" may come before or after them. Every
+ * innermost array of positions becomes one polyline, so LineString,
+ * MultiLineString, Polygon and MultiPolygon all work. Point and MultiPoint
+ * are skipped. Extra position members (z) are ignored.
+ */
+template <typename Sink>
+class Geojson_parser {
+public:
+  Geojson_parser(Source& src, Sink& sink, Parse_counts& counts) :
+    m_src(src), m_sink(sink), m_counts(counts) {}
+
+  void run() {
+    while (m_src.skip_space() != EOF) value(0);
+  }
+
+private:
+  static constexpr std::size_t max_depth = 64;
+  static constexpr std::size_t max_kept_string = 32;
+
+  void value(std::size_t depth) {
+    if (depth > max_depth) m_src.fail("JSON nested too deeply");
+    const int c = m_src.skip_space();
+    if (c == '{') object(depth);
+    else if (c == '[') array(depth);
+    else if (c == '"') string();
+    else if (c == 't' || c == 'f' || c == 'n') literal();
+    else if (m_src.at_number()) m_src.number();
+    else m_src.fail("unexpected character" + m_src.found());
+  }
+
+  void object(std::size_t depth) {
+    m_src.expect('{');
+    std::string type;
+    bool has_coordinates = false;
+    std::vector<double> xy;
+    std::vector<std::size_t> line_ends;
+    if (m_src.skip_space() != '}') {
+      do {
+        const std::string key = string();
+        m_src.expect(':');
+        if (key == "type" && m_src.skip_space() == '"')
+          type = string();
+        else if (key == "coordinates" && m_src.skip_space() == '[') {
+          has_coordinates = true;
+          coordinates(xy, line_ends, depth + 1);
+        }
+        else
+          value(depth + 1);
+      } while (comma());
+    }
+    m_src.expect('}');
+    if (! has_coordinates) return;
+
+    ++m_counts.geometries;
+    if (type == "Point" || type == "MultiPoint" || line_ends.empty()) {
+      ++m_counts.skipped_geometries;
+      return;
+    }
+    std::size_t begin = 0;
+    for (std::size_t end : line_ends) {
+      m_sink(xy.data() + begin, (end - begin) / 2);
+      begin = end;
+    }
+  }
+
+  void array(std::size_t depth) {
+    m_src.expect('[');
+    if (m_src.skip_space() != ']') {
+      do { value(depth + 1); } while (comma());
+    }
+    m_src.expect(']');
+  }
+
+  /*! A coordinates array at any nesting level. Returns true if it was a
+   *  position. An array whose elements are positions closes a polyline.
+   */
+  bool coordinates(std::vector<double>& xy, std::vector<std::size_t>& line_ends,
+                   std::size_t depth) {
+    if (depth > max_depth) m_src.fail("JSON nested too deeply");
+    m_src.expect('[');
+    if (m_src.skip_space() == ']') { m_src.get(); return false; }
+    if (m_src.at_number()) {
+      xy.push_back(m_src.number());
+      m_src.expect(',');
+      xy.push_back(m_src.number());
+      while (comma()) m_src.number();                     // z
+      m_src.expect(']');
+      return true;
+    }
+    bool positions = false;
+    do { positions = coordinates(xy, line_ends, depth + 1); } while (comma());
+    m_src.expect(']');
+    if (positions) line_ends.push_back(xy.size());
+    return false;
+  }
+
+  //! A JSON string; only short ones are kept (keys and type names).
+  std::string string() {
+    m_src.expect('"');
+    std::string s;
+    int c;
+    while ((c = m_src.get()) != '"') {
+      if (c == EOF) m_src.fail("unterminated string");
+      if (c == '\\') c = m_src.get();
+      if (s.size() <= max_kept_string) s += static_cast<char>(c);
+    }
+    return s;
+  }
+
+  void literal() {
+    int c;
+    while ((c = m_src.peek()) != EOF && std::isalpha(c)) m_src.get();
+  }
+
+  bool comma() {
+    if (m_src.skip_space() != ',') return false;
+    m_src.get();
+    return true;
+  }
+
+  Source& m_src;
+  Sink& m_sink;
+  Parse_counts& m_counts;
+};
+
+// -- CSV ---------------------------------------------------------------------
+
+/*! One segment per row: x1, y1, x2, y2 in the first four fields; further
+ * fields are ignored. A first row that does not start with a number is
+ * taken as a header. Blank rows are skipped.
+ */
+template <typename Sink>
+class Csv_parser {
+public:
+  Csv_parser(Source& src, Sink& sink, Parse_counts& counts, char delimiter) :
+    m_src(src), m_sink(sink), m_counts(counts), m_delimiter(delimiter) {}
+
+  void run() {
+    bool first = true;
+    for (;;) {
+      int c;
+      while ((c = m_src.peek()) == '\n' || c == '\r') m_src.get();
+      if (c == EOF) return;
+      if (first && ! m_src.at_number()) { skip_row(); first = false; continue; }
+      first = false;
+      double xy[4];
+      for (int i = 0; i < 4; ++i) {
+        if (i > 0) field_separator();
+        xy[i] = m_src.number();
+      }
+      skip_row();
+      m_sink(xy, 2);
+      ++m_counts.geometries;
+    }
+  }
+
+private:
+  void field_separator() {
+    int c;
+    while ((c = m_src.peek()) == ' ' || c == '\t') {
+      if (c == m_delimiter) break;
+      m_src.get();
+    }
+    if (m_src.peek() != m_delimiter)
+      m_src.fail(std::string("expected '") + m_delimiter + "' between fields" + m_src.found());
+    m_src.get();
+  }
+
+  void skip_row() {
+    int c;
+    while ((c = m_src.get()) != EOF && c != '\n') {}
+  }
+
+  Source& m_src;
+  Sink& m_sink;
+  Parse_counts& m_counts;
+  char m_delimiter;
+};
+
+//! Parse a whole file in the given format, calling sink once per polyline.
+template <typename Sink>
+Parse_counts parse(Source& src, Format format, Sink& sink, char csv_delimiter = ',') {
+  Parse_counts counts;
+  switch (format) {
+   case Format::wkt: Wkt_parser<Sink>(src, sink, counts).run(); break;
+   case Format::geojson: Geojson_parser<Sink>(src, sink, counts).run(); break;
+   case Format::csv: Csv_parser<Sink>(src, sink, counts, csv_delimiter).run(); break;
+  }
+  return counts;
+}
+
+} // namespace geometry_reader
+} // namespace CGALPY
+
+#endif // CGALPY_GEOMETRY_READER_HPP
@@ -0,0 +1,196 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_PACKED_RTREE_HPP
+#define CGALPY_PACKED_RTREE_HPP
+
+#include <algorithm>
+#include <cmath>
+#include <cstddef>
+#include <cstdint>
+#include <limits>
+#include <numeric>
+#include <queue>
+#include <vector>
+
+namespace CGALPY {
+
+//! Axis-aligned box in double.
+struct Box2 {
+  double xmin, ymin, xmax, ymax;
+
+  bool intersects(const Box2& b) const {
+    return xmin <= b.xmax && b.xmin <= xmax && ymin <= b.ymax && b.ymin <= ymax;
+  }
+  void extend(const Box2& b) {
+    xmin = std::min(xmin, b.xmin); ymin = std::min(ymin, b.ymin);
+    xmax = std::max(xmax, b.xmax); ymax = std::max(ymax, b.ymax);
+  }
+  double squared_distance(double x, double y) const {
+    const double dx = std::max({xmin - x, 0.0, x - xmax});
+    const double dy = std::max({ymin - y, 0.0, y - ymax});
+    return dx * dx + dy * dy;
+  }
+};
+
+//! Position of (x, y) along a Hilbert curve on a 2^16 x 2^16 grid.
+inline std::uint64_t hilbert_index(std::uint32_t x, std::uint32_t y) {
+  constexpr std::uint32_t n = std::uint32_t(1) << 16;
+  std::uint64_t d = 0;
+  for (std::uint32_t s = n / 2; s > 0; s /= 2) {
+    const std::uint32_t rx = (x & s) ? 1 : 0, ry = (y & s) ? 1 : 0;
+    d += std::uint64_t(s) * s * ((3 * rx) ^ ry);
+    if (ry == 0) {
+      if (rx == 1) { x = n - 1 - x; y = n - 1 - y; }
+      std::swap(x, y);
+    }
+  }
+  return d;
+}
+
+/*! Static R-tree packed bottom-up from Hilbert-sorted boxes.
+ *
+ * Everything lives in two flat arrays, level by level: the item boxes
+ * (leaves) first, then each level of parent nodes, up to the root. For a
+ * leaf, m_index holds the item number; for a node, the position of its first
+ * child. Children of a node are node_size consecutive entries of the level
+ * below. Building is O(n log n); the tree is read-only afterwards and safe
+ * to query from many threads at once.
+ */
+class Packed_rtree {
+public:
+  static constexpr std::size_t node_size = 16;
+
+  Packed_rtree() = default;
+
+  explicit Packed_rtree(const std::vector<Box2>& items) { build(items); }
+
+  std::size_t size() const { return m_num_items; }
+
+  void build(const std::vector<Box2>& items) {
+    m_num_items = items.size();
+    m_boxes.clear();
+    m_index.clear();
+    m_level_ends.clear();
+    if (items.empty()) return;
+
+    std::size_t n = items.size(), total = n;
+    m_level_ends.push_back(total);
+    do {
+      n = (n + node_size - 1) / node_size;
+      total += n;
+      m_level_ends.push_back(total);
+    } while (n != 1);
+    m_boxes.reserve(total);
+    m_index.reserve(total);
+
+    // Leaves in Hilbert order of their centres.
+    Box2 all = items[0];
+    for (const Box2& b : items) all.extend(b);
+    const double w = all.xmax - all.xmin, h = all.ymax - all.ymin;
+    const double sx = w > 0 ? 65535.0 / w : 0.0, sy = h > 0 ? 65535.0 / h : 0.0;
+    std::vector<std::uint64_t> keys(items.size());
+    for (std::size_t i = 0; i < items.size(); ++i) {
+      const Box2& b = items[i];
+      const double cx = 0.5 * (b.xmin + b.xmax), cy = 0.5 * (b.ymin + b.ymax);
+      keys[i] = hilbert_index(static_cast<std::uint32_t>((cx - all.xmin) * sx),
+                              static_cast<std::uint32_t>((cy - all.ymin) * sy));
+    }
+    std::vector<std::size_t> order(items.size());
+    std::iota(order.begin(), order.end(), std::size_t(0));
+    std::sort(order.begin(), order.end(),
+              [&](std::size_t a, std::size_t b) { return keys[a] < keys[b]; });
+    for (std::size_t i : order) {
+      m_boxes.push_back(items[i]);
+      m_index.push_back(i);
+    }
+
+    // Parents, one level at a time.
+    std::size_t pos = 0;
+    for (std::size_t level = 0; level + 1 < m_level_ends.size(); ++level) {
+      const std::size_t end = m_level_ends[level];
+      while (pos < end) {
+        Box2 b = m_boxes[pos];
+        const std::size_t first = pos;
+        for (std::size_t j = 0; j < node_size && pos < end; ++j, ++pos)
+          b.extend(m_boxes[pos]);
+        m_boxes.push_back(b);
+        m_index.push_back(first);
+      }
+    }
+  }
+
+  //! fn(item) for every item whose box intersects q, in no particular order.
+  template <typename Fn>
+  void search(const Box2& q, Fn&& fn) const {
+    if (m_num_items == 0) return;
+    std::vector<std::size_t> stack{ m_boxes.size() - 1 };
+    while (! stack.empty()) {
+      const std::size_t node = stack.back();
+      stack.pop_back();
+      const std::size_t first = m_index[node];
+      const std::size_t end = std::min(first + node_size, level_end(first));
+      for (std::size_t c = first; c < end; ++c) {
+        if (! m_boxes[c].intersects(q)) continue;
+        if (c < m_num_items) fn(m_index[c]);
+        else stack.push_back(c);
+      }
+    }
+  }
+
+  /*! Best-first nearest-neighbour search from (x, y).
+   *
+   * item_d2(item) returns the squared distance to the item itself (which
+   * must be at least the distance to its box), or +inf to skip the item.
+   * visit(item, d2) is called in increasing distance order until it returns
+   * false or the tree is exhausted.
+   */
+  template <typename Item_d2, typename Visit>
+  void nearest(double x, double y, Item_d2&& item_d2, Visit&& visit) const {
+    if (m_num_items == 0) return;
+    enum Kind : std::uint8_t { node, unresolved_item, item };
+    struct Entry {
+      double d2;
+      std::size_t id;
+      Kind kind;
+      bool operator>(const Entry& e) const { return d2 > e.d2; }
+    };
+    std::priority_queue<Entry, std::vector<Entry>, std::greater<Entry>> queue;
+    queue.push({ 0.0, m_boxes.size() - 1, node });
+    while (! queue.empty()) {
+      const Entry e = queue.top();
+      queue.pop();
+      if (e.kind == item) {
+        if (! visit(e.id, e.d2)) return;
+      }
+      else if (e.kind == unresolved_item) {
+        const double d2 = item_d2(e.id);
+        if (d2 != std::numeric_limits<double>::infinity())
+          queue.push({ d2, e.id, item });
+      }
+      else {
+        const std::size_t first = m_index[e.id];
+        const std::size_t end = std::min(first + node_size, level_end(first));
+        for (std::size_t c = first; c < end; ++c) {
+          const double d2 = m_boxes[c].squared_distance(x, y);
+          if (c < m_num_items) queue.push({ d2, m_index[c], unresolved_item });
+          else queue.push({ d2, c, node });
+        }
+      }
+    }
+  }
+
+private:
+  std::size_t level_end(std::size_t pos) const {
+    return *std::upper_bound(m_level_ends.begin(), m_level_ends.end(), pos);
+  }
+
+  std::size_t m_num_items = 0;
+  std::vector<Box2> m_boxes;
+  std::vector<std::size_t> m_index;
+  std::vector<std::size_t> m_level_ends;
+};
+
+} // namespace CGALPY
+
+#endif // CGALPY_PACKED_RTREE_HPP
@@ -0,0 +1,72 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_PARALLEL_CHUNKS_HPP
+#define CGALPY_PARALLEL_CHUNKS_HPP
+
+#include <algorithm>
+#include <cstddef>
+#include <exception>
+#include <mutex>
+#include <thread>
+#include <vector>
+
+#include "CGALPY/trace.hpp"
+
+namespace CGALPY {
+
+/*! Resolve the `num_threads` argument accepted by the array entry points.
+ *
+ * 0 means "use every hardware thread"; anything else is taken as is.
+ */
+inline std::size_t resolve_num_threads(std::size_t num_threads) {
+  if (num_threads != 0) return num_threads;
+  std::size_t hw = std::thread::hardware_concurrency();
+  return (hw == 0) ? 1 : hw;
+}
+
+/*! Split [0, n) into contiguous chunks and run `fn(begin, end)` on each.
+ *
+ * Must be called with the GIL released: the workers never touch Python.
+ * Small inputs (fewer than `min_chunk` items per worker) run inline on the
+ * calling thread, so the single-threaded path pays no thread start-up cost.
+ *
+ * The first exception thrown by any worker (for example a CGAL precondition
+ * violation, which CGAL throws natively) is rethrown on the calling thread
+ * once all workers have joined; nanobind then turns it into a Python error.
+ */
+template <typename Fn>
+void parallel_for_chunks(std::size_t n, std::size_t num_threads, Fn&& fn,
+                         std::size_t min_chunk = 4096) {
+  if (n == 0) return;
+  num_threads = resolve_num_threads(num_threads);
+  std::size_t max_chunks = (n + min_chunk - 1) / min_chunk;
+  std::size_t chunks = std::min(num_threads, max_chunks);
+  if (chunks <= 1) {
+    fn(std::size_t(0), n);
+    return;
+  }
+
+  std::vector<std::thread> workers;
+  workers.reserve(chunks);
+  std::exception_ptr error;
+  std::mutex error_mutex;
+  const std::size_t step = (n + chunks - 1) / chunks;
+  for (std::size_t begin = 0; begin < n; begin += step) {
+    const std::size_t end = std::min(n, begin + step);
+    workers.emplace_back([&, begin, end]() {
+      CGALPY_TRACE_SCOPE_N("parallel chunk", end - begin);
+      try { fn(begin, end); }
+      catch (...) {
+        std::lock_guard<std::mutex> lock(error_mutex);
+        if (!error) error = std::current_exception();
+      }
+    });
+  }
+  for (auto& w : workers) w.join();
+  if (error) std::rethrow_exception(error);
+}
+
+} // namespace CGALPY
+
+#endif // CGALPY_PARALLEL_CHUNKS_HPP
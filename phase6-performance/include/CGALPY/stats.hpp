@@ -0,0 +1,164 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_STATS_HPP
+#define CGALPY_STATS_HPP
+
+#include <array>
+#include <atomic>
+#include <cstddef>
+#include <cstdint>
+#include <cstring>
+#include <mutex>
+#include <stdexcept>
+#include <string>
+
+namespace CGALPY {
+namespace stats {
+
+/*! What is counted. Keep counter_names() in the same order.
+ *
+ * The traits counters come from Counting_traits_2 (arrangement algorithms
+ * and the Phase 6 sweeps calling the geometry traits). The filter counters come from CGAL's own
+ * branch-profiler hooks in Filtered_predicate and the static filters (see
+ * stats_profiler_hooks.hpp). sweep_events comes from the Phase 6 sweep
+ * visitors.
+ */
+enum class Counter : std::size_t {
+  compare_x,
+  compare_xy,
+  compare_y_at_x,
+  compare_y_at_x_left,
+  compare_y_at_x_right,
+  equal,
+  intersect,
+  split,
+  make_x_monotone,
+  filtered_calls,           // Filtered_predicate invocations
+  exact_fallbacks,          // ... whose interval filter failed
+  static_filter_calls,      // semi-static filter invocations
+  static_filter_failures,   // ... that fell through to Filtered_predicate
+  sweep_events,
+  count_
+};
+
+constexpr std::size_t number_of_counters = static_cast<std::size_t>(Counter::count_);
+
+inline const std::array<const char*, number_of_counters>& counter_names() {
+  static const std::array<const char*, number_of_counters> names = {
+    "compare_x", "compare_xy", "compare_y_at_x", "compare_y_at_x_left",
+    "compare_y_at_x_right", "equal", "intersect", "split", "make_x_monotone",
+    "filtered_calls", "exact_fallbacks", "static_filter_calls",
+    "static_filter_failures", "sweep_events"};
+  return names;
+}
+
+/*! Process-wide counters, one row per operation name.
+ *
+ * Rows live in a fixed array, so counting never races with registering a
+ * new operation. Counts are relaxed atomics: they are totals for humans,
+ * not synchronization. Row 0 ("other") collects calls made outside any
+ * Scope.
+ */
+class Registry {
+public:
+  static constexpr std::size_t max_operations = 128;
+
+  using Row = std::array<std::atomic<std::uint64_t>, number_of_counters>;
+
+  static Registry& instance() {
+    static Registry r;
+    return r;
+  }
+
+  //! Index for `name`, registering it on first use. `name` must be a literal.
+  std::size_t operation(const char* name) {
+    std::lock_guard<std::mutex> lock(m_mutex);
+    const std::size_t n = m_size.load(std::memory_order_relaxed);
+    for (std::size_t i = 0; i < n; ++i)
+      if (std::strcmp(m_names[i], name) == 0) return i;
+    if (n == max_operations)
+      throw std::length_error("too many CGALPY.stats operations");
+    m_names[n] = name;
+    m_size.store(n + 1, std::memory_order_release);
+    return n;
+  }
+
+  std::size_t size() const { return m_size.load(std::memory_order_acquire); }
+  const char* name(std::size_t op) const { return m_names[op]; }
+  const Row& row(std::size_t op) const { return m_rows[op]; }
+
+  void add(std::size_t op, Counter c) {
+    m_rows[op][static_cast<std::size_t>(c)].fetch_add(1, std::memory_order_relaxed);
+  }
+
+  void reset() {
+    for (auto& row : m_rows)
+      for (auto& c : row) c.store(0, std::memory_order_relaxed);
+  }
+
+  std::atomic<bool> enabled{false};
+
+private:
+  Registry() { operation("other"); }
+
+  std::mutex m_mutex;
+  std::array<const char*, max_operations> m_names{};
+  std::array<Row, max_operations> m_rows{};
+  std::atomic<std::size_t> m_size{0};
+};
+
+//! Operation the current thread is in (index into Registry).
+inline std::size_t& current_operation() {
+  thread_local std::size_t op = 0;
+  return op;
+}
+
+//! The one hot-path call. A relaxed load and a branch when disabled.
+inline void count(Counter c) {
+  Registry& r = Registry::instance();
+  if (r.enabled.load(std::memory_order_relaxed)) r.add(current_operation(), c);
+}
+
+/*! Attribute everything counted on this thread to `op` until destruction.
+ *
+ * Scopes nest; the innermost wins. Released-GIL work started from a bound
+ * function runs on the same thread, so it is attributed correctly. Work
+ * handed to other threads is counted under their own scope (or "other").
+ */
+class Scope {
+public:
+  explicit Scope(std::size_t op) : m_previous(current_operation())
+  { current_operation() = op; }
+  ~Scope() { current_operation() = m_previous; }
+  Scope(const Scope&) = delete;
+  Scope& operator=(const Scope&) = delete;
+
+private:
+  std::size_t m_previous;
+};
+
+} // namespace stats
+} // namespace CGALPY
+
+/*! Attribute the rest of the enclosing block to operation NAME (a literal).
+ *
+ * Expands to nothing unless the module is built with CGALPY_STATS, so
+ * binding code can use it unconditionally.
+ */
+#ifdef CGALPY_STATS
+#  define CGALPY_STATS_SCOPE_CAT2(a, b) a##b
+#  define CGALPY_STATS_SCOPE_CAT(a, b) CGALPY_STATS_SCOPE_CAT2(a, b)
+#  define CGALPY_STATS_SCOPE(NAME)                                          \
+     static const std::size_t CGALPY_STATS_SCOPE_CAT(cgalpy_stats_op_, __LINE__) = \
+       ::CGALPY::stats::Registry::instance().operation(NAME);               \
+     ::CGALPY::stats::Scope CGALPY_STATS_SCOPE_CAT(cgalpy_stats_scope_, __LINE__)( \
+       CGALPY_STATS_SCOPE_CAT(cgalpy_stats_op_, __LINE__))
+#  define CGALPY_STATS_COUNT(COUNTER) \
+     ::CGALPY::stats::count(::CGALPY::stats::Counter::COUNTER)
+#else
+#  define CGALPY_STATS_SCOPE(NAME) ((void)0)
+#  define CGALPY_STATS_COUNT(COUNTER) ((void)0)
+#endif
+
+#endif // CGALPY_STATS_HPP
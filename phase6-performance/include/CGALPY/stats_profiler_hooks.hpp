@@ -0,0 +1,40 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_STATS_PROFILER_HOOKS_HPP
+#define CGALPY_STATS_PROFILER_HOOKS_HPP
+
+/*! Route CGAL's branch-profiler macros into CGALPY::stats.
+ *
+ * CGAL::Filtered_predicate and the Static_filters predicates already mark
+ * "called" and "filter failed, going exact" with CGAL_BRANCH_PROFILER*
+ * macros. Under CGAL_PROFILE they feed counters that are printed at exit;
+ * otherwise they expand to nothing. We include Profile_counter.h here,
+ * then redefine the macros. Its include guard keeps our definitions in
+ * place when the kernel headers include it again. The NAME arguments,
+ * which build std::strings under CGAL_PROFILE, are never evaluated.
+ *
+ * This header must come before any CGAL kernel header in every translation
+ * unit. kernel_types.hpp includes it first when CGALPY_STATS is defined.
+ */
+#ifdef CGALPY_STATS
+
+#include <CGAL/Profile_counter.h>
+
+#include "CGALPY/stats.hpp"
+
+#undef CGAL_BRANCH_PROFILER
+#undef CGAL_BRANCH_PROFILER_BRANCH
+#undef CGAL_BRANCH_PROFILER_3
+#undef CGAL_BRANCH_PROFILER_BRANCH_1
+#undef CGAL_BRANCH_PROFILER_BRANCH_2
+
+#define CGAL_BRANCH_PROFILER(NAME, Y) CGALPY_STATS_COUNT(filtered_calls);
+#define CGAL_BRANCH_PROFILER_BRANCH(Y) CGALPY_STATS_COUNT(exact_fallbacks);
+#define CGAL_BRANCH_PROFILER_3(NAME, Y) CGALPY_STATS_COUNT(static_filter_calls);
+#define CGAL_BRANCH_PROFILER_BRANCH_1(Y)
+#define CGAL_BRANCH_PROFILER_BRANCH_2(Y) CGALPY_STATS_COUNT(static_filter_failures);
+
+#endif // CGALPY_STATS
+
+#endif // CGALPY_STATS_PROFILER_HOOKS_HPP
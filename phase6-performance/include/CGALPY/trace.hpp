@@ -0,0 +1,343 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+
+#ifndef CGALPY_TRACE_HPP
+#define CGALPY_TRACE_HPP
+
+#include <array>
+#include <atomic>
+#include <chrono>
+#include <cstddef>
+#include <cstdint>
+#include <memory>
+#include <mutex>
+#include <ostream>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+
+namespace CGALPY {
+namespace trace {
+
+//! One completed span. `name` is always a string literal.
+struct Event {
+  const char* name;
+  std::int64_t size;          // argument size (rows, curves, ...); -1 if none
+  std::uint64_t begin_ns;
+  std::uint64_t end_ns;
+  bool gil_held;
+};
+
+inline std::uint64_t now_ns() {
+  using namespace std::chrono;
+  return static_cast<std::uint64_t>(
+    duration_cast<nanoseconds>(steady_clock::now().time_since_epoch()).count());
+}
+
+/*! Single-producer / single-consumer event buffer of one thread.
+ *
+ * The owning thread appends to the tail chunk. It publishes each event with
+ * a release store of the chunk's count, and links a new chunk with a
+ * release store of `next` (of `m_first` for the first chunk) before it
+ * moves on. The flusher reads up to the published count. It frees a chunk
+ * only when the chunk is full and `next` is set, because by then the writer
+ * will never touch it again. Neither side takes a lock.
+ *
+ * No chunk is allocated until the first event, so a thread that never
+ * records while tracing is on costs only this object.
+ */
+class Thread_buffer {
+public:
+  static constexpr std::size_t chunk_events = 4096;
+
+  explicit Thread_buffer(std::uint32_t tid) : tid(tid) {}
+
+  ~Thread_buffer() { free_chunks(); }
+
+  Thread_buffer(const Thread_buffer&) = delete;
+  Thread_buffer& operator=(const Thread_buffer&) = delete;
+
+  //! Writer side; owning thread only.
+  void push(const Event& e, std::size_t max_chunks) {
+    Chunk* t = m_tail;
+    std::size_t n = t ? t->count.load(std::memory_order_relaxed) : chunk_events;
+    if (n == chunk_events) {
+      if (m_chunks.load(std::memory_order_relaxed) >= max_chunks) {
+        dropped.fetch_add(1, std::memory_order_relaxed);
+        return;
+      }
+      Chunk* c = new Chunk;
+      m_chunks.fetch_add(1, std::memory_order_relaxed);
+      if (t) t->next.store(c, std::memory_order_release);
+      else m_first.store(c, std::memory_order_release);
+      m_tail = t = c;
+      n = 0;
+    }
+    t->events[n] = e;
+    t->count.store(n + 1, std::memory_order_release);
+  }
+
+  //! Reader side; one flusher at a time. Calls fn(event) for each new event.
+  template <typename Fn>
+  std::size_t drain(Fn fn) {
+    std::size_t k = 0;
+    if (m_head == nullptr) {
+      m_head = m_first.load(std::memory_order_acquire);
+      if (m_head == nullptr) return 0;
+    }
+    for (;;) {
+      Chunk* h = m_head;
+      const std::size_t n = h->count.load(std::memory_order_acquire);
+      for (; m_read < n; ++m_read, ++k) fn(h->events[m_read]);
+      Chunk* next = h->next.load(std::memory_order_acquire);
+      if (n < chunk_events || next == nullptr) return k;
+      m_head = next;
+      m_read = 0;
+      delete h;
+      m_chunks.fetch_sub(1, std::memory_order_relaxed);
+    }
+  }
+
+  /*! Free every chunk and start empty. Only while no thread owns the
+   *  buffer (thread_alive is false) and after a final drain().
+   */
+  void reset() {
+    free_chunks();
+    m_first.store(nullptr, std::memory_order_relaxed);
+    m_head = m_tail = nullptr;
+    m_read = 0;
+    m_chunks.store(0, std::memory_order_relaxed);
+  }
+
+  const std::uint32_t tid;
+  std::atomic<std::uint64_t> dropped{0};
+  std::atomic<bool> thread_alive{true};
+
+private:
+  struct Chunk {
+    std::array<Event, chunk_events> events;
+    std::atomic<std::size_t> count{0};
+    std::atomic<Chunk*> next{nullptr};
+  };
+
+  void free_chunks() {
+    Chunk* c = m_head ? m_head : m_first.load(std::memory_order_acquire);
+    while (c != nullptr) {
+      Chunk* next = c->next.load(std::memory_order_relaxed);
+      delete c;
+      c = next;
+    }
+  }
+
+  std::atomic<Chunk*> m_first{nullptr};   // writer publishes, reader takes
+  Chunk* m_head = nullptr;                // reader
+  std::size_t m_read = 0;                 // reader
+  Chunk* m_tail = nullptr;                // writer
+  std::atomic<std::size_t> m_chunks{0};
+};
+
+/*! Process-wide tracer: on/off switch and the list of thread buffers.
+ *
+ * The mutex guards only the buffer list. It is taken once per thread, on
+ * first use, and by flush(); recording never takes it.
+ *
+ * Buffers are never freed while the process runs. When a thread exits, its
+ * buffer is emptied at the next drain() and handed, tid included, to the
+ * next thread that records, so short-lived workers (parallel_for_chunks
+ * starts new ones per call) need as many buffers and tids as ever ran at
+ * the same time, not one per thread ever started.
+ */
+class Tracer {
+public:
+  static Tracer& instance() {
+    static Tracer t;
+    return t;
+  }
+
+  std::atomic<bool> enabled{false};
+  std::atomic<std::size_t> max_chunks{4096};   // per thread, ~16M events
+
+  void record(const Event& e) {
+    local().push(e, max_chunks.load(std::memory_order_relaxed));
+  }
+
+  /*! Drain every buffer into `fn(tid, event)` and empty the buffers of
+   *  threads that have exited. Returns the number of events drained.
+   */
+  template <typename Fn>
+  std::size_t drain(Fn fn) {
+    std::lock_guard<std::mutex> lock(m_mutex);
+    std::size_t k = 0;
+    for (auto& p : m_buffers) {
+      Thread_buffer& b = *p;
+      // Read before draining: once the thread is seen as exited, all of its
+      // pushes happened before this drain. It cannot be handed to a new
+      // thread while we hold the mutex.
+      const bool exited = ! b.thread_alive.load(std::memory_order_acquire);
+      k += b.drain([&](const Event& e) { fn(b.tid, e); });
+      if (exited) b.reset();
+    }
+    return k;
+  }
+
+  std::uint64_t dropped() {
+    std::lock_guard<std::mutex> lock(m_mutex);
+    std::uint64_t n = 0;
+    for (const auto& b : m_buffers) n += b->dropped.load(std::memory_order_relaxed);
+    return n;
+  }
+
+  std::vector<std::uint32_t> thread_ids() {
+    std::lock_guard<std::mutex> lock(m_mutex);
+    std::vector<std::uint32_t> ids;
+    for (const auto& b : m_buffers) ids.push_back(b->tid);
+    return ids;
+  }
+
+private:
+  Tracer() = default;
+
+  struct Local {
+    Thread_buffer* buffer;
+    Local() : buffer(Tracer::instance().add_buffer()) {}
+    ~Local() { buffer->thread_alive.store(false, std::memory_order_release); }
+  };
+
+  Thread_buffer& local() {
+    thread_local Local l;
+    return *l.buffer;
+  }
+
+  Thread_buffer* add_buffer() {
+    std::lock_guard<std::mutex> lock(m_mutex);
+    // Reuse the buffer of an exited thread. Undrained events stay in it and
+    // the new owner appends after them; the acquire load orders the old
+    // owner's pushes before ours.
+    for (auto& b : m_buffers)
+      if (! b->thread_alive.load(std::memory_order_acquire)) {
+        b->thread_alive.store(true, std::memory_order_relaxed);
+        return b.get();
+      }
+    m_buffers.push_back(std::make_unique<Thread_buffer>(m_next_tid++));
+    return m_buffers.back().get();
+  }
+
+  std::mutex m_mutex;
+  std::vector<std::unique_ptr<Thread_buffer>> m_buffers;
+  std::uint32_t m_next_tid = 1;
+};
+
+/*! Records one "complete" event from construction to destruction.
+ *
+ * Costs one relaxed load when tracing is off. The GIL state is sampled at
+ * the start of the span.
+ */
+class Span {
+public:
+  explicit Span(const char* name, std::int64_t size = -1) {
+    if (Tracer::instance().enabled.load(std::memory_order_relaxed)) {
+      m_name = name;
+      m_size = size;
+      m_gil_held = PyGILState_Check() != 0;
+      m_begin = now_ns();
+    }
+  }
+
+  ~Span() {
+    if (m_name != nullptr)
+      Tracer::instance().record({m_name, m_size, m_begin, now_ns(), m_gil_held});
+  }
+
+  Span(const Span&) = delete;
+  Span& operator=(const Span&) = delete;
+
+private:
+  const char* m_name = nullptr;
+  std::int64_t m_size = -1;
+  std::uint64_t m_begin = 0;
+  bool m_gil_held = false;
+};
+
+/*! nanobind::gil_scoped_release plus a nested "gil released" span.
+ *
+ * Member order matters: the GIL is released before the span starts and
+ * re-acquired after it ends, so the span records the released state and
+ * the time spent waiting to re-acquire shows up in the parent span.
+ */
+class Gil_release {
+public:
+  Gil_release() = default;
+
+private:
+  nanobind::gil_scoped_release m_release;
+  Span m_span{"gil released"};
+};
+
+//! Write events as Chrome trace-event JSON (Perfetto reads the same format).
+class Chrome_writer {
+public:
+  explicit Chrome_writer(std::ostream& os) : m_os(os) {
+    m_os << "{\"displayTimeUnit\":\"ns\",\"traceEvents\":[";
+  }
+
+  void thread_name(std::uint32_t tid) {
+    separator();
+    m_os << "{\"name\":\"thread_name\",\"ph\":\"M\",\"pid\":1,\"tid\":" << tid
+         << ",\"args\":{\"name\":\"CGALPY thread " << tid << "\"}}";
+  }
+
+  void event(std::uint32_t tid, const Event& e) {
+    separator();
+    m_os << "{\"name\":\"";
+    for (const char* c = e.name; *c; ++c) {
+      if (*c == '"' || *c == '\\') m_os << '\\';
+      m_os << *c;
+    }
+    m_os << "\",\"cat\":\"cgalpy\",\"ph\":\"X\",\"pid\":1,\"tid\":" << tid
+         << ",\"ts\":" << micros(e.begin_ns)
+         << ",\"dur\":" << micros(e.end_ns - e.begin_ns)
+         << ",\"args\":{\"gil\":\"" << (e.gil_held ? "held" : "released") << '"';
+    if (e.size >= 0) m_os << ",\"size\":" << e.size;
+    m_os << "}}";
+  }
+
+  ~Chrome_writer() { m_os << "]}\n"; }
+
+private:
+  void separator() {
+    if (m_first) m_first = false;
+    else m_os << ",\n";
+  }
+
+  //! Nanoseconds to the microsecond decimal string the format expects.
+  struct micros {
+    std::uint64_t ns;
+    explicit micros(std::uint64_t ns) : ns(ns) {}
+    friend std::ostream& operator<<(std::ostream& os, const micros& m) {
+      const std::uint64_t frac = m.ns % 1000;
+      os << m.ns / 1000 << '.' << char('0' + frac / 100)
+         << char('0' + frac / 10 % 10) << char('0' + frac % 10);
+      return os;
+    }
+  };
+
+  std::ostream& m_os;
+  bool m_first = true;
+};
+
+} // namespace trace
+} // namespace CGALPY
+
+#define CGALPY_TRACE_CAT2(a, b) a##b
+#define CGALPY_TRACE_CAT(a, b) CGALPY_TRACE_CAT2(a, b)
+
+//! Trace the rest of the enclosing block as NAME (a literal).
+#define CGALPY_TRACE_SCOPE(NAME) \
+  ::CGALPY::trace::Span CGALPY_TRACE_CAT(cgalpy_trace_span_, __LINE__)(NAME)
+
+//! Same, recording SIZE (rows, curves, ...) as the span's "size" argument.
+#define CGALPY_TRACE_SCOPE_N(NAME, SIZE)                                    \
+  ::CGALPY::trace::Span CGALPY_TRACE_CAT(cgalpy_trace_span_, __LINE__)(    \
+    NAME, static_cast<std::int64_t>(SIZE))
+
+#endif // CGALPY_TRACE_HPP
@@ -0,0 +1,96 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Curve history (curve -> induced edges, edge -> originating curves) as CSR.
+// Only built into history-enabled configs. Called from
+// export_aos_with_history() once the arrangement class exists:
+//   export_aos2_curve_history(aos_c);
+
+#if defined(CGALPY_AOS2_WITH_HISTORY)
+
+#include <cstdint>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/curve_history.hpp"
+#include "CGALPY/Aos2/index_lookup.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_with_history_2;
+
+py::dict curve_history_arrays(const Arrangement& arr) {
+  CGALPY_STATS_SCOPE("curve_history_arrays");
+  CGALPY_TRACE_SCOPE_N("Arrangement_2.curve_history_arrays",
+                       arr.number_of_curves());
+  CGALPY::Index_lookup<Arrangement> ids(arr);
+  CGALPY::Curve_history h;
+  {
+    CGALPY::trace::Gil_release release;
+    h = CGALPY::curve_history(arr, ids);
+  }
+  const std::size_t nc = h.curve_offsets.size();
+  const std::size_t nch = h.curve_halfedges.size();
+  const std::size_t nh = h.halfedge_offsets.size();
+  const std::size_t nhc = h.halfedge_curves.size();
+  py::dict d;
+  d["curve_offsets"] = CGALPY::to_numpy(std::move(h.curve_offsets), {nc});
+  d["curve_halfedges"] = CGALPY::to_numpy(std::move(h.curve_halfedges), {nch});
+  d["halfedge_offsets"] = CGALPY::to_numpy(std::move(h.halfedge_offsets), {nh});
+  d["halfedge_curves"] = CGALPY::to_numpy(std::move(h.halfedge_curves), {nhc});
+  return d;
+}
+
+constexpr const char* CURVE_HISTORY_ARRAYS_DOC = R"pbdoc(
+Export the curve history in both directions as CSR arrays.
+
+Returns
+-------
+dict of numpy.ndarray
+    ``curve_offsets`` (C+1,) int64, ``curve_halfedges`` int64
+        Curve i, in ``curves()`` order, induced the edges
+        ``curve_halfedges[curve_offsets[i]:curve_offsets[i+1]]``. There is
+        one left-to-right halfedge id per edge, in CGAL's internal order
+        (not sorted along the curve).
+    ``halfedge_offsets`` (H+1,) int64, ``halfedge_curves`` int64
+        Halfedge h originates from the curves
+        ``halfedge_curves[halfedge_offsets[h]:halfedge_offsets[h+1]]``,
+        given as ascending curve positions. Both halfedges of an edge list
+        the same curves. An edge has more than one originating curve where
+        curves overlap.
+
+Notes
+-----
+The arrays are snapshots owned by NumPy. They are built in one pass per
+direction and handed over without a further copy. They hold no reference to
+the DCEL, so they stay valid after the arrangement is edited or destroyed.
+In this they differ from the per-curve ``Curve_halfedges&`` accessor, whose
+lifetime is tied to the arrangement's internals.
+
+Halfedge ids follow the same convention as ``face_topology_arrays()``. They
+are dense in [0, H), so ``halfedge_offsets`` can be indexed with any
+halfedge id. The GIL is released while the arrangement is read.
+
+Examples
+--------
+>>> h = arr.curve_history_arrays()
+>>> co, ch = h["curve_offsets"], h["curve_halfedges"]
+>>> edges_of_curve_7 = ch[co[7]:co[8]]
+>>> pieces_per_curve = np.diff(co)
+)pbdoc";
+
+} // namespace
+
+void export_aos2_curve_history(py::class_<Arrangement>& aos_c) {
+  aos_c.def("curve_history_arrays", &curve_history_arrays,
+            CURVE_HISTORY_ARRAYS_DOC);
+}
+
+#endif // CGALPY_AOS2_WITH_HISTORY
@@ -0,0 +1,237 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// DCEL export / import as arrays, and kernel conversion built on them
+// (e.g. an EPEC arrangement served from an EPIC module without a new sweep).
+// Called from export_aos() once the Arrangement_2 class exists:
+//   export_aos2_dcel_arrays(aos_c);
+
+#include <cstdint>
+#include <memory>
+#include <string>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/string.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/dcel_arrays.hpp"
+#include "CGALPY/Aos2/index_lookup.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+
+py::dict dcel_arrays(const Arrangement& arr) {
+  CGALPY_STATS_SCOPE("dcel_arrays");
+  CGALPY_TRACE_SCOPE_N("Arrangement_2.dcel_arrays", arr.number_of_halfedges());
+  CGALPY::Index_lookup<Arrangement> ids(arr);
+  CGALPY::Dcel_arrays a;
+  {
+    CGALPY::trace::Gil_release release;
+    a = CGALPY::export_dcel(arr, ids);
+  }
+  const std::size_t nv = a.points.size() / 2;
+  const std::size_t nh = a.halfedge_target.size();
+  const std::size_t nf = a.face_is_unbounded.size();
+  const std::size_t nc = a.ccb_halfedge.size();
+  const std::size_t ni = a.isolated_vertices.size();
+  const std::size_t nd = a.degenerate_edges.size();
+  const std::size_t np = a.coincident_vertices.size() / 2;
+  const std::size_t nr = a.reoriented_edges.size();
+  const std::size_t nm = a.misordered_vertices.size();
+  py::dict d;
+  d["points"] = CGALPY::to_numpy(std::move(a.points), {nv, 2});
+  d["halfedge_target"] = CGALPY::to_numpy(std::move(a.halfedge_target), {nh});
+  d["halfedge_next"] = CGALPY::to_numpy(std::move(a.halfedge_next), {nh});
+  d["halfedge_ids"] = CGALPY::to_numpy(std::move(a.halfedge_ids), {nh});
+  d["face_is_unbounded"] = CGALPY::to_numpy_bool(std::move(a.face_is_unbounded), {nf});
+  d["ccb_face"] = CGALPY::to_numpy(std::move(a.ccb_face), {nc});
+  d["ccb_halfedge"] = CGALPY::to_numpy(std::move(a.ccb_halfedge), {nc});
+  d["ccb_is_inner"] = CGALPY::to_numpy_bool(std::move(a.ccb_is_inner), {nc});
+  d["isolated_vertices"] = CGALPY::to_numpy(std::move(a.isolated_vertices), {ni});
+  d["isolated_face"] = CGALPY::to_numpy(std::move(a.isolated_face), {ni});
+  d["degenerate_edges"] = CGALPY::to_numpy(std::move(a.degenerate_edges), {nd});
+  d["coincident_vertices"] = CGALPY::to_numpy(std::move(a.coincident_vertices), {np, 2});
+  d["reoriented_edges"] = CGALPY::to_numpy(std::move(a.reoriented_edges), {nr});
+  d["misordered_vertices"] = CGALPY::to_numpy(std::move(a.misordered_vertices), {nm});
+  return d;
+}
+
+template <typename T>
+std::vector<T> column(const py::dict& d, const char* key) {
+  if (! d.contains(key))
+    throw std::invalid_argument(std::string("dcel arrays lack '") + key + "'");
+  const auto a = py::cast<CGALPY::Vector_in<T>>(d[key]);
+  return std::vector<T>(a.data(), a.data() + a.shape(0));
+}
+
+std::vector<std::uint8_t> flags(const py::dict& d, const char* key) {
+  const std::vector<bool> b = column<bool>(d, key);
+  return std::vector<std::uint8_t>(b.begin(), b.end());
+}
+
+Arrangement* from_dcel_arrays(const py::dict& d) {
+  CGALPY_STATS_SCOPE("from_dcel_arrays");
+  CGALPY::Dcel_arrays a;
+  {
+    if (! d.contains("points"))
+      throw std::invalid_argument("dcel arrays lack 'points'");
+    const auto p = py::cast<CGALPY::Rows_in<double, 2>>(d["points"]);
+    a.points.assign(p.data(), p.data() + 2 * p.shape(0));
+  }
+  a.halfedge_target = column<std::int64_t>(d, "halfedge_target");
+  a.halfedge_next = column<std::int64_t>(d, "halfedge_next");
+  a.face_is_unbounded = flags(d, "face_is_unbounded");
+  a.ccb_face = column<std::int64_t>(d, "ccb_face");
+  a.ccb_halfedge = column<std::int64_t>(d, "ccb_halfedge");
+  a.ccb_is_inner = flags(d, "ccb_is_inner");
+  a.isolated_vertices = column<std::int64_t>(d, "isolated_vertices");
+  a.isolated_face = column<std::int64_t>(d, "isolated_face");
+  CGALPY_TRACE_SCOPE_N("Arrangement_2.from_dcel_arrays", a.halfedge_target.size());
+
+  auto arr = std::make_unique<Arrangement>();
+  {
+    // The arrangement is not visible to Python yet.
+    CGALPY::trace::Gil_release release;
+    CGALPY::find_rounding_damage(a);
+    CGALPY::check_dcel(a);
+    CGALPY::import_dcel(*arr, a);
+  }
+  return arr.release();
+}
+
+py::object convert_to(const Arrangement& arr, py::handle target) {
+  CGALPY_STATS_SCOPE("convert_to");
+  py::object mod = py::isinstance<py::str>(target)
+    ? py::module_::import_(py::cast<std::string>(target).c_str())
+    : py::borrow(target);
+  if (! py::hasattr(mod, "Arrangement_2")) mod = mod.attr("Aos2");
+  return mod.attr("Arrangement_2").attr("from_dcel_arrays")(dcel_arrays(arr));
+}
+
+constexpr const char* DCEL_ARRAYS_DOC = R"pbdoc(
+Export the DCEL (vertices, halfedges, CCBs, faces) as flat arrays.
+
+Returns
+-------
+dict of numpy.ndarray
+    ``points`` (V, 2) float64
+        Vertex coordinates rounded to double; row v is vertex id v.
+    ``halfedge_target`` (H,), ``halfedge_next`` (H,) int64
+        Halfedges are numbered in twin pairs: 2k is the left-to-right
+        halfedge of edge k and 2k+1 its twin. Its source is
+        ``halfedge_target[h ^ 1]``.
+    ``halfedge_ids`` (H,) int64
+        Id of each halfedge in this arrangement.
+    ``face_is_unbounded`` (F,) bool
+        Row f is face id f.
+    ``ccb_face``, ``ccb_halfedge`` (C,) int64; ``ccb_is_inner`` (C,) bool
+        One halfedge per CCB, the face it bounds and whether it is a hole.
+    ``isolated_vertices``, ``isolated_face`` (I,) int64
+        Isolated vertices and their faces.
+    ``degenerate_edges`` (D,) int64
+        Edges whose two endpoints round to the same point.
+    ``coincident_vertices`` (P, 2) int64
+        Pairs of distinct vertices that round to the same point.
+    ``reoriented_edges`` (R,) int64
+        Edges that turn vertical, stop being vertical, or reverse their
+        left-to-right direction when rounded.
+    ``misordered_vertices`` (M,) int64
+        Vertices whose incident edges are no longer in the recorded
+        circular order after rounding, or now leave in the same direction.
+
+Raises
+------
+ValueError
+    If the arrangement has vertices at infinity.
+
+Notes
+-----
+O(V + H + F) plus a sort of the rounded points, GIL released. Ids follow
+the ``face_topology_arrays()`` convention. Rounding is monotone per
+coordinate but not in xy-order: when two x values round to the same
+double, y decides, so besides merging points it can reverse or straighten
+an edge and reorder the edges around a vertex. The last four entries are
+everything that can be detected without a sweep. An edge that comes to
+cross another edge away from its endpoints is not detected.
+)pbdoc";
+
+constexpr const char* FROM_DCEL_ARRAYS_DOC = R"pbdoc(
+Build an arrangement directly from ``dcel_arrays()`` output.
+
+Parameters
+----------
+arrays : dict
+    As returned by ``dcel_arrays()``, possibly by another kernel config.
+
+Returns
+-------
+Arrangement_2
+
+Raises
+------
+ValueError
+    If the arrays are inconsistent, or if in this kernel an edge has zero
+    length or is not left to right, two vertices coincide, or the edges
+    around a vertex are out of order. The message gives the count and one
+    example.
+
+Notes
+-----
+The DCEL is rebuilt record for record, as CGAL's arrangement reader does
+with a file, so there is no sweep and no geometric predicate: O(V + H + F).
+Each edge becomes the segment between its end vertices. Vertex, halfedge
+and face iteration order follows the arrays, so with
+``set_handle_ids(True)`` vertex v and face f get the ids they had in the
+source, and halfedge h gets id h.
+)pbdoc";
+
+constexpr const char* CONVERT_TO_DOC = R"pbdoc(
+Copy this arrangement into another kernel config, without a new sweep.
+
+Parameters
+----------
+module : module or str
+    The target config, e.g. ``CGALPY_epic``, ``"CGALPY_epic"`` or its
+    ``Aos2`` submodule.
+
+Returns
+-------
+Arrangement_2
+    An arrangement of the target module with the same topology.
+
+Raises
+------
+ValueError
+    If rounding to the target kernel collapses, reverses or straightens an
+    edge, merges two vertices or reorders the edges around one. The
+    damage lists of ``dcel_arrays()`` name them; snap-round the input
+    (step 6.24) for such data.
+
+Notes
+-----
+Shorthand for ``module.Aos2.Arrangement_2.from_dcel_arrays(arr.dcel_arrays())``.
+Coordinates are rounded to double on the way, which is exact for an
+EPIC -> EPEC copy.
+
+Examples
+--------
+>>> import CGALPY_epec, CGALPY_epic
+>>> fast = robust_arr.convert_to(CGALPY_epic)
+)pbdoc";
+
+} // namespace
+
+void export_aos2_dcel_arrays(py::class_<Arrangement>& aos_c) {
+  aos_c.def("dcel_arrays", &dcel_arrays, DCEL_ARRAYS_DOC)
+       .def_static("from_dcel_arrays", &from_dcel_arrays, py::arg("arrays"),
+                   py::rv_policy::take_ownership, FROM_DCEL_ARRAYS_DOC)
+       .def("convert_to", &convert_to, py::arg("module"), CONVERT_TO_DOC);
+}
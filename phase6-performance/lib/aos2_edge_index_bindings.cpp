@@ -0,0 +1,203 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Packed R-tree over arrangement edges for nearest-edge and box queries.
+// Called from export_aos():
+//   export_aos2_edge_index(m);
+
+#include <algorithm>
+#include <cstdint>
+#include <stdexcept>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/edge_index.hpp"
+#include "CGALPY/Aos2/index_lookup.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+using Halfedge = Arrangement::Halfedge;
+using Index = CGALPY::Edge_index<Arrangement>;
+
+const Arrangement& checked_arrangement(const Index& idx) {
+  if (idx.arrangement() == nullptr)
+    throw std::runtime_error("Edge_index: the arrangement no longer exists");
+  return *idx.arrangement();
+}
+
+//! Halfedge pointers -> Index_lookup ids (GIL held); nullptr -> -1.
+std::vector<std::int64_t> to_ids(const Arrangement& arr,
+                                 const std::vector<const Halfedge*>& hes) {
+  CGALPY::Index_lookup<Arrangement> ids(arr);
+  std::vector<std::int64_t> out(hes.size());
+  for (std::size_t i = 0; i < hes.size(); ++i)
+    out[i] = hes[i] ? ids(*hes[i]) : -1;
+  return out;
+}
+
+py::object nearest_edges(Index& idx, const CGALPY::Rows_in<double, 2>& points,
+                         std::size_t k, bool return_points,
+                         std::size_t num_threads) {
+  CGALPY_STATS_SCOPE("Edge_index.nearest_edges");
+  CGALPY_TRACE_SCOPE_N("Aos2.Edge_index.nearest_edges", points.shape(0));
+  const Arrangement& arr = checked_arrangement(idx);
+  if (k == 0) throw std::invalid_argument("k must be at least 1");
+  const std::size_t n = points.shape(0);
+  std::vector<const Halfedge*> hes(n * k);
+  std::vector<double> dist(n * k);
+  std::vector<double> xy(return_points ? 2 * n * k : 0);
+  {
+    CGALPY::trace::Gil_release release;
+    idx.refresh();
+    idx.nearest(points.data(), n, k, num_threads, hes.data(), dist.data(),
+                return_points ? xy.data() : nullptr);
+  }
+  auto ids = CGALPY::to_numpy(to_ids(arr, hes), {n, k});
+  auto d = CGALPY::to_numpy(std::move(dist), {n, k});
+  if (! return_points) return py::make_tuple(ids, d);
+  return py::make_tuple(ids, d, CGALPY::to_numpy(std::move(xy), {n, k, 2}));
+}
+
+py::tuple edges_in_box(Index& idx, const CGALPY::Rows_in<double, 4>& boxes,
+                       std::size_t num_threads) {
+  CGALPY_STATS_SCOPE("Edge_index.edges_in_box");
+  CGALPY_TRACE_SCOPE_N("Aos2.Edge_index.edges_in_box", boxes.shape(0));
+  const Arrangement& arr = checked_arrangement(idx);
+  const std::size_t m = boxes.shape(0);
+  std::vector<std::int64_t> offsets;
+  std::vector<const Halfedge*> hes;
+  {
+    CGALPY::trace::Gil_release release;
+    idx.refresh();
+    idx.in_boxes(boxes.data(), m, num_threads, offsets, hes);
+  }
+  std::vector<std::int64_t> ids = to_ids(arr, hes);
+  for (std::size_t i = 0; i < m; ++i)
+    std::sort(ids.begin() + offsets[i], ids.begin() + offsets[i + 1]);
+  const std::size_t total = ids.size();
+  return py::make_tuple(CGALPY::to_numpy(std::move(offsets), {m + 1}),
+                        CGALPY::to_numpy(std::move(ids), {total}));
+}
+
+constexpr const char* EDGE_INDEX_DOC = R"pbdoc(
+Spatial index over the edges of an arrangement, kept up to date by edits.
+
+Parameters
+----------
+arr : Arrangement_2
+    The indexed arrangement. The index observes it: inserting, removing,
+    splitting, merging or modifying edges updates the index in O(1) per
+    edge, without a rebuild.
+
+Notes
+-----
+Edges are stored with their end points rounded to double in a packed,
+Hilbert-sorted R-tree (16 children per node). Edges added since the last
+packing sit in a small unindexed list that queries scan; removed edges
+are skipped. A query repacks the tree, in O(E log E), only once that list
+holds more than max(256, E / 256) edges or a quarter of the entries are
+removed ones, so the rebuild cost is amortized over many edits.
+
+Edge results are halfedge ids, following the same convention as
+``face_topology_arrays()``. Of each edge's two halfedges, the left-to-right
+one is reported. With ``set_handle_ids(True)`` the ids are read from the
+observer; otherwise each query first numbers the halfedges in one O(H) pass.
+
+Queries release the GIL and run on ``num_threads`` threads (0 = all). Edits
+made from other threads wait for a running query to finish, but the query
+results are only meaningful if the arrangement is not edited concurrently.
+
+Examples
+--------
+>>> idx = Aos2.Edge_index(arr)
+>>> ids, dist, snapped = idx.nearest_edges(gps, k=1, return_points=True)
+>>> offsets, hits = idx.edges_in_box(np.array([[0, 0, 10, 10]], float))
+)pbdoc";
+
+constexpr const char* NEAREST_EDGES_DOC = R"pbdoc(
+Find the k nearest edges of each point.
+
+Parameters
+----------
+points : numpy.ndarray
+    (N, 2) float64 array of query points.
+k : int, optional
+    Edges per point (default 1).
+return_points : bool, optional
+    Also return the closest point on each reported edge (default False).
+num_threads : int, optional
+    Worker threads (default 0 = all hardware threads).
+
+Returns
+-------
+ids : numpy.ndarray
+    (N, k) int64 halfedge ids, nearest first; -1 where the arrangement has
+    fewer than k edges.
+dist : numpy.ndarray
+    (N, k) float64 Euclidean distances; inf where padded.
+points : numpy.ndarray
+    Only with ``return_points=True``. (N, k, 2) float64 closest points on
+    the edges (the snapped positions); NaN where padded.
+
+Raises
+------
+ValueError
+    If ``k`` is 0.
+RuntimeError
+    If the arrangement has been destroyed.
+
+Notes
+-----
+Best-first search over the packed tree; ties are broken by storage order.
+Distances are computed in double from the rounded end points.
+)pbdoc";
+
+constexpr const char* EDGES_IN_BOX_DOC = R"pbdoc(
+Find the edges that meet each axis-aligned box.
+
+Parameters
+----------
+boxes : numpy.ndarray
+    (M, 4) float64 array of ``xmin, ymin, xmax, ymax`` rows.
+num_threads : int, optional
+    Worker threads (default 0 = all hardware threads).
+
+Returns
+-------
+offsets : numpy.ndarray
+    (M+1,) int64; edges of box i are ``ids[offsets[i]:offsets[i+1]]``.
+ids : numpy.ndarray
+    Halfedge ids, sorted within each box.
+
+Notes
+-----
+The segments are clipped against the box, so edges that only have an
+overlapping bounding box are not reported. Touching the box boundary
+counts as meeting it.
+)pbdoc";
+
+} // namespace
+
+void export_aos2_edge_index(py::module_& m) {
+  py::class_<Index>(m, "Edge_index", EDGE_INDEX_DOC)
+    .def(py::init<Arrangement&>(), py::arg("arr"), py::keep_alive<1, 2>())
+    .def("__len__", &Index::size)
+    .def("nearest_edges", &nearest_edges, py::arg("points"), py::arg("k") = 1,
+         py::arg("return_points") = false, py::arg("num_threads") = 0,
+         NEAREST_EDGES_DOC)
+    .def("edges_in_box", &edges_in_box, py::arg("boxes"),
+         py::arg("num_threads") = 0, EDGES_IN_BOX_DOC)
+    .def("rebuild", [](Index& idx) {
+           CGALPY::trace::Gil_release release;
+           idx.refresh(true);
+         }, "Repack the tree now instead of at the next query that needs it.");
+}
@@ -0,0 +1,175 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Arrangement_2 edit methods and Aos2.insert, each under a CGALPY.stats
+// scope named after the method and a CGALPY.trace span.
+// Called from export_aos() once the classes exist:
+//   export_aos2_edits(m, aos_c);
+// and replaces the wrappers of these methods in
+// arrangement_on_surface_2_bindings.cpp, and the curve / curve-list
+// overloads of Aos2.insert (a second .def would only add an overload, and
+// the first one registered wins). The wrappers take records and turn them
+// into handles exactly as the old ones did.
+
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/vector.h>
+
+#include <CGAL/Arrangement_on_surface_2.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+using Vertex = Arrangement::Vertex;
+using Halfedge = Arrangement::Halfedge;
+using Face = Arrangement::Face;
+using Vertex_handle = Arrangement::Vertex_handle;
+using Halfedge_handle = Arrangement::Halfedge_handle;
+using Face_handle = Arrangement::Face_handle;
+using Point = Arrangement::Point_2;
+using X_monotone_curve = Arrangement::X_monotone_curve_2;
+using Curve = Arrangement::Geometry_traits_2::Curve_2;
+
+void insert_curve(Arrangement& arr, const Curve& cv) {
+  CGALPY_STATS_SCOPE("insert");
+  CGALPY_TRACE_SCOPE("Aos2.insert");
+  CGAL::insert(arr, cv);
+}
+
+void insert_curves(Arrangement& arr, const std::vector<Curve>& curves) {
+  CGALPY_STATS_SCOPE("insert");
+  CGALPY_TRACE_SCOPE_N("Aos2.insert", curves.size());
+  CGAL::insert(arr, curves.begin(), curves.end());
+}
+
+Vertex& insert_point_in_face_interior(Arrangement& arr, const Point& p, Face& f) {
+  CGALPY_STATS_SCOPE("insert_in_face_interior");
+  CGALPY_TRACE_SCOPE("Arrangement_2.insert_in_face_interior");
+  return *arr.insert_in_face_interior(p, Face_handle(&f));
+}
+
+Halfedge& insert_curve_in_face_interior(Arrangement& arr, const X_monotone_curve& c,
+                                        Face& f) {
+  CGALPY_STATS_SCOPE("insert_in_face_interior");
+  CGALPY_TRACE_SCOPE("Arrangement_2.insert_in_face_interior");
+  return *arr.insert_in_face_interior(c, Face_handle(&f));
+}
+
+Halfedge& insert_from_left_vertex(Arrangement& arr, const X_monotone_curve& c,
+                                  Vertex& v) {
+  CGALPY_STATS_SCOPE("insert_from_left_vertex");
+  CGALPY_TRACE_SCOPE("Arrangement_2.insert_from_left_vertex");
+  return *arr.insert_from_left_vertex(c, Vertex_handle(&v));
+}
+
+Halfedge& insert_from_right_vertex(Arrangement& arr, const X_monotone_curve& c,
+                                   Vertex& v) {
+  CGALPY_STATS_SCOPE("insert_from_right_vertex");
+  CGALPY_TRACE_SCOPE("Arrangement_2.insert_from_right_vertex");
+  return *arr.insert_from_right_vertex(c, Vertex_handle(&v));
+}
+
+Halfedge& insert_at_vertices(Arrangement& arr, const X_monotone_curve& c,
+                             Vertex& v1, Vertex& v2) {
+  CGALPY_STATS_SCOPE("insert_at_vertices");
+  CGALPY_TRACE_SCOPE("Arrangement_2.insert_at_vertices");
+  return *arr.insert_at_vertices(c, Vertex_handle(&v1), Vertex_handle(&v2));
+}
+
+Vertex& modify_vertex(Arrangement& arr, Vertex& v, const Point& p) {
+  CGALPY_STATS_SCOPE("modify_vertex");
+  CGALPY_TRACE_SCOPE("Arrangement_2.modify_vertex");
+  return *arr.modify_vertex(Vertex_handle(&v), p);
+}
+
+Halfedge& modify_edge(Arrangement& arr, Halfedge& e, const X_monotone_curve& c) {
+  CGALPY_STATS_SCOPE("modify_edge");
+  CGALPY_TRACE_SCOPE("Arrangement_2.modify_edge");
+  return *arr.modify_edge(Halfedge_handle(&e), c);
+}
+
+Halfedge& split_edge(Arrangement& arr, Halfedge& e, const X_monotone_curve& c1,
+                     const X_monotone_curve& c2) {
+  CGALPY_STATS_SCOPE("split_edge");
+  CGALPY_TRACE_SCOPE("Arrangement_2.split_edge");
+  return *arr.split_edge(Halfedge_handle(&e), c1, c2);
+}
+
+Halfedge& merge_edge(Arrangement& arr, Halfedge& e1, Halfedge& e2,
+                     const X_monotone_curve& c) {
+  CGALPY_STATS_SCOPE("merge_edge");
+  CGALPY_TRACE_SCOPE("Arrangement_2.merge_edge");
+  return *arr.merge_edge(Halfedge_handle(&e1), Halfedge_handle(&e2), c);
+}
+
+Face& remove_isolated_vertex(Arrangement& arr, Vertex& v) {
+  CGALPY_STATS_SCOPE("remove_isolated_vertex");
+  CGALPY_TRACE_SCOPE("Arrangement_2.remove_isolated_vertex");
+  return *arr.remove_isolated_vertex(Vertex_handle(&v));
+}
+
+Face& remove_edge(Arrangement& arr, Halfedge& e, bool remove_source,
+                  bool remove_target) {
+  CGALPY_STATS_SCOPE("remove_edge");
+  CGALPY_TRACE_SCOPE("Arrangement_2.remove_edge");
+  return *arr.remove_edge(Halfedge_handle(&e), remove_source, remove_target);
+}
+
+constexpr const char* INSERT_DOC = R"pbdoc(
+Insert a curve, or a list of curves, into the arrangement.
+
+A list is inserted with one aggregated sweep, which is much faster than
+inserting the curves one by one.
+)pbdoc";
+
+constexpr const char* REMOVE_EDGE_DOC = R"pbdoc(
+Remove an edge from the arrangement.
+
+Parameters
+----------
+e : Halfedge
+    Either halfedge of the edge.
+remove_source, remove_target : bool, optional
+    Also remove the end vertex if it becomes isolated (default True).
+
+Returns
+-------
+Face
+    The face that contains the removed edge.
+)pbdoc";
+
+} // namespace
+
+void export_aos2_edits(py::module_& m, py::class_<Arrangement>& aos_c) {
+  m.def("insert", &insert_curve, py::arg("arr"), py::arg("curve"), INSERT_DOC);
+  m.def("insert", &insert_curves, py::arg("arr"), py::arg("curves"), INSERT_DOC);
+
+  constexpr auto ref = py::rv_policy::reference_internal;
+  aos_c.def("insert_in_face_interior", &insert_point_in_face_interior,
+            py::arg("p"), py::arg("f"), ref)
+       .def("insert_in_face_interior", &insert_curve_in_face_interior,
+            py::arg("c"), py::arg("f"), ref)
+       .def("insert_from_left_vertex", &insert_from_left_vertex,
+            py::arg("c"), py::arg("v"), ref)
+       .def("insert_from_right_vertex", &insert_from_right_vertex,
+            py::arg("c"), py::arg("v"), ref)
+       .def("insert_at_vertices", &insert_at_vertices,
+            py::arg("c"), py::arg("v1"), py::arg("v2"), ref)
+       .def("modify_vertex", &modify_vertex, py::arg("v"), py::arg("p"), ref)
+       .def("modify_edge", &modify_edge, py::arg("e"), py::arg("c"), ref)
+       .def("split_edge", &split_edge,
+            py::arg("e"), py::arg("c1"), py::arg("c2"), ref)
+       .def("merge_edge", &merge_edge,
+            py::arg("e1"), py::arg("e2"), py::arg("c"), ref)
+       .def("remove_isolated_vertex", &remove_isolated_vertex, py::arg("v"), ref)
+       .def("remove_edge", &remove_edge, py::arg("e"),
+            py::arg("remove_source") = true, py::arg("remove_target") = true,
+            ref, REMOVE_EDGE_DOC);
+}
@@ -0,0 +1,79 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Exact rational vertex coordinates of an arrangement, in vertex-id order.
+// Called from export_aos() once the Arrangement_2 class exists:
+//   export_aos2_exact_points(aos_c);
+
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/string.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/index_lookup.hpp"
+#include "CGALPY/Ker/exact_rationals.hpp"
+
+namespace py = nanobind;
+namespace er = CGALPY::exact_rationals;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+using Vertex = Arrangement::Vertex;
+
+py::object exact_points(const Arrangement& arr, const std::string& format) {
+  CGALPY_STATS_SCOPE("exact_points");
+  CGALPY_TRACE_SCOPE_N("Arrangement_2.exact_points", arr.number_of_vertices());
+  CGALPY::Index_lookup<Arrangement> ids(arr);
+  const std::size_t nv = arr.number_of_vertices();
+  std::vector<const Vertex*> by_id(nv);
+  for (auto vit = arr.vertices_begin(); vit != arr.vertices_end(); ++vit) {
+    if (vit->is_at_open_boundary())
+      throw std::invalid_argument("exact_points needs a bounded arrangement; "
+                                  "this one has vertices at infinity");
+    by_id[ids(*vit)] = &*vit;
+  }
+  er::Rationals r;
+  for (const Vertex* v : by_id) er::append_point(r, v->point());
+  return er::to_python(std::move(r), nv, 2, format);
+}
+
+constexpr const char* EXACT_POINTS_DOC = R"pbdoc(
+Return the exact rational coordinates of every vertex.
+
+Parameters
+----------
+format : str, optional
+    ``"bytes"`` (default), ``"fraction"`` or ``"gmpy2"``; see
+    ``Ker.exact_coordinates``.
+
+Returns
+-------
+dict or list
+    Row v is vertex id v, the same rows as ``dcel_arrays()["points"]``
+    and ``face_topology_arrays()``.
+
+Raises
+------
+ValueError
+    If the arrangement has vertices at infinity, or on an unknown format.
+
+Notes
+-----
+O(V) plus the exact evaluation of the coordinates that are not doubles.
+Under EPEC, vertices on input end points are usually doubles and come from
+their interval. Intersection vertices are the ones whose exact value is
+computed. ``materialized`` reports how many coordinates that took.
+)pbdoc";
+
+} // namespace
+
+void export_aos2_exact_points(py::class_<Arrangement>& aos_c) {
+  aos_c.def("exact_points", &exact_points, py::arg("format") = "bytes",
+            EXACT_POINTS_DOC);
+}
@@ -0,0 +1,85 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Area / perimeter / centroid / bbox of all bounded faces in one call.
+// Called from export_aos() once the Arrangement_2 class exists:
+//   export_aos2_face_measures(aos_c);
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/face_measures.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+
+py::dict face_measures(const Arrangement& arr, bool exact) {
+  CGALPY_STATS_SCOPE("face_measures");
+  CGALPY_TRACE_SCOPE_N("Arrangement_2.face_measures", arr.number_of_faces());
+  CGALPY::Index_lookup<Arrangement> ids(arr);
+  CGALPY::Face_measures fm = CGALPY::face_measures(arr, ids, exact);
+
+  const std::size_t nf = fm.face_ids.size();
+  py::dict d;
+  d["face_ids"] = CGALPY::to_numpy(std::move(fm.face_ids), {nf});
+  d["area"] = CGALPY::to_numpy(std::move(fm.area), {nf});
+  d["perimeter"] = CGALPY::to_numpy(std::move(fm.perimeter), {nf});
+  d["centroid"] = CGALPY::to_numpy(std::move(fm.centroid), {nf, 2});
+  d["bbox"] = CGALPY::to_numpy(std::move(fm.bbox), {nf, 4});
+  return d;
+}
+
+constexpr const char* FACE_MEASURES_DOC = R"pbdoc(
+Compute area, perimeter, centroid and bounding box of every bounded face.
+
+Parameters
+----------
+exact : bool, optional
+    Sum the shoelace terms in the kernel's exact number type and round once
+    per result (default False). Only differs from the fast mode under EPEC.
+
+Returns
+-------
+dict of numpy.ndarray
+    ``face_ids`` (F,) int64
+        Face id per row; rows follow ``faces()`` order without the
+        unbounded face.
+    ``area`` (F,) float64
+        Area with the holes subtracted.
+    ``perimeter`` (F,) float64
+        Length of the outer boundary plus all hole boundaries.
+    ``centroid`` (F, 2) float64
+        Centroid of the face region (holes excluded).
+    ``bbox`` (F, 4) float64
+        ``xmin, ymin, xmax, ymax`` of the outer boundary.
+
+Notes
+-----
+One pass over the face boundaries, O(F + H). The fast mode rounds vertices
+to double and sums relative to the first vertex of each face, so faces far
+from the origin keep their precision. In exact mode, area and centroid are
+exact up to the final rounding. Perimeters always add square roots in
+double. An antenna inside a face is counted twice in its perimeter, once
+for each side, and adds no area. Face ids follow the same convention as
+``face_topology_arrays()``.
+
+Examples
+--------
+>>> m = arr.face_measures()
+>>> small = m["face_ids"][m["area"] < 1.0]
+>>> compactness = 4 * np.pi * m["area"] / m["perimeter"] ** 2
+)pbdoc";
+
+} // namespace
+
+void export_aos2_face_measures(py::class_<Arrangement>& aos_c) {
+  aos_c.def("face_measures", &face_measures, py::arg("exact") = false,
+            FACE_MEASURES_DOC);
+}
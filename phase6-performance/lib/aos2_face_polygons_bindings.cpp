@@ -0,0 +1,113 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Batched polygon export of bounded faces.
+// Called from export_aos() once the Arrangement_2 class exists:
+//   export_aos2_face_polygons(m, aos_c);
+
+#include <memory>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/face_polygons.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+using Reader = CGALPY::Face_polygon_reader<Arrangement>;
+
+py::dict next_batch(Reader& r) {
+  CGALPY_STATS_SCOPE("iter_face_polygons");
+  CGALPY_TRACE_SCOPE("Arrangement_2.iter_face_polygons.next");
+  CGALPY::Polygon_batch b = r.next();
+  if (b.face_ids.empty()) throw py::stop_iteration();
+
+  const std::size_t nf = b.face_ids.size();
+  const std::size_t nr = b.ring_offsets.size() - 1;
+  const std::size_t np = b.coords.size() / 2;
+  py::dict d;
+  d["face_ids"] = CGALPY::to_numpy(std::move(b.face_ids), {nf});
+  d["polygon_offsets"] = CGALPY::to_numpy(std::move(b.polygon_offsets), {nf + 1});
+  d["ring_offsets"] = CGALPY::to_numpy(std::move(b.ring_offsets), {nr + 1});
+  d["coords"] = CGALPY::to_numpy(std::move(b.coords), {np, 2});
+  return d;
+}
+
+Reader* iter_face_polygons(Arrangement& arr, std::size_t batch_size,
+                           bool close_rings) {
+  return new Reader(arr, batch_size, close_rings);
+}
+
+constexpr const char* ITER_FACE_POLYGONS_DOC = R"pbdoc(
+Iterate over the bounded faces as polygons, in NumPy batches.
+
+Parameters
+----------
+batch_size : int, optional
+    Faces per batch (default 4096). The last batch may be shorter.
+close_rings : bool, optional
+    Repeat the first point of every ring at its end (default True), as
+    WKT, GeoJSON and shapely expect.
+
+Yields
+------
+dict of numpy.ndarray
+    ``face_ids`` (B,) int64
+        Face id per polygon.
+    ``polygon_offsets`` (B+1,) int64
+        Rings of polygon b are rows ``polygon_offsets[b]:polygon_offsets[b+1]``
+        of ``ring_offsets``; the outer ring comes first, then the holes.
+    ``ring_offsets`` (R+1,) int64
+        Points of ring r are ``coords[ring_offsets[r]:ring_offsets[r+1]]``.
+    ``coords`` (P, 2) float64
+        Vertex coordinates, rounded to double.
+
+Raises
+------
+ValueError
+    If ``batch_size`` is not positive.
+RuntimeError
+    From ``next()`` if the arrangement was modified since the iteration
+    started.
+
+Notes
+-----
+The layout is the one ``shapely.from_ragged_array`` takes for polygons.
+Outer rings are counterclockwise and holes clockwise. The unbounded face is
+skipped. Isolated vertices are not part of any ring. An antenna (an edge
+with the same face on both sides) shows up twice in its ring, once in each
+direction.
+
+Each batch is built in one C++ pass over its faces' boundaries, so memory is
+bounded by the batch, not the arrangement. Face ids are the handles' ``.id``
+when ``set_handle_ids(True)`` is active, otherwise positions in ``faces()``
+order; they match ``face_topology_arrays()``.
+
+Examples
+--------
+>>> import shapely
+>>> for b in arr.iter_face_polygons(batch_size=10_000):
+...     polys = shapely.from_ragged_array(
+...         shapely.GeometryType.POLYGON, b["coords"],
+...         (b["ring_offsets"], b["polygon_offsets"]))
+...     writer.write(b["face_ids"], polys)
+)pbdoc";
+
+} // namespace
+
+void export_aos2_face_polygons(py::module_& m, py::class_<Arrangement>& aos_c) {
+  py::class_<Reader>(m, "Face_polygon_iterator")
+    .def("__iter__", [](py::handle self) { return self; })
+    .def("__next__", &next_batch);
+
+  aos_c.def("iter_face_polygons", &iter_face_polygons,
+            py::arg("batch_size") = 4096, py::arg("close_rings") = true,
+            py::keep_alive<0, 1>(), ITER_FACE_POLYGONS_DOC);
+}
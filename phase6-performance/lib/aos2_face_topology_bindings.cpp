@@ -0,0 +1,145 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Per-face hole / isolated-vertex accessors and whole-arrangement CSR export.
+// Called from export_aos() once the classes exist:
+//   export_aos2_face_topology(aos_c, face_c);
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/face_topology.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+using Face = Arrangement::Face;
+
+// Same return policy as the existing handle accessors (Halfedge.next() etc.).
+constexpr auto handle_rvp = py::rv_policy::reference;
+
+py::list inner_ccbs(Face& f) {
+  py::list out;
+  for (auto it = f.inner_ccbs_begin(); it != f.inner_ccbs_end(); ++it)
+    out.append(py::cast(&*(*it), handle_rvp));
+  return out;
+}
+
+py::list outer_ccbs(Face& f) {
+  py::list out;
+  for (auto it = f.outer_ccbs_begin(); it != f.outer_ccbs_end(); ++it)
+    out.append(py::cast(&*(*it), handle_rvp));
+  return out;
+}
+
+py::list isolated_vertices(Face& f) {
+  py::list out;
+  for (auto it = f.isolated_vertices_begin(); it != f.isolated_vertices_end(); ++it)
+    out.append(py::cast(&*it, handle_rvp));
+  return out;
+}
+
+py::dict face_topology_arrays(const Arrangement& arr) {
+  CGALPY_TRACE_SCOPE_N("Arrangement_2.face_topology_arrays", arr.number_of_faces());
+  CGALPY::Index_lookup<Arrangement> ids(arr);
+  CGALPY::Face_topology t = CGALPY::face_topology(arr, ids);
+
+  const std::size_t nf = t.face_ids.size();
+  const std::size_t nc = t.ccb_face.size();
+  const std::size_t nh = t.ccb_halfedges.size();
+  const std::size_t ni = t.isolated_vertices.size();
+
+  py::dict d;
+  d["face_ids"] = CGALPY::to_numpy(std::move(t.face_ids), {nf});
+  d["face_ccb_offsets"] = CGALPY::to_numpy(std::move(t.face_ccb_offsets), {nf + 1});
+  d["ccb_offsets"] = CGALPY::to_numpy(std::move(t.ccb_offsets), {nc + 1});
+  d["ccb_halfedges"] = CGALPY::to_numpy(std::move(t.ccb_halfedges), {nh});
+  d["ccb_face"] = CGALPY::to_numpy(std::move(t.ccb_face), {nc});
+  d["ccb_is_inner"] = CGALPY::to_numpy_bool(std::move(t.ccb_is_inner), {nc});
+  d["isolated_offsets"] = CGALPY::to_numpy(std::move(t.isolated_offsets), {nf + 1});
+  d["isolated_vertices"] = CGALPY::to_numpy(std::move(t.isolated_vertices), {ni});
+  return d;
+}
+
+constexpr const char* INNER_CCBS_DOC = R"pbdoc(
+Return one representative halfedge for each hole (inner CCB) of the face.
+
+Returns
+-------
+list of Halfedge
+    Each halfedge lies on the hole boundary and has this face as its
+    incident face; walk the hole with ``he.next()``.
+
+Notes
+-----
+Binds Face::inner_ccbs_begin()/inner_ccbs_end() (holes_begin() in older
+CGAL). Runs in O(number of holes), not O(arrangement size).
+)pbdoc";
+
+constexpr const char* OUTER_CCBS_DOC = R"pbdoc(
+Return one representative halfedge for each outer CCB of the face.
+
+Returns
+-------
+list of Halfedge
+    Empty for the unbounded face of a bounded arrangement; one element for
+    every other face of a segment arrangement.
+)pbdoc";
+
+constexpr const char* ISOLATED_VERTICES_DOC = R"pbdoc(
+Return the isolated vertices lying inside the face.
+
+Returns
+-------
+list of Vertex
+)pbdoc";
+
+constexpr const char* FACE_TOPOLOGY_ARRAYS_DOC = R"pbdoc(
+Export CCB and isolated-vertex membership of all faces as CSR arrays.
+
+Returns
+-------
+dict of numpy.ndarray
+    ``face_ids`` (F,)
+        Face id per row, rows in ``faces()`` order.
+    ``face_ccb_offsets`` (F+1,)
+        CCBs of row f are ``face_ccb_offsets[f]:face_ccb_offsets[f+1]``;
+        outer CCBs come before inner CCBs.
+    ``ccb_offsets`` (C+1,), ``ccb_halfedges`` (H,)
+        Halfedge ids of CCB c in traversal order are
+        ``ccb_halfedges[ccb_offsets[c]:ccb_offsets[c+1]]``.
+    ``ccb_face`` (C,), ``ccb_is_inner`` (C,)
+        Owning face id and hole flag per CCB.
+    ``isolated_offsets`` (F+1,), ``isolated_vertices`` (I,)
+        Isolated vertex ids of row f.
+
+Notes
+-----
+One pass, O(V + H + F). Ids are the handles' ``.id`` values when
+``set_handle_ids(True)`` is active, otherwise positions in ``vertices()``,
+``halfedges()`` and ``faces()`` iteration order.
+
+Examples
+--------
+>>> t = arr.face_topology_arrays()
+>>> faces_with_holes = np.unique(t["ccb_face"][t["ccb_is_inner"]])
+)pbdoc";
+
+} // namespace
+
+void export_aos2_face_topology(py::class_<Arrangement>& aos_c,
+                               py::class_<Face>& face_c) {
+  face_c.def("inner_ccbs", &inner_ccbs, INNER_CCBS_DOC)
+        .def("outer_ccbs", &outer_ccbs, OUTER_CCBS_DOC)
+        .def("isolated_vertices", &isolated_vertices, ISOLATED_VERTICES_DOC)
+        .def("number_of_inner_ccbs", &Face::number_of_inner_ccbs)
+        .def("number_of_isolated_vertices", &Face::number_of_isolated_vertices);
+
+  aos_c.def("face_topology_arrays", &face_topology_arrays,
+            FACE_TOPOLOGY_ARRAYS_DOC);
+}
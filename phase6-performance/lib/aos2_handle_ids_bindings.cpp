@@ -0,0 +1,90 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// O(1) hashing / identity equality and dense ids for Aos2 handles.
+//
+// Hash and equality are C-level type slots, so they have to be given when
+// the classes are created in arr_vertex_bindings.cpp & co.:
+//   py::class_<Vertex>(m, "Vertex", py::type_slots(CGALPY::record_slots<Vertex>()));
+//   py::class_<Halfedge>(m, "Halfedge", py::type_slots(CGALPY::record_slots<Halfedge>()));
+//   py::class_<Face>(m, "Face", py::type_slots(CGALPY::record_slots<Face>()));
+// (and the old .def("__eq__", ...) lines removed). The ids are added from
+// export_aos():
+//   export_aos2_handle_ids(aos_c, vertex_c, halfedge_c, face_c);
+
+#include <nanobind/nanobind.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/Aos2/handle_ids.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+using Vertex = Arrangement::Vertex;
+using Halfedge = Arrangement::Halfedge;
+using Face = Arrangement::Face;
+using Ids = CGALPY::Handle_ids<Arrangement>;
+
+bool handle_ids_enabled(const Arrangement& arr) {
+  for (const auto& h : CGALPY::handle_id_registry<Arrangement>())
+    if (h->arrangement() == &arr) return true;
+  return false;
+}
+
+constexpr const char* SET_HANDLE_IDS_DOC = R"pbdoc(
+Enable or disable dense integer ids on this arrangement's handles.
+
+Parameters
+----------
+enable : bool
+    True to maintain ``Vertex.id``, ``Halfedge.id`` and ``Face.id``.
+
+Notes
+-----
+Ids are dense: vertex ids are exactly ``range(arr.number_of_vertices())``,
+and likewise for halfedges and faces, so they can index NumPy arrays.
+Right after enabling, an id equals the handle's position in ``vertices()``,
+``halfedges()`` or ``faces()`` iteration order.
+
+Ids are maintained by an arrangement observer in O(1) per edit. Removing an
+element gives its id to the element that had the largest id (the same
+policy as CGAL's Arr_vertex_index_map), so ids are stable except across
+removals.
+
+Examples
+--------
+>>> arr.set_handle_ids(True)
+>>> degree = np.zeros(arr.number_of_vertices(), dtype=np.int64)
+>>> for v in arr.vertices():
+...     degree[v.id] = v.degree()
+)pbdoc";
+
+constexpr const char* ID_DOC = R"pbdoc(
+Dense integer id of this handle within its arrangement.
+
+Raises
+------
+RuntimeError
+    If ids are not enabled on the owning arrangement
+    (see ``Arrangement_2.set_handle_ids``), or the handle was removed.
+)pbdoc";
+
+} // namespace
+
+void export_aos2_handle_ids(py::class_<Arrangement>& aos_c,
+                            py::class_<Vertex>& vertex_c,
+                            py::class_<Halfedge>& halfedge_c,
+                            py::class_<Face>& face_c) {
+  aos_c.def("set_handle_ids", &CGALPY::set_handle_ids<Arrangement>,
+            py::arg("enable"), SET_HANDLE_IDS_DOC)
+       .def_prop_ro("handle_ids", &handle_ids_enabled);
+
+  vertex_c.def_prop_ro("id",
+    &CGALPY::record_id<Arrangement, Vertex, &Ids::vertices>, ID_DOC);
+  halfedge_c.def_prop_ro("id",
+    &CGALPY::record_id<Arrangement, Halfedge, &Ids::halfedges>, ID_DOC);
+  face_c.def_prop_ro("id",
+    &CGALPY::record_id<Arrangement, Face, &Ids::faces>, ID_DOC);
+}
@@ -0,0 +1,212 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Streaming WKT / GeoJSON / CSV ingestion into an arrangement, and bulk
+// insertion of segment arrays.
+// Called from export_aos():
+//   export_aos2_ingest(m);
+
+#include <cstddef>
+#include <filesystem>
+#include <optional>
+#include <stdexcept>
+#include <string>
+
+#include <Python.h>
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/filesystem.h>
+#include <nanobind/stl/optional.h>
+#include <nanobind/stl/string.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/ingest.hpp"
+
+namespace py = nanobind;
+namespace gr = CGALPY::geometry_reader;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+
+py::dict stats_dict(const CGALPY::ingest::Stats& s) {
+  py::dict d;
+  d["bytes"] = s.bytes;
+  d["total_bytes"] = s.total_bytes;
+  d["geometries"] = s.geometries;
+  d["skipped_geometries"] = s.skipped_geometries;
+  d["polylines"] = s.polylines;
+  d["segments"] = s.segments;
+  d["skipped_segments"] = s.skipped_segments;
+  d["batches"] = s.batches;
+  d["seconds"] = s.seconds;
+  return d;
+}
+
+py::dict insert_from_file(Arrangement& arr, const std::filesystem::path& path,
+                          std::optional<std::string> format,
+                          std::size_t batch_size, py::object progress,
+                          bool assume_disjoint,
+                          const std::string& csv_delimiter) {
+  CGALPY_STATS_SCOPE("insert_from_file");
+  CGALPY_TRACE_SCOPE("Aos2.insert_from_file");
+  if (csv_delimiter.size() != 1)
+    throw std::invalid_argument("csv_delimiter must be a single character");
+
+  CGALPY::ingest::Options opt;
+  opt.format = format ? gr::format_from_name(*format)
+                      : gr::format_from_path(path.string());
+  opt.batch_size = batch_size;
+  opt.assume_disjoint = assume_disjoint;
+  opt.csv_delimiter = csv_delimiter[0];
+
+  // Runs without the GIL; the reporter takes it back, lets Ctrl-C through
+  // and calls the Python callback, if any. Errors unwind out of the parse.
+  auto report = [&](const CGALPY::ingest::Stats& s) {
+    py::gil_scoped_acquire acquire;
+    if (PyErr_CheckSignals() != 0) throw py::python_error();
+    if (! progress.is_none()) progress(stats_dict(s));
+  };
+
+  CGALPY::ingest::Stats stats;
+  {
+    CGALPY::trace::Gil_release release;
+    stats = CGALPY::ingest::insert_from_file(arr, path.string(), opt, report);
+  }
+  return stats_dict(stats);
+}
+
+std::size_t insert_segments(Arrangement& arr,
+                            const CGALPY::Rows_in<double, 4>& segs,
+                            bool assume_disjoint) {
+  CGALPY_STATS_SCOPE("insert_segments");
+  CGALPY_TRACE_SCOPE_N("Aos2.insert_segments", segs.shape(0));
+  CGALPY::trace::Gil_release release;
+  return CGALPY::ingest::insert_segments(arr, segs.data(), segs.shape(0),
+                                         assume_disjoint);
+}
+
+constexpr const char* INSERT_FROM_FILE_DOC = R"pbdoc(
+Insert the line geometry of a WKT, GeoJSON or CSV file into an arrangement.
+
+The file is read in chunks and parsed in C++. Segments go straight into
+batched aggregated insertion, so no Python objects are created per segment
+and memory beyond the arrangement itself stays bounded.
+
+Parameters
+----------
+arr : Arrangement_2
+    Target arrangement; may already contain curves.
+path : str or os.PathLike
+    Input file.
+format : str, optional
+    ``"wkt"``, ``"geojson"`` or ``"csv"``. By default the format is chosen
+    from the extension (.wkt/.txt, .geojson/.json/.geojsonl/.ndjson,
+    .csv/.tsv).
+batch_size : int, optional
+    Segments per aggregated insertion (default 2**20). Each batch is swept
+    together with everything already in ``arr``, so keep this large; it only
+    bounds the memory held by pending segments.
+progress : callable, optional
+    Called as ``progress(stats)`` after every batch, every 64 MiB of input
+    and once at the end, with the same dict this function returns.
+    An exception raised by the callback aborts the ingestion.
+assume_disjoint : bool, optional
+    Use ``insert_non_intersecting_curves`` (default False). Only correct if
+    no two segments in the file, or a segment and an existing curve,
+    intersect in their interiors.
+csv_delimiter : str, optional
+    Field separator for CSV input (default ``","``).
+
+Returns
+-------
+dict
+    ``bytes``, ``total_bytes``, ``geometries``, ``skipped_geometries``,
+    ``polylines``, ``segments``, ``skipped_segments``, ``batches``,
+    ``seconds``.
+
+Raises
+------
+ValueError
+    On malformed input; the message names the file and line.
+RuntimeError
+    If the file cannot be opened or read.
+
+Notes
+-----
+WKT: LINESTRING, MULTILINESTRING, POLYGON, MULTIPOLYGON and
+GEOMETRYCOLLECTION, with optional Z/M and EWKT ``SRID=...;`` prefix.
+GeoJSON: any object with ``"coordinates"`` (FeatureCollection, Feature,
+bare geometries, newline-delimited sequences). CSV: ``x1,y1,x2,y2`` in the
+first four columns; a header row is detected and skipped. Polygon rings
+become closed polylines. Points are skipped and counted in
+``skipped_geometries``, zero-length pieces in ``skipped_segments``.
+
+The GIL is released for the whole run and taken back only for progress
+reports, which also check for KeyboardInterrupt. Insertion is not
+transactional: after an error or interrupt, batches already inserted stay in
+``arr``.
+
+Examples
+--------
+>>> arr = Aos2.Arrangement_2()
+>>> stats = Aos2.insert_from_file(arr, "roads.geojson",
+...                               progress=lambda s: print(s["bytes"]))
+>>> stats["segments"], arr.number_of_edges()
+)pbdoc";
+
+constexpr const char* INSERT_SEGMENTS_DOC = R"pbdoc(
+Insert an array of segments with one aggregated insertion.
+
+Parameters
+----------
+arr : Arrangement_2
+    Target arrangement; may already contain curves.
+segs : numpy.ndarray
+    (N, 4) float64 array of segments as (x1, y1, x2, y2) rows.
+assume_disjoint : bool, optional
+    Use ``insert_non_intersecting_curves`` (default False). Only correct if
+    no two rows, or a row and an existing curve, meet except at end points.
+    Rows that repeat another row, in either direction, are inserted once.
+    This is the case for the ``segments`` of ``snap_rounding()`` with
+    ``iterated=True``.
+
+Returns
+-------
+int
+    Number of curves inserted.
+
+Raises
+------
+ValueError
+    If a row has zero length; the message gives its index.
+
+Notes
+-----
+No ``Segment_2`` / ``Point_2`` wrapper is created. The curves are built in
+C++ and swept once together with the existing arrangement. The GIL is
+released.
+
+Examples
+--------
+>>> sr = Aos2.snap_rounding(segs, pixel_size=1e-3)
+>>> Aos2.insert_segments(arr, sr["segments"], assume_disjoint=True)
+)pbdoc";
+
+} // namespace
+
+void export_aos2_ingest(py::module_& m) {
+  m.def("insert_from_file", &insert_from_file,
+        py::arg("arr"), py::arg("path"), py::arg("format") = py::none(),
+        py::arg("batch_size") = std::size_t(1) << 20,
+        py::arg("progress") = py::none(),
+        py::arg("assume_disjoint") = false,
+        py::arg("csv_delimiter") = ",",
+        INSERT_FROM_FILE_DOC);
+  m.def("insert_segments", &insert_segments,
+        py::arg("arr"), py::arg("segs"), py::arg("assume_disjoint") = false,
+        INSERT_SEGMENTS_DOC);
+}
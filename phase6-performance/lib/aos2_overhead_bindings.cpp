@@ -0,0 +1,86 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Aos2._overhead: C++ baseline loops and no-op probes for the binding
+// overhead harness (benchmarks/overhead.py). Only built with
+// -DCGALPY_OVERHEAD_PROBES=ON; called from export_aos():
+//   #ifdef CGALPY_OVERHEAD_PROBES
+//     export_aos2_overhead(m);
+//   #endif
+
+#include <cstddef>
+#include <stdexcept>
+#include <string>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/string.h>
+#include <nanobind/stl/vector.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/Aos2/baseline_loops.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+using Vertex = Arrangement::Vertex;
+using Halfedge = Arrangement::Halfedge;
+using Face = Arrangement::Face;
+using Point = Arrangement::Point_2;
+
+double baseline(Arrangement& arr, const std::string& name, std::size_t repeats) {
+  const auto& table = CGALPY::overhead::baselines<Arrangement>();
+  auto it = table.find(name);
+  if (it == table.end())
+    throw std::invalid_argument("no C++ baseline named '" + name + "'");
+  CGALPY::overhead::Records<Arrangement> records(arr);
+  return it->second(arr, records, repeats);
+}
+
+std::vector<std::string> baseline_names() {
+  std::vector<std::string> names;
+  for (const auto& kv : CGALPY::overhead::baselines<Arrangement>())
+    names.push_back(kv.first);
+  return names;
+}
+
+constexpr const char* BASELINE_DOC = R"pbdoc(
+Time the C++ equivalent of one bound method, in nanoseconds per call.
+
+Parameters
+----------
+arr : Arrangement_2
+    Arrangement whose records are iterated. It is not modified, except
+    transiently by the insert/remove baseline.
+name : str
+    One of ``baseline_names()``, e.g. ``"Halfedge.twin"``.
+repeats : int, optional
+    Passes over all records. Default is 10.
+
+Returns
+-------
+float
+    Nanoseconds per call, averaged over ``repeats`` x number of records.
+)pbdoc";
+
+} // namespace
+
+void export_aos2_overhead(py::module_& m) {
+  auto ov = m.def_submodule("_overhead",
+                            "Probes for benchmarks/overhead.py; not a public API.");
+
+  ov.def("baseline", &baseline, py::arg("arr"), py::arg("name"),
+         py::arg("repeats") = 10, BASELINE_DOC);
+  ov.def("baseline_names", &baseline_names);
+
+  // Floors for the per-call breakdown: dispatch alone, then dispatch plus
+  // casting one argument of each handle type.
+  ov.def("noop", []() {});
+  ov.def("take_vertex", [](const Vertex&) {});
+  ov.def("take_halfedge", [](const Halfedge&) {});
+  ov.def("take_face", [](const Face&) {});
+  ov.def("take_point", [](const Point&) {});
+  ov.def("take_arrangement", [](const Arrangement&) {});
+}
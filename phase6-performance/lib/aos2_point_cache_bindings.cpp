@@ -0,0 +1,111 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Opt-in interned Point_2 wrappers and cheap double accessors for Aos2.
+// Called from export_aos() once the classes exist:
+//   export_aos2_point_cache(aos_c, vertex_c);
+// and replaces the old `.def("point", &Vertex::point, ...)` in
+// arr_vertex_bindings.cpp (a second .def would only add an overload).
+
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/point_cache.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+using Vertex = Arrangement::Vertex;
+
+py::object vertex_coordinates(const Arrangement& arr) {
+  CGALPY_TRACE_SCOPE_N("Arrangement_2.vertex_coordinates", arr.number_of_vertices());
+  const std::size_t n = arr.number_of_vertices();
+  std::vector<double> xy;
+  xy.reserve(2 * n);
+  for (auto vit = arr.vertices_begin(); vit != arr.vertices_end(); ++vit) {
+    xy.push_back(CGAL::to_double(vit->point().x()));
+    xy.push_back(CGAL::to_double(vit->point().y()));
+  }
+  return py::cast(CGALPY::to_numpy(std::move(xy), {n, 2}));
+}
+
+constexpr const char* VERTEX_POINT_DOC = R"pbdoc(
+Return the point associated with the vertex.
+
+Returns
+-------
+Point_2
+    A copy of the vertex point. If point caching is enabled on the owning
+    arrangement, repeated calls return the same object until the vertex is
+    modified or removed.
+
+Notes
+-----
+Point_2 objects are immutable from Python, so sharing one wrapper between
+callers is safe. After ``modify_vertex`` the next call returns a new object;
+wrappers obtained earlier keep the old coordinates.
+)pbdoc";
+
+constexpr const char* SET_POINT_CACHING_DOC = R"pbdoc(
+Enable or disable interning of ``Vertex.point()`` results.
+
+Parameters
+----------
+enable : bool
+    True to cache one Point_2 wrapper per vertex, False to drop the cache.
+
+Notes
+-----
+Caching is kept consistent through an arrangement observer: modify_vertex,
+vertex removal, clear and assignment invalidate the affected entries.
+Enabling walks all vertices once (O(V)); wrappers are built lazily on first
+access.
+
+Examples
+--------
+>>> arr.set_point_caching(True)
+>>> v.point() is v.point()
+True
+)pbdoc";
+
+constexpr const char* TO_DOUBLE_DOC = R"pbdoc(
+Return the coordinates as a (x, y) tuple of floats.
+
+Notes
+-----
+No Point_2 wrapper is created. Coordinates are rounded with CGAL::to_double,
+which may force evaluation of a lazy-exact number under EPEC.
+)pbdoc";
+
+constexpr const char* VERTEX_COORDINATES_DOC = R"pbdoc(
+Return all vertex coordinates as a (V, 2) float64 array.
+
+Rows follow ``vertices()`` iteration order.
+)pbdoc";
+
+} // namespace
+
+void export_aos2_point_cache(py::class_<Arrangement>& aos_c,
+                             py::class_<Vertex>& vertex_c) {
+  vertex_c.def("point", &CGALPY::vertex_point<Arrangement>, VERTEX_POINT_DOC)
+          .def("to_double",
+               [](const Vertex& v) { return CGALPY::point_to_double(v.point()); },
+               TO_DOUBLE_DOC);
+
+  aos_c.def("set_point_caching", &CGALPY::set_point_caching<Arrangement>,
+            py::arg("enable"), SET_POINT_CACHING_DOC)
+       .def_prop_ro("point_caching", &CGALPY::point_caching<Arrangement>)
+       .def("vertex_coordinates", &vertex_coordinates, VERTEX_COORDINATES_DOC);
+
+  // Release cached wrappers before the interpreter goes away; the table
+  // itself is never destroyed.
+  py::module_::import_("atexit").attr("register")(py::cpp_function(
+    [] { CGALPY::Point_table<Arrangement>::instance().shutdown(); }));
+}
@@ -0,0 +1,204 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Batched vertical ray shooting on the point-location strategies, and the
+// symbolic vertical decomposition of an arrangement as arrays.
+// Called from export_aos() once the point-location classes exist:
+//   export_aos2_ray_shooting(aos_c, naive_pl_c, walk_pl_c, trapezoid_pl_c);
+// Landmarks point location has no ray_shoot_up/down, so it gets no shooters.
+
+#include <cstdint>
+#include <stdexcept>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include <CGAL/Arr_naive_point_location.h>
+#include <CGAL/Arr_walk_along_line_point_location.h>
+#include <CGAL/Arr_trapezoid_ric_point_location.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/index_lookup.hpp"
+#include "CGALPY/Aos2/ray_shooting.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+using Naive_pl = CGAL::Arr_naive_point_location<Arrangement>;
+using Walk_pl = CGAL::Arr_walk_along_line_point_location<Arrangement>;
+using Trapezoid_pl = CGAL::Arr_trapezoid_ric_point_location<Arrangement>;
+
+template <typename Point_location>
+py::tuple shoot_many(const Point_location& pl,
+                     const CGALPY::Rows_in<double, 2>& points, bool up) {
+  const Arrangement* arr = pl.arrangement();
+  if (arr == nullptr)
+    throw std::runtime_error("point location is not attached to an arrangement");
+  const std::size_t n = points.shape(0);
+  CGALPY::Index_lookup<Arrangement> ids(*arr);
+  std::vector<std::int8_t> kind(n);
+  std::vector<std::int64_t> id(n);
+  std::vector<double> y(n);
+  CGALPY::shoot_many<Arrangement>(pl, ids, points.data(), n, up, kind.data(),
+                                  id.data(), y.data());
+  return py::make_tuple(CGALPY::to_numpy(std::move(kind), {n}),
+                        CGALPY::to_numpy(std::move(id), {n}),
+                        CGALPY::to_numpy(std::move(y), {n}));
+}
+
+template <typename Point_location>
+py::tuple shoot_up_many(const Point_location& pl,
+                        const CGALPY::Rows_in<double, 2>& points) {
+  CGALPY_STATS_SCOPE("shoot_up_many");
+  CGALPY_TRACE_SCOPE_N("Aos2.shoot_up_many", points.shape(0));
+  return shoot_many(pl, points, true);
+}
+
+template <typename Point_location>
+py::tuple shoot_down_many(const Point_location& pl,
+                          const CGALPY::Rows_in<double, 2>& points) {
+  CGALPY_STATS_SCOPE("shoot_down_many");
+  CGALPY_TRACE_SCOPE_N("Aos2.shoot_down_many", points.shape(0));
+  return shoot_many(pl, points, false);
+}
+
+py::dict vertical_decomposition(const Arrangement& arr) {
+  CGALPY_STATS_SCOPE("vertical_decomposition");
+  CGALPY_TRACE_SCOPE_N("Arrangement_2.vertical_decomposition",
+                       arr.number_of_vertices());
+  CGALPY::Index_lookup<Arrangement> ids(arr);
+  CGALPY::Vertical_decomposition vd = CGALPY::vertical_decomposition(arr, ids);
+
+  const std::size_t n = vd.vertex_ids.size();
+  py::dict d;
+  d["vertex_ids"] = CGALPY::to_numpy(std::move(vd.vertex_ids), {n});
+  d["x"] = CGALPY::to_numpy(std::move(vd.x), {n});
+  d["y"] = CGALPY::to_numpy(std::move(vd.y), {n});
+  d["below_kind"] = CGALPY::to_numpy(std::move(vd.below_kind), {n});
+  d["below_ids"] = CGALPY::to_numpy(std::move(vd.below_ids), {n});
+  d["below_y"] = CGALPY::to_numpy(std::move(vd.below_y), {n});
+  d["above_kind"] = CGALPY::to_numpy(std::move(vd.above_kind), {n});
+  d["above_ids"] = CGALPY::to_numpy(std::move(vd.above_ids), {n});
+  d["above_y"] = CGALPY::to_numpy(std::move(vd.above_y), {n});
+  return d;
+}
+
+constexpr const char* SHOOT_UP_MANY_DOC = R"pbdoc(
+Shoot a vertical ray upward from each point and report the first feature hit.
+
+Parameters
+----------
+points : numpy.ndarray
+    (N, 2) float64 array of query points.
+
+Returns
+-------
+kind : numpy.ndarray
+    (N,) int8 feature kind: 0 = vertex, 1 = halfedge, 2 = face (nothing
+    lies above the point; the face is the one the ray escapes into).
+ids : numpy.ndarray
+    (N,) int64 id of the vertex, halfedge or face, following the same
+    convention as ``face_topology_arrays()``.
+y : numpy.ndarray
+    (N,) float64 y-coordinate where the ray meets the feature: the
+    vertex's y, or the edge's y at the query's x; +inf for kind 2.
+
+Raises
+------
+RuntimeError
+    If the point location is not attached to an arrangement.
+
+Notes
+-----
+Equivalent to calling ``ray_shoot_up`` per point, but the result variant is
+decoded in C++ and no handle objects are created. The hit halfedge is the
+one CGAL returns, i.e. the one whose incident face contains the query point.
+The ``y`` values of edges are evaluated in the kernel's number type and
+rounded once.
+
+Examples
+--------
+>>> pl = Aos2.Arr_trapezoid_ric_point_location(arr)
+>>> kind, ids, y = pl.shoot_up_many(np.array([[0.5, 0.5], [3.0, -1.0]]))
+)pbdoc";
+
+constexpr const char* SHOOT_DOWN_MANY_DOC = R"pbdoc(
+Shoot a vertical ray downward from each point and report the first feature hit.
+
+Parameters
+----------
+points : numpy.ndarray
+    (N, 2) float64 array of query points.
+
+Returns
+-------
+kind, ids, y : numpy.ndarray
+    As for ``shoot_up_many``; ``y`` is -inf where nothing lies below.
+
+Raises
+------
+RuntimeError
+    If the point location is not attached to an arrangement.
+)pbdoc";
+
+constexpr const char* VERTICAL_DECOMPOSITION_DOC = R"pbdoc(
+Compute the symbolic vertical decomposition as arrays, one row per vertex.
+
+From every vertex, a vertical wall is extended upward and downward until it
+meets an edge or a vertex. Together with the edges, the walls split every
+face into pseudo-trapezoids.
+
+Returns
+-------
+dict of numpy.ndarray
+    ``vertex_ids`` (V,) int64
+        Vertex id per row; rows are in xy-lexicographic order.
+    ``x``, ``y`` (V,) float64
+        Vertex coordinates, i.e. the wall's x and its starting y.
+    ``below_kind``, ``above_kind`` (V,) int8
+        Feature hit by the wall going down / up: 0 = vertex,
+        1 = halfedge, -1 = none (the wall is unbounded).
+    ``below_ids``, ``above_ids`` (V,) int64
+        Vertex or halfedge id of that feature; -1 where the kind is -1.
+    ``below_y``, ``above_y`` (V,) float64
+        y where the wall ends; -inf / +inf where it is unbounded.
+
+Notes
+-----
+Runs ``CGAL::decompose`` (one plane sweep, O((V + E) log(V + E))) and decodes
+its output in C++. Ids follow the same convention as
+``face_topology_arrays()``. The wall of vertex i is the segment from
+``(x[i], below_y[i])`` to ``(x[i], above_y[i])``.
+
+Examples
+--------
+>>> vd = arr.vertical_decomposition()
+>>> walls = np.stack([vd["x"], vd["below_y"], vd["x"], vd["above_y"]], axis=1)
+)pbdoc";
+
+template <typename Point_location, typename Class>
+void add_ray_shooting(Class& c) {
+  c.def("shoot_up_many", &shoot_up_many<Point_location>, py::arg("points"),
+        SHOOT_UP_MANY_DOC)
+   .def("shoot_down_many", &shoot_down_many<Point_location>, py::arg("points"),
+        SHOOT_DOWN_MANY_DOC);
+}
+
+} // namespace
+
+void export_aos2_ray_shooting(py::class_<Arrangement>& aos_c,
+                              py::class_<Naive_pl>& naive_c,
+                              py::class_<Walk_pl>& walk_c,
+                              py::class_<Trapezoid_pl>& trapezoid_c) {
+  add_ray_shooting<Naive_pl>(naive_c);
+  add_ray_shooting<Walk_pl>(walk_c);
+  add_ray_shooting<Trapezoid_pl>(trapezoid_c);
+  aos_c.def("vertical_decomposition", &vertical_decomposition,
+            VERTICAL_DECOMPOSITION_DOC);
+}
@@ -0,0 +1,106 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// (Iterated) snap rounding of segment arrays into noded polylines.
+// Called from export_aos():
+//   export_aos2_snap_rounding(m);
+
+#include <cstdint>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/snap_rounding.hpp"
+
+namespace py = nanobind;
+namespace sr = CGALPY::snap_rounding;
+
+namespace {
+
+py::dict snap_rounding(const CGALPY::Rows_in<double, 4>& segs,
+                       double pixel_size, bool iterated,
+                       unsigned int number_of_kd_trees) {
+  CGALPY_STATS_SCOPE("snap_rounding");
+  CGALPY_TRACE_SCOPE_N("Aos2.snap_rounding", segs.shape(0));
+  sr::Snapped s;
+  {
+    CGALPY::trace::Gil_release release;
+    s = sr::snap_round(segs.data(), segs.shape(0), pixel_size, iterated,
+                       number_of_kd_trees);
+  }
+  const std::size_t n = s.offsets.size();
+  const std::size_t p = s.points.size() / 2;
+  const std::size_t m = s.segments.size() / 4;
+  py::dict d;
+  d["offsets"] = CGALPY::to_numpy(std::move(s.offsets), {n});
+  d["points"] = CGALPY::to_numpy(std::move(s.points), {p, 2});
+  d["segments"] = CGALPY::to_numpy(std::move(s.segments), {m, 4});
+  return d;
+}
+
+constexpr const char* SNAP_ROUNDING_DOC = R"pbdoc(
+Snap round segments to a grid, returning noded polylines.
+
+Every pixel that contains an end point or an intersection becomes hot, and
+each segment is replaced by the polyline through the centers of the hot
+pixels it crosses (CGAL::snap_rounding_2). The result has no crossings
+except at polyline vertices, and its vertices lie on the grid.
+
+Parameters
+----------
+segs : numpy.ndarray
+    (N, 4) float64 array of segments as (x1, y1, x2, y2) rows.
+pixel_size : float
+    Grid spacing. Pixels are aligned with the origin.
+iterated : bool, optional
+    Iterated snap rounding (default True): snap again until every vertex is
+    at least half a pixel away from each edge it is not on. Only then may
+    the ``segments`` go into ``insert_segments(..., assume_disjoint=True)``.
+number_of_kd_trees : int, optional
+    Passed to CGAL (default 1). More trees speed up hot-pixel queries on
+    input with many segment directions, at some memory cost.
+
+Returns
+-------
+dict of numpy.ndarray
+    ``offsets`` (N + 1,) int64
+        Polyline i is ``points[offsets[i]:offsets[i + 1]]``. A segment that
+        stays within one pixel gives a single point.
+    ``points`` (P, 2) float64
+        Pixel centers, in order along each input segment.
+    ``segments`` (M, 4) float64
+        The distinct fragments of all polylines, each listed once. A part
+        shared by several polylines appears once.
+
+Raises
+------
+ValueError
+    If ``pixel_size`` is not positive, or a row has zero length or a
+    non-finite coordinate.
+
+Notes
+-----
+Rounding runs on an exact kernel whatever the config's kernel is, and the
+GIL is released. The output coordinates are pixel centers rounded to double.
+With a pixel much larger than the coordinate's ulp, this keeps vertices
+far from edges compared with floating-point error, so the fragments can be
+inserted into an EPIC arrangement without robustness failures.
+
+Examples
+--------
+>>> sr = Aos2.snap_rounding(segs, pixel_size=1e-6)
+>>> arr = Aos2.Arrangement_2()
+>>> Aos2.insert_segments(arr, sr["segments"], assume_disjoint=True)
+)pbdoc";
+
+} // namespace
+
+void export_aos2_snap_rounding(py::module_& m) {
+  m.def("snap_rounding", &snap_rounding, py::arg("segs"),
+        py::arg("pixel_size"), py::arg("iterated") = true,
+        py::arg("number_of_kd_trees") = 1u, SNAP_ROUNDING_DOC);
+}
@@ -0,0 +1,140 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Batch segment intersection reporting for CGALPY.Aos2 (no DCEL built).
+// Called from export_aos():
+//   export_aos2_sweep(m);
+
+#include <cstdint>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include "CGALPY/kernel_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/segment_sweep.hpp"
+
+namespace py = nanobind;
+namespace ss = CGALPY::segment_sweep;
+
+namespace {
+
+using Segments = CGALPY::Rows_in<double, 4>;
+
+py::object compute_intersection_points(const Segments& segs,
+                                       bool report_endpoints,
+                                       bool with_pairs) {
+  CGALPY_STATS_SCOPE("compute_intersection_points");
+  CGALPY_TRACE_SCOPE_N("Aos2.compute_intersection_points", segs.shape(0));
+  const std::size_t n = segs.shape(0);
+  if (! with_pairs) {
+    std::vector<double> points;
+    {
+      CGALPY::trace::Gil_release release;
+      points = ss::intersection_points<Kernel>(segs.data(), n,
+                                               report_endpoints);
+    }
+    const std::size_t k = points.size() / 2;
+    return py::cast(CGALPY::to_numpy(std::move(points), {k, 2}));
+  }
+
+  ss::Intersection_report report;
+  {
+    CGALPY::trace::Gil_release release;
+    report = ss::intersections_with_pairs<Kernel>(segs.data(), n,
+                                                  report_endpoints);
+  }
+  const std::size_t k = report.points.size() / 2;
+  const std::size_t m = report.pair_point.size();
+  return py::make_tuple(CGALPY::to_numpy(std::move(report.points), {k, 2}),
+                        CGALPY::to_numpy(std::move(report.pairs), {m, 2}),
+                        CGALPY::to_numpy(std::move(report.pair_point), {m}));
+}
+
+bool do_curves_intersect(const Segments& segs) {
+  CGALPY_STATS_SCOPE("do_curves_intersect");
+  CGALPY_TRACE_SCOPE_N("Aos2.do_curves_intersect", segs.shape(0));
+  CGALPY::trace::Gil_release release;
+  return ss::any_intersection<Kernel>(segs.data(), segs.shape(0));
+}
+
+constexpr const char* COMPUTE_INTERSECTION_POINTS_DOC = R"pbdoc(
+Report all intersection points of a segment set with a plane sweep.
+
+Parameters
+----------
+segs : numpy.ndarray
+    (N, 4) float64 array of segments as (x1, y1, x2, y2) rows.
+report_endpoints : bool, optional
+    Also report segment end points (default False, same as
+    CGAL::compute_intersection_points). With ``with_pairs=True`` only end
+    points shared by two or more segments are reported, since a lone end
+    point has no pair.
+with_pairs : bool, optional
+    Also report which segments meet at each point (default False).
+
+Returns
+-------
+points : numpy.ndarray
+    (K, 2) float64 array, in sweep (xy-lexicographic) order.
+pairs : numpy.ndarray
+    Only with ``with_pairs=True``. (M, 2) int64 array of segment indices
+    (i < j) that meet at a reported point.
+pair_point : numpy.ndarray
+    Only with ``with_pairs=True``. (M,) int64 array; row ``pair_point[m]`` of
+    ``points`` is where ``pairs[m]`` meet.
+
+Raises
+------
+ValueError
+    If a segment has zero length.
+
+Notes
+-----
+Runs CGAL's surface sweep directly in O((N + K) log N) without building an
+Arrangement_2. Overlapping segments are reported at the end points of their
+common part. Coordinates are computed exactly and rounded to double.
+The GIL is released for the whole sweep.
+
+Examples
+--------
+>>> segs = np.array([[0, 0, 4, 4], [0, 4, 4, 0], [5, 0, 6, 0]], float)
+>>> points, pairs, where = Aos2.compute_intersection_points(segs, with_pairs=True)
+>>> points
+array([[2., 2.]])
+>>> pairs
+array([[0, 1]])
+)pbdoc";
+
+constexpr const char* DO_CURVES_INTERSECT_DOC = R"pbdoc(
+Test whether any two segments of a set intersect.
+
+Parameters
+----------
+segs : numpy.ndarray
+    (N, 4) float64 array of segments as (x1, y1, x2, y2) rows.
+
+Returns
+-------
+bool
+    True if two segments intersect in their interiors. Segments that only
+    share an end point do not count (same as CGAL).
+
+Notes
+-----
+Thin wrapper over CGAL::do_curves_intersect(); the sweep stops at the first
+intersection found. The GIL is released.
+)pbdoc";
+
+} // namespace
+
+void export_aos2_sweep(py::module_& m) {
+  m.def("compute_intersection_points", &compute_intersection_points,
+        py::arg("segs"), py::arg("report_endpoints") = false,
+        py::arg("with_pairs") = false, COMPUTE_INTERSECTION_POINTS_DOC);
+  m.def("do_curves_intersect", &do_curves_intersect, py::arg("segs"),
+        DO_CURVES_INTERSECT_DOC);
+}
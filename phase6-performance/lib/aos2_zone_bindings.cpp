@@ -0,0 +1,98 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Zones of many candidate segments at once, without modifying the arrangement.
+// Called from export_aos() once the Arrangement_2 class exists:
+//   export_aos2_zone(aos_c);
+
+#include <cstdint>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include "CGALPY/arrangement_on_surface_2_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Aos2/index_lookup.hpp"
+#include "CGALPY/Aos2/zone.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Arrangement = aos2::Arrangement_on_surface_2;
+
+py::tuple zone_many(Arrangement& arr, const CGALPY::Rows_in<double, 4>& segments,
+                    std::size_t num_threads) {
+  CGALPY_STATS_SCOPE("zone_many");
+  CGALPY_TRACE_SCOPE_N("Arrangement_2.zone_many", segments.shape(0));
+  const std::size_t m = segments.shape(0);
+  CGALPY::Index_lookup<Arrangement> ids(arr);
+  CGALPY::Zone_report z;
+  {
+    CGALPY::trace::Gil_release release;
+    z = CGALPY::zone_many(arr, ids, segments.data(), m, num_threads);
+  }
+  const std::size_t nnz = z.ids.size();
+  return py::make_tuple(CGALPY::to_numpy(std::move(z.offsets), {m + 1}),
+                        CGALPY::to_numpy(std::move(z.kinds), {nnz}),
+                        CGALPY::to_numpy(std::move(z.ids), {nnz}));
+}
+
+constexpr const char* ZONE_MANY_DOC = R"pbdoc(
+Compute the zone of each candidate segment without inserting it.
+
+The zone of a curve is the set of vertices, edges and faces it would cross
+if it were inserted. This answers "what would this edit touch" without the
+insert-then-rollback round trip.
+
+Parameters
+----------
+segments : numpy.ndarray
+    (M, 4) float64 array of candidate segments as (x1, y1, x2, y2) rows.
+num_threads : int, optional
+    Worker threads (default 0 = all hardware threads).
+
+Returns
+-------
+offsets : numpy.ndarray
+    (M+1,) int64; the cells crossed by segment i are
+    ``kinds[offsets[i]:offsets[i+1]]`` / ``ids[offsets[i]:offsets[i+1]]``.
+kinds : numpy.ndarray
+    int8 cell kinds: 0 = vertex, 1 = halfedge, 2 = face.
+ids : numpy.ndarray
+    int64 cell ids, following the same convention as
+    ``face_topology_arrays()``. Of each crossed edge, the left-to-right
+    halfedge is reported.
+
+Raises
+------
+ValueError
+    If a segment has zero length.
+
+Notes
+-----
+Cells are listed in the order the zone walk meets them, from the segment's
+left end to its right end. An edge that overlaps the segment is reported
+once; a vertex the segment passes through or ends on is reported as a
+vertex.
+
+The arrangement is not modified and no observer is notified. The query
+releases the GIL and splits the segments over ``num_threads`` workers. Each
+worker runs ``CGAL::zone`` with a shared walk-along-line point location,
+which is what ``CGAL::insert`` uses for a single curve. The arrangement must
+not be edited from another thread while the query runs.
+
+Examples
+--------
+>>> offsets, kinds, ids = arr.zone_many(np.array([[0, 5, 20, 5]], float))
+>>> crossed_faces = ids[offsets[0]:offsets[1]][kinds[offsets[0]:offsets[1]] == 2]
+)pbdoc";
+
+} // namespace
+
+void export_aos2_zone(py::class_<Arrangement>& aos_c) {
+  aos_c.def("zone_many", &zone_many, py::arg("segments"),
+            py::arg("num_threads") = 0, ZONE_MANY_DOC);
+}
@@ -0,0 +1,210 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Vectorized kernel predicates and constructions for CGALPY.Ker.
+// Called from export_kernel() next to the Point_2 / Segment_2 classes:
+//   export_ker_arrays(m);
+//   export_ker_point_to_double(point_2_c);
+
+#include <cstdint>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include "CGALPY/kernel_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/parallel_chunks.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Ker/array_predicates.hpp"
+
+namespace py = nanobind;
+namespace ka = CGALPY::ker_arrays;
+
+namespace {
+
+using Points = CGALPY::Rows_in<double, 2>;
+using Segments = CGALPY::Rows_in<double, 4>;
+
+py::object orientation(const Points& p, const Points& q, const Points& r,
+                       std::size_t num_threads) {
+  CGALPY_TRACE_SCOPE_N("Ker.orientation", p.shape(0));
+  CGALPY::check_same_rows(p.shape(0), q.shape(0), "p", "q");
+  CGALPY::check_same_rows(p.shape(0), r.shape(0), "p", "r");
+  const std::size_t n = p.shape(0);
+  std::vector<std::int8_t> out(n);
+  {
+    CGALPY::trace::Gil_release release;
+    Kernel kernel;
+    CGALPY::parallel_for_chunks(n, num_threads,
+      [&](std::size_t b, std::size_t e)
+      { ka::orientation_rows(kernel, p.data(), q.data(), r.data(),
+                             out.data(), b, e); });
+  }
+  return py::cast(CGALPY::to_numpy(std::move(out), {n}));
+}
+
+py::object do_intersect(const Segments& a, const Segments& b,
+                        std::size_t num_threads) {
+  CGALPY_TRACE_SCOPE_N("Ker.do_intersect", a.shape(0));
+  CGALPY::check_same_rows(a.shape(0), b.shape(0), "segs_a", "segs_b");
+  const std::size_t n = a.shape(0);
+  std::vector<std::uint8_t> out(n);
+  {
+    CGALPY::trace::Gil_release release;
+    Kernel kernel;
+    bool* flags = reinterpret_cast<bool*>(out.data());
+    CGALPY::parallel_for_chunks(n, num_threads,
+      [&](std::size_t lo, std::size_t hi)
+      { ka::do_intersect_rows(kernel, a.data(), b.data(), flags, lo, hi); });
+  }
+  return py::cast(CGALPY::to_numpy_bool(std::move(out), {n}));
+}
+
+py::object intersection(const Segments& a, const Segments& b,
+                        std::size_t num_threads) {
+  CGALPY_TRACE_SCOPE_N("Ker.intersection", a.shape(0));
+  CGALPY::check_same_rows(a.shape(0), b.shape(0), "segs_a", "segs_b");
+  const std::size_t n = a.shape(0);
+  std::vector<std::int8_t> kinds(n);
+  std::vector<double> coords(4 * n);
+  {
+    CGALPY::trace::Gil_release release;
+    Kernel kernel;
+    CGALPY::parallel_for_chunks(n, num_threads,
+      [&](std::size_t lo, std::size_t hi)
+      { ka::intersection_rows(kernel, a.data(), b.data(), kinds.data(),
+                              coords.data(), lo, hi); });
+  }
+  return py::make_tuple(CGALPY::to_numpy(std::move(kinds), {n}),
+                        CGALPY::to_numpy(std::move(coords), {n, 4}));
+}
+
+py::object squared_distance(const Points& points, const Segments& segs,
+                            std::size_t num_threads) {
+  CGALPY_TRACE_SCOPE_N("Ker.squared_distance", points.shape(0));
+  CGALPY::check_same_rows(points.shape(0), segs.shape(0), "points", "segs");
+  const std::size_t n = points.shape(0);
+  std::vector<double> out(n);
+  {
+    CGALPY::trace::Gil_release release;
+    Kernel kernel;
+    CGALPY::parallel_for_chunks(n, num_threads,
+      [&](std::size_t lo, std::size_t hi)
+      { ka::squared_distance_rows(kernel, points.data(), segs.data(),
+                                  out.data(), lo, hi); });
+  }
+  return py::cast(CGALPY::to_numpy(std::move(out), {n}));
+}
+
+constexpr const char* ORIENTATION_DOC = R"pbdoc(
+Evaluate orientation(p[i], q[i], r[i]) for every row.
+
+Parameters
+----------
+p, q, r : numpy.ndarray
+    (N, 2) float64 arrays of point coordinates.
+num_threads : int, optional
+    Worker threads; 1 (default) runs on the calling thread, 0 uses all cores.
+
+Returns
+-------
+numpy.ndarray
+    (N,) int8 array: -1 (right turn / clockwise), 0 (collinear),
+    +1 (left turn / counterclockwise).
+
+Notes
+-----
+Uses the kernel's filtered Orientation_2 predicate; the exact fallback only
+runs for nearly-degenerate rows. The GIL is released for the whole call.
+)pbdoc";
+
+constexpr const char* DO_INTERSECT_DOC = R"pbdoc(
+Test segs_a[i] against segs_b[i] for intersection.
+
+Parameters
+----------
+segs_a, segs_b : numpy.ndarray
+    (N, 4) float64 arrays of segments as (x1, y1, x2, y2) rows.
+num_threads : int, optional
+    Worker threads; 1 (default) runs on the calling thread, 0 uses all cores.
+
+Returns
+-------
+numpy.ndarray
+    (N,) bool array.
+)pbdoc";
+
+constexpr const char* INTERSECTION_DOC = R"pbdoc(
+Compute segs_a[i] intersected with segs_b[i] for every row.
+
+Parameters
+----------
+segs_a, segs_b : numpy.ndarray
+    (N, 4) float64 arrays of segments as (x1, y1, x2, y2) rows.
+num_threads : int, optional
+    Worker threads; 1 (default) runs on the calling thread, 0 uses all cores.
+
+Returns
+-------
+kinds : numpy.ndarray
+    (N,) int8 array: 0 no intersection, 1 point, 2 overlapping segment.
+coords : numpy.ndarray
+    (N, 4) float64 array. Point results fill columns 0-1, overlaps fill all
+    four columns, unused entries are NaN.
+
+Notes
+-----
+The intersection is computed exactly by the kernel and then rounded to
+double. Rows that do not intersect never reach the construction.
+)pbdoc";
+
+constexpr const char* SQUARED_DISTANCE_DOC = R"pbdoc(
+Compute squared_distance(points[i], segs[i]) for every row.
+
+Parameters
+----------
+points : numpy.ndarray
+    (N, 2) float64 array.
+segs : numpy.ndarray
+    (N, 4) float64 array of segments as (x1, y1, x2, y2) rows.
+num_threads : int, optional
+    Worker threads; 1 (default) runs on the calling thread, 0 uses all cores.
+
+Returns
+-------
+numpy.ndarray
+    (N,) float64 array of squared distances, rounded from the kernel's
+    number type.
+)pbdoc";
+
+constexpr const char* POINT_TO_DOUBLE_DOC = R"pbdoc(
+Return the coordinates as a (x, y) tuple of floats.
+
+Notes
+-----
+Rounds with CGAL::to_double, which may force evaluation of a lazy-exact
+number under EPEC. Cheaper than ``(float(p.x()), float(p.y()))``, which
+builds two FT wrappers first.
+)pbdoc";
+
+} // namespace
+
+void export_ker_point_to_double(py::class_<Kernel::Point_2>& point_c) {
+  point_c.def("to_double",
+              [](const Kernel::Point_2& p)
+              { return py::make_tuple(CGAL::to_double(p.x()),
+                                      CGAL::to_double(p.y())); },
+              POINT_TO_DOUBLE_DOC);
+}
+
+void export_ker_arrays(py::module_& m) {
+  m.def("orientation", &orientation, py::arg("p"), py::arg("q"), py::arg("r"),
+        py::arg("num_threads") = 1, ORIENTATION_DOC);
+  m.def("do_intersect", &do_intersect, py::arg("segs_a"), py::arg("segs_b"),
+        py::arg("num_threads") = 1, DO_INTERSECT_DOC);
+  m.def("intersection", &intersection, py::arg("segs_a"), py::arg("segs_b"),
+        py::arg("num_threads") = 1, INTERSECTION_DOC);
+  m.def("squared_distance", &squared_distance, py::arg("points"),
+        py::arg("segs"), py::arg("num_threads") = 1, SQUARED_DISTANCE_DOC);
+}
@@ -0,0 +1,98 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Exact rational coordinates of Point_2 sequences, without decimal strings.
+// Called from export_kernel() next to the Point_2 class:
+//   export_ker_exact(m);
+
+#include <string>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/string.h>
+
+#include "CGALPY/kernel_types.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Ker/exact_rationals.hpp"
+
+namespace py = nanobind;
+namespace er = CGALPY::exact_rationals;
+
+namespace {
+
+py::object exact_coordinates(py::sequence points, const std::string& format) {
+  CGALPY_STATS_SCOPE("exact_coordinates");
+  CGALPY_TRACE_SCOPE_N("Ker.exact_coordinates", py::len(points));
+  er::Rationals r;
+  std::size_t n = 0;
+  for (py::handle h : points) {
+    Kernel::Point_2* p = nullptr;
+    if (! py::try_cast(h, p) || p == nullptr)
+      throw py::type_error(("element " + std::to_string(n) +
+                            " is not a Point_2").c_str());
+    er::append_point(r, *p);
+    ++n;
+  }
+  return er::to_python(std::move(r), n, 2, format);
+}
+
+constexpr const char* EXACT_COORDINATES_DOC = R"pbdoc(
+Return the exact rational coordinates of many points.
+
+Parameters
+----------
+points : sequence of Point_2
+format : str, optional
+    ``"bytes"`` (default), ``"fraction"`` or ``"gmpy2"``.
+
+Returns
+-------
+dict or list
+    With ``"bytes"``, a dict:
+
+    ``sign`` (N, 2) int8
+        -1, 0 or 1 per coordinate.
+    ``offsets`` (4N + 1,) int64; ``bytes`` (B,) uint8
+        Coordinate k = 2 i + j (x: j = 0, y: j = 1) has numerator magnitude
+        ``bytes[offsets[2k]:offsets[2k + 1]]`` and denominator
+        ``bytes[offsets[2k + 1]:offsets[2k + 2]]``, little-endian, so
+        ``int.from_bytes(b, "little")`` reads them back. Fractions are in
+        lowest terms.
+    ``materialized`` int
+        How many coordinates needed their exact value computed.
+
+    With ``"fraction"`` or ``"gmpy2"``, a list of ``[x, y]`` lists of
+    ``fractions.Fraction`` or ``gmpy2.mpq``.
+
+Raises
+------
+TypeError
+    If an element is not a Point_2.
+ValueError
+    On an unknown format.
+ImportError
+    For ``"gmpy2"`` when gmpy2 is not installed.
+
+Notes
+-----
+Numbers are read from the GMP limbs (``mpz_export``), never through a
+decimal string. Under EPEC a coordinate whose interval approximation is a
+single double is that double, and is written without touching its exact
+value. Only the others are evaluated with ``CGAL::exact``, which
+is what ``materialized`` counts. Under EPIC every coordinate is a double,
+and its exact binary fraction is returned.
+
+Examples
+--------
+>>> pts = [v.point() for v in arr.vertices()]
+>>> Ker.exact_coordinates(pts, format="fraction")[0]
+[Fraction(1, 3), Fraction(2, 3)]
+)pbdoc";
+
+} // namespace
+
+void export_ker_exact(py::module_& m) {
+  m.def("exact_coordinates", &exact_coordinates, py::arg("points"),
+        py::arg("format") = "bytes", EXACT_COORDINATES_DOC);
+}
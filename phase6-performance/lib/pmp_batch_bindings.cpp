@@ -0,0 +1,263 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// PMP over a list of Surface_mesh objects in one call: named parameters are
+// parsed once and the loop over meshes runs in C++.
+// Called from the Polygon_mesh_processing export:
+//   export_pmp_batch(pmp);
+
+#include <cstddef>
+#include <cstdint>
+#include <optional>
+#include <stdexcept>
+#include <string>
+#include <utility>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+
+#include <CGAL/Surface_mesh.h>
+
+#include "CGALPY/kernel_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/named_parameter_applicator.hpp"
+#include "CGALPY/Named_parameter_wrapper.hpp"
+#include "CGALPY/Named_parameter_geom_traits.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Pmp/concurrency.hpp"
+#include "CGALPY/Pmp/mesh_batch.hpp"
+#include "CGALPY/Pmp/remeshing_parameters.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Surface_mesh = CGAL::Surface_mesh<Kernel::Point_3>;
+using CGALPY::Concurrency;
+
+//! The Surface_mesh objects of a Python sequence (owned by the sequence).
+template <typename Mesh>
+std::vector<Mesh*> mesh_pointers(const py::sequence& meshes) {
+  std::vector<Mesh*> ms;
+  ms.reserve(py::len(meshes));
+  for (py::handle h : meshes) {
+    Surface_mesh* m = nullptr;
+    if (! py::try_cast<Surface_mesh*>(h, m) || m == nullptr)
+      throw py::type_error(("mesh " + std::to_string(ms.size()) +
+                            " is not a Surface_mesh").c_str());
+    ms.push_back(m);
+  }
+  return ms;
+}
+
+//! Worker threads for a batch: 1 unless "parallel" was requested.
+std::size_t batch_threads(const Concurrency& c) {
+  return c.parallel ? c.num_threads : 1;
+}
+
+template <typename T, typename... Args>
+struct Face_normals_batch_wrapper {
+  static CGALPY::mesh_batch::Face_normals call(T np, Args&&... args) {
+    return run(np, std::forward<Args>(args)...);
+  }
+
+  static CGALPY::mesh_batch::Face_normals
+  run(T np, const std::vector<const Surface_mesh*>& meshes, const Concurrency& c) {
+    CGALPY::trace::Gil_release release;
+    return CGALPY::mesh_batch::face_normals(meshes, np, batch_threads(c));
+  }
+};
+
+template <typename T, typename... Args>
+struct Isotropic_remeshing_batch_wrapper {
+  static CGALPY::mesh_batch::Meshes call(T np, Args&&... args) {
+    return run(np, std::forward<Args>(args)...);
+  }
+
+  // As for the single-mesh call, the GIL is released only with "parallel":
+  // the meshes are Python objects that another thread could be using.
+  static CGALPY::mesh_batch::Meshes
+  run(T np, const std::vector<Surface_mesh*>& meshes,
+      const std::vector<double>& targets, const Concurrency& c) {
+    std::optional<CGALPY::trace::Gil_release> release;
+    if (c.parallel) release.emplace();
+    return CGALPY::mesh_batch::isotropic_remeshing(meshes, targets.data(),
+                                                   targets.size(), np,
+                                                   batch_threads(c));
+  }
+};
+
+py::tuple compute_face_normals_batch(const py::sequence& meshes,
+                                     const py::dict& params) {
+  CGALPY_STATS_SCOPE("PMP.compute_face_normals_batch");
+  CGALPY_TRACE_SCOPE_N("PMP.compute_face_normals_batch", py::len(meshes));
+  const std::vector<const Surface_mesh*> ms = mesh_pointers<const Surface_mesh>(meshes);
+  Concurrency concurrency;
+  auto np = CGAL::parameters::default_values();
+  CGALPY::Named_parameter_geom_traits op1;
+  CGALPY::Named_parameter_parallel op2(concurrency);
+  CGALPY::Named_parameter_num_threads op3(concurrency);
+  CGALPY::Named_parameter_wrapper<Face_normals_batch_wrapper,
+                                  const std::vector<const Surface_mesh*>&,
+                                  const Concurrency&>
+    wrapper(ms, concurrency);
+  CGALPY::mesh_batch::Face_normals r =
+    CGALPY::named_parameter_applicator(wrapper, np, params, op1, op2, op3);
+  const std::size_t n = static_cast<std::size_t>(r.offsets.back());
+  return py::make_tuple(CGALPY::to_numpy(std::move(r.offsets), { ms.size() + 1 }),
+                        CGALPY::to_numpy(std::move(r.normals), { n, 3 }));
+}
+
+py::tuple remesh_batch(const py::sequence& meshes, std::vector<double> targets,
+                       const py::dict& params) {
+  const std::vector<Surface_mesh*> ms = mesh_pointers<Surface_mesh>(meshes);
+  if (targets.size() != 1 && targets.size() != ms.size())
+    throw std::invalid_argument("target_edge_length must be a scalar or have one "
+                                "entry per mesh (" + std::to_string(ms.size()) +
+                                "), got " + std::to_string(targets.size()));
+  for (double t : targets)
+    if (! (t > 0))
+      throw std::invalid_argument("target_edge_length must be positive");
+  CGALPY::mesh_batch::check_distinct(ms);
+
+  Concurrency concurrency;
+  auto np = CGAL::parameters::default_values();
+  CGALPY::Named_parameter_geom_traits op1;
+  CGALPY::Named_parameter_number_of_iterations op2;
+  CGALPY::Named_parameter_protect_constraints op3;
+  CGALPY::Named_parameter_parallel op4(concurrency);
+  CGALPY::Named_parameter_num_threads op5(concurrency);
+  CGALPY::Named_parameter_wrapper<Isotropic_remeshing_batch_wrapper,
+                                  const std::vector<Surface_mesh*>&,
+                                  const std::vector<double>&, const Concurrency&>
+    wrapper(ms, targets, concurrency);
+  CGALPY::mesh_batch::Meshes r =
+    CGALPY::named_parameter_applicator(wrapper, np, params, op1, op2, op3, op4, op5);
+  const std::size_t nv = static_cast<std::size_t>(r.vertex_offsets.back());
+  const std::size_t nf = static_cast<std::size_t>(r.face_offsets.back());
+  return py::make_tuple(CGALPY::to_numpy(std::move(r.vertices), { nv, 3 }),
+                        CGALPY::to_numpy(std::move(r.vertex_offsets), { ms.size() + 1 }),
+                        CGALPY::to_numpy(std::move(r.faces), { nf, 3 }),
+                        CGALPY::to_numpy(std::move(r.face_offsets), { ms.size() + 1 }));
+}
+
+py::tuple isotropic_remeshing_batch(const py::sequence& meshes,
+                                    double target_edge_length,
+                                    const py::dict& params) {
+  CGALPY_STATS_SCOPE("PMP.isotropic_remeshing_batch");
+  CGALPY_TRACE_SCOPE_N("PMP.isotropic_remeshing_batch", py::len(meshes));
+  return remesh_batch(meshes, { target_edge_length }, params);
+}
+
+py::tuple isotropic_remeshing_batch_per_mesh(const py::sequence& meshes,
+                                             const CGALPY::Vector_in<double>& target_edge_length,
+                                             const py::dict& params) {
+  CGALPY_STATS_SCOPE("PMP.isotropic_remeshing_batch");
+  CGALPY_TRACE_SCOPE_N("PMP.isotropic_remeshing_batch", py::len(meshes));
+  const double* t = target_edge_length.data();
+  return remesh_batch(meshes, std::vector<double>(t, t + target_edge_length.shape(0)),
+                      params);
+}
+
+constexpr const char* COMPUTE_FACE_NORMALS_BATCH_DOC = R"pbdoc(
+Compute the face normals of many meshes in one call.
+
+Parameters
+----------
+meshes : sequence of Surface_mesh
+np : dict, optional
+    Named parameters, applied to every mesh: ``geom_traits``; ``parallel``
+    (bool, default False) and ``num_threads`` (int, default 0 = all
+    hardware threads) distribute the meshes over worker threads.
+
+Returns
+-------
+offsets : numpy.ndarray
+    (M+1,) int64; the normals of mesh i are ``normals[offsets[i]:offsets[i+1]]``.
+normals : numpy.ndarray
+    (offsets[-1], 3) float64 unit normals, one row per face in ``faces()``
+    order (the face rows of ``to_arrays()``).
+
+Raises
+------
+TypeError
+    If an element of ``meshes`` is not a Surface_mesh.
+
+Notes
+-----
+The named parameters are parsed once for the whole batch, and the loop over
+meshes runs in C++ with the GIL released. With ``parallel``, meshes are
+split into contiguous chunks of at least 16 meshes per worker. The meshes
+are only read and no property map is added to them.
+
+Examples
+--------
+>>> offsets, N = PMP.compute_face_normals_batch(meshes, {"parallel": True})
+>>> N[offsets[3]:offsets[4]]            # normals of meshes[3]
+)pbdoc";
+
+constexpr const char* ISOTROPIC_REMESHING_BATCH_DOC = R"pbdoc(
+Remesh many triangle meshes in place and return them as concatenated arrays.
+
+Parameters
+----------
+meshes : sequence of Surface_mesh
+    Triangle meshes, each remeshed in place. A mesh may appear only once.
+target_edge_length : float or numpy.ndarray
+    One target edge length for all meshes, or an (M,) float64 array with
+    one per mesh.
+np : dict, optional
+    Named parameters, applied to every mesh: ``geom_traits``,
+    ``number_of_iterations``, ``protect_constraints``; ``parallel`` (bool,
+    default False) and ``num_threads`` distribute the meshes over worker
+    threads.
+
+Returns
+-------
+vertices : numpy.ndarray
+    (V, 3) float64 vertex coordinates of all remeshed meshes.
+vertex_offsets : numpy.ndarray
+    (M+1,) int64; mesh i owns ``vertices[vertex_offsets[i]:vertex_offsets[i+1]]``.
+faces : numpy.ndarray
+    (F, 3) int64 triangles; entries index the mesh's own vertex rows, as in
+    ``to_arrays()``.
+face_offsets : numpy.ndarray
+    (M+1,) int64; mesh i owns ``faces[face_offsets[i]:face_offsets[i+1]]``.
+
+Raises
+------
+ValueError
+    If ``target_edge_length`` has the wrong length or a non-positive entry,
+    if a mesh is listed twice, or if a mesh cannot be exported (the message
+    names the mesh).
+
+Notes
+-----
+CGAL's remeshing of a single mesh is sequential; the batch gets its
+parallelism by remeshing different meshes on different threads, one mesh
+per task. The GIL is released only with ``parallel``, as for
+``isotropic_remeshing``. Do not use the meshes from another thread during
+the call.
+
+Examples
+--------
+>>> V, vo, F, fo = PMP.isotropic_remeshing_batch(
+...     meshes, 0.05, {"number_of_iterations": 3, "parallel": True})
+>>> V[vo[0]:vo[1]], F[fo[0]:fo[1]]     # meshes[0], also updated in place
+)pbdoc";
+
+} // namespace
+
+void export_pmp_batch(py::module_& pmp) {
+  pmp.def("compute_face_normals_batch", &compute_face_normals_batch,
+          py::arg("meshes"), py::arg("np") = py::dict(),
+          COMPUTE_FACE_NORMALS_BATCH_DOC)
+     .def("isotropic_remeshing_batch", &isotropic_remeshing_batch_per_mesh,
+          py::arg("meshes"), py::arg("target_edge_length"),
+          py::arg("np") = py::dict(), ISOTROPIC_REMESHING_BATCH_DOC)
+     .def("isotropic_remeshing_batch", &isotropic_remeshing_batch,
+          py::arg("meshes"), py::arg("target_edge_length"),
+          py::arg("np") = py::dict(), ISOTROPIC_REMESHING_BATCH_DOC);
+}
@@ -0,0 +1,275 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// "parallel" / "num_threads" named parameters for PMP normals, remeshing and
+// self-intersection tests on Surface_mesh.
+// Called from the Polygon_mesh_processing export, before the upstream normal
+// and remeshing functions are added so that these overloads are tried first:
+//   export_pmp_parallel(pmp);
+
+#include <cstddef>
+#include <optional>
+#include <string>
+#include <utility>
+
+#include <nanobind/nanobind.h>
+
+#include <CGAL/Surface_mesh.h>
+#include <CGAL/Polygon_mesh_processing/compute_normal.h>
+#include <CGAL/Polygon_mesh_processing/remesh.h>
+#include <CGAL/Polygon_mesh_processing/self_intersections.h>
+
+#include "CGALPY/kernel_types.hpp"
+#include "CGALPY/named_parameter_applicator.hpp"
+#include "CGALPY/Named_parameter_wrapper.hpp"
+#include "CGALPY/Named_parameter_geom_traits.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Pmp/concurrency.hpp"
+#include "CGALPY/Pmp/parallel_normals.hpp"
+#include "CGALPY/Pmp/remeshing_parameters.hpp"
+
+namespace py = nanobind;
+namespace PMP = CGAL::Polygon_mesh_processing;
+
+namespace {
+
+using Surface_mesh = CGAL::Surface_mesh<Kernel::Point_3>;
+using Vertex_index = Surface_mesh::Vertex_index;
+using Face_index = Surface_mesh::Face_index;
+using Vn_map = Surface_mesh::Property_map<Vertex_index, Kernel::Vector_3>;
+using Fn_map = Surface_mesh::Property_map<Face_index, Kernel::Vector_3>;
+using CGALPY::Concurrency;
+
+template <typename T, typename... Args>
+struct Compute_face_normals_wrapper {
+  static void call(T np, Args&&... args) { face_normals(np, std::forward<Args>(args)...); }
+
+  static void face_normals(T np, const Surface_mesh& sm, const Fn_map& fnm,
+                           const Concurrency& c) {
+    if (! c.parallel) {
+      PMP::compute_face_normals(sm, fnm, np);
+      return;
+    }
+    CGALPY::trace::Gil_release release;
+    CGALPY::pmp_parallel::compute_face_normals(sm, fnm, np, c.num_threads);
+  }
+};
+
+template <typename T, typename... Args>
+struct Compute_vertex_normals_wrapper {
+  static void call(T np, Args&&... args) { vertex_normals(np, std::forward<Args>(args)...); }
+
+  static void vertex_normals(T np, const Surface_mesh& sm, const Vn_map& vnm,
+                             const Concurrency& c) {
+    if (! c.parallel) {
+      PMP::compute_vertex_normals(sm, vnm, np);
+      return;
+    }
+    CGALPY::trace::Gil_release release;
+    CGALPY::pmp_parallel::compute_vertex_normals(sm, vnm, np, c.num_threads);
+  }
+};
+
+template <typename T, typename... Args>
+struct Isotropic_remeshing_wrapper {
+  static void call(T np, Args&&... args) { remesh(np, std::forward<Args>(args)...); }
+
+  // CGAL's remeshing is sequential; "parallel" only lets other Python
+  // threads run (and remesh other meshes) meanwhile.
+  static void remesh(T np, Surface_mesh& sm, const double& target_edge_length,
+                     const Concurrency& c) {
+    std::optional<CGALPY::trace::Gil_release> release;
+    if (c.parallel) release.emplace();
+    PMP::isotropic_remeshing(faces(sm), target_edge_length, sm, np);
+  }
+};
+
+template <typename T, typename... Args>
+struct Does_self_intersect_wrapper {
+  static bool call(T np, Args&&... args) { return test(np, std::forward<Args>(args)...); }
+
+  static bool test(T np, const Surface_mesh& sm, const Concurrency& c) {
+    std::optional<CGALPY::trace::Gil_release> release;
+    if (c.parallel) release.emplace();
+    return CGALPY::with_concurrency_tag(c, [&](auto tag) {
+      return PMP::does_self_intersect<decltype(tag)>(sm, np);
+    });
+  }
+};
+
+void compute_face_normals(const Surface_mesh& sm, const Fn_map& fnm,
+                          const py::dict& params) {
+  CGALPY_STATS_SCOPE("PMP.compute_face_normals");
+  CGALPY_TRACE_SCOPE_N("PMP.compute_face_normals", sm.number_of_faces());
+  Concurrency concurrency;
+  auto np = CGAL::parameters::default_values();
+  CGALPY::Named_parameter_geom_traits op1;
+  CGALPY::Named_parameter_parallel op2(concurrency);
+  CGALPY::Named_parameter_num_threads op3(concurrency);
+  CGALPY::Named_parameter_wrapper<Compute_face_normals_wrapper, const Surface_mesh&,
+                                  const Fn_map&, const Concurrency&>
+    wrapper(sm, fnm, concurrency);
+  CGALPY::named_parameter_applicator(wrapper, np, params, op1, op2, op3);
+}
+
+void compute_vertex_normals(const Surface_mesh& sm, const Vn_map& vnm,
+                            const py::dict& params) {
+  CGALPY_STATS_SCOPE("PMP.compute_vertex_normals");
+  CGALPY_TRACE_SCOPE_N("PMP.compute_vertex_normals", sm.number_of_vertices());
+  Concurrency concurrency;
+  auto np = CGAL::parameters::default_values();
+  CGALPY::Named_parameter_geom_traits op1;
+  CGALPY::Named_parameter_parallel op2(concurrency);
+  CGALPY::Named_parameter_num_threads op3(concurrency);
+  CGALPY::Named_parameter_wrapper<Compute_vertex_normals_wrapper, const Surface_mesh&,
+                                  const Vn_map&, const Concurrency&>
+    wrapper(sm, vnm, concurrency);
+  CGALPY::named_parameter_applicator(wrapper, np, params, op1, op2, op3);
+}
+
+void isotropic_remeshing(Surface_mesh& sm, double target_edge_length,
+                         const py::dict& params) {
+  CGALPY_STATS_SCOPE("PMP.isotropic_remeshing");
+  CGALPY_TRACE_SCOPE_N("PMP.isotropic_remeshing", sm.number_of_faces());
+  Concurrency concurrency;
+  auto np = CGAL::parameters::default_values();
+  CGALPY::Named_parameter_geom_traits op1;
+  CGALPY::Named_parameter_number_of_iterations op2;
+  CGALPY::Named_parameter_protect_constraints op3;
+  CGALPY::Named_parameter_parallel op4(concurrency);
+  CGALPY::Named_parameter_num_threads op5(concurrency);
+  CGALPY::Named_parameter_wrapper<Isotropic_remeshing_wrapper, Surface_mesh&,
+                                  const double&, const Concurrency&>
+    wrapper(sm, target_edge_length, concurrency);
+  CGALPY::named_parameter_applicator(wrapper, np, params, op1, op2, op3, op4, op5);
+}
+
+bool does_self_intersect(const Surface_mesh& sm, const py::dict& params) {
+  CGALPY_STATS_SCOPE("PMP.does_self_intersect");
+  CGALPY_TRACE_SCOPE_N("PMP.does_self_intersect", sm.number_of_faces());
+  Concurrency concurrency;
+  auto np = CGAL::parameters::default_values();
+  CGALPY::Named_parameter_geom_traits op1;
+  CGALPY::Named_parameter_parallel op2(concurrency);
+  CGALPY::Named_parameter_num_threads op3(concurrency);
+  CGALPY::Named_parameter_wrapper<Does_self_intersect_wrapper, const Surface_mesh&,
+                                  const Concurrency&>
+    wrapper(sm, concurrency);
+  return CGALPY::named_parameter_applicator(wrapper, np, params, op1, op2, op3);
+}
+
+constexpr const char* COMPUTE_FACE_NORMALS_DOC = R"pbdoc(
+Compute the outward unit normal of every face.
+
+Parameters
+----------
+mesh : Surface_mesh
+fnormals : Surface_mesh face property map of Vector_3
+    Receives one normal per face.
+np : dict, optional
+    Named parameters: ``geom_traits``; ``parallel`` (bool, default False)
+    and ``num_threads`` (int, default 0 = all hardware threads).
+
+Notes
+-----
+With ``{"parallel": True}`` the faces are split into contiguous chunks,
+one per worker, and the GIL is released for the whole call. Every face
+normal is computed by ``PMP::compute_face_normal`` exactly as in the
+sequential function, so the results are identical. Meshes below a few
+thousand faces run on the calling thread.
+
+Examples
+--------
+>>> fn = mesh.add_property_map("f:normals", Vector_3(0, 0, 0))
+>>> PMP.compute_face_normals(mesh, fn, {"parallel": True, "num_threads": 8})
+)pbdoc";
+
+constexpr const char* COMPUTE_VERTEX_NORMALS_DOC = R"pbdoc(
+Compute the unit normal of every vertex from its incident faces.
+
+Parameters
+----------
+mesh : Surface_mesh
+vnormals : Surface_mesh vertex property map of Vector_3
+    Receives one normal per vertex.
+np : dict, optional
+    Named parameters: ``geom_traits``; ``parallel`` (bool, default False)
+    and ``num_threads`` (int, default 0 = all hardware threads).
+
+Notes
+-----
+With ``{"parallel": True}`` face normals are computed in parallel into a
+temporary map, then vertex normals in a second parallel pass over the
+vertices; the GIL is released for the whole call. The per-vertex
+computation is ``PMP::compute_vertex_normal``, so the results match the
+sequential function.
+)pbdoc";
+
+constexpr const char* ISOTROPIC_REMESHING_DOC = R"pbdoc(
+Remesh all faces of a triangle mesh towards a uniform edge length.
+
+Parameters
+----------
+mesh : Surface_mesh
+    Triangle mesh, modified in place.
+target_edge_length : float
+np : dict, optional
+    Named parameters: ``geom_traits``, ``number_of_iterations``,
+    ``protect_constraints``; ``parallel`` (bool, default False) and
+    ``num_threads``.
+
+Notes
+-----
+CGAL's isotropic remeshing has no parallel implementation. With
+``{"parallel": True}`` the GIL is released while the mesh is remeshed, so
+several meshes can be remeshed at once from a thread pool; ``num_threads``
+is accepted for uniformity and ignored. Do not touch ``mesh`` from another
+thread during the call.
+
+Examples
+--------
+>>> from concurrent.futures import ThreadPoolExecutor
+>>> with ThreadPoolExecutor(8) as pool:
+...     list(pool.map(lambda m: PMP.isotropic_remeshing(
+...         m, 0.05, {"parallel": True}), meshes))
+)pbdoc";
+
+constexpr const char* DOES_SELF_INTERSECT_DOC = R"pbdoc(
+Test whether a triangle mesh has intersecting faces.
+
+Parameters
+----------
+mesh : Surface_mesh
+np : dict, optional
+    Named parameters: ``geom_traits``; ``parallel`` (bool, default False)
+    and ``num_threads`` (int, default 0 = all hardware threads).
+
+Returns
+-------
+bool
+
+Notes
+-----
+``{"parallel": True}`` selects CGAL's ``Parallel_if_available_tag``
+implementation, which uses TBB when the module is built with it (and the
+sequential code otherwise); ``num_threads`` caps the TBB scheduler for the
+call. The GIL is released in that case.
+)pbdoc";
+
+} // namespace
+
+void export_pmp_parallel(py::module_& pmp) {
+  pmp.def("compute_face_normals", &compute_face_normals, py::arg("mesh"),
+          py::arg("fnormals"), py::arg("np") = py::dict(),
+          COMPUTE_FACE_NORMALS_DOC)
+     .def("compute_vertex_normals", &compute_vertex_normals, py::arg("mesh"),
+          py::arg("vnormals"), py::arg("np") = py::dict(),
+          COMPUTE_VERTEX_NORMALS_DOC)
+     .def("isotropic_remeshing", &isotropic_remeshing, py::arg("mesh"),
+          py::arg("target_edge_length"), py::arg("np") = py::dict(),
+          ISOTROPIC_REMESHING_DOC)
+     .def("does_self_intersect", &does_self_intersect, py::arg("mesh"),
+          py::arg("np") = py::dict(),
+          DOES_SELF_INTERSECT_DOC);
+}
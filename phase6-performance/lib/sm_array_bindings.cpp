@@ -0,0 +1,254 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// Surface_mesh <-> NumPy: bulk construction / export and property maps as
+// array views.
+// Called from the Surface_mesh export once its class exists:
+//   export_sm_arrays(sm_c);
+
+#include <cstdint>
+#include <stdexcept>
+#include <string>
+#include <type_traits>
+#include <vector>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/ndarray.h>
+#include <nanobind/stl/string.h>
+
+#include <CGAL/Surface_mesh.h>
+
+#include "CGALPY/kernel_types.hpp"
+#include "CGALPY/array_support.hpp"
+#include "CGALPY/stats.hpp"
+#include "CGALPY/trace.hpp"
+#include "CGALPY/Pmp/mesh_arrays.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using Surface_mesh = CGAL::Surface_mesh<Kernel::Point_3>;
+using Point_3 = Kernel::Point_3;
+using Vector_3 = Kernel::Vector_3;
+using Vertex_index = Surface_mesh::Vertex_index;
+using Face_index = Surface_mesh::Face_index;
+using Edge_index = Surface_mesh::Edge_index;
+using Halfedge_index = Surface_mesh::Halfedge_index;
+
+/*! Point_3 / Vector_3 of a double-based kernel are three packed doubles, so
+ * their property arrays can be viewed as (n, 3) float64. Exact kernels
+ * (lazy or multiprecision FT) cannot.
+ */
+template <typename T>
+constexpr bool packed_xyz =
+  (std::is_same_v<T, Point_3> || std::is_same_v<T, Vector_3>) &&
+  std::is_same_v<Kernel::FT, double> && sizeof(T) == 3 * sizeof(double) &&
+  std::is_standard_layout_v<T>;
+
+template <typename Index>
+std::size_t slots(const Surface_mesh& sm) {
+  if constexpr (std::is_same_v<Index, Vertex_index>) return sm.num_vertices();
+  else if constexpr (std::is_same_v<Index, Face_index>) return sm.num_faces();
+  else if constexpr (std::is_same_v<Index, Edge_index>) return sm.num_edges();
+  else return sm.num_halfedges();
+}
+
+//! View of property `name` if it exists with value type T, else None.
+template <typename Index, typename T>
+py::object try_view(Surface_mesh& sm, py::handle owner, const std::string& name) {
+  auto pm = sm.template property_map<Index, T>(name);
+  if (! pm) return py::none();
+  const std::size_t n = slots<Index>(sm);
+  T* data = const_cast<T*>(pm->data());
+  if constexpr (std::is_arithmetic_v<T>) {
+    return py::cast(py::ndarray<py::numpy, T>(data, { n }, owner));
+  }
+  else if constexpr (packed_xyz<T>) {
+    return py::cast(py::ndarray<py::numpy, double>(
+      reinterpret_cast<double*>(data), { n, 3 }, owner));
+  }
+  else {
+    // Exact coordinates: a rounded, read-only copy.
+    auto* copy = new std::vector<double>();
+    copy->reserve(3 * n);
+    for (std::size_t i = 0; i < n; ++i) {
+      copy->push_back(CGAL::to_double(data[i].x()));
+      copy->push_back(CGAL::to_double(data[i].y()));
+      copy->push_back(CGAL::to_double(data[i].z()));
+    }
+    py::capsule deleter(copy, [](void* p) noexcept {
+      delete static_cast<std::vector<double>*>(p);
+    });
+    return py::cast(py::ndarray<py::numpy, const double>(copy->data(), { n, 3 },
+                                                         deleter));
+  }
+}
+
+template <typename Index>
+py::object find_view(Surface_mesh& sm, py::handle owner, const std::string& name) {
+  py::object r;
+  // Value types in order of likelihood; the first one that matches wins.
+  for (auto attempt : { &try_view<Index, Point_3>, &try_view<Index, Vector_3>,
+                        &try_view<Index, double>, &try_view<Index, float>,
+                        &try_view<Index, int>, &try_view<Index, std::int64_t>,
+                        &try_view<Index, std::uint32_t>,
+                        &try_view<Index, std::size_t> }) {
+    r = attempt(sm, owner, name);
+    if (! r.is_none()) return r;
+  }
+  return r;
+}
+
+py::object property_array(py::handle self, const std::string& name) {
+  Surface_mesh& sm = py::cast<Surface_mesh&>(self);
+  // "v:normals" names a vertex property; an unprefixed name may be any kind.
+  const char kind = (name.size() > 1 && name[1] == ':') ? name[0] : '\0';
+  auto wants = [kind](char k) { return kind == k || kind == '\0'; };
+  py::object r = py::none();
+  if (wants('v')) r = find_view<Vertex_index>(sm, self, name);
+  if (r.is_none() && wants('f')) r = find_view<Face_index>(sm, self, name);
+  if (r.is_none() && wants('e')) r = find_view<Edge_index>(sm, self, name);
+  if (r.is_none() && wants('h')) r = find_view<Halfedge_index>(sm, self, name);
+  if (r.is_none())
+    throw std::invalid_argument("no property map named '" + name +
+                                "' with a supported value type (Point_3, "
+                                "Vector_3, float, double, int, int64, uint32, "
+                                "size_t)");
+  return r;
+}
+
+Surface_mesh from_arrays(const CGALPY::Rows_in<double, 3>& vertices,
+                         const py::ndarray<const std::int64_t, py::ndim<2>,
+                                           py::c_contig, py::device::cpu>& faces) {
+  CGALPY_STATS_SCOPE("Surface_mesh.from_arrays");
+  CGALPY_TRACE_SCOPE_N("Surface_mesh.from_arrays", faces.shape(0));
+  Surface_mesh sm;
+  {
+    // The mesh is not visible to Python yet, so nothing else can touch it.
+    CGALPY::trace::Gil_release release;
+    CGALPY::mesh_arrays::build(sm, vertices.data(), vertices.shape(0),
+                               faces.data(), faces.shape(0), faces.shape(1));
+  }
+  return sm;
+}
+
+py::tuple to_arrays(const Surface_mesh& sm) {
+  CGALPY_STATS_SCOPE("Surface_mesh.to_arrays");
+  CGALPY_TRACE_SCOPE_N("Surface_mesh.to_arrays", sm.number_of_faces());
+  CGALPY::mesh_arrays::Arrays a = CGALPY::mesh_arrays::export_arrays(sm);
+  return py::make_tuple(CGALPY::to_numpy(std::move(a.vertices), { a.nv, 3 }),
+                        CGALPY::to_numpy(std::move(a.faces), { a.nf, a.k }));
+}
+
+constexpr const char* FROM_ARRAYS_DOC = R"pbdoc(
+Build a Surface_mesh from a vertex array and a face index array.
+
+Parameters
+----------
+vertices : numpy.ndarray
+    (N, 3) float64 vertex coordinates; row i becomes vertex index i.
+faces : numpy.ndarray
+    (M, k) int64 vertex indices, k >= 3; row j becomes face index j.
+    Faces must be consistently oriented.
+
+Returns
+-------
+Surface_mesh
+
+Raises
+------
+ValueError
+    If an index is out of range or repeated within a face, or if a face
+    would make the mesh non-manifold or clashes in orientation with a
+    neighbour. The message names the offending row.
+
+Notes
+-----
+One ``add_vertex`` / ``add_face`` per row in C++, after a single
+``reserve``; the GIL is released while the mesh is built. For polygon
+soups that are not yet consistently oriented, orient them first with
+``PMP.orient_polygon_soup``.
+
+Examples
+--------
+>>> sm = Surface_mesh.from_arrays(V, F)
+>>> V2, F2 = sm.to_arrays()
+)pbdoc";
+
+constexpr const char* TO_ARRAYS_DOC = R"pbdoc(
+Export vertex coordinates and face indices as NumPy arrays.
+
+Returns
+-------
+vertices : numpy.ndarray
+    (N, 3) float64 coordinates (rounded under exact kernels).
+faces : numpy.ndarray
+    (M, k) int64 vertex rows per face, in the face's halfedge order.
+
+Raises
+------
+ValueError
+    If the faces do not all have the same degree.
+
+Notes
+-----
+Removed elements are skipped. Without removals, row i is vertex index i,
+so ``from_arrays(*sm.to_arrays())`` reproduces the indices. After
+removals, vertices are renumbered compactly; call ``collect_garbage()``
+first to keep rows aligned with ``property_array`` views.
+)pbdoc";
+
+constexpr const char* PROPERTY_ARRAY_DOC = R"pbdoc(
+Expose the storage of a property map as a NumPy array view.
+
+Parameters
+----------
+name : str
+    Property name, e.g. ``"v:point"``, ``"v:normals"``, ``"f:normals"``.
+    A ``v:`` / ``f:`` / ``e:`` / ``h:`` prefix selects the element type;
+    other names are looked up on vertices, faces, edges, then halfedges.
+
+Returns
+-------
+numpy.ndarray
+    Row i is the value of element index i. Point_3 / Vector_3 values give
+    (n, 3) float64, scalars give (n,). Under a double-based kernel the
+    array is a writable view of the map itself: writing to it changes the
+    mesh, and PMP output written into the map shows up in the array without
+    a copy. Under exact kernels, Point_3 / Vector_3 maps are returned as a
+    rounded read-only copy.
+
+Raises
+------
+ValueError
+    If no property of that name exists with a supported value type.
+
+Notes
+-----
+n counts removed elements too (``num_vertices()`` rather than
+``number_of_vertices()``). The view keeps the mesh alive, but it points
+into the property's buffer: adding elements may reallocate it, and
+``collect_garbage()`` moves elements. Fetch the view again after either.
+
+Examples
+--------
+>>> normals = sm.add_property_map("v:normals", Vector_3(0, 0, 0))
+>>> PMP.compute_vertex_normals(sm, normals)
+>>> N = sm.property_array("v:normals")          # (n, 3), no copy
+>>> P = sm.points_array()
+>>> P[:, 2] += 0.1                              # moves every vertex up
+)pbdoc";
+
+} // namespace
+
+void export_sm_arrays(py::class_<Surface_mesh>& sm_c) {
+  sm_c.def_static("from_arrays", &from_arrays, py::arg("vertices"),
+                  py::arg("faces"), FROM_ARRAYS_DOC)
+      .def("to_arrays", &to_arrays, TO_ARRAYS_DOC)
+      .def("property_array", &property_array, py::arg("name"),
+           PROPERTY_ARRAY_DOC)
+      .def("points_array",
+           [](py::handle self) { return property_array(self, "v:point"); },
+           "View of the vertex point map: ``property_array(\"v:point\")``.");
+}
@@ -0,0 +1,127 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// CGALPY.stats: opt-in counters for traits calls, filter failures and sweep
+// events. Built in every config so `CGALPY.stats.available` can be checked;
+// the counters only exist with -DCGALPY_STATS=ON. Called from the module
+// init next to the other top-level submodules:
+//   export_stats(m);
+
+#include <cstdint>
+#include <stdexcept>
+
+#include <nanobind/nanobind.h>
+
+#include "CGALPY/stats.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+#ifdef CGALPY_STATS
+constexpr bool available = true;
+#else
+constexpr bool available = false;
+#endif
+
+void require_stats() {
+  if (! available)
+    throw std::runtime_error("this CGALPY build has no stats support; "
+                             "rebuild with -DCGALPY_STATS=ON");
+}
+
+void set_enabled(bool enable) {
+  if (enable) require_stats();
+  CGALPY::stats::Registry::instance().enabled.store(enable);
+}
+
+py::dict row_dict(const CGALPY::stats::Registry::Row& row) {
+  py::dict d;
+  const auto& names = CGALPY::stats::counter_names();
+  for (std::size_t c = 0; c < names.size(); ++c)
+    d[names[c]] = row[c].load(std::memory_order_relaxed);
+  return d;
+}
+
+py::dict as_dict() {
+  auto& reg = CGALPY::stats::Registry::instance();
+  py::dict out;
+  for (std::size_t op = 0; op < reg.size(); ++op) {
+    bool any = false;
+    for (const auto& c : reg.row(op)) any = any || c.load(std::memory_order_relaxed);
+    if (any) out[reg.name(op)] = row_dict(reg.row(op));
+  }
+  return out;
+}
+
+py::dict totals() {
+  auto& reg = CGALPY::stats::Registry::instance();
+  const auto& names = CGALPY::stats::counter_names();
+  py::dict out;
+  for (std::size_t c = 0; c < names.size(); ++c) {
+    std::uint64_t sum = 0;
+    for (std::size_t op = 0; op < reg.size(); ++op)
+      sum += reg.row(op)[c].load(std::memory_order_relaxed);
+    out[names[c]] = sum;
+  }
+  return out;
+}
+
+constexpr const char* ENABLE_DOC = R"pbdoc(
+Start counting. Counts accumulate until ``reset()``.
+
+Raises
+------
+RuntimeError
+    If the module was built without ``-DCGALPY_STATS=ON``.
+)pbdoc";
+
+constexpr const char* AS_DICT_DOC = R"pbdoc(
+Return the counts per operation.
+
+Returns
+-------
+dict
+    ``{operation: {counter: int}}`` for every operation with a non-zero
+    count. Operations are the bound functions that declare a stats scope
+    (``"compute_intersection_points"``, ``"insert_segments"``,
+    ``"vertical_decomposition"``, ...). Work done outside any scope is
+    reported under ``"other"``.
+
+Notes
+-----
+Counters:
+
+- ``compare_x`` ... ``make_x_monotone``: geometry-traits functor calls made
+  by the arrangement algorithms.
+- ``filtered_calls`` / ``exact_fallbacks``: filtered kernel predicates
+  evaluated, and how many of those failed the interval filter and ran in
+  exact arithmetic.
+- ``static_filter_calls`` / ``static_filter_failures``: the same for the
+  semi-static filters in front of them (EPIC).
+- ``sweep_events``: events handled by the Phase 6 sweep entry points.
+
+Examples
+--------
+>>> from CGALPY import stats
+>>> stats.enable(); stats.reset()
+>>> Aos2.compute_intersection_points(segments)
+>>> s = stats.as_dict()["compute_intersection_points"]
+>>> s["exact_fallbacks"] / max(1, s["filtered_calls"])
+)pbdoc";
+
+} // namespace
+
+void export_stats(py::module_& m) {
+  auto s = m.def_submodule("stats", "Opt-in performance counters.");
+  s.attr("available") = available;
+  s.def("enable", []() { set_enabled(true); }, ENABLE_DOC);
+  s.def("disable", []() { set_enabled(false); }, "Stop counting; counts are kept.");
+  s.def("enabled", []() {
+    return CGALPY::stats::Registry::instance().enabled.load();
+  }, "True while counting.");
+  s.def("reset", []() { CGALPY::stats::Registry::instance().reset(); },
+        "Zero every counter of every operation.");
+  s.def("as_dict", &as_dict, AS_DICT_DOC);
+  s.def("totals", &totals, "Return ``{counter: int}`` summed over all operations.");
+}
@@ -0,0 +1,120 @@
+// Copyright (c) 2026 Utkarsh Khajuria
+// Phase 6 performance work - CGAL Python Bindings
+//
+// CGALPY.trace: runtime-switchable tracing of bound calls, exported as
+// Chrome trace-event JSON. Called from the module init:
+//   export_trace(m);
+// Bound functions opt in with CGALPY_TRACE_SCOPE / CGALPY_TRACE_SCOPE_N and
+// use CGALPY::trace::Gil_release instead of py::gil_scoped_release.
+
+#include <cstddef>
+#include <cstdint>
+#include <fstream>
+#include <stdexcept>
+#include <string>
+
+#include <nanobind/nanobind.h>
+#include <nanobind/stl/string.h>
+
+#include "CGALPY/trace.hpp"
+
+namespace py = nanobind;
+
+namespace {
+
+using CGALPY::trace::Tracer;
+
+void start(std::size_t max_events_per_thread) {
+  using CGALPY::trace::Thread_buffer;
+  if (max_events_per_thread < Thread_buffer::chunk_events)
+    throw std::invalid_argument("max_events_per_thread must be at least " +
+                                std::to_string(Thread_buffer::chunk_events));
+  Tracer& t = Tracer::instance();
+  t.max_chunks.store(max_events_per_thread / Thread_buffer::chunk_events);
+  t.enabled.store(true);
+}
+
+std::size_t flush(const std::string& path) {
+  py::gil_scoped_release release;
+  std::ofstream os(path);
+  if (! os) throw std::runtime_error("cannot open '" + path + "' for writing");
+  Tracer& t = Tracer::instance();
+  std::size_t n = 0;
+  {
+    CGALPY::trace::Chrome_writer writer(os);
+    for (auto tid : t.thread_ids()) writer.thread_name(tid);
+    n = t.drain([&](std::uint32_t tid, const CGALPY::trace::Event& e) {
+      writer.event(tid, e);
+    });
+  }
+  if (! os) throw std::runtime_error("error while writing '" + path + "'");
+  return n;
+}
+
+std::size_t discard() {
+  return Tracer::instance().drain([](std::uint32_t, const CGALPY::trace::Event&) {});
+}
+
+constexpr const char* START_DOC = R"pbdoc(
+Start recording bound calls.
+
+Parameters
+----------
+max_events_per_thread : int, optional
+    Buffered events per thread before new events are dropped (and counted
+    by ``dropped()``). Default 16M, about 640 MB per thread at worst;
+    ``flush()`` frees what it writes.
+
+Notes
+-----
+Each traced call records its name, start and duration, the thread, whether
+the GIL was held, and the size of its main argument where that is
+meaningful (rows of an input array, number of curves). Recording appends to
+a buffer owned by the calling thread and takes no lock, so long traces
+barely perturb the workload. Calls made while tracing is stopped cost one
+atomic load.
+)pbdoc";
+
+constexpr const char* FLUSH_DOC = R"pbdoc(
+Write all buffered events to ``path`` as Chrome trace-event JSON.
+
+Parameters
+----------
+path : str
+    Output file; open it in https://ui.perfetto.dev or chrome://tracing.
+
+Returns
+-------
+int
+    Number of events written.
+
+Notes
+-----
+Tracing may continue while flushing. Written events are removed from the
+buffers, so calling ``flush()`` periodically with different paths bounds
+memory use on long runs; each file is a complete trace.
+
+Examples
+--------
+>>> from CGALPY import trace
+>>> trace.start()
+>>> ingest(arr, features)
+>>> trace.stop()
+>>> trace.flush("ingest.json")
+)pbdoc";
+
+} // namespace
+
+void export_trace(py::module_& m) {
+  auto t = m.def_submodule("trace", "Chrome/Perfetto tracing of bound calls.");
+  t.def("start", &start, py::arg("max_events_per_thread") = std::size_t(1) << 24,
+        START_DOC);
+  t.def("stop", []() { Tracer::instance().enabled.store(false); },
+        "Stop recording. Buffered events are kept until flush() or discard().");
+  t.def("enabled", []() { return Tracer::instance().enabled.load(); },
+        "True while recording.");
+  t.def("flush", &flush, py::arg("path"), FLUSH_DOC);
+  t.def("discard", &discard, "Drop buffered events; returns how many.");
+  t.def("dropped", []() { return Tracer::instance().dropped(); },
+        "Number of events lost to full per-thread buffers since import.");
+}
@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""dcel_arrays / from_dcel_arrays / convert_to: rebuilding an arrangement without a sweep."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY import Aos2
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Point_2, Segment_2
+
+
+def ring(points):
+    p = [Point_2(x, y) for x, y in points]
+    return [Segment_2(p[i], p[(i + 1) % len(p)]) for i in range(len(p))]
+
+
+def counts(a):
+    return (a.number_of_vertices(), a.number_of_edges(), a.number_of_faces())
+
+
+def edit_ccbs(d, **cols):
+    """Copy of d with the given ccb rows replaced: cols maps name -> {row: value}."""
+    out = dict(d)
+    for k, rows in cols.items():
+        out[k] = d[k].copy()
+        for i, v in rows.items():
+            out[k][i] = v
+    return out
+
+
+print("=" * 60)
+print("TEST 1: Square with a hole, a crossing and an isolated point")
+print("=" * 60)
+
+arr = Arrangement_2()
+Aos2.insert(arr, ring([(0, 0), (10, 0), (10, 10), (0, 10)]) +
+                 ring([(2, 2), (6, 2), (4, 5)]) +
+                 [Segment_2(Point_2(7, 1), Point_2(9, 9)), Segment_2(Point_2(7, 9), Point_2(9, 1))])
+Aos2.insert_point(arr, Point_2(8, 8))
+d = arr.dcel_arrays()
+print(f"  shapes: {[(k, d[k].shape) for k in ('points', 'halfedge_target', 'face_is_unbounded', 'ccb_face')]}")
+print(f"  inner CCBs {int(d['ccb_is_inner'].sum())}, isolated {d['isolated_vertices'].tolist()}  "
+      f"(expected 2, one vertex)")
+print(f"  twins start where the other ends: "
+      f"{np.array_equal(d['halfedge_target'][d['halfedge_next'] ^ 1], d['halfedge_target'])}  (expected True)")
+
+copy = Arrangement_2.from_dcel_arrays(d)
+print(f"  V/E/F {counts(arr)} -> {counts(copy)}  (expected equal)")
+print(f"  face areas equal: "
+      f"{np.array_equal(arr.face_measures()['area'], copy.face_measures()['area'])}  (expected True)")
+d2 = copy.dcel_arrays()
+same = all(np.array_equal(d[k], d2[k]) for k in d if k != "halfedge_ids")
+print(f"  re-export identical: {same}  (expected True)")
+
+print("\n" + "=" * 60)
+print("TEST 2: Rebuild vs re-insertion on 20,000 random segments")
+print("=" * 60)
+
+rng = np.random.default_rng(48)
+segs = rng.random((20_000, 4)) * 1000.0
+big = Arrangement_2()
+Aos2.insert(big, [Segment_2(Point_2(*s[:2]), Point_2(*s[2:])) for s in segs])
+
+t0 = time.perf_counter()
+d = big.dcel_arrays()
+rebuilt = Arrangement_2.from_dcel_arrays(d)
+t_dcel = time.perf_counter() - t0
+
+t0 = time.perf_counter()
+again = Arrangement_2()
+Aos2.insert(again, [Segment_2(Point_2(*s[:2]), Point_2(*s[2:])) for s in segs])
+t_sweep = time.perf_counter() - t0
+print(f"  {big.number_of_edges()} edges: dcel round trip {t_dcel * 1e3:.0f} ms, "
+      f"re-insertion {t_sweep * 1e3:.0f} ms")
+print(f"  counts equal: {counts(rebuilt) == counts(again) == counts(big)}  (expected True)")
+
+print("\n" + "=" * 60)
+print("TEST 3: Corrupted arrays are refused")
+print("=" * 60)
+
+d = arr.dcel_arrays()
+broken_next = dict(d, halfedge_next=np.roll(d["halfedge_next"], 1))
+missing = {k: v for k, v in d.items() if k != "halfedge_target"}
+dropped = dict(d, ccb_face=d["ccb_face"][:-1], ccb_halfedge=d["ccb_halfedge"][:-1],
+               ccb_is_inner=d["ccb_is_inner"][:-1])
+
+face_unb = d["face_is_unbounded"][d["ccb_face"]].astype(bool)
+inner = d["ccb_is_inner"].astype(bool)
+hole = int(np.flatnonzero(inner & ~face_unb)[0])            # a hole of the square
+outer = int(np.flatnonzero(~inner)[0])
+unb = int(np.flatnonzero(face_unb)[0])
+other_face = int(next(f for f in d["ccb_face"][~inner] if f != d["ccb_face"][outer]))
+twice = dict(d, ccb_face=np.append(d["ccb_face"], other_face),
+             ccb_halfedge=np.append(d["ccb_halfedge"], d["ccb_halfedge"][outer]),
+             ccb_is_inner=np.append(d["ccb_is_inner"], 1))
+cases = [(broken_next, "broken next"), (missing, "missing key"), (dropped, "dropped CCB"),
+         (edit_ccbs(d, ccb_is_inner={hole: 0}), "second outer CCB on a face"),
+         (edit_ccbs(d, ccb_is_inner={unb: 0}), "outer CCB on the unbounded face"),
+         (edit_ccbs(d, ccb_is_inner={outer: 1}), "bounded face without outer CCB"),
+         (edit_ccbs(d, ccb_face={outer: other_face}), "CCB reported for the wrong face"),
+         (twice, "one cycle on two faces")]
+for bad, label in cases:
+    try:
+        Arrangement_2.from_dcel_arrays(bad)
+        print(f"  {label}: no error (unexpected)")
+    except ValueError as e:
+        print(f"  {label}: ValueError: {e}")
+
+print("\n" + "=" * 60)
+print("TEST 4: Damage done by rounding is reported")
+print("=" * 60)
+
+tiny = Point_2(5, 0).x() / 5e20                 # exact 1e-20 under EPEC, 0 under EPIC
+damaged = [("coincident_vertices", "merged points",
+            [Segment_2(Point_2(0, 0), Point_2(1, 1)), Segment_2(Point_2(1 + tiny, 1), Point_2(2, 0))]),
+           ("reoriented_edges", "edge turned vertical and reversed",
+            [Segment_2(Point_2(1, 5), Point_2(1 + tiny, 0))]),
+           ("misordered_vertices", "two edges rounded onto one ray",
+            [Segment_2(Point_2(1 + tiny, 0), Point_2(0, 1)), Segment_2(Point_2(1 + tiny, 0), Point_2(-1, 2))])]
+for key, label, segments in damaged:
+    near = Arrangement_2()
+    Aos2.insert(near, segments)
+    d = near.dcel_arrays()
+    print(f"  {label}: {key} {d[key].tolist()}  (expected one entry under EPEC, none under EPIC)")
+    if len(d[key]):
+        try:
+            Arrangement_2.from_dcel_arrays(d)
+            print("    from_dcel_arrays: no error (unexpected)")
+        except ValueError as e:
+            print(f"    from_dcel_arrays: ValueError: {e}")
+
+print("\n" + "=" * 60)
+print("TEST 5: convert_to another kernel config")
+print("=" * 60)
+
+try:
+    import CGALPY_epic
+except ImportError:
+    print("  skipped: no second config importable as CGALPY_epic")
+else:
+    fast = big.convert_to(CGALPY_epic)
+    print(f"  {type(fast).__module__}: V/E/F {counts(fast)}  (expected {counts(big)})")
+    print(f"  by name: {counts(big.convert_to('CGALPY_epic')) == counts(big)}  (expected True)")
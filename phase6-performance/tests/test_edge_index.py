@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Edge_index: nearest-edge and box queries, kept current by arrangement edits."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY import Aos2
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Point_2, Segment_2
+
+
+def brute_nearest(raw, pts):
+    """Distance from each point to each segment of an (E, 4) array: (N, E)."""
+    a, b = raw[None, :, :2], raw[None, :, 2:]
+    p = pts[:, None, :]
+    d = b - a
+    t = np.clip(((p - a) * d).sum(-1) / (d * d).sum(-1), 0, 1)
+    return np.linalg.norm(p - (a + t[..., None] * d), axis=-1)
+
+
+def edge_array(arr):
+    return np.array([[float(he.source().point().x()), float(he.source().point().y()),
+                      float(he.target().point().x()), float(he.target().point().y())]
+                     for he in arr.edges()])
+
+
+print("=" * 60)
+print("TEST 1: Unit square")
+print("=" * 60)
+
+arr = Arrangement_2()
+P = Point_2
+Aos2.insert(arr, [Segment_2(P(0, 0), P(1, 0)), Segment_2(P(1, 0), P(1, 1)),
+                  Segment_2(P(1, 1), P(0, 1)), Segment_2(P(0, 1), P(0, 0))])
+idx = Aos2.Edge_index(arr)
+print(f"  len(idx) = {len(idx)} (expected 4)")
+ids, dist, snapped = idx.nearest_edges(np.array([[0.5, -2.0], [0.9, 0.5]]), k=2,
+                                       return_points=True)
+print(f"  distances {dist.tolist()}  (expected [[2, 3], [0.1, 0.5]])")
+print(f"  snapped {snapped[:, 0].tolist()}  (expected [[0.5, 0], [1, 0.5]])")
+ids, dist = idx.nearest_edges(np.array([[0.5, 0.5]]), k=6)
+print(f"  k=6 on 4 edges: ids {ids.tolist()}  (last two -1)")
+offsets, hits = idx.edges_in_box(np.array([[0.2, -0.1, 0.8, 0.1],     # bottom edge only
+                                           [0.2, 0.2, 0.8, 0.8],      # inside, no edge
+                                           [0.9, 0.9, 2.0, 2.0]]))    # corner: 2 edges
+print(f"  edges_in_box counts {np.diff(offsets).tolist()}  (expected [1, 0, 2])")
+
+print("\n" + "=" * 60)
+print("TEST 2: Random segments vs brute force")
+print("=" * 60)
+
+rng = np.random.default_rng(41)
+raw = rng.random((3_000, 4)) * 1000.0
+arr = Arrangement_2()
+Aos2.insert(arr, [Segment_2(P(*s[:2]), P(*s[2:])) for s in raw])
+idx = Aos2.Edge_index(arr)
+edges = edge_array(arr)
+pts = rng.random((500, 2)) * 1000.0
+ids, dist = idx.nearest_edges(pts, k=3)
+ref = np.sort(brute_nearest(edges, pts), axis=1)[:, :3]
+print(f"  {len(idx)} edges; max |dist - brute| = {np.abs(dist - ref).max():.3g}")
+
+print("\n" + "=" * 60)
+print("TEST 3: Incremental updates (no rebuild by hand)")
+print("=" * 60)
+
+far = np.array([[5000.0, 5000.0]])
+_, d0 = idx.nearest_edges(far)
+Aos2.insert(arr, [Segment_2(P(4999, 4990), P(4999, 5010))])
+_, d1 = idx.nearest_edges(far)
+print(f"  after inserting an edge near (5000, 5000): {d0[0, 0]:.1f} -> {d1[0, 0]:.1f} (expected 1.0)")
+victim = next(he for he in arr.edges() if float(he.source().point().x()) == 4999)
+arr.remove_edge(victim)
+_, d2 = idx.nearest_edges(far)
+print(f"  after removing it: {d2[0, 0]:.1f} (expected {d0[0, 0]:.1f})")
+print(f"  len(idx) == number_of_edges: {len(idx) == arr.number_of_edges()}")
+
+more = rng.random((2_000, 4)) * 1000.0
+Aos2.insert(arr, [Segment_2(P(*s[:2]), P(*s[2:])) for s in more])
+ids, dist = idx.nearest_edges(pts, k=3)
+ref = np.sort(brute_nearest(edge_array(arr), pts), axis=1)[:, :3]
+print(f"  after 2000 more insertions (splits everywhere): "
+      f"max |dist - brute| = {np.abs(dist - ref).max():.3g}, len ok: {len(idx) == arr.number_of_edges()}")
+
+arr.set_handle_ids(True)
+ids, _ = idx.nearest_edges(pts[:5])
+by_id = {he.id: he for he in arr.halfedges()}
+print(f"  ids resolve to halfedges via .id: {all(i in by_id for i in ids[:, 0])}")
+
+print("\n" + "=" * 60)
+print("TEST 4: Throughput, 100k GPS points")
+print("=" * 60)
+
+gps = rng.random((100_000, 2)) * 1000.0
+for threads in (1, 0):
+    t0 = time.perf_counter()
+    idx.nearest_edges(gps, k=1, num_threads=threads)
+    dt = time.perf_counter() - t0
+    print(f"  num_threads={threads}: {len(gps) / dt / 1e3:.0f}k queries/s")
+boxes = np.hstack([gps[:10_000], gps[:10_000] + 5.0])
+t0 = time.perf_counter()
+offsets, hits = idx.edges_in_box(boxes)
+print(f"  edges_in_box: 10k boxes in {(time.perf_counter() - t0) * 1e3:.1f} ms, "
+      f"{len(hits)} hits")
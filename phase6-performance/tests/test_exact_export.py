@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""exact_points / Ker.exact_coordinates: exact rationals from GMP limbs, no strings."""
+import importlib.util
+import sys
+import time
+from fractions import Fraction
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY import Aos2, Ker
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Point_2, Segment_2
+
+
+def decode(d):
+    """Rebuild [[Fraction, Fraction], ...] from the "bytes" layout."""
+    off, blob, sign = d["offsets"], d["bytes"].tobytes(), d["sign"].ravel()
+    vals = []
+    for k in range(len(sign)):
+        num = int.from_bytes(blob[off[2 * k]:off[2 * k + 1]], "little")
+        den = int.from_bytes(blob[off[2 * k + 1]:off[2 * k + 2]], "little")
+        vals.append(int(sign[k]) * Fraction(num, den))
+    return [vals[i:i + 2] for i in range(0, len(vals), 2)]
+
+
+print("=" * 60)
+print("TEST 1: Two segments crossing at (1/3, 2/3)")
+print("=" * 60)
+
+arr = Arrangement_2()
+Aos2.insert(arr, [Segment_2(Point_2(0, 0), Point_2(1, 2)),
+                  Segment_2(Point_2(0, 1), Point_2(1, 0))])
+fr = arr.exact_points(format="fraction")
+print(f"  vertices {sorted(map(tuple, fr))}")
+print(f"  crossing exact: {[Fraction(1, 3), Fraction(2, 3)] in fr}  (expected True)")
+print(f"  end points integral: "
+      f"{all(x.denominator == 1 and y.denominator == 1 for x, y in fr if [x, y] != [Fraction(1, 3), Fraction(2, 3)])}"
+      f"  (expected True)")
+d = arr.exact_points()
+print(f"  materialized {d['materialized']}  (expected 2 under EPEC: the crossing only; 0 under EPIC)")
+
+print("\n" + "=" * 60)
+print("TEST 2: bytes layout and gmpy2 agree with Fraction")
+print("=" * 60)
+
+print(f"  shapes: sign {d['sign'].shape}, offsets {d['offsets'].shape}  "
+      f"(expected ({arr.number_of_vertices()}, 2), ({4 * arr.number_of_vertices() + 1},))")
+print(f"  decoded bytes == fraction: {decode(d) == fr}  (expected True)")
+if importlib.util.find_spec("gmpy2") is None:
+    print("  gmpy2 not installed, skipped")
+else:
+    g = arr.exact_points(format="gmpy2")
+    print(f"  gmpy2 == fraction: "
+          f"{all(Fraction(int(a.numerator), int(a.denominator)) == b for ga, fa in zip(g, fr) for a, b in zip(ga, fa))}"
+          f"  (expected True)")
+
+print("\n" + "=" * 60)
+print("TEST 3: Doubles come back as their exact binary fractions")
+print("=" * 60)
+
+values = [0.1, -1e-300, 2.0 ** 60, -0.0, 5e-324]
+pts = [Point_2(x, -x) for x in values]
+got = Ker.exact_coordinates(pts, format="fraction")
+print(f"  exact: {all(g == [Fraction(x), Fraction(-x)] for g, x in zip(got, values))}  (expected True)")
+print(f"  via bytes: {decode(Ker.exact_coordinates(pts)) == got}  (expected True)")
+
+print("\n" + "=" * 60)
+print("TEST 4: 20,000 random segments, exact_points vs printing")
+print("=" * 60)
+
+rng = np.random.default_rng(50)
+segs = rng.random((20_000, 4)) * 1000.0
+big = Arrangement_2()
+Aos2.insert(big, [Segment_2(Point_2(*s[:2]), Point_2(*s[2:])) for s in segs])
+
+t0 = time.perf_counter()
+d = big.exact_points()
+t_bytes = time.perf_counter() - t0
+t0 = time.perf_counter()
+f = big.exact_points(format="fraction")
+t_frac = time.perf_counter() - t0
+t0 = time.perf_counter()
+s = [str(v.point()).split() for v in big.vertices()]
+t_str = time.perf_counter() - t0
+print(f"  {big.number_of_vertices()} vertices: bytes {t_bytes * 1e3:.0f} ms, "
+      f"fraction {t_frac * 1e3:.0f} ms, str(point) {t_str * 1e3:.0f} ms (rounded)")
+print(f"  materialized {d['materialized']} of {2 * big.number_of_vertices()} coordinates  "
+      f"(expected about 2 per crossing under EPEC)")
+
+print("\n" + "=" * 60)
+print("TEST 5: Errors")
+print("=" * 60)
+
+for bad, label, exc in [(lambda: arr.exact_points(format="decimal"), "unknown format", ValueError),
+                        (lambda: Ker.exact_coordinates([Point_2(0, 0), "p"]), "non-point", TypeError)]:
+    try:
+        bad()
+        print(f"  {label}: no error (unexpected)")
+    except exc as e:
+        print(f"  {label}: {exc.__name__}: {e}")
@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Batched face polygon export vs walking CCBs with he.next() in Python."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY import Aos2
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Point_2, Segment_2
+
+
+def box(x0, y0, x1, y1):
+    p = [Point_2(x0, y0), Point_2(x1, y0), Point_2(x1, y1), Point_2(x0, y1)]
+    return [Segment_2(p[i], p[(i + 1) % 4]) for i in range(4)]
+
+
+def signed_area(ring):
+    x, y = ring[:, 0], ring[:, 1]
+    return 0.5 * float(np.dot(x[:-1], y[1:]) - np.dot(x[1:], y[:-1]))
+
+
+def polygons(batch):
+    """[(face_id, [ring arrays])] from one batch."""
+    out = []
+    po, ro, xy = batch["polygon_offsets"], batch["ring_offsets"], batch["coords"]
+    for b, fid in enumerate(batch["face_ids"]):
+        rings = [xy[ro[r]:ro[r + 1]] for r in range(po[b], po[b + 1])]
+        out.append((int(fid), rings))
+    return out
+
+
+print("=" * 60)
+print("TEST 1: Square with a hole next to a plain square")
+print("=" * 60)
+
+arr = Arrangement_2()
+Aos2.insert(arr, box(0, 0, 10, 10) + box(3, 3, 7, 7) + box(10, 0, 20, 10)[:3])
+batches = list(arr.iter_face_polygons())
+polys = [p for b in batches for p in polygons(b)]
+print(f"  {len(batches)} batch, {len(polys)} polygons (expected 1 batch, 3 polygons)")
+for fid, rings in polys:
+    areas = [signed_area(r) for r in rings]
+    print(f"  face {fid}: {len(rings)} ring(s), signed areas {areas}")
+print("  Expected: [100.0, -16.0] (outer CCW, hole CW), [16.0], [100.0]")
+print(f"  Rings closed: {all(np.array_equal(r[0], r[-1]) for _, rs in polys for r in rs)}")
+
+open_rings = [r for b in arr.iter_face_polygons(close_rings=False)
+              for _, rs in polygons(b) for r in rs]
+print(f"  close_rings=False ring lengths: {[len(r) for r in open_rings]} (expected 4s)")
+
+topo = arr.face_topology_arrays()
+ids = sorted(fid for fid, _ in polys)
+bounded = [int(f) for f, o0, o1 in zip(topo["face_ids"], topo["face_ccb_offsets"][:-1],
+                                      topo["face_ccb_offsets"][1:])
+           if not topo["ccb_is_inner"][o0:o1].all()]
+print(f"  Face ids {ids} match face_topology_arrays bounded faces {sorted(bounded)}")
+
+print("\n" + "=" * 60)
+print("TEST 2: batch_size")
+print("=" * 60)
+
+sizes = [len(b["face_ids"]) for b in arr.iter_face_polygons(batch_size=2)]
+print(f"  batch_size=2 -> batch sizes {sizes} (expected [2, 1])")
+try:
+    arr.iter_face_polygons(batch_size=0)
+    print("  ⚠️ batch_size=0 accepted!")
+except ValueError as e:
+    print(f"  ✓ ValueError: {e}")
+
+print("\n" + "=" * 60)
+print("TEST 3: Modification during iteration")
+print("=" * 60)
+
+it = arr.iter_face_polygons(batch_size=1)
+next(it)
+Aos2.insert(arr, [Segment_2(Point_2(10, 0), Point_2(20, 10))])   # splits the right square
+try:
+    next(it)
+    print("  ⚠️ Iteration continued after an edit!")
+except RuntimeError as e:
+    print(f"  ✓ RuntimeError: {e}")
+print(f"  Fresh iteration after the edit: "
+      f"{sum(len(b['face_ids']) for b in arr.iter_face_polygons())} polygons (expected 4)")
+
+print("\n" + "=" * 60)
+print("TEST 4: 100 x 100 grid, batches vs Python CCB walk")
+print("=" * 60)
+
+n = 100
+grid = Arrangement_2()
+segs = [Segment_2(Point_2(i, 0), Point_2(i, n)) for i in range(n + 1)]
+segs += [Segment_2(Point_2(0, j), Point_2(n, j)) for j in range(n + 1)]
+Aos2.insert(grid, segs)
+
+t0 = time.perf_counter()
+count = 0
+total = 0.0
+for b in grid.iter_face_polygons(batch_size=1000):
+    for _, rings in polygons(b):
+        total += signed_area(rings[0])
+    count += len(b["face_ids"])
+t_batch = time.perf_counter() - t0
+
+t0 = time.perf_counter()
+py_rings = []
+for f in grid.faces():
+    if f.is_unbounded():
+        continue
+    ring = []
+    first = he = f.outer_ccb()
+    while True:
+        p = he.source().point()
+        ring.append((float(p.x()), float(p.y())))
+        he = he.next()
+        if he == first:
+            break
+    py_rings.append(ring)
+t_py = time.perf_counter() - t0
+
+print(f"  {count} polygons, total area {total} (expected 10000, 10000.0)")
+print(f"  iter_face_polygons: {t_batch * 1e3:.1f} ms  |  Python walk: {t_py * 1e3:.1f} ms  "
+      f"({t_py / t_batch:.0f}x)")
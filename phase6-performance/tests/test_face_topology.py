@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Face.inner_ccbs() / isolated_vertices() and arr.face_topology_arrays()."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+from CGALPY import Aos2
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Segment_2, Point_2
+
+
+def square(x0, y0, size):
+    pts = [Point_2(x0, y0), Point_2(x0 + size, y0),
+           Point_2(x0 + size, y0 + size), Point_2(x0, y0 + size)]
+    return [Segment_2(pts[i], pts[(i + 1) % 4]) for i in range(4)]
+
+
+print("=" * 60)
+print("TEST 1: Square with two square holes and one isolated point")
+print("=" * 60)
+
+arr = Arrangement_2()
+Aos2.insert(arr, square(0, 0, 100) + square(10, 10, 10) + square(50, 50, 10))
+outer = next(f for f in arr.faces()
+             if not f.is_unbounded() and len(f.inner_ccbs()) > 0)
+arr.insert_in_face_interior(Point_2(80, 20), outer)
+
+print(f"  len(outer.inner_ccbs()) = {len(outer.inner_ccbs())}   (expected 2)")
+print(f"  len(outer.outer_ccbs()) = {len(outer.outer_ccbs())}   (expected 1)")
+print(f"  len(outer.isolated_vertices()) = {len(outer.isolated_vertices())}   (expected 1)")
+print(f"  isolated point: {outer.isolated_vertices()[0].point()}")
+print(f"  unbounded outer_ccbs: {len(arr.unbounded_face().outer_ccbs())}   (expected 0)")
+
+for he in outer.inner_ccbs():
+    n, curr = 0, he
+    while True:
+        n += 1
+        curr = curr.next()
+        if curr == he:
+            break
+    print(f"  hole walk length {n}, incident face is outer: {he.face() == outer}")
+
+print("\n" + "=" * 60)
+print("TEST 2: face_topology_arrays() layout")
+print("=" * 60)
+
+t = arr.face_topology_arrays()
+for key, a in t.items():
+    print(f"  {key:18s} shape={a.shape} dtype={a.dtype}")
+print(f"  faces: {len(t['face_ids'])} (arr: {arr.number_of_faces()})")
+print(f"  CCB halfedges total: {len(t['ccb_halfedges'])} (arr halfedges: {arr.number_of_halfedges()})")
+print(f"  inner CCBs: {int(t['ccb_is_inner'].sum())}   (expected 2)")
+print(f"  isolated vertices: {len(t['isolated_vertices'])}   (expected 1)")
+
+print("\n" + "=" * 60)
+print("TEST 3: Ids agree with .id when handle ids are enabled")
+print("=" * 60)
+
+arr.set_handle_ids(True)
+t = arr.face_topology_arrays()
+row = [f.id for f in arr.faces()].index(outer.id)
+lo, hi = t["face_ccb_offsets"][row], t["face_ccb_offsets"][row + 1]
+inner_rows = [c for c in range(lo, hi) if t["ccb_is_inner"][c]]
+first_ids = sorted(int(t["ccb_halfedges"][t["ccb_offsets"][c]]) for c in inner_rows)
+print(f"  CSR hole representatives: {first_ids}")
+print(f"  inner_ccbs() ids:         {sorted(he.id for he in outer.inner_ccbs())}")
+
+print("\n" + "=" * 60)
+print("TEST 4: Parcel map, per-face Python scan vs one CSR pass")
+print("=" * 60)
+
+arr = Arrangement_2()
+segs = []
+for i in range(40):
+    for j in range(40):
+        segs += square(i * 100, j * 100, 100)
+        segs += square(i * 100 + 30, j * 100 + 30, 20)     # one hole per parcel
+Aos2.insert(arr, segs)
+
+t0 = time.perf_counter()
+holes = sum(len(f.inner_ccbs()) for f in arr.faces())
+dt_faces = time.perf_counter() - t0
+
+t0 = time.perf_counter()
+t = arr.face_topology_arrays()
+dt_csr = time.perf_counter() - t0
+print(f"  holes via inner_ccbs(): {holes} in {dt_faces * 1e3:.1f} ms")
+print(f"  holes via CSR:          {int(t['ccb_is_inner'].sum())} in {dt_csr * 1e3:.1f} ms")
@@ -0,0 +1,39 @@
+#!/usr/bin/env python3
+"""fuzz_edits.py reproducer scripts: record a sequence, then run the script on its own."""
+import io
+import os
+import subprocess
+import sys
+import tempfile
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'benchmarks'))
+
+import fuzz_edits as fe
+import workloads as wl
+
+cg = wl.Cgalpy("CGALPY")
+tmp = tempfile.mkdtemp(prefix="fuzz_reproducer_")
+
+print("=" * 60)
+print("TEST 1: Recorded calls replay as a standalone script")
+print("=" * 60)
+
+for seed, n_ops, grid in [(3, 3000, 10), (11, 2000, 6)]:
+    ops = fe.generate(seed, n_ops, grid)
+    rec = io.StringIO()
+    ex = fe.Executor(cg, grid, rec)
+    for op in ops:
+        if ex.s.valid(op):
+            ex.run(op)
+    arr = ex.arr
+    want = f"valid: True  V E F: {arr.number_of_vertices()} {arr.number_of_edges()} {arr.number_of_faces()}"
+
+    path = os.path.join(tmp, f"seed-{seed}.py")
+    fe.write_script(path, "CGALPY", "none (test)", len(ops), rec.getvalue())
+    run = subprocess.run([sys.executable, path], capture_output=True, text=True)
+    got = run.stdout.strip().splitlines()[-1] if run.stdout.strip() else ""
+    print(f"  seed {seed}: {rec.getvalue().count(chr(10))} lines, exit {run.returncode}  (expected 0)")
+    print(f"    script: {got}")
+    print(f"    direct: {want}  (expected equal)")
+    if run.returncode:
+        print("    " + run.stderr.strip().replace("\n", "\n    "))
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""Handle hashing / equality (type slots) and dense ids."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Segment_2, Point_2
+
+print("=" * 60)
+print("TEST 1: Equality and hash are identity of the DCEL record")
+print("=" * 60)
+
+arr = Arrangement_2()
+unbounded = arr.unbounded_face()
+v1 = arr.insert_in_face_interior(Point_2(0, 0), unbounded)
+v2 = arr.insert_in_face_interior(Point_2(10, 0), unbounded)
+v3 = arr.insert_in_face_interior(Point_2(5, 10), unbounded)
+he1 = arr.insert_at_vertices(Segment_2(Point_2(0, 0), Point_2(10, 0)), v1, v2)
+he2 = arr.insert_at_vertices(Segment_2(Point_2(10, 0), Point_2(5, 10)), v2, v3)
+he3 = arr.insert_at_vertices(Segment_2(Point_2(5, 10), Point_2(0, 0)), v3, v1)
+
+print(f"  he1.source() == v1: {he1.source() == v1}   (expected True)")
+print(f"  hash(he1.source()) == hash(v1): {hash(he1.source()) == hash(v1)}   (expected True)")
+print(f"  he1 == he1.twin(): {he1 == he1.twin()}   (expected False)")
+print(f"  v1 == 'v1': {v1 == 'v1'}   (expected False, NotImplemented path)")
+
+faces = {f: i for i, f in enumerate(arr.faces())}
+print(f"  Faces as dict keys: {len(faces)} entries   (expected 2)")
+print(f"  unbounded in faces: {arr.unbounded_face() in faces}   (expected True)")
+
+print("\n" + "=" * 60)
+print("TEST 2: Cost of == and hash() (slots, no dispatch)")
+print("=" * 60)
+
+N = 1_000_000
+t0 = time.perf_counter()
+for _ in range(N):
+    unbounded == unbounded
+dt_eq = time.perf_counter() - t0
+t0 = time.perf_counter()
+for _ in range(N):
+    hash(v1)
+dt_hash = time.perf_counter() - t0
+print(f"  ==     : {dt_eq / N * 1e9:6.1f} ns/call")
+print(f"  hash() : {dt_hash / N * 1e9:6.1f} ns/call")
+
+print("\n" + "=" * 60)
+print("TEST 3: Dense ids")
+print("=" * 60)
+
+try:
+    v1.id
+    print("  ⚠️ id available without set_handle_ids!")
+except RuntimeError as e:
+    print(f"  ✓ RuntimeError before enabling: {e}")
+
+arr.set_handle_ids(True)
+vids = sorted(v.id for v in arr.vertices())
+hids = sorted(h.id for h in arr.halfedges())
+fids = sorted(f.id for f in arr.faces())
+print(f"  vertex ids:   {vids}   (expected [0, 1, 2])")
+print(f"  halfedge ids: {hids}   (expected [0..5])")
+print(f"  face ids:     {fids}   (expected [0, 1])")
+print(f"  ids follow iteration order: {[v.id for v in arr.vertices()] == [0, 1, 2]}")
+
+print("\n" + "=" * 60)
+print("TEST 4: Ids stay dense through edits")
+print("=" * 60)
+
+
+def dense(arr):
+    return (sorted(v.id for v in arr.vertices()) == list(range(arr.number_of_vertices())) and
+            sorted(h.id for h in arr.halfedges()) == list(range(arr.number_of_halfedges())) and
+            sorted(f.id for f in arr.faces()) == list(range(arr.number_of_faces())))
+
+
+mid = Point_2(5, 0)
+e1 = arr.split_edge(he1, Segment_2(Point_2(0, 0), mid), Segment_2(mid, Point_2(10, 0)))
+print(f"  after split_edge:  dense={dense(arr)}")
+arr.merge_edge(e1, e1.next(), Segment_2(Point_2(0, 0), Point_2(10, 0)))
+print(f"  after merge_edge:  dense={dense(arr)}")
+arr.remove_edge(he2)
+print(f"  after remove_edge: dense={dense(arr)}  faces={arr.number_of_faces()}")
+iso = arr.insert_in_face_interior(Point_2(50, 50), arr.unbounded_face())
+print(f"  new vertex id = {iso.id}   (expected {arr.number_of_vertices() - 1})")
+arr.remove_isolated_vertex(iso)
+print(f"  after remove_isolated_vertex: dense={dense(arr)}")
+
+print("\n" + "=" * 60)
+print("TEST 5: Ids index NumPy arrays")
+print("=" * 60)
+
+import numpy as np
+degree = np.zeros(arr.number_of_vertices(), dtype=np.int64)
+for v in arr.vertices():
+    degree[v.id] = v.degree()
+print(f"  degree by id: {degree.tolist()}")
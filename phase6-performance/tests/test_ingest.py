@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Streaming WKT / GeoJSON / CSV ingestion vs building segments in Python."""
+import os
+import resource
+import sys
+import tempfile
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY import Aos2
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Point_2, Segment_2
+
+tmp = tempfile.mkdtemp(prefix="cgalpy-ingest-")
+
+
+def write(name, text):
+    path = os.path.join(tmp, name)
+    with open(path, "w") as f:
+        f.write(text)
+    return path
+
+
+def vef(arr):
+    return (arr.number_of_vertices(), arr.number_of_edges(), arr.number_of_faces())
+
+
+# Square with a diagonal, as a polygon ring plus one line string: V=4, E=5, F=3
+WKT = """POLYGON ((0 0, 4 0, 4 4, 0 4, 0 0))
+LINESTRING (0 0, 4 4)
+POINT (9 9)
+"""
+GEOJSON = """{"type": "FeatureCollection", "features": [
+ {"type": "Feature", "properties": {"name": "square"},
+  "geometry": {"type": "Polygon", "coordinates": [[[0,0],[4,0],[4,4],[0,4],[0,0]]]}},
+ {"type": "Feature", "properties": {},
+  "geometry": {"type": "LineString", "coordinates": [[0,0],[4,4]]}},
+ {"type": "Feature", "properties": {}, "geometry": {"type": "Point", "coordinates": [9,9]}}
+]}
+"""
+CSV = """x1,y1,x2,y2
+0,0,4,0
+4,0,4,4
+4,4,0,4
+0,4,0,0
+0,0,4,4
+"""
+
+print("=" * 60)
+print("TEST 1: Same arrangement from each format")
+print("=" * 60)
+
+for name, text in [("square.wkt", WKT), ("square.geojson", GEOJSON), ("square.csv", CSV)]:
+    arr = Arrangement_2()
+    stats = Aos2.insert_from_file(arr, write(name, text))
+    print(f"  {name:<15} VEF {vef(arr)}  segments {stats['segments']}  "
+          f"skipped geometries {stats['skipped_geometries']}")
+print("  Expected: VEF (4, 5, 3) each; 5 segments; 1 skipped point for WKT/GeoJSON")
+
+print("\n" + "=" * 60)
+print("TEST 2: Matches Aos2.insert on random segments, any batch size")
+print("=" * 60)
+
+rng = np.random.default_rng(38)
+segs = rng.random((5_000, 4)) * 1000.0
+path = os.path.join(tmp, "random.csv")
+np.savetxt(path, segs, delimiter=",", fmt="%.17g")
+
+ref = Arrangement_2()
+Aos2.insert(ref, [Segment_2(Point_2(*s[:2]), Point_2(*s[2:])) for s in segs])
+for batch in (64, 1000, 1 << 20):
+    arr = Arrangement_2()
+    stats = Aos2.insert_from_file(arr, path, batch_size=batch)
+    print(f"  batch_size={batch:<8} VEF {vef(arr)} batches {stats['batches']}  "
+          f"(reference {vef(ref)})")
+
+print("\n" + "=" * 60)
+print("TEST 3: Progress callback")
+print("=" * 60)
+
+reports = []
+arr = Arrangement_2()
+stats = Aos2.insert_from_file(arr, path, batch_size=1000, progress=reports.append)
+print(f"  {len(reports)} reports (expected >= 5: one per batch plus the final one)")
+print(f"  bytes non-decreasing: {all(a['bytes'] <= b['bytes'] for a, b in zip(reports, reports[1:]))}")
+print(f"  last report == return value: {reports[-1] == stats}  "
+      f"(bytes {stats['bytes']} of {stats['total_bytes']})")
+
+
+def stop(s):
+    if s["batches"] == 2:
+        raise KeyboardInterrupt
+
+
+arr = Arrangement_2()
+try:
+    Aos2.insert_from_file(arr, path, batch_size=1000, progress=stop)
+    print("  ⚠️ Callback exception swallowed!")
+except KeyboardInterrupt:
+    print(f"  ✓ Aborted from the callback; {arr.number_of_edges()} edges kept "
+          "(first two batches stay inserted)")
+
+print("\n" + "=" * 60)
+print("TEST 4: Malformed input")
+print("=" * 60)
+
+for name, text in [("bad.wkt", "LINESTRING (0 0, 1)\n"),
+                   ("bad.geojson", '{"type": "LineString", "coordinates": [[0, 0], [1, "a"]]}'),
+                   ("bad.csv", "0,0,1,1\n0,0,1\n")]:
+    try:
+        Aos2.insert_from_file(Arrangement_2(), write(name, text))
+        print(f"  ⚠️ {name} accepted!")
+    except ValueError as e:
+        print(f"  ✓ {name}: ValueError: {e}")
+try:
+    Aos2.insert_from_file(Arrangement_2(), os.path.join(tmp, "missing.csv"))
+except RuntimeError as e:
+    print(f"  ✓ missing file: RuntimeError: {e}")
+try:
+    Aos2.insert_from_file(Arrangement_2(), write("roads.dat", CSV))
+except ValueError as e:
+    print(f"  ✓ unknown extension: ValueError: {e}")
+arr = Arrangement_2()
+Aos2.insert_from_file(arr, os.path.join(tmp, "square.csv"), format="csv")
+print(f"  format= overrides the extension: VEF {vef(arr)} (expected (4, 5, 3))")
+
+print("\n" + "=" * 60)
+print("TEST 5: Time and memory vs the Python path (200k segments)")
+print("=" * 60)
+
+segs = rng.random((200_000, 4)) * 100_000.0
+path = os.path.join(tmp, "big.csv")
+np.savetxt(path, segs, delimiter=",", fmt="%.17g")
+
+
+def rss_mb():
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / (2**20 if sys.platform == "darwin" else 2**10)
+
+
+before = rss_mb()
+t0 = time.perf_counter()
+arr = Arrangement_2()
+Aos2.insert_from_file(arr, path)
+t_file = time.perf_counter() - t0
+after_file = rss_mb()
+
+t0 = time.perf_counter()
+loaded = np.loadtxt(path, delimiter=",")
+ref = Arrangement_2()
+Aos2.insert(ref, [Segment_2(Point_2(*s[:2]), Point_2(*s[2:])) for s in loaded])
+t_py = time.perf_counter() - t0
+after_py = rss_mb()
+
+print(f"  insert_from_file: {t_file:.2f} s, peak RSS +{after_file - before:.0f} MB")
+print(f"  loadtxt + Segment_2 list + insert: {t_py:.2f} s, peak RSS +{after_py - after_file:.0f} MB more")
+print(f"  Same VEF: {vef(arr) == vef(ref)}")
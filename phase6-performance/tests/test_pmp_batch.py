@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""Batched PMP: compute_face_normals_batch / isotropic_remeshing_batch."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY.Ker import Vector_3
+from CGALPY.Pol import Surface_mesh
+import CGALPY.Polygon_mesh_processing as PMP
+
+
+def torus(m, R=1.0, r=0.3):
+    """Closed torus, m x m quads split into 2 m^2 triangles."""
+    u, v = np.meshgrid(np.arange(m) * (2 * np.pi / m),
+                       np.arange(m) * (2 * np.pi / m), indexing="ij")
+    V = np.stack([(R + r * np.cos(v)) * np.cos(u),
+                  (R + r * np.cos(v)) * np.sin(u),
+                  r * np.sin(v)], axis=-1).reshape(-1, 3)
+    i, j = np.meshgrid(np.arange(m), np.arange(m), indexing="ij")
+    a, b = i * m + j, ((i + 1) % m) * m + j
+    c, d = ((i + 1) % m) * m + (j + 1) % m, i * m + (j + 1) % m
+    F = np.concatenate([np.stack([a, b, c], -1).reshape(-1, 3),
+                        np.stack([a, c, d], -1).reshape(-1, 3)]).astype(np.int64)
+    return V, F
+
+
+print("=" * 60)
+print("TEST 1: Face normals of 20,000 small meshes")
+print("=" * 60)
+
+rng = np.random.default_rng(0)
+meshes = []
+for k in range(20000):
+    V, F = torus(6 + k % 5)
+    meshes.append(Surface_mesh.from_arrays(V * rng.uniform(0.5, 2.0), F))
+
+t0 = time.perf_counter()
+ref = []
+for sm in meshes:
+    fn = sm.add_property_map("f:normals", Vector_3(0, 0, 0))
+    PMP.compute_face_normals(sm, fn)
+    ref.append(sm.property_array("f:normals").copy())
+t_loop = time.perf_counter() - t0
+
+for params in [{}, {"parallel": True}]:
+    t0 = time.perf_counter()
+    offsets, N = PMP.compute_face_normals_batch(meshes, params)
+    dt = time.perf_counter() - t0
+    same = all(np.array_equal(N[offsets[i]:offsets[i + 1]], ref[i]) for i in range(len(meshes)))
+    print(f"  {str(params):<20} {len(N)} normals in {dt * 1e3:.0f} ms "
+          f"(loop: {t_loop * 1e3:.0f} ms); equal to per-mesh calls: {same}  (expected True)")
+print(f"  offsets: {offsets.shape}, last {offsets[-1]}  (expected ({len(meshes) + 1},), {len(N)})")
+
+try:
+    PMP.compute_face_normals_batch([meshes[0], "not a mesh"])
+except TypeError as e:
+    print(f"  bad element: TypeError: {e}")
+
+print("\n" + "=" * 60)
+print("TEST 2: Remeshing a batch in place")
+print("=" * 60)
+
+V, F = torus(12)
+batch = [Surface_mesh.from_arrays(V, F) for _ in range(64)]
+t0 = time.perf_counter()
+V2, vo, F2, fo = PMP.isotropic_remeshing_batch(
+    batch, 0.1, {"number_of_iterations": 2, "parallel": True})
+dt = time.perf_counter() - t0
+print(f"  64 meshes in {dt * 1e3:.0f} ms: {len(V2)} vertices, {len(F2)} faces")
+Vi, Fi = batch[5].to_arrays()
+print(f"  slice 5 == batch[5].to_arrays(): "
+      f"{np.array_equal(V2[vo[5]:vo[6]], Vi) and np.array_equal(F2[fo[5]:fo[6]], Fi)}  (expected True)")
+print(f"  face indices local to each mesh: "
+      f"{all(F2[fo[i]:fo[i + 1]].max() < vo[i + 1] - vo[i] for i in range(64))}  (expected True)")
+
+lengths = np.linspace(0.05, 0.2, 4)
+batch = [Surface_mesh.from_arrays(V, F) for _ in range(4)]
+_, _, _, fo = PMP.isotropic_remeshing_batch(batch, lengths)
+print(f"  per-mesh targets {lengths}: faces {np.diff(fo)}  (expected decreasing)")
+
+for bad, label in [(lambda: PMP.isotropic_remeshing_batch(batch, np.ones(3)), "3 targets for 4 meshes"),
+                   (lambda: PMP.isotropic_remeshing_batch(batch, -1.0), "negative target"),
+                   (lambda: PMP.isotropic_remeshing_batch([batch[0], batch[0]], 0.1), "duplicate mesh")]:
+    try:
+        bad()
+        print(f"  {label}: no error (unexpected)")
+    except ValueError as e:
+        print(f"  {label}: ValueError: {e}")
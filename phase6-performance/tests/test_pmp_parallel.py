@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""PMP "parallel" / "num_threads" named parameters."""
+import sys
+import threading
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY.Ker import Vector_3
+from CGALPY.Pol import Surface_mesh
+import CGALPY.Polygon_mesh_processing as PMP
+
+
+def torus(m, R=1.0, r=0.3):
+    """Closed torus, m x m quads split into 2 m^2 triangles."""
+    u, v = np.meshgrid(np.arange(m) * (2 * np.pi / m),
+                       np.arange(m) * (2 * np.pi / m), indexing="ij")
+    V = np.stack([(R + r * np.cos(v)) * np.cos(u),
+                  (R + r * np.cos(v)) * np.sin(u),
+                  r * np.sin(v)], axis=-1).reshape(-1, 3)
+    i, j = np.meshgrid(np.arange(m), np.arange(m), indexing="ij")
+    a, b = i * m + j, ((i + 1) % m) * m + j
+    c, d = ((i + 1) % m) * m + (j + 1) % m, i * m + (j + 1) % m
+    F = np.concatenate([np.stack([a, b, c], -1).reshape(-1, 3),
+                        np.stack([a, c, d], -1).reshape(-1, 3)]).astype(np.int64)
+    return V, F
+
+
+print("=" * 60)
+print("TEST 1: Parallel normals match the sequential ones")
+print("=" * 60)
+
+V, F = torus(400)
+sm = Surface_mesh.from_arrays(V, F)
+results = {}
+for k, (label, params) in enumerate([("sequential", {}),
+                                     ("parallel", {"parallel": True}),
+                                     ("parallel, 3 threads", {"parallel": True, "num_threads": 3})]):
+    fn = sm.add_property_map(f"f:n{k}", Vector_3(0, 0, 0))
+    vn = sm.add_property_map(f"v:n{k}", Vector_3(0, 0, 0))
+    t0 = time.perf_counter()
+    PMP.compute_face_normals(sm, fn, params)
+    PMP.compute_vertex_normals(sm, vn, params)
+    dt = time.perf_counter() - t0
+    results[label] = (sm.property_array(f"f:n{k}").copy(),
+                      sm.property_array(f"v:n{k}").copy())
+    print(f"  {label:<20} {len(F)} faces, normals in {dt * 1e3:.1f} ms")
+ref_f, ref_v = results["sequential"]
+for label, (f, v) in results.items():
+    print(f"  {label:<20} identical: {np.array_equal(f, ref_f) and np.array_equal(v, ref_v)}"
+          "  (expected True)")
+
+try:
+    PMP.compute_face_normals(sm, fn, {"parallel": True, "num_threads": -1})
+except ValueError as e:
+    print(f"  num_threads=-1: ValueError: {e}")
+
+print("\n" + "=" * 60)
+print("TEST 2: Remeshing releases the GIL with parallel=True")
+print("=" * 60)
+
+V, F = torus(60)
+target = 0.5 * 2 * np.pi * 1.3 / 60
+for params in [{}, {"parallel": True}]:
+    meshes = [Surface_mesh.from_arrays(V, F) for _ in range(4)]
+    t0 = time.perf_counter()
+    workers = [threading.Thread(target=PMP.isotropic_remeshing,
+                                args=(m, target, dict(params, number_of_iterations=2)))
+               for m in meshes]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    dt = time.perf_counter() - t0
+    print(f"  {str(params):<20} 4 meshes on 4 threads: {dt * 1e3:.0f} ms, "
+          f"faces {[m.number_of_faces() for m in meshes]}")
+print("  (expected: parallel noticeably faster on a multi-core machine, same face counts)")
+
+print("\n" + "=" * 60)
+print("TEST 3: does_self_intersect with the parallel tag")
+print("=" * 60)
+
+sm = Surface_mesh.from_arrays(*torus(100))
+print(f"  sequential: {PMP.does_self_intersect(sm)}  (expected False)")
+print(f"  parallel:   {PMP.does_self_intersect(sm, {'parallel': True, 'num_threads': 2})}"
+      "  (expected False)")
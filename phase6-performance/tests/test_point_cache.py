@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""Interned Vertex.point() wrappers: identity, invalidation, allocation savings."""
+import gc
+import subprocess
+import sys
+import time
+import tracemalloc
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+from CGALPY import Aos2
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Segment_2, Point_2
+
+
+def build_grid(n):
+    arr = Arrangement_2()
+    f = arr.unbounded_face()
+    vs = [[arr.insert_in_face_interior(Point_2(i, j), f) for j in range(n)]
+          for i in range(n)]
+    for i in range(n):
+        for j in range(n - 1):
+            arr.insert_at_vertices(Segment_2(Point_2(i, j), Point_2(i, j + 1)),
+                                   vs[i][j], vs[i][j + 1])
+    return arr, vs
+
+
+print("=" * 60)
+print("TEST 1: Default behaviour unchanged (fresh copy per call)")
+print("=" * 60)
+
+arr, vs = build_grid(10)
+v = vs[3][3]
+print(f"  point_caching = {arr.point_caching}")
+print(f"  v.point() is v.point(): {v.point() is v.point()}   (expected False)")
+
+print("\n" + "=" * 60)
+print("TEST 2: Cached wrappers are shared")
+print("=" * 60)
+
+arr.set_point_caching(True)
+p1 = v.point()
+p2 = v.point()
+he = next(h for h in arr.halfedges() if h.target() == v)
+print(f"  v.point() is v.point(): {p1 is p2}   (expected True)")
+print(f"  he.target().point() is v.point(): {he.target().point() is p1}   (expected True)")
+
+print("\n" + "=" * 60)
+print("TEST 3: modify_vertex invalidates, old wrapper keeps old value")
+print("=" * 60)
+
+iso = arr.insert_in_face_interior(Point_2(100, 100), arr.unbounded_face())
+old = iso.point()
+arr.modify_vertex(iso, Point_2(200, 200))
+new = iso.point()
+print(f"  old: {old}   (expected 100 100)")
+print(f"  new: {new}   (expected 200 200)")
+print(f"  new is old: {new is old}   (expected False)")
+print(f"  new is iso.point(): {new is iso.point()}   (expected True)")
+
+print("\n" + "=" * 60)
+print("TEST 4: to_double() / vertex_coordinates()")
+print("=" * 60)
+
+print(f"  v.to_double() = {v.to_double()}")
+print(f"  Point_2(1, 2).to_double() = {Point_2(1, 2).to_double()}")
+xy = arr.vertex_coordinates()
+print(f"  vertex_coordinates(): shape={xy.shape}, dtype={xy.dtype}")
+
+print("\n" + "=" * 60)
+print("TEST 5: Allocations in a tight traversal loop")
+print("=" * 60)
+
+arr, _ = build_grid(100)
+
+
+def walk(arr, rounds=5):
+    total = 0.0
+    for _ in range(rounds):
+        for he in arr.halfedges():
+            total += float(he.source().point().x())
+    return total
+
+
+for enabled in (False, True):
+    arr.set_point_caching(enabled)
+    walk(arr, rounds=1)                       # warm the cache
+    gc.collect()
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    walk(arr)
+    dt = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"  caching={enabled!s:5}: {dt * 1e3:7.1f} ms, peak traced {peak / 1024:8.1f} KiB")
+
+print("\n" + "=" * 60)
+print("TEST 6: Disabling and arrangement destruction")
+print("=" * 60)
+
+arr.set_point_caching(False)
+print(f"  point_caching after disable: {arr.point_caching}")
+arr.set_point_caching(True)
+del arr
+gc.collect()
+other = Arrangement_2()
+other.set_point_caching(True)     # purges the detached cache of the dead arrangement
+print("  ✓ No crash after destroying a cached arrangement")
+
+print("\n" + "=" * 60)
+print("TEST 7: Exit with caching on and wrappers cached")
+print("=" * 60)
+
+script = """
+import sys
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+from CGALPY import Aos2
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Point_2, Segment_2
+arr = Arrangement_2()
+Aos2.insert(arr, [Segment_2(Point_2(0, 0), Point_2(1, 1))])
+arr.set_point_caching(True)
+held = [v.point() for v in arr.vertices()]
+"""
+run = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True)
+print(f"  exit code {run.returncode}  (expected 0, no crash in Py_Finalize)")
+if run.returncode:
+    print("  " + run.stderr.strip().replace("\n", "\n  "))
+
+print("\n" + "=" * 60)
+print("TEST 8: merge_edge drops the merged-away vertex")
+print("=" * 60)
+
+cached = Arrangement_2()
+cached.set_point_caching(True)
+plain = Arrangement_2()
+stale = 0
+for i in range(200):
+    Aos2.insert(cached, [Segment_2(Point_2(0, 0), Point_2(10, 0))])
+    he = next(h for h in cached.halfedges() if h.source().to_double() == (0.0, 0.0))
+    mid = Point_2(5, 0)
+    e1 = cached.split_edge(he, Segment_2(Point_2(0, 0), mid), Segment_2(mid, Point_2(10, 0)))
+    for v in cached.vertices():
+        v.point()                                        # caches the middle vertex
+    cached.merge_edge(e1, e1.next(), Segment_2(Point_2(0, 0), Point_2(10, 0)))
+    # The freed vertex record may be reused by either arrangement.
+    for a in (cached, plain):
+        v = a.insert_in_face_interior(Point_2(i, -1), a.unbounded_face())
+        stale += v.to_double() != (float(i), -1.0) or v.point().to_double() != (float(i), -1.0)
+    cached.clear()
+print(f"  vertices with a stale point: {stale}   (expected 0)")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""Batched vertical ray shooting and vertical decomposition arrays vs per-point calls."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY import Aos2
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Point_2, Segment_2
+
+STRATEGIES = [Aos2.Arr_naive_point_location, Aos2.Arr_walk_along_line_point_location,
+              Aos2.Arr_trapezoid_ric_point_location]
+
+
+def box(x0, y0, x1, y1):
+    p = [Point_2(x0, y0), Point_2(x1, y0), Point_2(x1, y1), Point_2(x0, y1)]
+    return [Segment_2(p[i], p[(i + 1) % 4]) for i in range(4)]
+
+
+print("=" * 60)
+print("TEST 1: Square with a roof vertex")
+print("=" * 60)
+
+arr = Arrangement_2()
+Aos2.insert(arr, box(0, 0, 10, 10) + [Segment_2(Point_2(5, 10), Point_2(5, 12))])
+queries = np.array([[2.0, 5.0],     # below the top edge: halfedge at y=10
+                    [5.0, 5.0],     # below the vertex (5, 10)
+                    [20.0, 0.0],    # nothing above or below
+                    [2.0, -3.0]])   # below the square: bottom edge at y=0
+for cls in STRATEGIES:
+    pl = cls(arr)
+    kind, ids, y = pl.shoot_up_many(queries)
+    print(f"  {cls.__name__}: up kind {kind.tolist()} y {y.tolist()}")
+print("  (expected kind [1, 0, 2, 1], y [10, 10, inf, 0])")
+kind, ids, y = pl.shoot_down_many(queries)
+print(f"  down kind {kind.tolist()} y {y.tolist()}  (expected [1, 1, 2, 2], [0, 0, -inf, -inf])")
+
+arr.set_handle_ids(True)
+kind, ids, _ = pl.shoot_up_many(queries[:2])
+vertex = next(v for v in arr.vertices() if v.point() == Point_2(5, 10))
+print(f"  vertex id matches .id: {ids[1] == vertex.id}")
+
+print("\n" + "=" * 60)
+print("TEST 2: Vertical decomposition of a square with a diamond hole")
+print("=" * 60)
+
+arr = Arrangement_2()
+d = [Point_2(4, 5), Point_2(5, 4), Point_2(6, 5), Point_2(5, 6)]
+Aos2.insert(arr, box(0, 0, 10, 10) + [Segment_2(d[i], d[(i + 1) % 4]) for i in range(4)])
+vd = arr.vertical_decomposition()
+print(f"  rows {len(vd['vertex_ids'])} (expected 8)")
+print(f"  xy-lexicographic order: {bool(np.all(np.diff(vd['x']) >= 0))}")
+inner = (vd["x"] > 0) & (vd["x"] < 10)
+for x, y, bk, by, ak, ay in zip(vd["x"][inner], vd["y"][inner], vd["below_kind"][inner],
+                                vd["below_y"][inner], vd["above_kind"][inner],
+                                vd["above_y"][inner]):
+    print(f"  ({x:g}, {y:g}): below kind {bk} y {by:g}, above kind {ak} y {ay:g}")
+print("  (expected (4,5): 1/0, 1/10; (5,4): 1/0, 0/6; (5,6): 0/4, 1/10; (6,5): 1/0, 1/10)")
+walls = np.stack([vd["x"], vd["below_y"], vd["x"], vd["above_y"]], axis=1)[inner]
+print(f"  wall segments:\n{walls}")
+
+print("\n" + "=" * 60)
+print("TEST 3: Random segments, batched vs per-point ray_shoot_up")
+print("=" * 60)
+
+rng = np.random.default_rng(42)
+raw = rng.random((2_000, 4)) * 1000.0
+arr = Arrangement_2()
+Aos2.insert(arr, [Segment_2(Point_2(*s[:2]), Point_2(*s[2:])) for s in raw])
+pts = rng.random((20_000, 2)) * 1000.0
+pl = Aos2.Arr_trapezoid_ric_point_location(arr)
+
+t0 = time.perf_counter()
+kind, ids, y = pl.shoot_up_many(pts)
+t_batch = time.perf_counter() - t0
+
+t0 = time.perf_counter()
+loop = [pl.ray_shoot_up(Point_2(*p)) for p in pts]
+t_loop = time.perf_counter() - t0
+print(f"  per-point: {t_loop * 1e3:.0f} ms, batched: {t_batch * 1e3:.0f} ms "
+      f"({t_loop / t_batch:.1f}x)")
+print(f"  kinds: {np.bincount(kind, minlength=3).tolist()} (vertex, halfedge, face)")
+hit = kind == 1
+print(f"  hits lie above their query: {bool(np.all(y[hit] >= pts[hit, 1]))}")
+
+t0 = time.perf_counter()
+vd = arr.vertical_decomposition()
+print(f"  vertical_decomposition: {len(vd['vertex_ids'])} vertices in "
+      f"{(time.perf_counter() - t0) * 1e3:.0f} ms")
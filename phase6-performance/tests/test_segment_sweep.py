@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+"""Batch intersection reporting (sweep on arrays) vs building an Arrangement_2."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY import Aos2
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Point_2, Segment_2
+
+print("=" * 60)
+print("TEST 1: Small hand-checked set")
+print("=" * 60)
+
+segs = np.array([[0, 0, 4, 4],     # 0
+                 [0, 4, 4, 0],     # 1  crosses 0 at (2, 2)
+                 [2, 0, 2, 4],     # 2  vertical, through (2, 2) too
+                 [5, 0, 6, 0],     # 3  isolated
+                 [6, 0, 7, 1]],    # 4  touches 3 at shared end point
+                dtype=np.float64)
+
+points, pairs, where = Aos2.compute_intersection_points(segs, with_pairs=True)
+print(f"  points:\n{points}")
+print(f"  pairs:\n{pairs}")
+print(f"  pair_point: {where.tolist()}")
+print("  Expected: one point (2, 2) with pairs (0,1), (0,2), (1,2)")
+
+points_ep = Aos2.compute_intersection_points(segs, report_endpoints=True)
+print(f"  With end points: {len(points_ep)} points (expected 10: every end point + (2, 2))")
+
+_, pairs_ep, _ = Aos2.compute_intersection_points(segs, report_endpoints=True,
+                                                  with_pairs=True)
+print(f"  With end points + pairs: {pairs_ep.tolist()}")
+print("  Expected: the three (2, 2) pairs plus (3, 4) at the shared end point (6, 0)")
+print(f"  do_curves_intersect: {Aos2.do_curves_intersect(segs)}")
+print(f"  do_curves_intersect(segs[3:4]): {Aos2.do_curves_intersect(segs[3:4])}")
+
+print("\n" + "=" * 60)
+print("TEST 2: Overlapping segments")
+print("=" * 60)
+
+overlap = np.array([[0, 0, 4, 0], [2, 0, 6, 0]], dtype=np.float64)
+points, pairs, where = Aos2.compute_intersection_points(overlap, with_pairs=True)
+print(f"  points: {points.tolist()}   (overlap end points (2, 0) and (4, 0))")
+print(f"  pairs:  {pairs.tolist()}")
+
+print("\n" + "=" * 60)
+print("TEST 3: Agreement with Arrangement_2 vertex count")
+print("=" * 60)
+
+rng = np.random.default_rng(27)
+segs = rng.random((2_000, 4)) * 100.0
+
+t0 = time.perf_counter()
+points = Aos2.compute_intersection_points(segs)
+t_sweep = time.perf_counter() - t0
+
+t0 = time.perf_counter()
+arr = Arrangement_2()
+Aos2.insert(arr, [Segment_2(Point_2(*s[:2]), Point_2(*s[2:])) for s in segs])
+t_arr = time.perf_counter() - t0
+
+# Random segments in general position: every non end point vertex is a crossing
+crossings = arr.number_of_vertices() - 2 * len(segs)
+print(f"  Sweep points: {len(points)}  |  arrangement crossings: {crossings}")
+print(f"  Sweep: {t_sweep * 1e3:.1f} ms  |  Arrangement_2 build: {t_arr * 1e3:.1f} ms")
+
+print("\n" + "=" * 60)
+print("TEST 4: Degenerate segment is rejected")
+print("=" * 60)
+
+try:
+    Aos2.compute_intersection_points(np.array([[1, 1, 1, 1]], dtype=np.float64))
+    print("  ⚠️ Zero-length segment accepted!")
+except ValueError as e:
+    print(f"  ✓ ValueError: {e}")
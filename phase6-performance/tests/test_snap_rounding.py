@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""snap_rounding / insert_segments: noded polylines on a grid, bulk insertion."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY import Aos2
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Point_2, Segment_2
+
+
+def counts(a):
+    return (a.number_of_vertices(), a.number_of_edges(), a.number_of_faces())
+
+
+print("=" * 60)
+print("TEST 1: Three segments through one pixel")
+print("=" * 60)
+
+segs = np.array([[0.0, 0.0, 4.0, 4.0],
+                 [0.0, 4.0, 4.0, 0.0],
+                 [0.0, 2.1, 4.0, 1.9]])
+sr = Aos2.snap_rounding(segs, pixel_size=1.0)
+off, pts = sr["offsets"], sr["points"]
+print(f"  offsets {off.tolist()}  (expected {len(segs) + 1} entries)")
+for i in range(len(segs)):
+    print(f"  polyline {i}: {pts[off[i]:off[i + 1]].tolist()}")
+# The crossing (2, 2) lies in the pixel [2, 3) x [2, 3), centered at (2.5, 2.5).
+shared = all([2.5, 2.5] in pts[off[i]:off[i + 1]].tolist() for i in range(len(segs)))
+print(f"  all polylines through (2.5, 2.5): {shared}  (expected True)")
+print(f"  fragments {len(sr['segments'])}, distinct: "
+      f"{len(np.unique(sr['segments'], axis=0)) == len(sr['segments'])}  (expected True)")
+
+print("\n" + "=" * 60)
+print("TEST 2: Dirty fan of near-collinear segments")
+print("=" * 60)
+
+rng = np.random.default_rng(49)
+k = 200
+angle = rng.uniform(-1e-9, 1e-9, k)
+shift = rng.uniform(-1e-9, 1e-9, (k, 2))
+fan = np.column_stack([-np.cos(angle), -np.sin(angle), np.cos(angle), np.sin(angle)]) * 10.0
+fan += np.hstack([shift, shift])
+
+exact = Arrangement_2()
+Aos2.insert(exact, [Segment_2(Point_2(*s[:2]), Point_2(*s[2:])) for s in fan])
+print(f"  raw input: V/E/F {counts(exact)}")
+
+sr = Aos2.snap_rounding(fan, pixel_size=1e-6)
+frags = sr["segments"]
+print(f"  {len(frags)} fragments cross: {Aos2.do_curves_intersect(frags)}  (expected False)")
+arr = Arrangement_2()
+n = Aos2.insert_segments(arr, frags, assume_disjoint=True)
+print(f"  inserted {n}, snapped: V/E/F {counts(arr)}")
+print(f"  vertices == distinct snapped points: "
+      f"{arr.number_of_vertices() == len(np.unique(sr['points'], axis=0))}  (expected True)")
+
+print("\n" + "=" * 60)
+print("TEST 3: insert_segments vs wrapper insertion, 20,000 segments")
+print("=" * 60)
+
+segs = rng.random((20_000, 4)) * 1000.0
+t0 = time.perf_counter()
+a = Arrangement_2()
+Aos2.insert(a, [Segment_2(Point_2(*s[:2]), Point_2(*s[2:])) for s in segs])
+t_wrap = time.perf_counter() - t0
+t0 = time.perf_counter()
+b = Arrangement_2()
+Aos2.insert_segments(b, segs)
+t_arr = time.perf_counter() - t0
+print(f"  wrappers {t_wrap * 1e3:.0f} ms, insert_segments {t_arr * 1e3:.0f} ms")
+print(f"  counts equal: {counts(a) == counts(b)}  (expected True)")
+
+t0 = time.perf_counter()
+sr = Aos2.snap_rounding(segs, pixel_size=1e-3)
+c = Arrangement_2()
+Aos2.insert_segments(c, sr["segments"], assume_disjoint=True)
+t_sr = time.perf_counter() - t0
+print(f"  snap rounding + disjoint insertion {t_sr * 1e3:.0f} ms: faces {c.number_of_faces()} "
+      f"(exact {a.number_of_faces()}, expected close)")
+
+print("\n" + "=" * 60)
+print("TEST 4: Invalid input")
+print("=" * 60)
+
+good = np.array([[0.0, 0.0, 1.0, 1.0]])
+for bad, label in [(lambda: Aos2.snap_rounding(good, pixel_size=0.0), "zero pixel"),
+                   (lambda: Aos2.snap_rounding(np.array([[1.0, 1.0, 1.0, 1.0]]), 0.1), "zero-length row"),
+                   (lambda: Aos2.snap_rounding(np.array([[0.0, np.nan, 1.0, 1.0]]), 0.1), "NaN"),
+                   (lambda: Aos2.insert_segments(Arrangement_2(), np.array([[1.0, 1.0, 1.0, 1.0]])),
+                    "insert_segments zero-length row")]:
+    try:
+        bad()
+        print(f"  {label}: no error (unexpected)")
+    except ValueError as e:
+        print(f"  {label}: ValueError: {e}")
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""CGALPY.stats: opt-in traits / filter / sweep counters."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY import Aos2, stats
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Segment_2, Point_2
+
+print("=" * 60)
+print("TEST 1: Availability and enable/disable")
+print("=" * 60)
+
+print(f"  stats.available = {stats.available}")
+if not stats.available:
+    try:
+        stats.enable()
+    except RuntimeError as e:
+        print(f"  enable() raised RuntimeError as expected: {e}")
+    sys.exit(0)
+
+stats.disable()
+stats.reset()
+print(f"  enabled() after disable(): {stats.enabled()}   (expected False)")
+
+arr = Arrangement_2()
+Aos2.insert(arr, [Segment_2(Point_2(0, 0), Point_2(10, 10)),
+                  Segment_2(Point_2(0, 10), Point_2(10, 0))])
+print(f"  as_dict() while disabled: {stats.as_dict()}   (expected {{}})")
+
+print("\n" + "=" * 60)
+print("TEST 2: Counts for one insert, per operation")
+print("=" * 60)
+
+stats.enable()
+arr = Arrangement_2()
+Aos2.insert(arr, [Segment_2(Point_2(0, 0), Point_2(10, 10)),
+                  Segment_2(Point_2(0, 10), Point_2(10, 0))])
+d = stats.as_dict()
+print(f"  operations: {sorted(d)}")
+for op, counts in d.items():
+    nonzero = {k: v for k, v in counts.items() if v}
+    print(f"  {op}: {nonzero}")
+total = stats.totals()
+print(f"  intersect calls: {total['intersect']}   (expected > 0: one crossing)")
+print(f"  compare_xy calls: {total['compare_xy']}   (expected > 0)")
+print(f"  counted under 'insert': {'insert' in d}   (expected True)")
+stats.reset()
+Aos2.compute_intersection_points(np.array([[0, 0, 10, 10], [0, 10, 10, 0]], dtype=np.float64))
+sweep = stats.as_dict().get("compute_intersection_points", {})
+print(f"  compute_intersection_points traits calls: intersect={sweep.get('intersect', 0)}, "
+      f"compare_xy={sweep.get('compare_xy', 0)}   (expected > 0)")
+
+print("\n" + "=" * 60)
+print("TEST 3: Filter failures on degenerate input")
+print("=" * 60)
+
+stats.reset()
+# Three segments concurrent at (0.3, 0.9), which is not a double. Under EPEC
+# the crossing is a lazy constructed point, and deciding that the third
+# segment passes exactly through it cannot be done by the interval filter.
+segs = [Segment_2(Point_2(0, 0), Point_2(1, 3)),
+        Segment_2(Point_2(0, 1), Point_2(3, 0)),
+        Segment_2(Point_2(-6, 0), Point_2(1, 1))]
+degenerate = Arrangement_2()
+Aos2.insert(degenerate, segs)
+t = stats.totals()
+print(f"  filtered_calls={t['filtered_calls']}, exact_fallbacks={t['exact_fallbacks']}")
+print(f"  static_filter_calls={t['static_filter_calls']}, "
+      f"static_filter_failures={t['static_filter_failures']}")
+print(f"  vertices: {degenerate.number_of_vertices()}   (EPEC: 7, one triple crossing)")
+print(f"  exact_fallbacks > 0: {t['exact_fallbacks'] > 0}   (expected True on EPEC)")
+
+print("\n" + "=" * 60)
+print("TEST 4: Sweep events from compute_intersection_points(with_pairs=True)")
+print("=" * 60)
+
+stats.reset()
+a = np.array([[0, 0, 10, 10], [0, 10, 10, 0], [5, 0, 5, 10]], dtype=np.float64)
+Aos2.compute_intersection_points(a, with_pairs=True)
+ev = stats.as_dict().get("compute_intersection_points", {}).get("sweep_events", 0)
+print(f"  sweep_events = {ev}   (expected 7: 6 end points + 1 triple crossing)")
+
+print("\n" + "=" * 60)
+print("TEST 5: Edit methods are counted per operation")
+print("=" * 60)
+
+stats.reset()
+edits = Arrangement_2()
+f = edits.unbounded_face()
+p = [Point_2(0, 0), Point_2(10, 0), Point_2(5, 10)]
+v = [edits.insert_in_face_interior(q, f) for q in p]
+# The second and third edges meet edges already at their vertices, so CGAL
+# has to compare curves around the vertex: traits calls under the new scope.
+he = [edits.insert_at_vertices(Segment_2(p[i], p[(i + 1) % 3]), v[i], v[(i + 1) % 3])
+      for i in range(3)]
+mid = Point_2(5, 0)
+e = edits.split_edge(he[0], Segment_2(p[0], mid), Segment_2(mid, p[1]))
+e = edits.merge_edge(e, e.next(), Segment_2(p[0], p[1]))
+edits.remove_edge(e)
+d = stats.as_dict()
+print(f"  operations: {sorted(d)}   (edits with no traits call have no row)")
+print(f"  insert_at_vertices compare calls: "
+      f"{sum(n for k, n in d.get('insert_at_vertices', {}).items() if k.startswith('compare'))}"
+      f"   (expected > 0)")
+print(f"  nothing left in 'other': {'other' not in d}   (expected True)")
+
+print("\n" + "=" * 60)
+print("TEST 6: reset() and overhead while disabled")
+print("=" * 60)
+
+stats.reset()
+print(f"  totals after reset all zero: {not any(stats.totals().values())}")
+
+rng = np.random.default_rng(0)
+xy = rng.uniform(0, 1000, size=(2000, 4))
+segs = [Segment_2(Point_2(*r[:2]), Point_2(*r[2:])) for r in xy]
+for state in (False, True):
+    (stats.enable if state else stats.disable)()
+    t0 = time.perf_counter()
+    Aos2.insert(Arrangement_2(), segs)
+    print(f"  enabled={state}: {(time.perf_counter() - t0) * 1e3:.1f} ms")
+stats.disable()
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""Surface_mesh.from_arrays / to_arrays and property maps as NumPy views."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY.Ker import Point_3, Vector_3
+from CGALPY.Pol import Surface_mesh
+import CGALPY.Polygon_mesh_processing as PMP
+
+
+def grid(n):
+    """(n+1)^2 vertices, 2 n^2 consistently oriented triangles."""
+    xs, ys = np.meshgrid(np.arange(n + 1.0), np.arange(n + 1.0), indexing="ij")
+    V = np.stack([xs.ravel(), ys.ravel(), np.zeros(xs.size)], axis=1)
+    i, j = np.meshgrid(np.arange(n), np.arange(n), indexing="ij")
+    a = (i * (n + 1) + j).ravel()
+    b, c, d = a + n + 1, a + n + 2, a + 1
+    F = np.concatenate([np.stack([a, b, c], 1), np.stack([a, c, d], 1)]).astype(np.int64)
+    return V, F
+
+
+print("=" * 60)
+print("TEST 1: Tetrahedron round trip")
+print("=" * 60)
+
+V = np.array([[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, 0, 1]], dtype=float)
+F = np.array([[0, 2, 1], [0, 1, 3], [0, 3, 2], [1, 2, 3]], dtype=np.int64)
+sm = Surface_mesh.from_arrays(V, F)
+print(f"  {sm.number_of_vertices()} vertices, {sm.number_of_faces()} faces  (expected 4, 4)")
+V2, F2 = sm.to_arrays()
+print(f"  vertices equal: {np.array_equal(V, V2)}")
+print(f"  faces equal up to rotation: "
+      f"{all(any(np.array_equal(np.roll(f2, r), f) for r in range(3)) for f, f2 in zip(F, F2))}")
+
+for bad, label in [(np.array([[0, 1, 7]]), "index out of range"),
+                   (np.array([[0, 1, 1]]), "repeated index"),
+                   (np.array([[0, 1, 2], [0, 1, 2]]), "duplicate face (non-manifold)")]:
+    try:
+        Surface_mesh.from_arrays(V, bad.astype(np.int64))
+        print(f"  {label}: no error (unexpected)")
+    except ValueError as e:
+        print(f"  {label}: ValueError: {e}")
+
+print("\n" + "=" * 60)
+print("TEST 2: Property maps as views")
+print("=" * 60)
+
+P = sm.points_array()
+P[3, 2] = 2.0
+print(f"  write through points_array: point(3) = {sm.point(list(sm.vertices())[3])}  (expected 0 0 2)")
+normals = sm.add_property_map("v:normals", Vector_3(0, 0, 0))
+PMP.compute_vertex_normals(sm, normals)
+N = sm.property_array("v:normals")
+print(f"  v:normals shape {N.shape}, unit length: {np.allclose(np.linalg.norm(N, axis=1), 1)}")
+print(f"  shares memory with map: {np.shares_memory(N, sm.property_array('v:normals'))}")
+try:
+    sm.property_array("v:nothing")
+except ValueError as e:
+    print(f"  missing property: ValueError: {e}")
+
+print("\n" + "=" * 60)
+print("TEST 3: 1M-triangle grid, bulk vs element-wise")
+print("=" * 60)
+
+V, F = grid(708)
+t0 = time.perf_counter()
+sm = Surface_mesh.from_arrays(V, F)
+t_build = time.perf_counter() - t0
+t0 = time.perf_counter()
+V2, F2 = sm.to_arrays()
+t_export = time.perf_counter() - t0
+print(f"  from_arrays: {len(F)} faces in {t_build * 1e3:.0f} ms; "
+      f"to_arrays in {t_export * 1e3:.0f} ms; round trip exact: "
+      f"{np.array_equal(V, V2) and np.array_equal(np.sort(F, 1), np.sort(F2, 1))}")
+
+small_V, small_F = grid(70)
+t0 = time.perf_counter()
+loop = Surface_mesh()
+vs = [loop.add_vertex(Point_3(*p)) for p in small_V]
+for f in small_F:
+    loop.add_face(*(vs[i] for i in f))
+t_loop = time.perf_counter() - t0
+print(f"  element-wise build of {len(small_F)} faces: {t_loop * 1e3:.0f} ms "
+      f"(~{t_loop * len(F) / len(small_F) / t_build:.0f}x slower per face)")
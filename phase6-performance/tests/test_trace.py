@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""CGALPY.trace: Chrome trace-event export of bound calls."""
+import json
+import os
+import sys
+import tempfile
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY import Aos2, Ker, trace
+
+rng = np.random.default_rng(0)
+p, q, r = (rng.uniform(0, 100, size=(200_000, 2)) for _ in range(3))
+segs = rng.uniform(0, 100, size=(300, 4))
+out_dir = tempfile.mkdtemp()
+
+print("=" * 60)
+print("TEST 1: Record a few calls and flush")
+print("=" * 60)
+
+trace.discard()
+trace.start()
+print(f"  enabled(): {trace.enabled()}   (expected True)")
+Ker.orientation(p, q, r)
+Ker.orientation(p, q, r, num_threads=4)
+Aos2.compute_intersection_points(segs)
+trace.stop()
+
+path = os.path.join(out_dir, "trace.json")
+n = trace.flush(path)
+with open(path) as f:
+    doc = json.load(f)
+events = [e for e in doc["traceEvents"] if e["ph"] == "X"]
+print(f"  flush() returned {n}, file has {len(events)} complete events")
+print(f"  names: {sorted({e['name'] for e in events})}")
+
+print("\n" + "=" * 60)
+print("TEST 2: Event contents")
+print("=" * 60)
+
+calls = [e for e in events if e["name"] == "Ker.orientation"]
+print(f"  Ker.orientation spans: {len(calls)}   (expected 2)")
+print(f"  size arg: {calls[0]['args'].get('size')}   (expected 200000)")
+print(f"  gil at call: {calls[0]['args']['gil']}   (expected held)")
+released = [e for e in events if e["name"] == "gil released"]
+print(f"  'gil released' spans: {len(released)}, gil arg: {released[0]['args']['gil']}")
+chunks = [e for e in events if e["name"] == "parallel chunk"]
+print(f"  parallel chunks: {len(chunks)} on {len({e['tid'] for e in chunks})} threads   (expected 4 on 4)")
+outer, inner = calls[0], released[0]
+nested = outer["ts"] <= inner["ts"] and inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+print(f"  first 'gil released' nested in first call: {nested}")
+
+print("\n" + "=" * 60)
+print("TEST 3: Buffers are drained by flush")
+print("=" * 60)
+
+print(f"  second flush: {trace.flush(os.path.join(out_dir, 'empty.json'))} events   (expected 0)")
+
+print("\n" + "=" * 60)
+print("TEST 4: Bounded buffers count dropped events")
+print("=" * 60)
+
+before = trace.dropped()
+trace.start(max_events_per_thread=4096)
+for _ in range(5000):
+    Ker.orientation(p[:1], q[:1], r[:1])
+trace.stop()
+kept = trace.discard()
+print(f"  kept {kept}, dropped {trace.dropped() - before}   (kept + dropped = 10000: call + gil span each)")
+
+print("\n" + "=" * 60)
+print("TEST 5: Short-lived workers reuse buffers and tids")
+print("=" * 60)
+
+trace.start()
+for _ in range(2000):
+    Ker.orientation(p, q, r, num_threads=4)
+trace.stop()
+path = os.path.join(out_dir, "workers.json")
+trace.flush(path)
+with open(path) as f:
+    doc = json.load(f)
+chunks = [e for e in doc["traceEvents"] if e["name"] == "parallel chunk"]
+tids = [e for e in doc["traceEvents"] if e["ph"] == "M"]
+print(f"  {len(chunks)} parallel chunks on {len({e['tid'] for e in chunks})} tids, "
+      f"{len(tids)} thread tracks   (expected 8000 on 4, 5 tracks: main + 4 workers)")
+
+print("\n" + "=" * 60)
+print("TEST 6: Cost per traced call")
+print("=" * 60)
+
+one = (p[:1], q[:1], r[:1])
+for state in (False, True):
+    (trace.start if state else trace.stop)()
+    t0 = time.perf_counter()
+    for _ in range(100_000):
+        Ker.orientation(*one)
+    dt = (time.perf_counter() - t0) / 100_000 * 1e9
+    print(f"  tracing={state}: {dt:.0f} ns/call")
+trace.stop()
+trace.discard()
+
+print("\n" + "=" * 60)
+print("TEST 7: Arrangement edit methods are traced")
+print("=" * 60)
+
+arr = Aos2.Arrangement_2()
+a, b = Ker.Point_2(0, 0), Ker.Point_2(1, 1)
+trace.start()
+va = arr.insert_in_face_interior(a, arr.unbounded_face())
+vb = arr.insert_in_face_interior(b, arr.unbounded_face())
+he = arr.insert_at_vertices(Ker.Segment_2(a, b), va, vb)
+arr.remove_edge(he)
+trace.stop()
+path = os.path.join(out_dir, "edits.json")
+trace.flush(path)
+with open(path) as f:
+    doc = json.load(f)
+names = [e["name"] for e in doc["traceEvents"] if e["ph"] == "X"]
+for name in ("Arrangement_2.insert_at_vertices", "Arrangement_2.remove_edge"):
+    print(f"  {name}: {names.count(name)} span(s)   (expected 1)")
+print(f"  vertices left: {arr.number_of_vertices()}   (expected 0)")
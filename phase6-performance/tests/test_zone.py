@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""zone_many: CSR zones of candidate segments vs insert-and-count, arrangement untouched."""
+import sys
+import time
+sys.path.insert(0, '/Users/utkarshkhajuria/cgal-python-bindings/build/src/libs/cgalpy')
+
+import numpy as np
+from CGALPY import Aos2
+from CGALPY.Aos2 import Arrangement_2
+from CGALPY.Ker import Point_2, Segment_2
+
+
+def box(x0, y0, x1, y1):
+    p = [Point_2(x0, y0), Point_2(x1, y0), Point_2(x1, y1), Point_2(x0, y1)]
+    return [Segment_2(p[i], p[(i + 1) % 4]) for i in range(4)]
+
+
+def sizes(arr):
+    return arr.number_of_vertices(), arr.number_of_edges(), arr.number_of_faces()
+
+
+print("=" * 60)
+print("TEST 1: Two squares side by side")
+print("=" * 60)
+
+arr = Arrangement_2()
+Aos2.insert(arr, box(0, 0, 10, 10) + box(10, 0, 20, 10))
+before = sizes(arr)
+cands = np.array([[-5.0, 5.0, 25.0, 5.0],     # crosses both squares
+                  [2.0, 2.0, 4.0, 4.0],       # inside the left square
+                  [-5.0, 10.0, 25.0, 10.0],   # overlaps the top edges
+                  [5.0, 5.0, 10.0, 10.0]])    # ends on the shared vertex
+offsets, kinds, ids = arr.zone_many(cands)
+for i in range(len(cands)):
+    k = kinds[offsets[i]:offsets[i + 1]]
+    print(f"  segment {i}: kinds {k.tolist()}")
+print("  (expected 0: [2, 1, 2, 1, 2, 1, 2]; 1: [2]; "
+      "2: [2, 0, 1, 0, 1, 0, 2]; 3: [2, 0])")
+print(f"  arrangement unchanged: {sizes(arr) == before}")
+
+arr.set_handle_ids(True)
+offsets, kinds, ids = arr.zone_many(cands[1:2])
+faces = {f.id for f in arr.faces()}
+print(f"  face id resolves via .id: {ids[0] in faces}")
+
+try:
+    arr.zone_many(np.array([[1.0, 1.0, 1.0, 1.0]]))
+    print("  degenerate segment: no error (unexpected)")
+except ValueError as e:
+    print(f"  degenerate segment: ValueError: {e}")
+
+print("\n" + "=" * 60)
+print("TEST 2: Random arrangement, zone sizes vs insert-and-count")
+print("=" * 60)
+
+rng = np.random.default_rng(43)
+raw = rng.random((1_500, 4)) * 1000.0
+arr = Arrangement_2()
+Aos2.insert(arr, [Segment_2(Point_2(*s[:2]), Point_2(*s[2:])) for s in raw])
+cands = rng.random((200, 4)) * 1000.0
+offsets, kinds, ids = arr.zone_many(cands)
+mismatch = 0
+for i, s in enumerate(cands[:20]):
+    trial = Arrangement_2()
+    Aos2.insert(trial, [Segment_2(Point_2(*r[:2]), Point_2(*r[2:])) for r in raw])
+    e0 = trial.number_of_edges()
+    Aos2.insert(trial, Segment_2(Point_2(*s[:2]), Point_2(*s[2:])))
+    crossed = int(np.sum(kinds[offsets[i]:offsets[i + 1]] == 1))
+    # Every crossed edge is split, and the new curve adds one edge per face.
+    faces = int(np.sum(kinds[offsets[i]:offsets[i + 1]] == 2))
+    mismatch += (trial.number_of_edges() - e0) != crossed + faces
+print(f"  edge-count mismatches over 20 candidates: {mismatch} (expected 0)")
+
+print("\n" + "=" * 60)
+print("TEST 3: Throughput, 10k candidates")
+print("=" * 60)
+
+cands = rng.random((10_000, 4)) * 1000.0
+for threads in (1, 0):
+    t0 = time.perf_counter()
+    offsets, kinds, ids = arr.zone_many(cands, num_threads=threads)
+    dt = time.perf_counter() - t0
+    print(f"  num_threads={threads}: {dt * 1e3:.0f} ms, {len(ids)} cells")
+t0 = time.perf_counter()
+for s in cands[:1_000]:
+    arr.zone_many(s[None, :], num_threads=1)
+print(f"  one call per candidate, 1000 candidates: {(time.perf_counter() - t0) * 1e3:.0f} ms")